@@ -0,0 +1,281 @@
+"""
+파일명: backend/lib/AccessLogSpool.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: DB 적재가 밀리거나 실패한 접근 로그 행을 보관하는 append-only 세그먼트 JSONL 스풀
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import IO
+
+from lib.Logger import logger
+
+SPOOL_SEGMENT_PATTERN = re.compile(r"^spool-(\d{12})\.jsonl$")
+SPOOL_WORKER_DIR_PATTERN = re.compile(r"^worker-\d+(?:-\d+)?$")
+SPOOL_OWNER_LOCK_NAME = ".owner.lock"
+SPOOL_MAX_OWNER_CANDIDATES = 16
+SPOOL_ORPHAN_SCAN_INTERVAL_SEC = 30.0
+
+
+@dataclass(frozen=True)
+class SpoolCursor:
+    segmentPath: str
+    offset: int
+
+
+class AccessLogSpool:
+    """
+    설명: worker 전용 하위 디렉터리(<root>/worker-<pid>)의 세그먼트 파일(spool-<seq>.jsonl)에 행을 한 줄씩 추가하고,
+    가장 오래된 세그먼트부터 재생
+    처리 규칙: 하위 디렉터리의 .owner.lock을 수명 동안 flock으로 잡아 소유를 표시하고, 자기 디렉터리만 쓰기/재생,
+    자기 보관분이 비면 소유자가 종료된(잠금이 풀린) 다른 worker 디렉터리를 하나씩 인수해 재생 후 삭제,
+    세그먼트는 쓰기 중 LOCK_EX / 읽기 중 LOCK_SH, 프로세스 안에서는 Lock으로 직렬화(writer task의 to_thread 호출),
+    worker별 보관 크기가 maxBytes를 넘으면 새 행을 거절(기존 보관분 우선), 재생 위치는 <세그먼트>.pos에 기록해 재기동 후 이어서 재생
+    실패 동작: 파일 I/O 오류는 경고 로그 후 append False / 빈 배치 반환, fcntl이 없는 플랫폼이면 생성 시 ImportError
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, rootDirectory: str, maxBytes: int, segmentBytes: int):
+        import fcntl
+
+        self.fcntl = fcntl
+        self.rootDirectory = rootDirectory
+        self.maxBytes = maxBytes
+        self.segmentBytes = max(1, segmentBytes)
+        self.lock = Lock()
+        self.activePath: str | None = None
+        self.activeHandle: IO[bytes] | None = None
+        self.totalBytes = 0
+        self.corruptLines = 0
+        self.adoptedDirectory: str | None = None
+        self.adoptedLockFd: int | None = None
+        self.orphanScanAt = 0.0
+        os.makedirs(rootDirectory, exist_ok=True)
+        self.ownerLockFd: int | None
+        self.directory, self.ownerLockFd = self.claimOwnDirectory()
+        for path in self.listSegments(self.directory):
+            self.totalBytes += os.path.getsize(path) - self.readOffset(path)
+
+    def claimOwnDirectory(self) -> tuple[str, int]:
+        """설명: worker-<pid>(같은 PID가 살아 있는 다른 컨테이너와 공유 시 worker-<pid>-<n>) 디렉터리 소유 잠금 반환값: (경로, 잠금 fd). 갱신일: 2026-10-18"""
+        for index in range(SPOOL_MAX_OWNER_CANDIDATES):
+            suffix = f"-{index}" if index else ""
+            directory = os.path.join(self.rootDirectory, f"worker-{os.getpid()}{suffix}")
+            os.makedirs(directory, exist_ok=True)
+            lockFd = self.tryLockDirectory(directory)
+            if lockFd is not None:
+                return directory, lockFd
+        raise OSError(f"no free access log spool directory under {self.rootDirectory}")
+
+    def tryLockDirectory(self, directory: str) -> int | None:
+        """설명: 디렉터리 소유 잠금을 기다리지 않고 시도 반환값: 잠근 fd, 다른 프로세스가 소유 중이면 None. 갱신일: 2026-10-18"""
+        lockFd = os.open(os.path.join(directory, SPOOL_OWNER_LOCK_NAME), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self.fcntl.flock(lockFd, self.fcntl.LOCK_EX | self.fcntl.LOCK_NB)
+        except OSError:
+            os.close(lockFd)
+            return None
+        return lockFd
+
+    def listSegments(self, directory: str) -> list[str]:
+        try:
+            names = sorted(name for name in os.listdir(directory) if SPOOL_SEGMENT_PATTERN.match(name))
+        except OSError:
+            return []
+        return [os.path.join(directory, name) for name in names]
+
+    def nextSegmentPath(self) -> str:
+        segments = self.listSegments(self.directory)
+        lastSequence = int(SPOOL_SEGMENT_PATTERN.match(os.path.basename(segments[-1])).group(1)) if segments else 0
+        return os.path.join(self.directory, f"spool-{lastSequence + 1:012d}.jsonl")
+
+    def readOffset(self, segmentPath: str) -> int:
+        try:
+            with open(f"{segmentPath}.pos", encoding="ascii") as handle:
+                return max(0, int(handle.read().strip() or 0))
+        except (OSError, ValueError):
+            return 0
+
+    def writeOffset(self, segmentPath: str, offset: int) -> None:
+        tempPath = f"{segmentPath}.pos.tmp"
+        with open(tempPath, "w", encoding="ascii") as handle:
+            handle.write(str(offset))
+        os.replace(tempPath, f"{segmentPath}.pos")
+
+    def closeActive(self) -> None:
+        if self.activeHandle is not None:
+            try:
+                self.activeHandle.close()
+            except OSError:
+                pass
+        self.activeHandle = None
+        self.activePath = None
+
+    def append(self, rows: list[dict[str, object]]) -> bool:
+        """설명: 행 목록을 활성 세그먼트 끝에 추가(블로킹 I/O라 이벤트 루프에서는 to_thread로 호출) 반환값: 디스크 상한 초과/I/O 실패면 False(아무것도 쓰지 않음). 갱신일: 2026-10-18"""
+        if not rows:
+            return True
+        payload = b"".join(
+            json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n" for row in rows
+        )
+        with self.lock:
+            if self.totalBytes + len(payload) > self.maxBytes:
+                return False
+            try:
+                if self.activeHandle is None or self.activeHandle.tell() >= self.segmentBytes:
+                    self.closeActive()
+                    self.activePath = self.nextSegmentPath()
+                    self.activeHandle = open(self.activePath, "ab")
+                self.fcntl.flock(self.activeHandle.fileno(), self.fcntl.LOCK_EX)
+                try:
+                    self.activeHandle.write(payload)
+                    self.activeHandle.flush()
+                finally:
+                    self.fcntl.flock(self.activeHandle.fileno(), self.fcntl.LOCK_UN)
+            except OSError as error:
+                logger.warning("access log spool append failed: error=%s", type(error).__name__)
+                self.closeActive()
+                return False
+            self.totalBytes += len(payload)
+            return True
+
+    def readBatch(self, maxRows: int) -> tuple[list[dict[str, object]], SpoolCursor | None]:
+        """
+        설명: 자기 디렉터리(비었으면 인수한 고아 디렉터리)의 가장 오래된 세그먼트 재생 위치부터 최대 maxRows행 읽기
+        처리 규칙: 개행으로 끝나지 않은 꼬리(쓰기 중단분)는 읽지 않고, JSON 파싱 실패 줄은 건너뛰며 카운트
+        반환값: (행 목록, commit에 넘길 커서) — 재생할 것이 없으면 ([], None)
+        갱신일: 2026-10-18
+        """
+        with self.lock:
+            rows, cursor = self.readDirectoryBatch(self.directory, maxRows)
+            if cursor is not None:
+                return rows, cursor
+            while self.adoptedDirectory is not None or self.adoptOrphan():
+                rows, cursor = self.readDirectoryBatch(self.adoptedDirectory, maxRows)
+                if cursor is not None:
+                    return rows, cursor
+                self.releaseAdopted(remove=True)
+            return [], None
+
+    def readDirectoryBatch(self, directory: str, maxRows: int) -> tuple[list[dict[str, object]], SpoolCursor | None]:
+        for segmentPath in self.listSegments(directory):
+            offset = self.readOffset(segmentPath)
+            rows: list[dict[str, object]] = []
+            try:
+                with open(segmentPath, "rb") as handle:
+                    self.fcntl.flock(handle.fileno(), self.fcntl.LOCK_SH)
+                    handle.seek(offset)
+                    while len(rows) < maxRows:
+                        line = handle.readline()
+                        if not line or not line.endswith(b"\n"):
+                            break
+                        offset += len(line)
+                        try:
+                            row = json.loads(line)
+                        except ValueError:
+                            self.corruptLines += 1
+                            continue
+                        if isinstance(row, dict):
+                            rows.append(row)
+                    atEnd = handle.read(1) == b""
+            except OSError as error:
+                logger.warning("access log spool read failed: error=%s", type(error).__name__)
+                return [], None
+            if rows or offset > self.readOffset(segmentPath):
+                return rows, SpoolCursor(segmentPath, offset)
+            if atEnd and segmentPath != self.activePath:
+                self.removeSegment(segmentPath)
+        return [], None
+
+    def adoptOrphan(self) -> bool:
+        """
+        설명: 소유 잠금이 풀린(worker 종료/재기동 전 PID) 다른 worker 디렉터리 하나를 인수
+        처리 규칙: 잠금을 잡은 동안에는 다른 worker가 같은 디렉터리를 재생하지 않음, 인수분 보관 크기를 totalBytes에 더함
+        반환값: 인수했으면 True
+        갱신일: 2026-10-18
+        """
+        self.orphanScanAt = time.monotonic()
+        try:
+            names = sorted(os.listdir(self.rootDirectory))
+        except OSError:
+            return False
+        for name in names:
+            directory = os.path.join(self.rootDirectory, name)
+            if not SPOOL_WORKER_DIR_PATTERN.match(name) or directory == self.directory or not os.path.isdir(directory):
+                continue
+            try:
+                lockFd = self.tryLockDirectory(directory)
+            except OSError:
+                continue
+            if lockFd is None:
+                continue
+            self.adoptedDirectory = directory
+            self.adoptedLockFd = lockFd
+            for path in self.listSegments(directory):
+                try:
+                    self.totalBytes += max(0, os.path.getsize(path) - self.readOffset(path))
+                except OSError:
+                    pass
+            return True
+        return False
+
+    def releaseAdopted(self, remove: bool) -> None:
+        """설명: 인수한 디렉터리 잠금 해제 부작용: remove면 비워진 디렉터리 삭제(다른 worker가 그사이 잠금 파일을 만들면 남겨 둠). 갱신일: 2026-10-18"""
+        if self.adoptedDirectory is None or self.adoptedLockFd is None:
+            return
+        if remove:
+            try:
+                os.remove(os.path.join(self.adoptedDirectory, SPOOL_OWNER_LOCK_NAME))
+                os.rmdir(self.adoptedDirectory)
+            except OSError:
+                pass
+        os.close(self.adoptedLockFd)
+        self.adoptedDirectory = None
+        self.adoptedLockFd = None
+
+    def commit(self, cursor: SpoolCursor) -> None:
+        """설명: 재생 완료 위치 기록, 세그먼트를 끝까지 재생했으면 파일 삭제 부작용: .pos 갱신/세그먼트 삭제. 갱신일: 2026-10-18"""
+        with self.lock:
+            previousOffset = self.readOffset(cursor.segmentPath)
+            self.totalBytes = max(0, self.totalBytes - max(0, cursor.offset - previousOffset))
+            try:
+                segmentSize = os.path.getsize(cursor.segmentPath)
+            except OSError:
+                return
+            if cursor.offset >= segmentSize:
+                if cursor.segmentPath == self.activePath:
+                    self.closeActive()
+                self.removeSegment(cursor.segmentPath)
+                return
+            try:
+                self.writeOffset(cursor.segmentPath, cursor.offset)
+            except OSError as error:
+                logger.warning("access log spool offset write failed: error=%s", type(error).__name__)
+
+    def removeSegment(self, segmentPath: str) -> None:
+        for path in (segmentPath, f"{segmentPath}.pos"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as error:
+                logger.warning("access log spool cleanup failed: error=%s", type(error).__name__)
+
+    def hasPending(self) -> bool:
+        """설명: 재생할 보관분이 있거나 고아 디렉터리 점검 주기가 됐는지(I/O 없이 판단) 갱신일: 2026-10-18"""
+        return self.totalBytes > 0 or time.monotonic() - self.orphanScanAt >= SPOOL_ORPHAN_SCAN_INTERVAL_SEC
+
+    def close(self) -> None:
+        with self.lock:
+            self.closeActive()
+            self.releaseAdopted(remove=False)
+            if self.ownerLockFd is not None:
+                os.close(self.ownerLockFd)
+                self.ownerLockFd = None
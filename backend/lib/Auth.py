@@ -11,6 +11,7 @@ import uuid
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from lib.AuthVersionCache import getCachedAuthVersion, storeCachedAuthVersion
 from lib.Logger import logger
 from lib import Database as DB
 from pydantic import BaseModel
@@ -237,6 +238,15 @@ def decodeAuthToken(token: str, *, expectedTokenType: str) -> dict:
 
 
 async def readCurrentAuthVersion(username: str) -> int | None:
+    """
+    설명: 사용자 현재 authVersion 조회
+    처리 규칙: AuthVersionCache가 켜져 있으면 TTL 내 캐시 값을 사용하고, DB 조회 결과만 캐시에 저장
+    반환값: 0 이상 authVersion 또는 None(사용자 없음/조회 실패)
+    갱신일: 2026-10-18
+    """
+    cachedAuthVersion = getCachedAuthVersion(username)
+    if cachedAuthVersion is not None:
+        return cachedAuthVersion
     manager = DB.getManager()
     if not manager:
         return None
@@ -254,7 +264,10 @@ async def readCurrentAuthVersion(username: str) -> int | None:
         normalized = int(value or 0)
     except (TypeError, ValueError):
         return None
-    return normalized if normalized >= 0 else None
+    if normalized < 0:
+        return None
+    storeCachedAuthVersion(username, normalized)
+    return normalized
 
 
 def bindAuthUsernameToRequestState(request: Request, username: str | None) -> None:
@@ -0,0 +1,249 @@
+"""
+파일명: backend/lib/AuthVersionCache.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: getCurrentUser의 auth.userAuthVersion 조회를 줄이기 위한 username → authVersion 프로세스 내 캐시와 무효화 채널
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from lib.Logger import logger
+
+AUTH_VERSION_EVENT_STATE_TYPE = "auth_version"
+AUTH_VERSION_EVENT_OVERLAP_MS = 2_000
+
+
+@dataclass(frozen=True)
+class AuthVersionCacheConfig:
+    ttlMs: int = 0
+    maxEntries: int = 10_000
+    pollIntervalMs: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttlMs > 0 and self.maxEntries > 0
+
+    @property
+    def eventRetentionMs(self) -> int:
+        """설명: 교차 worker 무효화 이벤트 보존 시간 반환값: TTL/poll 간격보다 넉넉한 ms. 갱신일: 2026-10-18"""
+        return max(60_000, self.ttlMs * 4, self.pollIntervalMs * 4)
+
+
+def readMonotonicMs() -> int:
+    return int(time.monotonic() * 1000)
+
+
+class AuthVersionCache:
+    """
+    설명: TTL과 최대 항목 수로 제한한 LRU 캐시
+    처리 규칙: invalidate는 TTL 동안 tombstone을 남겨, 커밋 직전 조회한 이전 버전이 다시 캐시되는 경합을 차단
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, config: AuthVersionCacheConfig | None = None):
+        self.config = config or AuthVersionCacheConfig()
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self.tombstones: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, username: str) -> int | None:
+        """설명: 만료 전 캐시 값 조회 반환값: authVersion 또는 None(미스/비활성). 갱신일: 2026-10-18"""
+        if not self.config.enabled:
+            return None
+        nowMs = readMonotonicMs()
+        with self.lock:
+            entry = self.entries.get(username)
+            if entry is None or entry[1] <= nowMs:
+                if entry is not None:
+                    self.entries.pop(username, None)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(username)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, username: str, authVersion: int) -> None:
+        """설명: DB에서 읽은 authVersion 저장 처리 규칙: 유효 tombstone이 있으면 저장하지 않음. 갱신일: 2026-10-18"""
+        if not self.config.enabled:
+            return
+        nowMs = readMonotonicMs()
+        with self.lock:
+            tombstoneUntilMs = self.tombstones.get(username)
+            if tombstoneUntilMs is not None:
+                if tombstoneUntilMs > nowMs:
+                    return
+                self.tombstones.pop(username, None)
+            self.entries[username] = (authVersion, nowMs + self.config.ttlMs)
+            self.entries.move_to_end(username)
+            while len(self.entries) > self.config.maxEntries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, username: str) -> None:
+        """설명: 사용자 항목 제거와 TTL 동안의 재캐시 차단 부작용: tombstone 기록. 갱신일: 2026-10-18"""
+        if not self.config.enabled:
+            return
+        nowMs = readMonotonicMs()
+        with self.lock:
+            self.entries.pop(username, None)
+            self.tombstones[username] = nowMs + self.config.ttlMs
+            self.invalidations += 1
+            if len(self.tombstones) > self.config.maxEntries:
+                self.tombstones = {
+                    key: untilMs for key, untilMs in self.tombstones.items() if untilMs > nowMs
+                }
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.tombstones.clear()
+
+    def snapshot(self) -> dict[str, int | bool]:
+        """설명: 관측용 캐시 통계 반환값: 활성 여부/TTL/항목 수/hit·miss·무효화 수 dict. 갱신일: 2026-10-18"""
+        with self.lock:
+            return {
+                "enabled": self.config.enabled,
+                "ttlMs": self.config.ttlMs,
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+authVersionCache = AuthVersionCache()
+invalidationPollerTask: asyncio.Task[None] | None = None
+
+
+def _readNonNegativeInt(section, key: str, envName: str, fallback: int) -> int:
+    rawValue = os.getenv(envName)
+    if rawValue is None and section is not None:
+        rawValue = section.get(key)
+    if rawValue is None or not str(rawValue).strip():
+        return fallback
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"AUTH {key} must be an integer") from error
+    if value < 0:
+        raise ValueError(f"AUTH {key} must not be negative")
+    return value
+
+
+def configureAuthVersionCache(config) -> AuthVersionCacheConfig:
+    """
+    설명: [AUTH] auth_version_cache_ttl_ms/auth_version_cache_max_entries/auth_version_invalidation_poll_ms(ENV 우선) 반영
+    처리 규칙: TTL 0이면 캐시를 끄고 매 요청 DB 조회(기존 동작), TTL이 곧 비밀번호 변경 후 허용 staleness 상한
+    실패 동작: 음수/정수 아님은 ValueError
+    갱신일: 2026-10-18
+    """
+    global authVersionCache
+    section = config["AUTH"] if config is not None and "AUTH" in config else None
+    cacheConfig = AuthVersionCacheConfig(
+        ttlMs=_readNonNegativeInt(section, "auth_version_cache_ttl_ms", "AUTH_VERSION_CACHE_TTL_MS", 0),
+        maxEntries=_readNonNegativeInt(
+            section,
+            "auth_version_cache_max_entries",
+            "AUTH_VERSION_CACHE_MAX_ENTRIES",
+            10_000,
+        ),
+        pollIntervalMs=_readNonNegativeInt(
+            section,
+            "auth_version_invalidation_poll_ms",
+            "AUTH_VERSION_INVALIDATION_POLL_MS",
+            0,
+        ),
+    )
+    authVersionCache = AuthVersionCache(cacheConfig)
+    return cacheConfig
+
+
+def getCachedAuthVersion(username: str) -> int | None:
+    return authVersionCache.get(username)
+
+
+def storeCachedAuthVersion(username: str, authVersion: int) -> None:
+    authVersionCache.set(username, authVersion)
+
+
+def invalidateCachedAuthVersion(username: str) -> None:
+    """설명: 현재 worker의 사용자 authVersion 캐시 무효화 부작용: tombstone 기록. 갱신일: 2026-10-18"""
+    if isinstance(username, str) and username.strip():
+        authVersionCache.invalidate(username.strip())
+
+
+def isAuthVersionInvalidationChannelEnabled() -> bool:
+    return authVersionCache.config.enabled and authVersionCache.config.pollIntervalMs > 0
+
+
+def getAuthVersionEventRetentionMs() -> int:
+    return authVersionCache.config.eventRetentionMs
+
+
+def getAuthVersionCacheStats() -> dict[str, int | bool]:
+    return authVersionCache.snapshot()
+
+
+async def runAuthVersionInvalidationPoller(
+    fetchEvents: Callable[[int], Awaitable[list[tuple[str, int]]]],
+    startAfterMs: int,
+) -> None:
+    """
+    설명: 다른 worker가 기록한 무효화 이벤트를 주기적으로 읽어 로컬 캐시를 무효화
+    처리 규칙: 이벤트 커서는 만료 시각(변경 시각 + 보존 시간) 기준이며, 커밋 지연을 위해 overlap 구간을 재조회
+    실패 동작: 조회 실패는 경고 로그 후 다음 주기에 재시도
+    갱신일: 2026-10-18
+    """
+    cursorMs = startAfterMs
+    intervalSeconds = authVersionCache.config.pollIntervalMs / 1000.0
+    while True:
+        await asyncio.sleep(intervalSeconds)
+        try:
+            events = await fetchEvents(cursorMs - AUTH_VERSION_EVENT_OVERLAP_MS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.warning("auth version invalidation poll failed: error=%s", type(error).__name__)
+            continue
+        for username, expiresAtMs in events:
+            invalidateCachedAuthVersion(username)
+            cursorMs = max(cursorMs, expiresAtMs)
+
+
+def startAuthVersionInvalidationPoller(
+    fetchEvents: Callable[[int], Awaitable[list[tuple[str, int]]]],
+    nowMs: int,
+) -> bool:
+    """설명: 교차 worker 무효화 poller 시작 반환값: 채널 비활성 또는 이미 실행 중이면 False. 갱신일: 2026-10-18"""
+    global invalidationPollerTask
+    if not isAuthVersionInvalidationChannelEnabled():
+        return False
+    if invalidationPollerTask is not None and not invalidationPollerTask.done():
+        return False
+    startAfterMs = nowMs + authVersionCache.config.eventRetentionMs
+    invalidationPollerTask = asyncio.create_task(runAuthVersionInvalidationPoller(fetchEvents, startAfterMs))
+    return True
+
+
+async def stopAuthVersionInvalidationPoller() -> None:
+    """설명: 실행 중인 무효화 poller 취소 부작용: 전역 task 참조 해제. 갱신일: 2026-10-18"""
+    global invalidationPollerTask
+    task = invalidationPollerTask
+    invalidationPollerTask = None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
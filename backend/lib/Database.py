@@ -1,23 +1,45 @@
 """
 파일명: backend/lib/Database.py
 작성자: LSH
-갱신일: 2026-01-18
+갱신일: 2026-10-18
 설명: DB 매니저/쿼리 로더/디렉터리 감시. 파라미터 바인딩 강제·PII 마스킹 로깅
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
 import re
 import threading
 import time
-from typing import Any
+from typing import Any, AsyncIterator
 import contextvars
+from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlsplit, urlunsplit
 
 from databases import Database
-from lib.Logger import logger
+from lib.DatabasePool import (
+    DatabasePoolConfig,
+    DatabasePoolTelemetry,
+    DatabasePoolTimeoutError,
+    buildDatabasePoolOptions,
+    instrumentDatabasePool,
+    readDatabaseUrlFamily,
+)
+from lib.Logger import logStructured, logger
+from lib.Metrics import registerGauge
+from lib.ReadReplica import (
+    REPLICA_LAG_SQL_POSTGRESQL,
+    REPLICA_PING_SQL,
+    ReplicaConfig,
+    ReplicaRouter,
+    ReplicaTarget,
+    isReplicaUnavailableError,
+)
+from lib.QueryMetrics import recordQueryTiming
 from lib.ServiceError import ServiceError
 from lib.SqlLoader import parseSqlFile, scanSqlQueries
 from sqlalchemy import MetaData
@@ -63,6 +85,10 @@ reloadPublicationLock = threading.Lock()
 # 요청 단위 SQL 카운터(ContextVar)
 sqlCountVar: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("sql_count", default=None)
 
+# 읽기 replica 라우팅: transaction() 안이거나 같은 요청에서 쓰기가 있었으면 primary에서 읽는다(read-your-writes).
+transactionActiveVar: contextvars.ContextVar[bool] = contextvars.ContextVar("db_transaction_active", default=False)
+primaryReadPinVar: contextvars.ContextVar[list[bool] | None] = contextvars.ContextVar("db_primary_read_pin", default=None)
+
 SENSITIVE_SQL_PARAM_NAME_PATTERN = re.compile(
     r"(pass(word)?|pwd|secret|token|refresh|access|auth|cookie|session|csrf|email|eml|phone|mobile|tel|ssn|rrn|card|account|acct|bank)",
     re.IGNORECASE,
@@ -122,6 +148,10 @@ UNSAFE_INLINE_LITERAL_PREDICATE_PATTERN = re.compile(
     """,
     re.IGNORECASE | re.VERBOSE,
 )
+SQL_LOG_CODE_TOKEN_PATTERN = re.compile(
+    rf"(?<!:):(?P<param>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<number>{SQL_NUMERIC_LITERAL_PATTERN.pattern})",
+    re.VERBOSE,
+)
 SQL_PREDICATE_CLAUSE_PATTERN = re.compile(
     r"(?<!:)\b(?:group\s+by|order\s+by|where|having|join|on|limit|offset|fetch|returning|union|intersect|except)\b",
     re.IGNORECASE,
@@ -210,6 +240,32 @@ def getManager(name: str | None = None) -> "DatabaseManager" | None:
     return dbManagers.get(key)
 
 
+def getDatabasePoolStats() -> dict[str, dict[str, Any]]:
+    """설명: 등록된 DatabaseManager별 연결 풀 통계 반환값: {DB 이름: 풀 통계 dict}. 갱신일: 2026-10-18"""
+    stats: dict[str, dict[str, Any]] = {}
+    for name, manager in sorted(dbManagers.items()):
+        if hasattr(manager, "getPoolStats"):
+            stats[name] = manager.getPoolStats()
+    return stats
+
+
+def collectPoolGauge(key: str) -> dict[tuple[str, ...], float]:
+    samples: dict[tuple[str, ...], float] = {}
+    for name, poolStats in getDatabasePoolStats().items():
+        samples[(name,)] = float(poolStats.get(key) or 0)
+        for replicaStats in poolStats.get("replicas") or []:
+            samples[(replicaStats["label"],)] = float(replicaStats.get(key) or 0)
+    return samples
+
+
+registerGauge("db_pool_connections_in_use", lambda: collectPoolGauge("inUse"))
+registerGauge("db_pool_connections_idle", lambda: collectPoolGauge("idle"))
+registerGauge("db_pool_waiters", lambda: collectPoolGauge("waiters"))
+registerGauge("db_pool_max_size", lambda: collectPoolGauge("maxSize"))
+registerGauge("db_statement_cache_entries", lambda: collectPoolGauge("statementCacheEntries"))
+registerGauge("db_statement_cache_size", lambda: collectPoolGauge("statementCacheSize"))
+
+
 def incSqlCount(n: int = 1) -> None:
     """설명: 현재 컨텍스트 SQL 카운터 증 부작용: sqlCountVar 값 n만큼 증가. 갱신일: 2025-11-12"""
     try:
@@ -231,6 +287,341 @@ def resetSqlCount() -> None:
         pass
 
 
+def resetPrimaryReadPin() -> None:
+    """설명: 요청 시작/종료 시 read-your-writes 고정 해제 부작용: 새 mutable 플래그를 발급해 child task와 공유. 갱신일: 2026-10-18"""
+    primaryReadPinVar.set([False])
+
+
+def pinPrimaryReads() -> None:
+    """설명: 현재 요청의 이후 읽기를 primary로 고정 갱신일: 2026-10-18"""
+    holder = primaryReadPinVar.get()
+    if holder is None:
+        primaryReadPinVar.set([True])
+    else:
+        holder[0] = True
+
+
+def isPrimaryReadPinned() -> bool:
+    holder = primaryReadPinVar.get()
+    return bool(holder and holder[0])
+
+
+def markTransactionActive() -> contextvars.Token:
+    """설명: transaction() 경계 진입 표시 반환값: resetTransactionActive에 넘길 토큰. 갱신일: 2026-10-18"""
+    return transactionActiveVar.set(True)
+
+
+def resetTransactionActive(token: contextvars.Token) -> None:
+    transactionActiveVar.reset(token)
+
+
+def scanSqlSegments(query: str) -> list[tuple[str, str]]:
+    """설명: SQL을 실행 코드/문자열/인용 식별자/주석 구간으로 분리 반환값: (종류, 원문) 튜플 목록. 갱신일: 2026-07-11"""
+    sql = str(query or "")
+    segments: list[tuple[str, str]] = []
+    index = 0
+    codeStart = 0
+    length = len(sql)
+
+    def appendCode(end: int) -> None:
+        if end > codeStart:
+            segments.append(("code", sql[codeStart:end]))
+
+    while index < length:
+        char = sql[index]
+        nextChar = sql[index + 1] if index + 1 < length else ""
+        isEscapeString = (
+            char in {"e", "E"}
+            and nextChar == "'"
+            and (index == 0 or not (sql[index - 1].isalnum() or sql[index - 1] in {"_", "$"}))
+        )
+        if char == "'" or isEscapeString:
+            appendCode(index)
+            start = index
+            escapeBackslash = isEscapeString
+            index += 2 if isEscapeString else 1
+            while index < length:
+                current = sql[index]
+                if escapeBackslash and current == "\\" and index + 1 < length:
+                    index += 2
+                    continue
+                if current == "'":
+                    if index + 1 < length and sql[index + 1] == "'":
+                        index += 2
+                        continue
+                    index += 1
+                    break
+                index += 1
+            segments.append(("string", sql[start:index]))
+            codeStart = index
+            continue
+        if char == "$":
+            delimiterMatch = re.match(r"\$(?:[a-zA-Z_][a-zA-Z0-9_]*)?\$", sql[index:])
+            if delimiterMatch is not None:
+                delimiter = delimiterMatch.group(0)
+                contentStart = index + len(delimiter)
+                closeIndex = sql.find(delimiter, contentStart)
+                if closeIndex >= 0:
+                    appendCode(index)
+                    end = closeIndex + len(delimiter)
+                    segments.append(("string", sql[index:end]))
+                    index = end
+                    codeStart = index
+                    continue
+        if char == '"':
+            appendCode(index)
+            start = index
+            index += 1
+            while index < length:
+                if sql[index] == '"':
+                    if index + 1 < length and sql[index + 1] == '"':
+                        index += 2
+                        continue
+                    index += 1
+                    break
+                index += 1
+            segments.append(("quoted", sql[start:index]))
+            codeStart = index
+            continue
+        if char == "-" and nextChar == "-":
+            appendCode(index)
+            start = index
+            index += 2
+            while index < length and sql[index] != "\n":
+                index += 1
+            segments.append(("comment", sql[start:index]))
+            codeStart = index
+            continue
+        if char == "/" and nextChar == "*":
+            appendCode(index)
+            start = index
+            index += 2
+            commentDepth = 1
+            while index < length and commentDepth > 0:
+                current = sql[index]
+                following = sql[index + 1] if index + 1 < length else ""
+                if current == "/" and following == "*":
+                    commentDepth += 1
+                    index += 2
+                    continue
+                if current == "*" and following == "/":
+                    commentDepth -= 1
+                    index += 2
+                    continue
+                index += 1
+            segments.append(("comment", sql[start:index]))
+            codeStart = index
+            continue
+        index += 1
+
+    appendCode(length)
+    return segments
+
+def extractSqlPlaceholders(query: str) -> set[str]:
+    """설명: 쿼리에서 :name 형 플레이스홀더 목록 추출 반환값: 바인딩 이름 집합(set). 갱신일: 2025-11-12"""
+    # PostgreSQL 캐스트(::jsonb)와 구분하기 위해 단일 ':'만 파라미터로 본다.
+    placeholders: set[str] = set()
+    for kind, raw in scanSqlSegments(query):
+        if kind == "code":
+            placeholders.update(re.findall(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)", raw))
+    return placeholders
+
+def normalizeSqlForLog(query: str) -> str:
+    """설명: SQL 원문의 빈 줄/불필요 공백 정리해 사람 읽기 좋게 반환값: 로그 출력용 정규화 SQL 문자열. 갱신일: 2026-02-22"""
+    rawLines = str(query or "").splitlines()
+    lines: list[str] = []
+    for rawLine in rawLines:
+        line = re.sub(r"\s+", " ", rawLine).strip()
+        if not line:
+            continue
+        lines.append(line)
+    return "\n".join(lines).rstrip(";")
+
+def hasUnsafeInlineLiteralPredicate(query: str) -> bool:
+    """설명: raw SQL의 WHERE/HAVING 절에 직접 박힌 문자열/숫자 리터럴 조건이 있는지 판별 반환값: 위험 패턴이면 True. 갱신일: 2026-06-04"""
+    analysisParts: list[str] = []
+    for kind, raw in scanSqlSegments(query):
+        if kind == "string":
+            analysisParts.append(SQL_STRING_LITERAL_MARKER)
+        elif kind == "code":
+            analysisParts.append(SQL_NUMERIC_LITERAL_PATTERN.sub(SQL_NUMERIC_LITERAL_MARKER, raw))
+        else:
+            analysisParts.append("".join("\n" if char == "\n" else " " for char in raw))
+    analysisSql = "".join(analysisParts)
+    if not analysisSql.strip():
+        return False
+    clauseMatches = list(SQL_PREDICATE_CLAUSE_PATTERN.finditer(analysisSql))
+    matchDepths: list[int] = []
+    matchIndexByStart = {match.start(): index for index, match in enumerate(clauseMatches)}
+    parenthesisDepth = 0
+    for charIndex, char in enumerate(analysisSql):
+        clauseIndex = matchIndexByStart.get(charIndex)
+        if clauseIndex is not None:
+            while len(matchDepths) <= clauseIndex:
+                matchDepths.append(parenthesisDepth)
+        if char == "(":
+            parenthesisDepth += 1
+        elif char == ")":
+            parenthesisDepth = max(0, parenthesisDepth - 1)
+
+    pendingJoinDepths: set[int] = set()
+    predicateStarts: list[tuple[int, re.Match[str], int]] = []
+    for matchIndex, clauseMatch in enumerate(clauseMatches):
+        clauseName = re.sub(r"\s+", " ", clauseMatch.group(0).strip().lower())
+        clauseDepth = matchDepths[matchIndex]
+        if clauseName == "join":
+            pendingJoinDepths.add(clauseDepth)
+            continue
+        if clauseName == "on":
+            if clauseDepth in pendingJoinDepths:
+                predicateStarts.append((matchIndex, clauseMatch, clauseDepth))
+                pendingJoinDepths.discard(clauseDepth)
+            continue
+        if clauseName in {"where", "having"}:
+            predicateStarts.append((matchIndex, clauseMatch, clauseDepth))
+        pendingJoinDepths.discard(clauseDepth)
+
+    for matchIndex, clauseMatch, clauseDepth in predicateStarts:
+        regionEnd = len(analysisSql)
+        for nextIndex in range(matchIndex + 1, len(clauseMatches)):
+            if matchDepths[nextIndex] <= clauseDepth:
+                regionEnd = clauseMatches[nextIndex].start()
+                break
+        predicateRegion = analysisSql[clauseMatch.end() : regionEnd]
+        if (
+            SQL_ANALYSIS_CAST_LITERAL_PREFIX_PATTERN.search(predicateRegion) is not None
+            or UNSAFE_INLINE_LITERAL_PREDICATE_PATTERN.search(predicateRegion) is not None
+        ):
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    """
+    설명: 이름 기반 쿼리를 로드 시점에 한 번 분석해 둔 불변 레코드
+    처리 규칙: 플레이스홀더 집합/로그용 정규화 SQL과 그 구간 분해 결과를 보관
+    갱신일: 2026-10-18
+    """
+
+    name: str
+    sql: str
+    placeholders: frozenset[str]
+    normalizedLogText: str
+    logSegments: tuple[tuple[str, str], ...]
+    isReadOnly: bool = False
+    multiValuesTemplate: tuple[str, tuple[str, ...], str] | None = None
+
+
+SQL_READ_STATEMENT_PATTERN = re.compile(r"^\s*(?:select|with)\b", re.IGNORECASE)
+# 쓰기/잠금 키워드와 연결(세션) 상태를 읽는 함수(changes/ROW_COUNT 등)는 replica로 보내면 안 된다.
+SQL_WRITE_KEYWORD_PATTERN = re.compile(
+    r"\b(?:insert|update|delete|merge|upsert|returning|into|lock|share|nextval|setval|pg_advisory_\w*"
+    r"|changes|total_changes|row_count|found_rows|last_insert_rowid|last_insert_id|lastval|currval)\b",
+    re.IGNORECASE,
+)
+
+
+def isReadOnlySql(query: str) -> bool:
+    """설명: 주석/문자열을 제외한 SQL이 SELECT/WITH로 시작하고 쓰기·잠금·세션 상태 키워드가 없는지 판별 갱신일: 2026-10-18"""
+    code = " ".join(raw for kind, raw in scanSqlSegments(query) if kind == "code")
+    return SQL_READ_STATEMENT_PATTERN.match(code) is not None and SQL_WRITE_KEYWORD_PATTERN.search(code) is None
+
+
+SQL_INSERT_STATEMENT_PATTERN = re.compile(r"^\s*insert\b", re.IGNORECASE)
+SQL_VALUES_TUPLE_PATTERN = re.compile(r"\bvalues\s*\(", re.IGNORECASE)
+SQL_PLACEHOLDER_PATTERN = re.compile(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)")
+SQL_MULTI_VALUES_UNSAFE_TAIL_PATTERN = re.compile(r"^\s*,|\bdo\s+update\b|\bvalues\b", re.IGNORECASE)
+# 문장당 바인드 수 상한(PostgreSQL 32767, SQLite 3.32+ 32766, MySQL 65535)보다 약간 낮게 잡는다.
+MULTI_VALUES_MAX_BIND_PARAMS = 32000
+
+
+def buildMultiValuesTemplate(query: str) -> tuple[str, tuple[str, ...], str] | None:
+    """
+    설명: 단일 행 INSERT ... VALUES (...)를 다중 행으로 펼치기 위한 템플릿 분해
+    처리 규칙: 모든 플레이스홀더가 VALUES 튜플 안에 있을 때만 대상. 이미 다중 행이거나 ON CONFLICT DO UPDATE
+    (같은 문장에서 같은 키를 두 번 갱신하면 PostgreSQL 오류)가 뒤따르면 제외
+    반환값: (VALUES 앞부분, 튜플 조각(짝수 인덱스=SQL 텍스트, 홀수 인덱스=바인드 이름), 튜플 뒷부분) 또는 None
+    갱신일: 2026-10-18
+    """
+    segments = scanSqlSegments(query)
+    if not SQL_INSERT_STATEMENT_PATTERN.match("".join(raw for kind, raw in segments if kind == "code")):
+        return None
+    head: list[str] = []
+    rowParts: list[str] = []
+    rowText: list[str] = []
+    tail: list[str] = []
+    tailCode: list[str] = []
+    state = "head"
+    depth = 0
+    for kind, raw in segments:
+        if kind != "code":
+            (head if state == "head" else rowText if state == "row" else tail).append(raw)
+            continue
+        position = 0
+        while position < len(raw):
+            if state == "head":
+                match = SQL_VALUES_TUPLE_PATTERN.search(raw, position)
+                if match is None:
+                    head.append(raw[position:])
+                    break
+                head.append(raw[position : match.end() - 1])
+                position = match.end() - 1
+                state = "row"
+            elif state == "row":
+                placeholder = SQL_PLACEHOLDER_PATTERN.match(raw, position)
+                if placeholder is not None:
+                    rowParts.extend(("".join(rowText), placeholder.group(1)))
+                    rowText = []
+                    position = placeholder.end()
+                    continue
+                char = raw[position]
+                depth += 1 if char == "(" else -1 if char == ")" else 0
+                rowText.append(char)
+                position += 1
+                if depth == 0:
+                    state = "tail"
+            else:
+                tail.append(raw[position:])
+                tailCode.append(raw[position:])
+                break
+    if state != "tail":
+        return None
+    rowParts.append("".join(rowText))
+    tailCodeText = "".join(tailCode)
+    headText = "".join(head)
+    if SQL_MULTI_VALUES_UNSAFE_TAIL_PATTERN.search(tailCodeText) or SQL_PLACEHOLDER_PATTERN.search(tailCodeText):
+        return None
+    if extractSqlPlaceholders(headText):
+        return None
+    return headText, tuple(rowParts), "".join(tail)
+
+
+@lru_cache(maxsize=256)
+def buildMultiValuesSql(template: tuple[str, tuple[str, ...], str], rowCount: int) -> str:
+    """설명: 템플릿을 rowCount행 VALUES로 펼친 SQL 생성(행 i의 바인드는 :이름__i) 반환값: SQL 문자열. 갱신일: 2026-10-18"""
+    head, rowParts, tail = template
+    rows = [
+        "".join(part if position % 2 == 0 else f":{part}__{index}" for position, part in enumerate(rowParts))
+        for index in range(rowCount)
+    ]
+    return head + ",\n".join(rows) + tail
+
+
+def prepareQuery(queryName: str, sql: str) -> PreparedQuery:
+    """설명: SQL 원문을 PreparedQuery로 사전 분석 반환값: 호출마다 재사용할 불변 분석 레코드. 갱신일: 2026-10-18"""
+    normalized = normalizeSqlForLog(sql)
+    return PreparedQuery(
+        name=queryName,
+        sql=sql,
+        placeholders=frozenset(extractSqlPlaceholders(sql)),
+        normalizedLogText=normalized,
+        logSegments=tuple(scanSqlSegments(normalized)),
+        isReadOnly=isReadOnlySql(sql),
+        multiValuesTemplate=buildMultiValuesTemplate(sql),
+    )
+
+
 class QueryManager:
     instance: "QueryManager" | None = None
 
@@ -251,10 +642,26 @@ class QueryManager:
             self.queries: dict[str, str] = {}
             self.nameToFile: dict[str, str] = {}
             self.fileToNames: dict[str, set[str]] = {}
+            self.preparedQueries: dict[str, PreparedQuery] = {}
 
     def setAll(self, queries: dict[str, str], nameToFile: dict[str, str], fileToNames: dict[str, set[str]]):
-        """설명: 전체 쿼리/파일 매핑 덮어쓰기 부작용: QueryManager 내부 인덱스 3종 전체 교체. 갱신일: 2025-11-12"""
-        self.queries = dict(queries or {})
+        """
+        설명: 전체 쿼리/파일 매핑 덮어쓰기
+        처리 규칙: 게시 전에 모든 쿼리를 PreparedQuery로 분석하고, SQL이 바뀌지 않은 항목은 기존 레코드를 재사용
+        부작용: QueryManager 내부 인덱스 4종 전체 교체
+        갱신일: 2026-10-18
+        """
+        nextQueries = dict(queries or {})
+        previousPrepared = getattr(self, "preparedQueries", {}) or {}
+        nextPrepared: dict[str, PreparedQuery] = {}
+        for name, sql in nextQueries.items():
+            existing = previousPrepared.get(name)
+            if existing is not None and existing.sql == sql:
+                nextPrepared[name] = existing
+            else:
+                nextPrepared[name] = prepareQuery(name, sql)
+        self.preparedQueries = nextPrepared
+        self.queries = nextQueries
         self.nameToFile = dict(nameToFile or {})
         self.fileToNames = {fp: set(names) for fp, names in (fileToNames or {}).items()}
 
@@ -262,16 +669,75 @@ class QueryManager:
         """설명: 이름으로 SQL 텍스트 조회 반환값: 등록된 SQL 문자열 또 None. 갱신일: 2025-11-12"""
         return self.queries.get(queryName)
 
+    def getPreparedQuery(self, queryName: str) -> PreparedQuery | None:
+        """설명: 이름으로 사전 분석된 쿼리 조회 반환값: PreparedQuery 또는 None. 갱신일: 2026-10-18"""
+        return self.preparedQueries.get(queryName)
+
+
+DEFAULT_SQL_LOG_SLOW_MS = 500
+DEFAULT_ITERATE_BATCH_SIZE = 500
+DEFAULT_EXECUTE_MANY_CHUNK_SIZE = 500
+
+
+def readSqlLogIntEnv(name: str, fallback: int) -> int:
+    raw = str(os.getenv(name, "")).strip()
+    if not raw:
+        return fallback
+    try:
+        value = int(raw)
+    except ValueError:
+        return fallback
+    return value if value >= 0 else fallback
+
+
+def readSqlLogSampleRate() -> int:
+    """설명: SQL_LOG_SAMPLE_RATE(queryName별 1/N 기록) 조회 반환값: 1 이상 정수(기본 1=전부 기록). 갱신일: 2026-10-18"""
+    return max(1, readSqlLogIntEnv("SQL_LOG_SAMPLE_RATE", 1))
+
+
+def readSqlLogSlowMs() -> int:
+    """설명: 샘플링과 무관하게 항상 기록할 느린 쿼리 기준(SQL_LOG_SLOW_MS) 조회 반환값: ms. 갱신일: 2026-10-18"""
+    return readSqlLogIntEnv("SQL_LOG_SLOW_MS", DEFAULT_SQL_LOG_SLOW_MS)
+
 
 class DatabaseManager:
     """설명: databases. Database 래퍼로 실행/바인딩 검증 담당 갱신일: 2025-11-12"""
 
-    def __init__(self, databaseUrl: str):
-        """설명: DB 연결 URL 기반 클라이언트 준비 부작용: databases.Database 및 QueryManager 참조 초기화. 갱신일: 2025-11-12"""
+    def __init__(
+        self,
+        databaseUrl: str,
+        poolConfig: DatabasePoolConfig | None = None,
+        name: str | None = None,
+        replicaConfig: ReplicaConfig | None = None,
+    ):
+        """
+        설명: DB 연결 URL 기반 클라이언트 준비
+        처리 규칙: poolConfig의 크기/수명/statement cache 설정을 드라이버 풀 인자로 전달(미지정 항목은 드라이버 기본값),
+        name은 풀 메트릭 db 라벨(미지정이면 DB 종류), replicaConfig.urls마다 같은 풀 설정의 읽기 전용 연결 준비
+        부작용: databases.Database 및 QueryManager 참조 초기화
+        갱신일: 2026-10-18
+        """
         self.databaseUrl = databaseUrl
-        self.database = Database(databaseUrl)
+        self.poolConfig = poolConfig or DatabasePoolConfig()
+        label = name or readDatabaseUrlFamily(databaseUrl)
+        self.poolTelemetry = DatabasePoolTelemetry(label)
+        self.driverPool: Any | None = None
+        self.database = Database(databaseUrl, **buildDatabasePoolOptions(databaseUrl, self.poolConfig))
+        self.replicaRouter: ReplicaRouter | None = None
+        self.replicaHealthTask: asyncio.Task | None = None
+        if replicaConfig is not None and replicaConfig.urls:
+            targets = [
+                ReplicaTarget(
+                    replicaUrl,
+                    Database(replicaUrl, **buildDatabasePoolOptions(replicaUrl, self.poolConfig)),
+                    f"{label}:replica{index}",
+                )
+                for index, replicaUrl in enumerate(replicaConfig.urls, start=1)
+            ]
+            self.replicaRouter = ReplicaRouter(replicaConfig, targets)
         self.metadata = MetaData()
         self.queryManager = QueryManager.getInstance()
+        self.queryLogSampleCounts: dict[str, int] = {}
 
     def maskParams(self, values: dict[str, Any] | None) -> dict[str, str]:
         """설명: 로그에 사용할 파라미터 키만 노출 반환값: 입력 키 유지하고 값 모두 ***로 치환한 dict. 갱신일: 2025-11-12"""
@@ -281,105 +747,7 @@ class DatabaseManager:
 
     def scanSqlSegments(self, query: str) -> list[tuple[str, str]]:
         """설명: SQL을 실행 코드/문자열/인용 식별자/주석 구간으로 분리 반환값: (종류, 원문) 튜플 목록. 갱신일: 2026-07-11"""
-        sql = str(query or "")
-        segments: list[tuple[str, str]] = []
-        index = 0
-        codeStart = 0
-        length = len(sql)
-
-        def appendCode(end: int) -> None:
-            if end > codeStart:
-                segments.append(("code", sql[codeStart:end]))
-
-        while index < length:
-            char = sql[index]
-            nextChar = sql[index + 1] if index + 1 < length else ""
-            isEscapeString = (
-                char in {"e", "E"}
-                and nextChar == "'"
-                and (index == 0 or not (sql[index - 1].isalnum() or sql[index - 1] in {"_", "$"}))
-            )
-            if char == "'" or isEscapeString:
-                appendCode(index)
-                start = index
-                escapeBackslash = isEscapeString
-                index += 2 if isEscapeString else 1
-                while index < length:
-                    current = sql[index]
-                    if escapeBackslash and current == "\\" and index + 1 < length:
-                        index += 2
-                        continue
-                    if current == "'":
-                        if index + 1 < length and sql[index + 1] == "'":
-                            index += 2
-                            continue
-                        index += 1
-                        break
-                    index += 1
-                segments.append(("string", sql[start:index]))
-                codeStart = index
-                continue
-            if char == "$":
-                delimiterMatch = re.match(r"\$(?:[a-zA-Z_][a-zA-Z0-9_]*)?\$", sql[index:])
-                if delimiterMatch is not None:
-                    delimiter = delimiterMatch.group(0)
-                    contentStart = index + len(delimiter)
-                    closeIndex = sql.find(delimiter, contentStart)
-                    if closeIndex >= 0:
-                        appendCode(index)
-                        end = closeIndex + len(delimiter)
-                        segments.append(("string", sql[index:end]))
-                        index = end
-                        codeStart = index
-                        continue
-            if char == '"':
-                appendCode(index)
-                start = index
-                index += 1
-                while index < length:
-                    if sql[index] == '"':
-                        if index + 1 < length and sql[index + 1] == '"':
-                            index += 2
-                            continue
-                        index += 1
-                        break
-                    index += 1
-                segments.append(("quoted", sql[start:index]))
-                codeStart = index
-                continue
-            if char == "-" and nextChar == "-":
-                appendCode(index)
-                start = index
-                index += 2
-                while index < length and sql[index] != "\n":
-                    index += 1
-                segments.append(("comment", sql[start:index]))
-                codeStart = index
-                continue
-            if char == "/" and nextChar == "*":
-                appendCode(index)
-                start = index
-                index += 2
-                commentDepth = 1
-                while index < length and commentDepth > 0:
-                    current = sql[index]
-                    following = sql[index + 1] if index + 1 < length else ""
-                    if current == "/" and following == "*":
-                        commentDepth += 1
-                        index += 2
-                        continue
-                    if current == "*" and following == "/":
-                        commentDepth -= 1
-                        index += 2
-                        continue
-                    index += 1
-                segments.append(("comment", sql[start:index]))
-                codeStart = index
-                continue
-            index += 1
-
-        appendCode(length)
-        return segments
+        return scanSqlSegments(query)
 
     def decodeSqlStringSegment(self, rawLiteral: str) -> str:
         """설명: 민감도 판정을 위해 단일/escape/dollar SQL 문자열의 내용만 복원 반환값: 문자열 내부 값. 갱신일: 2026-07-11"""
@@ -412,23 +780,11 @@ class DatabaseManager:
 
     def extractPlaceholders(self, query: str) -> set[str]:
         """설명: 쿼리에서 :name 형 플레이스홀더 목록 추출 반환값: 바인딩 이름 집합(set). 갱신일: 2025-11-12"""
-        # PostgreSQL 캐스트(::jsonb)와 구분하기 위해 단일 ':'만 파라미터로 본다.
-        placeholders: set[str] = set()
-        for kind, raw in self.scanSqlSegments(query):
-            if kind == "code":
-                placeholders.update(re.findall(r"(?<!:):([a-zA-Z_][a-zA-Z0-9_]*)", raw))
-        return placeholders
+        return extractSqlPlaceholders(query)
 
     def normalizeQueryForLog(self, query: str) -> str:
         """설명: SQL 원문의 빈 줄/불필요 공백 정리해 사람 읽기 좋게 반환값: 로그 출력용 정규화 SQL 문자열. 갱신일: 2026-02-22"""
-        rawLines = str(query or "").splitlines()
-        lines: list[str] = []
-        for rawLine in rawLines:
-            line = re.sub(r"\s+", " ", rawLine).strip()
-            if not line:
-                continue
-            lines.append(line)
-        return "\n".join(lines).rstrip(";")
+        return normalizeSqlForLog(query)
 
     def truncateLogText(self, text: str, maxLength: int = 1200) -> str:
         """설명: 과도하게 긴 SQL 로그 잘라 단일 라인 로그 폭주 방지 반환값: 길 제한이 적용된 문자열. 갱신일: 2026-02-22"""
@@ -439,12 +795,14 @@ class DatabaseManager:
     def mapDatabaseBackendRuntimeError(self, error: Exception) -> Exception:
         """
         설명: 런타임 DB backend 중단 예외를 서비스 계층 공통 코드로 정규화
-        처리 규칙: query not found(ValueError)는 그대로 유지하고, known backend-not-running만 DB_NOT_READY로 승격
+        처리 규칙: query not found(ValueError)는 그대로 유지하고, known backend-not-running과 pool 획득 대기 초과만 DB_NOT_READY로 승격
         반환값: 재전파할 원본 예외 또는 ServiceError("DB_NOT_READY")
-        갱신일: 2026-06-24
+        갱신일: 2026-10-18
         """
         if isinstance(error, ValueError):
             return error
+        if isinstance(error, DatabasePoolTimeoutError):
+            return ServiceError("DB_NOT_READY")
         message = str(error or "").strip().lower()
         if isinstance(error, AssertionError) and "databasebackend is not running" in message:
             return ServiceError("DB_NOT_READY")
@@ -548,15 +906,19 @@ class DatabaseManager:
         text = str(safeValue).replace("'", "''")
         return f"'{text}'"
 
-    def renderQueryForLog(self, normalizedQuery: str, values: dict[str, Any] | None, revealLiteral: bool) -> str:
-        """설명: :name 플레이스홀더 로그용 리터럴로 치환한 SQL 생성 반환값: 바인딩 치환된 SQL 문자열. 갱신일: 2026-02-22"""
+    def renderQueryForLog(
+        self,
+        normalizedQuery: str,
+        values: dict[str, Any] | None,
+        revealLiteral: bool,
+        segments: tuple[tuple[str, str], ...] | None = None,
+    ) -> str:
+        """설명: :name 플레이스홀더 로그용 리터럴로 치환한 SQL 생성(사전 분해 구간이 있으면 재사용) 반환값: 바인딩 치환된 SQL 문자열. 갱신일: 2026-10-18"""
         params = values or {}
         rendered: list[str] = []
-        codeTokenPattern = re.compile(
-            rf"(?<!:):(?P<param>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<number>{SQL_NUMERIC_LITERAL_PATTERN.pattern})",
-            re.VERBOSE,
-        )
-        for kind, raw in self.scanSqlSegments(normalizedQuery):
+        if segments is None:
+            segments = tuple(self.scanSqlSegments(normalizedQuery))
+        for kind, raw in segments:
             if kind == "string":
                 literalValue = self.decodeSqlStringSegment(raw)
                 if revealLiteral and not self.isSensitiveSqlStringValue(literalValue):
@@ -569,7 +931,7 @@ class DatabaseManager:
                 continue
 
             lastEnd = 0
-            for match in codeTokenPattern.finditer(raw):
+            for match in SQL_LOG_CODE_TOKEN_PATTERN.finditer(raw):
                 rendered.append(raw[lastEnd : match.start()])
                 key = match.group("param")
                 if key is not None:
@@ -586,73 +948,177 @@ class DatabaseManager:
 
     def hasUnsafeInlineLiteralPredicate(self, query: str) -> bool:
         """설명: raw SQL의 WHERE/HAVING 절에 직접 박힌 문자열/숫자 리터럴 조건이 있는지 판별 반환값: 위험 패턴이면 True. 갱신일: 2026-06-04"""
-        analysisParts: list[str] = []
-        for kind, raw in self.scanSqlSegments(query):
-            if kind == "string":
-                analysisParts.append(SQL_STRING_LITERAL_MARKER)
-            elif kind == "code":
-                analysisParts.append(SQL_NUMERIC_LITERAL_PATTERN.sub(SQL_NUMERIC_LITERAL_MARKER, raw))
-            else:
-                analysisParts.append("".join("\n" if char == "\n" else " " for char in raw))
-        analysisSql = "".join(analysisParts)
-        if not analysisSql.strip():
-            return False
-        clauseMatches = list(SQL_PREDICATE_CLAUSE_PATTERN.finditer(analysisSql))
-        matchDepths: list[int] = []
-        matchIndexByStart = {match.start(): index for index, match in enumerate(clauseMatches)}
-        parenthesisDepth = 0
-        for charIndex, char in enumerate(analysisSql):
-            clauseIndex = matchIndexByStart.get(charIndex)
-            if clauseIndex is not None:
-                while len(matchDepths) <= clauseIndex:
-                    matchDepths.append(parenthesisDepth)
-            if char == "(":
-                parenthesisDepth += 1
-            elif char == ")":
-                parenthesisDepth = max(0, parenthesisDepth - 1)
-
-        pendingJoinDepths: set[int] = set()
-        predicateStarts: list[tuple[int, re.Match[str], int]] = []
-        for matchIndex, clauseMatch in enumerate(clauseMatches):
-            clauseName = re.sub(r"\s+", " ", clauseMatch.group(0).strip().lower())
-            clauseDepth = matchDepths[matchIndex]
-            if clauseName == "join":
-                pendingJoinDepths.add(clauseDepth)
-                continue
-            if clauseName == "on":
-                if clauseDepth in pendingJoinDepths:
-                    predicateStarts.append((matchIndex, clauseMatch, clauseDepth))
-                    pendingJoinDepths.discard(clauseDepth)
-                continue
-            if clauseName in {"where", "having"}:
-                predicateStarts.append((matchIndex, clauseMatch, clauseDepth))
-            pendingJoinDepths.discard(clauseDepth)
+        return hasUnsafeInlineLiteralPredicate(query)
 
-        for matchIndex, clauseMatch, clauseDepth in predicateStarts:
-            regionEnd = len(analysisSql)
-            for nextIndex in range(matchIndex + 1, len(clauseMatches)):
-                if matchDepths[nextIndex] <= clauseDepth:
-                    regionEnd = clauseMatches[nextIndex].start()
-                    break
-            predicateRegion = analysisSql[clauseMatch.end() : regionEnd]
-            if (
-                SQL_ANALYSIS_CAST_LITERAL_PREFIX_PATTERN.search(predicateRegion) is not None
-                or UNSAFE_INLINE_LITERAL_PREDICATE_PATTERN.search(predicateRegion) is not None
-            ):
-                return True
-        return False
+    def shouldEmitQueryLog(self, logName: str, durationMs: float | None, failed: bool) -> bool:
+        """
+        설명: SQL 로그 출력 여부를 레벨/샘플링/느린 쿼리/실패 기준으로 판정
+        처리 규칙: INFO 비활성이면 항상 False, 실패 또는 SQL_LOG_SLOW_MS 이상은 항상 True,
+        그 외는 queryName별 SQL_LOG_SAMPLE_RATE(1/N, 기본 1=전부) 중 첫 번째만 True
+        갱신일: 2026-10-18
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return False
+        if failed:
+            return True
+        if durationMs is not None and durationMs >= readSqlLogSlowMs():
+            return True
+        sampleRate = readSqlLogSampleRate()
+        if sampleRate <= 1:
+            return True
+        seen = self.queryLogSampleCounts.get(logName, 0)
+        self.queryLogSampleCounts[logName] = seen + 1
+        return seen % sampleRate == 0
 
-    def logQuery(self, op: str, query: str, values: dict[str, Any] | None = None, queryName: str | None = None) -> None:
-        """설명: SQL 로그 읽기 쉬운 최소 필드(queryName/sqlRendered)로 구성 부작용: logger.info로 단일 JSON 로그 기록. 갱신일: 2026-02-22"""
-        normalized = self.normalizeQueryForLog(query)
+    def buildQueryLogPayload(
+        self,
+        op: str,
+        query: str,
+        values: dict[str, Any] | None,
+        queryName: str | None,
+        prepared: PreparedQuery | None,
+        durationMs: float | None,
+        rowCount: int | None,
+        errorType: str | None,
+    ) -> dict[str, Any]:
+        """설명: SQL 로그 payload 생성(정규화/마스킹/리터럴 치환/절단) 반환값: db.query 이벤트 dict. 갱신일: 2026-10-18"""
         revealLiteral = self.shouldRevealSqlLiteralValues()
-        rendered = self.renderQueryForLog(normalized, values, revealLiteral)
+        if prepared is not None:
+            rendered = self.renderQueryForLog(
+                prepared.normalizedLogText, values, revealLiteral, segments=prepared.logSegments
+            )
+        else:
+            rendered = self.renderQueryForLog(self.normalizeQueryForLog(query), values, revealLiteral)
         payload: dict[str, Any] = {
             "event": "db.query",
             "sqlRendered": self.truncateLogText(rendered),
         }
         payload["queryName"] = queryName or op
-        logger.info(json.dumps(payload, ensure_ascii=False))
+        if durationMs is not None:
+            payload["durationMs"] = round(durationMs, 3)
+        if rowCount is not None:
+            payload["rowsAffected" if op in ("execute", "executeMany") else "rowsReturned"] = rowCount
+        if errorType:
+            payload["errorType"] = errorType
+        return payload
+
+    def logQuery(
+        self,
+        op: str,
+        query: str,
+        values: dict[str, Any] | None = None,
+        queryName: str | None = None,
+        prepared: PreparedQuery | None = None,
+        durationMs: float | None = None,
+        rowCount: int | None = None,
+        errorType: str | None = None,
+    ) -> None:
+        """
+        설명: SQL 실행 결과를 db.query 구조 로그 한 줄(queryName/sqlRendered/durationMs/행 수)로 기록
+        처리 규칙: 출력 대상일 때만 지연 payload를 넘겨, 실제 핸들러 출력 시점에만 렌더링/마스킹 수행
+        부작용: logStructured로 단일 구조 로그 기록(실패는 WARNING)
+        갱신일: 2026-10-18
+        """
+        logName = queryName or op
+        failed = errorType is not None
+        if not self.shouldEmitQueryLog(logName, durationMs, failed):
+            return
+        valuesSnapshot = dict(values) if values else None
+        logStructured(
+            logging.WARNING if failed else logging.INFO,
+            lambda: self.buildQueryLogPayload(
+                op, query, valuesSnapshot, queryName, prepared, durationMs, rowCount, errorType
+            ),
+        )
+
+    def chooseReadReplica(self, op: str, queryName: str | None, prepared: PreparedQuery | None) -> ReplicaTarget | None:
+        """
+        설명: 조회를 보낼 replica 선택
+        처리 규칙: replica_query_prefixes에 맞는 이름 기반 읽기 전용 fetch만 대상, transaction() 안이거나
+        같은 요청에서 쓰기가 있었으면(read-your-writes) primary 유지
+        반환값: healthy replica 또는 None(primary 사용)
+        갱신일: 2026-10-18
+        """
+        router = self.replicaRouter
+        if router is None or op == "execute" or prepared is None or not prepared.isReadOnly:
+            return None
+        if transactionActiveVar.get() or isPrimaryReadPinned() or not router.isEligibleQuery(queryName):
+            return None
+        return router.choose()
+
+    async def runOnDatabase(self, database: Any, op: str, query: str, values: dict[str, Any] | None) -> Any:
+        if op == "fetchOne":
+            return await database.fetch_one(query=query, values=values or {})
+        if op == "fetchAll":
+            return await database.fetch_all(query=query, values=values or {})
+        return await database.execute(query=query, values=values or {})
+
+    async def runStatement(
+        self,
+        op: str,
+        query: str,
+        values: dict[str, Any] | None,
+        queryName: str | None = None,
+        prepared: PreparedQuery | None = None,
+    ) -> Any:
+        """
+        설명: execute/fetchOne/fetchAll 드라이버 호출 공통 경로(SQL 카운터, 실행 시간 히스토그램, 결과/실패 로그)
+        처리 규칙: chooseReadReplica가 고른 replica에서 조회하고, replica 연결 장애면 제외 표시 후 primary에서 재시도.
+        primary 쓰기(execute 또는 읽기 전용이 아닌 쿼리)는 요청의 이후 읽기를 primary로 고정
+        실패 동작: 드라이버 예외는 실패 로그를 남긴 뒤 mapDatabaseBackendRuntimeError로 변환해 전파
+        반환값: 드라이버 원본 결과
+        갱신일: 2026-10-18
+        """
+        incSqlCount()
+        replica = self.chooseReadReplica(op, queryName, prepared)
+        if replica is not None:
+            startedAt = time.perf_counter()
+            try:
+                result = await self.runOnDatabase(replica.database, op, query, values)
+            except Exception as error:
+                if not isReplicaUnavailableError(error):
+                    durationMs = (time.perf_counter() - startedAt) * 1000.0
+                    recordQueryTiming(queryName or op, durationMs, failed=True)
+                    self.logQuery(op, query, values, queryName, prepared, durationMs, errorType=type(error).__name__)
+                    raise self.mapDatabaseBackendRuntimeError(error) from error
+                self.replicaRouter.markHealth(replica, False, error=error)
+            else:
+                durationMs = (time.perf_counter() - startedAt) * 1000.0
+                replica.reads += 1
+                replica.observeLatency(durationMs)
+                return self.finishStatement(op, query, values, queryName, prepared, durationMs, result)
+        elif op == "execute" or (prepared is not None and not prepared.isReadOnly):
+            pinPrimaryReads()
+        startedAt = time.perf_counter()
+        try:
+            result = await self.runOnDatabase(self.database, op, query, values)
+        except Exception as error:
+            durationMs = (time.perf_counter() - startedAt) * 1000.0
+            recordQueryTiming(queryName or op, durationMs, failed=True)
+            self.logQuery(op, query, values, queryName, prepared, durationMs, errorType=type(error).__name__)
+            raise self.mapDatabaseBackendRuntimeError(error) from error
+        durationMs = (time.perf_counter() - startedAt) * 1000.0
+        return self.finishStatement(op, query, values, queryName, prepared, durationMs, result)
+
+    def finishStatement(
+        self,
+        op: str,
+        query: str,
+        values: dict[str, Any] | None,
+        queryName: str | None,
+        prepared: PreparedQuery | None,
+        durationMs: float,
+        result: Any,
+    ) -> Any:
+        if op == "fetchOne":
+            rowCount = 0 if result is None else 1
+        elif op == "fetchAll":
+            rowCount = len(result) if result is not None else 0
+        else:
+            rowCount = result if isinstance(result, int) and not isinstance(result, bool) else None
+        recordQueryTiming(queryName or op, durationMs, rowCount)
+        self.logQuery(op, query, values, queryName, prepared, durationMs, rowCount)
+        return result
 
     def validateBindParameters(
         self,
@@ -671,67 +1137,70 @@ class DatabaseManager:
         allowStaticSqlLiteralPredicate: bool = False,
     ):
         """설명: 내부 SQL 실행 경로용 바인드/리터럴 검증 헬퍼 실패 동작: 누락/미사용/치환오용이면 ValueError 발생. 갱신일: 2026-06-04"""
-        values = values or {}
-        placeholders = self.extractPlaceholders(query)
-        provided = set(values.keys())
-
         if not allowStaticSqlLiteralPredicate and self.hasUnsafeInlineLiteralPredicate(query):
-            logger.warning(
-                json.dumps(
-                    {
-                        "event": "db.bind.warn",
-                        "msg": "unsafe inline literal predicate without bind params",
-                    },
-                    ensure_ascii=False,
-                )
+            logStructured(
+                logging.WARNING,
+                {
+                    "event": "db.bind.warn",
+                    "msg": "unsafe inline literal predicate without bind params",
+                },
             )
             raise ValueError("DB_400_INLINE_LITERAL_UNSAFE")
+        self.checkBindNames(self.extractPlaceholders(query), values)
+
+    def validatePreparedBindParameters(self, prepared: PreparedQuery, values: dict[str, Any] | None) -> None:
+        """
+        설명: 사전 분석된 이름 기반 쿼리의 바인드 검증(집합 비교만 수행)
+        처리 규칙: 레지스트리 SQL은 정적 리터럴 조건을 허용하므로 인라인 리터럴 판정은 생략
+        실패 동작: 누락/미사용/치환오용이면 ValueError 발생
+        갱신일: 2026-10-18
+        """
+        self.checkBindNames(prepared.placeholders, values)
+
+    def checkBindNames(self, placeholders: set[str] | frozenset[str], values: dict[str, Any] | None) -> None:
+        """설명: 플레이스홀더 집합과 전달 파라미터 키 비교 실패 동작: 누락/미사용/치환오용이면 ValueError 발생. 갱신일: 2026-10-18"""
+        provided = set((values or {}).keys())
 
         if provided and not placeholders:
 
             # 값만 있고 바인딩이 없으면 문자열 치환 오용 가능성
-            logger.warning(
-                json.dumps(
-                    {
-                        "event": "db.bind.warn",
-                        "msg": "values provided but no bind placeholders",
-                    },
-                    ensure_ascii=False,
-                )
+            logStructured(
+                logging.WARNING,
+                {
+                    "event": "db.bind.warn",
+                    "msg": "values provided but no bind placeholders",
+                },
             )
             raise ValueError("DB_400_BIND_REQUIRED")
 
         missing = placeholders - provided
         if missing:
-            logger.warning(
-                json.dumps(
-                    {
-                        "event": "db.bind.warn",
-                        "msg": "missing bind params",
-                        "missing": sorted(list(missing)),
-                    },
-                    ensure_ascii=False,
-                )
+            logStructured(
+                logging.WARNING,
+                {
+                    "event": "db.bind.warn",
+                    "msg": "missing bind params",
+                    "missing": sorted(list(missing)),
+                },
             )
             raise ValueError("DB_400_PARAM_MISSING")
 
         extra = provided - placeholders
         if extra:
-            logger.warning(
-                json.dumps(
-                    {
-                        "event": "db.bind.warn",
-                        "msg": "unused bind params",
-                        "unused": sorted(list(extra)),
-                    },
-                    ensure_ascii=False,
-                )
+            logStructured(
+                logging.WARNING,
+                {
+                    "event": "db.bind.warn",
+                    "msg": "unused bind params",
+                    "unused": sorted(list(extra)),
+                },
             )
             raise ValueError("DB_400_PARAM_UNUSED")
 
     async def connect(self):
         """설명: DB 연결 시작 및 SQLite 튜닝 적용 부작용: 연결 성립 후 WAL/timeout/synchronous pragma 시도. 갱신일: 2025-11-12"""
         await self.database.connect()
+        self.driverPool = instrumentDatabasePool(self.database, self.poolTelemetry, self.poolConfig.acquireTimeoutMs)
         logger.info(f"Connected to database {maskDatabaseUrl(self.databaseUrl)}")
 
         # SQLite 잠금 오류를 줄이기 위한 pragma 적용
@@ -742,10 +1211,110 @@ class DatabaseManager:
                 await self.database.execute("PRAGMA synchronous=NORMAL;")
         except Exception:
             pass
+        await self.connectReplicas()
+
+    async def connectReplicas(self) -> None:
+        """
+        설명: replica 연결과 주기 상태 점검 시작
+        처리 규칙: 연결에 실패한 replica는 제외 상태로 두고 상태 점검 루프가 복귀를 재시도(기동은 막지 않음)
+        부작용: replica_health_interval_ms 주기의 백그라운드 task 생성
+        갱신일: 2026-10-18
+        """
+        router = self.replicaRouter
+        if router is None:
+            return
+        for target in router.targets:
+            await self.connectReplica(target)
+        await self.refreshReplicaHealth()
+        self.replicaHealthTask = asyncio.create_task(self.runReplicaHealthLoop())
+
+    async def connectReplica(self, target: ReplicaTarget) -> bool:
+        if target.database.is_connected:
+            return True
+        try:
+            await target.database.connect()
+        except Exception as error:
+            self.replicaRouter.markHealth(target, False, error=error)
+            logStructured(
+                logging.WARNING,
+                {"event": "db.replica.connect_failed", "replica": target.label, "error": type(error).__name__},
+            )
+            return False
+        target.driverPool = instrumentDatabasePool(target.database, target.telemetry, self.poolConfig.acquireTimeoutMs)
+        logger.info(f"Connected to read replica {maskDatabaseUrl(target.databaseUrl)}")
+        return True
+
+    async def refreshReplicaHealth(self) -> None:
+        """
+        설명: replica별 연결/복제 지연 점검
+        처리 규칙: PostgreSQL은 마지막 재생 시각 기준 lag(ms), 그 외는 ping만 확인. lag가 replica_max_lag_ms를 넘거나
+        점검이 실패하면 제외, 기준을 만족하면 복귀
+        갱신일: 2026-10-18
+        """
+        router = self.replicaRouter
+        if router is None:
+            return
+        for target in router.targets:
+            if not await self.connectReplica(target):
+                continue
+            try:
+                if readDatabaseUrlFamily(target.databaseUrl) == "postgresql":
+                    row = await target.database.fetch_one(query=REPLICA_LAG_SQL_POSTGRESQL)
+                    lagMs = float(row["lagMs"] or 0) if row is not None else 0.0
+                else:
+                    await target.database.fetch_one(query=REPLICA_PING_SQL)
+                    lagMs = 0.0
+            except Exception as error:
+                router.markHealth(target, False, error=error)
+                continue
+            if lagMs > router.config.maxLagMs:
+                router.markHealth(target, False, lagMs=lagMs, error="replication lag exceeded")
+            else:
+                router.markHealth(target, True, lagMs=lagMs)
+
+    async def runReplicaHealthLoop(self) -> None:
+        intervalSec = self.replicaRouter.config.healthIntervalMs / 1000.0
+        while True:
+            await asyncio.sleep(intervalSec)
+            try:
+                await self.refreshReplicaHealth()
+            except Exception:
+                logger.exception("replica health check failed")
 
     async def disconnect(self):
-        """설명: 데이터베이스 연결 종료 부작용: pool/session 리소스 해제. 갱신일: 2025-11-12"""
+        """설명: 데이터베이스 연결 종료 부작용: pool/session 리소스 해제, replica 상태 점검 중지와 replica 연결 종료. 갱신일: 2026-10-18"""
+        if self.replicaHealthTask is not None:
+            self.replicaHealthTask.cancel()
+            try:
+                await self.replicaHealthTask
+            except asyncio.CancelledError:
+                pass
+            self.replicaHealthTask = None
+        if self.replicaRouter is not None:
+            for target in self.replicaRouter.targets:
+                if target.database.is_connected:
+                    await target.database.disconnect()
+                target.driverPool = None
+                target.healthy = False
         await self.database.disconnect()
+        self.driverPool = None
+
+    def getPoolStats(self) -> dict[str, Any]:
+        """
+        설명: 연결 풀 사용량과 획득 대기 통계
+        반환값: backend/min·max 크기/현재 연결 수/사용 중/유휴/대기 수/획득 수·타임아웃 수/획득 대기 p50·p95·max(ms)/
+        statement 캐시 용량·항목 수(asyncpg) dict,
+        replica가 있으면 replicas에 replica별 상태(healthy/lag/지연 EWMA/조회 수/제외 횟수)와 풀 통계 목록
+        갱신일: 2026-10-18
+        """
+        stats = {
+            "backend": readDatabaseUrlFamily(self.databaseUrl),
+            **self.poolTelemetry.snapshot(self.driverPool, self.poolConfig),
+        }
+        if self.replicaRouter is not None:
+            stats["replicaSelection"] = self.replicaRouter.config.selection
+            stats["replicas"] = [target.snapshot(self.poolConfig) for target in self.replicaRouter.targets]
+        return stats
 
     async def execute(self, query: str, values: dict[str, Any] | None = None, queryName: str | None = None) -> Any:
         """
@@ -755,14 +1324,7 @@ class DatabaseManager:
         갱신일: 2025-11-12
         """
         self._validateBindParameters(query, values, queryName=queryName, allowStaticSqlLiteralPredicate=False)
-        self.logQuery("execute", query, values, queryName)
-        incSqlCount()
-        try:
-            result = await self.database.execute(query=query, values=values or {})
-        except Exception as error:
-            raise self.mapDatabaseBackendRuntimeError(error) from error
-        logger.info(f"rows_affected={result}")
-        return result
+        return await self.runStatement("execute", query, values, queryName)
 
     async def fetchOne(
         self, query: str, values: dict[str, Any] | None = None, queryName: str | None = None
@@ -774,18 +1336,11 @@ class DatabaseManager:
         갱신일: 2025-11-12
         """
         self._validateBindParameters(query, values, queryName=queryName, allowStaticSqlLiteralPredicate=False)
-        self.logQuery("fetchOne", query, values, queryName)
-        incSqlCount()
-        try:
-            result = await self.database.fetch_one(query=query, values=values or {})
-        except Exception as error:
-            raise self.mapDatabaseBackendRuntimeError(error) from error
+        result = await self.runStatement("fetchOne", query, values, queryName)
         if result is not None:
             data: dict[str, Any] = dict(result)
-            logger.info("rows_returned=1")
             return data
         else:
-            logger.info("rows_returned=0")
             return None
 
     async def fetchAll(
@@ -798,80 +1353,167 @@ class DatabaseManager:
         갱신일: 2025-11-12
         """
         self._validateBindParameters(query, values, queryName=queryName, allowStaticSqlLiteralPredicate=False)
-        self.logQuery("fetchAll", query, values, queryName)
-        incSqlCount()
-        try:
-            result = await self.database.fetch_all(query=query, values=values or {})
-        except Exception as error:
-            raise self.mapDatabaseBackendRuntimeError(error) from error
+        result = await self.runStatement("fetchAll", query, values, queryName)
         if result is not None:
             data: list[dict[str, Any]] = [{column: row[column] for column in row.keys()} for row in result]  # type: ignore[index]
-            logger.info(f"rows_returned={len(data)}")
             return data
         else:
-            logger.info("rows_returned=0")
             return None
 
-    async def executeQuery(self, queryName: str, values: dict[str, Any] | None = None) -> Any:
-        """설명: 등록된 이름 기반 쿼리 실행 실패 동작: queryName 미등록이면 ValueError 발생. 갱신일: 2025-11-12"""
-        query = self.queryManager.getQuery(queryName)
-        if not query:
+    def getPreparedQuery(self, queryName: str) -> PreparedQuery:
+        """설명: 이름 기반 쿼리의 사전 분석 레코드 조회 실패 동작: queryName 미등록이면 ValueError 발생. 갱신일: 2026-10-18"""
+        prepared = self.queryManager.getPreparedQuery(queryName)
+        if prepared is None or not prepared.sql:
             logger.info(f"cannot find query name : {queryName}")
             raise ValueError(f"Query not found: {queryName}")
-        self._validateBindParameters(query, values, queryName=queryName, allowStaticSqlLiteralPredicate=True)
-        self.logQuery("execute", query, values, queryName)
-        incSqlCount()
+        return prepared
+
+    async def executeQuery(self, queryName: str, values: dict[str, Any] | None = None) -> Any:
+        """설명: 등록된 이름 기반 쿼리 실행 실패 동작: queryName 미등록이면 ValueError 발생. 갱신일: 2025-11-12"""
+        prepared = self.getPreparedQuery(queryName)
+        self.validatePreparedBindParameters(prepared, values)
+        return await self.runStatement("execute", prepared.sql, values, queryName, prepared)
+
+    async def executeManyQuery(
+        self,
+        queryName: str,
+        valuesList: list[dict[str, Any]],
+        chunkSize: int = DEFAULT_EXECUTE_MANY_CHUNK_SIZE,
+    ) -> int:
+        """
+        설명: 같은 등록 쿼리를 여러 바인드 행으로 일괄 실행
+        처리 규칙: 바인드 형태는 첫 행으로 한 번만 검증하고 나머지 행은 키 집합이 같은지만 비교.
+        단일 행 INSERT ... VALUES는 chunkSize행(바인드 수 상한 이내)씩 다중 행 VALUES 한 문장으로, 그 외 문장은
+        chunk마다 연결 1개에서 드라이버 execute_many로 실행. chunk 1개를 SQL 1회로 세고, 실행 시간 히스토그램과
+        db.query 로그(op executeMany, 전체 행 수)는 한 번만 기록
+        실패 동작: 미등록/바인드 불일치는 실행 전에 ValueError. chunk 사이 원자성은 없으므로 필요하면 transaction() 안에서 호출
+        반환값: 실행한 바인드 행 수
+        갱신일: 2026-10-18
+        """
+        if chunkSize < 1:
+            raise ValueError("chunkSize must be at least 1")
+        prepared = self.getPreparedQuery(queryName)
+        rows = [row or {} for row in valuesList]
+        if not rows:
+            return 0
+        self.validatePreparedBindParameters(prepared, rows[0])
+        firstKeys = rows[0].keys()
+        for row in rows[1:]:
+            if row.keys() != firstKeys:
+                self.checkBindNames(prepared.placeholders, row)
+        template = prepared.multiValuesTemplate
+        rowsPerChunk = chunkSize
+        if template is not None and prepared.placeholders:
+            rowsPerChunk = max(1, min(chunkSize, MULTI_VALUES_MAX_BIND_PARAMS // len(prepared.placeholders)))
+        pinPrimaryReads()
+        startedAt = time.perf_counter()
+        executedRows = 0
         try:
-            result = await self.database.execute(query=query, values=values or {})
+            for offset in range(0, len(rows), rowsPerChunk):
+                chunk = rows[offset : offset + rowsPerChunk]
+                incSqlCount()
+                if template is not None:
+                    binds = {f"{name}__{index}": value for index, row in enumerate(chunk) for name, value in row.items()}
+                    await self.database.execute(query=buildMultiValuesSql(template, len(chunk)), values=binds)
+                else:
+                    await self.database.execute_many(query=prepared.sql, values=chunk)
+                executedRows += len(chunk)
         except Exception as error:
+            durationMs = (time.perf_counter() - startedAt) * 1000.0
+            recordQueryTiming(queryName, durationMs, executedRows, failed=True)
+            self.logQuery(
+                "executeMany", prepared.sql, rows[0], queryName, prepared, durationMs, executedRows, type(error).__name__
+            )
             raise self.mapDatabaseBackendRuntimeError(error) from error
-        logger.info(f"rows_affected={result}")
-        return result
+        durationMs = (time.perf_counter() - startedAt) * 1000.0
+        recordQueryTiming(queryName, durationMs, executedRows)
+        self.logQuery("executeMany", prepared.sql, rows[0], queryName, prepared, durationMs, executedRows)
+        return executedRows
 
     async def fetchOneQuery(self, queryName: str, values: dict[str, Any] | None = None) -> dict[str, Any] | None:
         """설명: 등록 쿼리 중 단일 행 조회 실패 동작: queryName 미등록이면 ValueError 발생. 갱신일: 2025-11-12"""
-        query = self.queryManager.getQuery(queryName)
-        if not query:
-            logger.info(f"cannot find query name : {queryName}")
-            raise ValueError(f"Query not found: {queryName}")
-        self._validateBindParameters(query, values, queryName=queryName, allowStaticSqlLiteralPredicate=True)
-        self.logQuery("fetchOne", query, values, queryName)
-        incSqlCount()
-        try:
-            result = await self.database.fetch_one(query=query, values=values or {})
-        except Exception as error:
-            raise self.mapDatabaseBackendRuntimeError(error) from error
+        prepared = self.getPreparedQuery(queryName)
+        self.validatePreparedBindParameters(prepared, values)
+        result = await self.runStatement("fetchOne", prepared.sql, values, queryName, prepared)
         if result is not None:
             data: dict[str, Any] = dict(result)
-            logger.info("rows_returned=1")
             return data
         else:
-            logger.info("rows_returned=0")
             return None
 
     async def fetchAllQuery(
         self, queryName: str, values: dict[str, Any] | None = None
     ) -> list[dict[str, Any]] | None:
         """설명: 등록 쿼리 중 여러 행 조회 실패 동작: queryName 미등록이면 ValueError 발생. 갱신일: 2025-11-12"""
-        query = self.queryManager.getQuery(queryName)
-        if not query:
-            logger.info(f"cannot find query name : {queryName}")
-            raise ValueError(f"Query not found: {queryName}")
-        self._validateBindParameters(query, values, queryName=queryName, allowStaticSqlLiteralPredicate=True)
-        self.logQuery("fetchAll", query, values, queryName)
-        incSqlCount()
-        try:
-            result = await self.database.fetch_all(query=query, values=values or {})
-        except Exception as error:
-            raise self.mapDatabaseBackendRuntimeError(error) from error
+        prepared = self.getPreparedQuery(queryName)
+        self.validatePreparedBindParameters(prepared, values)
+        result = await self.runStatement("fetchAll", prepared.sql, values, queryName, prepared)
         if result is not None:
             data: list[dict[str, Any]] = [{column: row[column] for column in row.keys()} for row in result]  # type: ignore[index]
-            logger.info(f"rows_returned={len(data)}")
             return data
         else:
-            logger.info("rows_returned=0")
             return None
 
+    async def iterateQuery(
+        self,
+        queryName: str,
+        values: dict[str, Any] | None = None,
+        batchSize: int = DEFAULT_ITERATE_BATCH_SIZE,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        설명: 등록 쿼리 결과를 batchSize 행 단위 dict 목록으로 나눠 전달하는 스트리밍 조회(async generator)
+        처리 규칙: databases iterate()로 행을 읽어(PostgreSQL은 서버 측 cursor) 전체 결과를 메모리에 올리지 않음.
+        바인드 검증/SQL 카운터/replica 라우팅은 fetchAllQuery와 같고, 실행 시간 히스토그램과 db.query 로그는
+        마지막 행까지 읽은 뒤(또는 실패 시) 전체 행 수로 한 번 기록
+        실패 동작: queryName 미등록/바인드 불일치는 첫 batch 전에 ValueError, 드라이버 예외는 mapDatabaseBackendRuntimeError로 변환.
+        replica 연결 장애는 첫 batch 전에만 primary로 재시도
+        부작용: 소비가 끝나거나 중단(aclose)될 때까지 연결 1개 점유
+        갱신일: 2026-10-18
+        """
+        if batchSize < 1:
+            raise ValueError("batchSize must be at least 1")
+        prepared = self.getPreparedQuery(queryName)
+        self.validatePreparedBindParameters(prepared, values)
+        incSqlCount()
+        replica = self.chooseReadReplica("iterate", queryName, prepared)
+        if replica is None and not prepared.isReadOnly:
+            pinPrimaryReads()
+        databases = [self.database] if replica is None else [replica.database, self.database]
+        startedAt = time.perf_counter()
+        rowCount = 0
+        try:
+            for database in databases:
+                rows = database.iterate(query=prepared.sql, values=values or {})
+                try:
+                    batch: list[dict[str, Any]] = []
+                    async for row in rows:
+                        batch.append({column: row[column] for column in row.keys()})  # type: ignore[index]
+                        if len(batch) >= batchSize:
+                            rowCount += len(batch)
+                            yield batch
+                            batch = []
+                    if batch:
+                        rowCount += len(batch)
+                        yield batch
+                except Exception as error:
+                    if database is self.database or rowCount or not isReplicaUnavailableError(error):
+                        raise
+                    self.replicaRouter.markHealth(replica, False, error=error)
+                    continue
+                finally:
+                    await rows.aclose()
+                if database is not self.database:
+                    replica.reads += 1
+                break
+        except Exception as error:
+            durationMs = (time.perf_counter() - startedAt) * 1000.0
+            recordQueryTiming(queryName, durationMs, failed=True)
+            self.logQuery("iterate", prepared.sql, values, queryName, prepared, durationMs, errorType=type(error).__name__)
+            raise self.mapDatabaseBackendRuntimeError(error) from error
+        durationMs = (time.perf_counter() - startedAt) * 1000.0
+        recordQueryTiming(queryName, durationMs, rowCount)
+        self.logQuery("iterate", prepared.sql, values, queryName, prepared, durationMs, rowCount)
+
 # =========================
 # 쿼리 로더 설정 및 동작
 # =========================
@@ -893,20 +1535,16 @@ def loadQueries() -> int:
     queries, nameToFile, fileToNames = scanSqlQueries(queryDir)
     QueryManager.getInstance().setAll(queries, nameToFile, fileToNames)
     durationMs = int((time.perf_counter() - started) * 1000)
-    try:
-        msg = json.dumps(
-            {
-                "event": "query.load",
-                "file": queryDir,
-                "keys": sorted(list(queries.keys()))[:20],
-                "count": len(queries),
-                "duration_ms": durationMs,
-            },
-            ensure_ascii=False,
-        )
-        logger.info(msg)
-    except Exception:
-        logger.info(f"queries_loaded dir={queryDir} count={len(queries)} duration_ms={durationMs}")
+    logStructured(
+        logging.INFO,
+        {
+            "event": "query.load",
+            "file": queryDir,
+            "keys": sorted(list(queries.keys()))[:20],
+            "count": len(queries),
+            "duration_ms": durationMs,
+        },
+    )
     return len(queries)
 
 
@@ -980,7 +1618,7 @@ def doReload() -> bool:
             "error": str(e),
             "duration_ms": durationMs,
         }
-        logger.error(json.dumps(errPayload, ensure_ascii=False))
+        logStructured(logging.ERROR, errPayload)
 
         # 실패 시 기존 상태 유지
         return False
@@ -993,7 +1631,7 @@ def doReload() -> bool:
         "count": len(newQueries),
         "duration_ms": durationMs,
     }
-    logger.info(json.dumps(payload, ensure_ascii=False))
+    logStructured(logging.INFO, payload)
     return True
 
 
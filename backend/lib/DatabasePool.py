@@ -0,0 +1,245 @@
+"""
+파일명: backend/lib/DatabasePool.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: [DATABASE*] 섹션의 연결 풀 설정(asyncpg/aiomysql)과 DatabaseManager별 풀 사용량·획득 대기 계측
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from lib.Metrics import observeHistogram
+from lib.QueryMetrics import QueryLatencyHistogram
+
+
+class DatabasePoolTimeoutError(TimeoutError):
+    """설명: pool_acquire_timeout_ms 안에 연결을 얻지 못한 경우 갱신일: 2026-10-18"""
+
+
+@dataclass(frozen=True)
+class DatabasePoolConfig:
+    minSize: int | None = None
+    maxSize: int | None = None
+    acquireTimeoutMs: int = 0
+    maxIdleSec: int | None = None
+    maxLifetimeSec: int | None = None
+    statementCacheSize: int | None = None
+
+
+def readDatabaseUrlFamily(databaseUrl: str) -> str:
+    scheme = str(databaseUrl or "").split(":", 1)[0].lower()
+    if scheme.startswith("postgres"):
+        return "postgresql"
+    if scheme.startswith("mysql") or scheme.startswith("mariadb"):
+        return "mysql"
+    if scheme.startswith("sqlite"):
+        return "sqlite"
+    return scheme
+
+
+def _readOptionalInt(section, sectionName: str, key: str, minimum: int) -> int | None:
+    rawValue = section.get(key) if section is not None else None
+    if rawValue is None or not str(rawValue).strip():
+        return None
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"{sectionName} {key} must be an integer") from error
+    if value < minimum:
+        raise ValueError(f"{sectionName} {key} must be at least {minimum}")
+    return value
+
+
+def readDatabasePoolConfig(section, sectionName: str = "DATABASE") -> DatabasePoolConfig:
+    """
+    설명: [DATABASE*] pool_min_size/pool_max_size/pool_acquire_timeout_ms/pool_max_idle_sec/pool_max_lifetime_sec/statement_cache_size 조회
+    처리 규칙: 비워 둔 항목은 드라이버 기본값 사용, pool_acquire_timeout_ms=0(기본)은 무제한 대기,
+    pool_max_idle_sec(유휴 연결 수명)와 pool_max_lifetime_sec(연결 최대 수명)는 지원하는 드라이버에만 전달
+    실패 동작: 정수 아님/범위 밖/min > max는 ValueError
+    갱신일: 2026-10-18
+    """
+    minSize = _readOptionalInt(section, sectionName, "pool_min_size", 0)
+    maxSize = _readOptionalInt(section, sectionName, "pool_max_size", 1)
+    if minSize is not None and maxSize is not None and minSize > maxSize:
+        raise ValueError(f"{sectionName} pool_min_size must not exceed pool_max_size")
+    return DatabasePoolConfig(
+        minSize=minSize,
+        maxSize=maxSize,
+        acquireTimeoutMs=_readOptionalInt(section, sectionName, "pool_acquire_timeout_ms", 0) or 0,
+        maxIdleSec=_readOptionalInt(section, sectionName, "pool_max_idle_sec", 0),
+        maxLifetimeSec=_readOptionalInt(section, sectionName, "pool_max_lifetime_sec", 0),
+        statementCacheSize=_readOptionalInt(section, sectionName, "statement_cache_size", 0),
+    )
+
+
+def buildDatabasePoolOptions(databaseUrl: str, poolConfig: DatabasePoolConfig | None) -> dict[str, Any]:
+    """
+    설명: 풀 설정을 databases.Database(**options)로 넘길 드라이버별 인자로 변환
+    처리 규칙: asyncpg는 min_size/max_size/max_inactive_connection_lifetime(pool_max_idle_sec)/statement_cache_size,
+    aiomysql은 min_size/max_size(backend가 minsize/maxsize로 변환)/pool_recycle(pool_max_lifetime_sec),
+    드라이버에 대응 옵션이 없는 항목(asyncpg 최대 수명, aiomysql 유휴 수명)은 넘기지 않음, SQLite는 요청마다 연결을 여는 구조라 인자 없음
+    반환값: 드라이버 인자 dict
+    갱신일: 2026-10-18
+    """
+    if poolConfig is None:
+        return {}
+    family = readDatabaseUrlFamily(databaseUrl)
+    if family not in ("postgresql", "mysql"):
+        return {}
+    options: dict[str, Any] = {}
+    if poolConfig.minSize is not None:
+        options["min_size"] = poolConfig.minSize
+    if poolConfig.maxSize is not None:
+        options["max_size"] = poolConfig.maxSize
+    if family == "postgresql":
+        if poolConfig.maxIdleSec is not None:
+            options["max_inactive_connection_lifetime"] = float(poolConfig.maxIdleSec)
+        if poolConfig.statementCacheSize is not None:
+            options["statement_cache_size"] = poolConfig.statementCacheSize
+    elif poolConfig.maxLifetimeSec is not None:
+        options["pool_recycle"] = poolConfig.maxLifetimeSec
+    return options
+
+
+class DatabasePoolTelemetry:
+    """
+    설명: 풀 연결 획득/반납 계측(사용 중·대기 수, 획득 수/타임아웃 수, 획득 대기 분포)
+    처리 규칙: 이벤트 루프 단일 스레드에서만 갱신되므로 잠금 없이 정수 증감
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.inUse = 0
+        self.waiters = 0
+        self.acquired = 0
+        self.acquireTimeouts = 0
+        self.acquireWait = QueryLatencyHistogram()
+
+    def recordAcquireWait(self, waitMs: float, failed: bool = False) -> None:
+        self.acquireWait.observe(waitMs, None, failed, False)
+        observeHistogram("db_pool_acquire_wait_seconds", (self.label,), waitMs / 1000.0)
+
+    def snapshot(self, pool: Any = None, poolConfig: DatabasePoolConfig | None = None) -> dict[str, Any]:
+        """설명: 관측용 풀 통계 반환값: 크기/사용 중/유휴/대기/획득 대기 분위수/statement 캐시 점유 dict. 갱신일: 2026-10-18"""
+        minSize, maxSize, size, idle = readPoolSizes(pool)
+        statementCacheSize, statementCacheEntries = readStatementCacheStats(pool)
+        if minSize is None and poolConfig is not None:
+            minSize = poolConfig.minSize
+        if maxSize is None and poolConfig is not None:
+            maxSize = poolConfig.maxSize
+        return {
+            "minSize": minSize,
+            "maxSize": maxSize,
+            "size": self.inUse + idle if size is None else size,
+            "inUse": self.inUse,
+            "idle": idle,
+            "waiters": self.waiters,
+            "acquired": self.acquired,
+            "acquireTimeouts": self.acquireTimeouts,
+            "acquireTimeoutMs": poolConfig.acquireTimeoutMs if poolConfig is not None else 0,
+            "acquireWaitP50Ms": round(self.acquireWait.percentile(0.50), 3),
+            "acquireWaitP95Ms": round(self.acquireWait.percentile(0.95), 3),
+            "acquireWaitMaxMs": round(self.acquireWait.maxMs, 3),
+            "statementCacheSize": statementCacheSize,
+            "statementCacheEntries": statementCacheEntries,
+        }
+
+
+def readPoolSizes(pool: Any) -> tuple[int | None, int | None, int | None, int]:
+    """설명: 드라이버 풀에서 (min, max, 현재 연결 수, 유휴 연결 수) 조회(asyncpg/aiomysql 외에는 크기 미상) 갱신일: 2026-10-18"""
+    if pool is None:
+        return None, None, None, 0
+    if hasattr(pool, "get_idle_size"):
+        return pool.get_min_size(), pool.get_max_size(), pool.get_size(), pool.get_idle_size()
+    if hasattr(pool, "freesize"):
+        return pool.minsize, pool.maxsize, pool.size, pool.freesize
+    return None, None, None, 0
+
+
+def readStatementCacheStats(pool: Any) -> tuple[int | None, int]:
+    """
+    설명: asyncpg 풀의 연결별 prepared statement 캐시 점유 조회
+    처리 규칙: 열린 연결의 캐시 항목 수를 합산하고, 용량은 연결당 statement_cache_size(asyncpg 기본 100)를 그대로 보고.
+    asyncpg는 캐시 적중/미적중 수를 노출하지 않으므로 항목 수(=연결별로 prepare된 서로 다른 SQL 수)로 재사용 여부를 관측
+    반환값: (연결당 용량, 캐시 항목 합계), asyncpg가 아니거나 연결이 없으면 (None, 0)
+    갱신일: 2026-10-18
+    """
+    capacity: int | None = None
+    entries = 0
+    for holder in getattr(pool, "_holders", None) or ():
+        statementCache = getattr(getattr(holder, "_con", None), "_stmt_cache", None)
+        if statementCache is None:
+            continue
+        capacity = statementCache.get_max_size()
+        entries += len(statementCache)
+    return capacity, entries
+
+
+class InstrumentedPool:
+    """
+    설명: databases backend의 드라이버 풀을 감싸 acquire/release를 계측하고 획득 대기 상한을 적용
+    처리 규칙: acquire/release 외 속성(close/wait_closed 등)은 원본 풀로 위임
+    실패 동작: 대기 상한 초과 시 DatabasePoolTimeoutError
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, pool: Any, telemetry: DatabasePoolTelemetry, acquireTimeoutMs: int = 0):
+        self.pool = pool
+        self.telemetry = telemetry
+        self.acquireTimeoutMs = acquireTimeoutMs
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool, name)
+
+    async def acquire(self) -> Any:
+        telemetry = self.telemetry
+        telemetry.waiters += 1
+        startedAt = time.perf_counter()
+        try:
+            if self.acquireTimeoutMs > 0:
+                connection = await asyncio.wait_for(self.pool.acquire(), self.acquireTimeoutMs / 1000.0)
+            else:
+                connection = await self.pool.acquire()
+        except asyncio.TimeoutError:
+            telemetry.acquireTimeouts += 1
+            telemetry.recordAcquireWait((time.perf_counter() - startedAt) * 1000.0, failed=True)
+            raise DatabasePoolTimeoutError(f"database pool acquire timed out after {self.acquireTimeoutMs}ms") from None
+        finally:
+            telemetry.waiters -= 1
+        telemetry.recordAcquireWait((time.perf_counter() - startedAt) * 1000.0)
+        telemetry.acquired += 1
+        telemetry.inUse += 1
+        return connection
+
+    async def release(self, connection: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            result = self.pool.release(connection, *args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            self.telemetry.inUse = max(0, self.telemetry.inUse - 1)
+
+
+def instrumentDatabasePool(database: Any, telemetry: DatabasePoolTelemetry, acquireTimeoutMs: int = 0) -> Any:
+    """
+    설명: 연결된 databases.Database의 backend 풀을 InstrumentedPool로 교체
+    처리 규칙: 이미 감싼 풀은 대기 상한만 갱신, backend에 풀이 없으면 아무것도 하지 않음
+    반환값: 드라이버 원본 풀(없으면 None)
+    갱신일: 2026-10-18
+    """
+    backend = getattr(database, "_backend", None)
+    pool = getattr(backend, "_pool", None)
+    if pool is None:
+        return None
+    if isinstance(pool, InstrumentedPool):
+        pool.acquireTimeoutMs = acquireTimeoutMs
+        return pool.pool
+    backend._pool = InstrumentedPool(pool, telemetry, acquireTimeoutMs)
+    return pool
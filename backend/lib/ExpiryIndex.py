@@ -0,0 +1,171 @@
+"""
+파일명: backend/lib/ExpiryIndex.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: 인메모리 저장소의 만료 정리를 전체 스캔 없이 처리하는 버킷형 timer wheel과 이를 쓰는 만료 dict
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from typing import Any
+
+
+class ExpiryIndex:
+    """
+    설명: 키 → 만료 tick 색인(tick = resolution 단위 시각)
+    처리 규칙: tick마다 삽입 순서를 보존하는 버킷(dict)을 두고 비어 있지 않은 tick만 min-heap에 올림,
+    등록/갱신/삭제는 버킷 간 이동이라 O(1), 만료 처리는 만료된 버킷만 순서대로 꺼내므로 항목당 상각 O(1)
+    갱신일: 2026-10-18
+    """
+
+    __slots__ = ("resolution", "buckets", "bucketHeap", "deadlines")
+
+    def __init__(self, resolution: float = 1.0):
+        if resolution <= 0:
+            raise ValueError("expiry index resolution must be positive")
+        self.resolution = resolution
+        self.buckets: dict[int, dict[Hashable, None]] = {}
+        self.bucketHeap: list[int] = []
+        self.deadlines: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.deadlines
+
+    def tickFor(self, expiresAt: float) -> int:
+        """설명: expiresAt 이후 첫 tick 경계(만료 전에 꺼내지 않도록 올림) 갱신일: 2026-10-18"""
+        return int(expiresAt // self.resolution) + 1
+
+    def schedule(self, key: Hashable, expiresAt: float) -> None:
+        """설명: 키의 만료 시각 등록/갱신(같은 tick이면 no-op) 갱신일: 2026-10-18"""
+        tick = self.tickFor(expiresAt)
+        previousTick = self.deadlines.get(key)
+        if previousTick == tick:
+            return
+        if previousTick is not None:
+            self.removeFromBucket(key, previousTick)
+        bucket = self.buckets.get(tick)
+        if bucket is None:
+            bucket = self.buckets[tick] = {}
+            heapq.heappush(self.bucketHeap, tick)
+            if len(self.bucketHeap) > 2 * len(self.buckets) + 64:
+                # 비워진 버킷 tick이 heap에 쌓이면 살아 있는 tick만으로 재구성
+                self.bucketHeap = list(self.buckets)
+                heapq.heapify(self.bucketHeap)
+        bucket[key] = None
+        self.deadlines[key] = tick
+
+    def removeFromBucket(self, key: Hashable, tick: int) -> None:
+        bucket = self.buckets.get(tick)
+        if bucket is None:
+            return
+        bucket.pop(key, None)
+        if not bucket:
+            del self.buckets[tick]
+
+    def discard(self, key: Hashable) -> None:
+        tick = self.deadlines.pop(key, None)
+        if tick is not None:
+            self.removeFromBucket(key, tick)
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.bucketHeap.clear()
+        self.deadlines.clear()
+
+    def popExpired(self, now: float) -> list[Hashable]:
+        """
+        설명: now 기준 만료 tick에 속한 키를 오래된 순서로 색인에서 제거
+        반환값: 만료 키 목록(호출자가 실제 저장소 정리/재등록 판단)
+        갱신일: 2026-10-18
+        """
+        expiredKeys: list[Hashable] = []
+        currentTick = int(now // self.resolution)
+        while self.bucketHeap and self.bucketHeap[0] <= currentTick:
+            tick = heapq.heappop(self.bucketHeap)
+            bucket = self.buckets.pop(tick, None)
+            if not bucket:
+                continue
+            for key in bucket:
+                del self.deadlines[key]
+            expiredKeys.extend(bucket)
+        return expiredKeys
+
+    def popOldest(self) -> Hashable | None:
+        """설명: 만료 시각이 가장 이른 키 1개 제거(같은 tick이면 먼저 등록된 순) 반환값: 비어 있으면 None. 갱신일: 2026-10-18"""
+        while self.bucketHeap:
+            tick = self.bucketHeap[0]
+            bucket = self.buckets.get(tick)
+            if not bucket:
+                heapq.heappop(self.bucketHeap)
+                continue
+            key = next(iter(bucket))
+            del bucket[key]
+            del self.deadlines[key]
+            if not bucket:
+                del self.buckets[tick]
+                heapq.heappop(self.bucketHeap)
+            return key
+        return None
+
+
+class ExpiringStore(MutableMapping):
+    """
+    설명: 값에서 만료 시각을 읽어 ExpiryIndex에 자동 등록하는 dict 호환 저장소
+    처리 규칙: sweep(now)은 만료된 항목만 제거, maxEntries를 넘으면 만료가 가장 이른 항목부터 축출
+    갱신일: 2026-10-18
+    """
+
+    def __init__(
+        self,
+        expiresAtOf: Callable[[Any], float],
+        *,
+        resolution: float = 1.0,
+        maxEntries: int | None = None,
+    ):
+        self.expiresAtOf = expiresAtOf
+        self.maxEntries = maxEntries
+        self.data: dict[Hashable, Any] = {}
+        self.index = ExpiryIndex(resolution)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self.data[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.data[key] = value
+        self.index.schedule(key, self.expiresAtOf(value))
+        if self.maxEntries is not None:
+            while len(self.data) > self.maxEntries:
+                oldestKey = self.index.popOldest()
+                if oldestKey is None:
+                    break
+                self.data.pop(oldestKey, None)
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self.data[key]
+        self.index.discard(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    def clear(self) -> None:
+        self.data.clear()
+        self.index.clear()
+
+    def sweep(self, now: float) -> int:
+        """설명: 만료 항목 제거 반환값: 제거한 항목 수. 갱신일: 2026-10-18"""
+        removed = 0
+        for key in self.index.popExpired(now):
+            if self.data.pop(key, None) is not None:
+                removed += 1
+        return removed
@@ -19,12 +19,14 @@ MESSAGES = MappingProxyType({
         "error.csrf_required": "CSRF required",
         "db.unavailable": "db unavailable",
         "obs.not_ready": "not ready",
+        "obs.not_found": "not found",
         "auth.state_store_unavailable": "temporary auth state storage unavailable",
         "error.db_not_ready": "database not ready",
         "error.server_error": "server error",
         "auth.user_exists": "user already exists",
         "auth.refresh_missing": "refresh token missing",
         "auth.refresh_invalid": "invalid refresh token",
+        "auth.hash_busy": "authentication is busy, retry shortly",
     }),
     "ko": MappingProxyType({
         "success": "성공",
@@ -33,12 +35,14 @@ MESSAGES = MappingProxyType({
         "error.csrf_required": "CSRF 토큰이 필요합니다",
         "db.unavailable": "DB를 사용할 수 없습니다",
         "obs.not_ready": "준비되지 않았습니다",
+        "obs.not_found": "찾을 수 없습니다",
         "auth.state_store_unavailable": "인증 상태 저장소를 일시적으로 사용할 수 없습니다",
         "error.db_not_ready": "데이터베이스가 준비되지 않았습니다",
         "error.server_error": "서버 오류가 발생했습니다",
         "auth.user_exists": "이미 가입된 사용자입니다",
         "auth.refresh_missing": "리프레시 토큰이 없습니다",
         "auth.refresh_invalid": "유효하지 않은 리프레시 토큰입니다",
+        "auth.hash_busy": "인증 요청이 많습니다. 잠시 후 다시 시도하세요",
     }),
 })
 
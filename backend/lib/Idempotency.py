@@ -1,14 +1,18 @@
 """
 파일명: backend/lib/Idempotency.py
 작성자: LSH
-갱신일: 2026-04-08
-설명: 멱등성 키 저장소/검증/중복 재실행 방지 공용 유틸
+갱신일: 2026-10-18
+설명: 멱등성 키 저장소/검증/중복 재실행 방지 공용 유틸과 만료 항목 주기 정리
 """
 
+import asyncio
 import hashlib
 import json
+import os
 import re
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 from lib import Database as DB
@@ -20,6 +24,37 @@ IDEMPOTENCY_STATUS_PENDING = "pending"
 IDEMPOTENCY_STATUS_DONE = "done"
 IDEMPOTENCY_TTL_MS = 24 * 60 * 60 * 1000
 IDEMPOTENCY_KEY_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{8,120}$")
+IDEMPOTENCY_PURGE_MAX_BATCHES_PER_RUN = 10
+
+
+@dataclass(frozen=True)
+class IdempotencyConfig:
+    purgeIntervalMs: int = 60_000
+    purgeBatchSize: int = 1000
+    coalesceWaitMs: int = 10_000
+    resultCacheEntries: int = 1024
+
+
+class InflightIdempotencyRequest:
+    """설명: 이 프로세스에서 선점(new)한 멱등성 요청 1건과 중복 요청이 기다릴 future 갱신일: 2026-10-18"""
+
+    __slots__ = ("payloadDigest", "future", "deadlineMs")
+
+    def __init__(self, payloadDigest: str, deadlineMs: int):
+        self.payloadDigest = payloadDigest
+        self.future: asyncio.Future[dict[str, Any] | None] = asyncio.get_running_loop().create_future()
+        self.deadlineMs = deadlineMs
+
+
+idempotencyConfig = IdempotencyConfig()
+idempotencySweeperTask: asyncio.Task[None] | None = None
+
+# (scope, key) → 진행 중 요청, (scope, key) → (payloadDigest, result, expiresAtMs) 완료 응답 LRU
+inflightIdempotencyRequests: dict[tuple[str, str], InflightIdempotencyRequest] = {}
+completedIdempotencyResults: OrderedDict[tuple[str, str], tuple[str, dict[str, Any], int]] = OrderedDict()
+
+# ensureTable을 이미 수행한 DB 매니저(재연결/재설정으로 매니저가 바뀌면 한 번 더 확인)
+idempotencyStoreManager: Any = None
 
 
 def getIdempotencyDbManager():
@@ -89,16 +124,82 @@ def buildIdempotencyPayloadDigest(scopeType: str, payload: dict[str, Any]) -> st
 
 async def ensureIdempotencyStore() -> Any:
     """
-    설명: 멱등성 저장소 테이블 준비와 기본 정리 수행
+    설명: 멱등성 저장소 테이블 준비(매니저당 1회)
+    처리 규칙: 스키마는 migrations/20261018_request_idempotency로 배포 시 적용하고, 여기서는 마이그레이션 누락 환경을 위해
+    매니저마다 처음 한 번만 ensureTable 실행, 만료 항목 정리는 요청 경로가 아닌 purge sweeper가 담당
     반환값: 멱등성 저장에 사용할 DB 매니저 인스턴스
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
+    global idempotencyStoreManager
     manager = getIdempotencyDbManager()
-    await manager.executeQuery("idempotency.ensureTable")
-    await manager.executeQuery("idempotency.deleteExpired", {"nowMs": int(time.time() * 1000)})
+    if manager is not idempotencyStoreManager:
+        await manager.executeQuery("idempotency.ensureTable")
+        idempotencyStoreManager = manager
     return manager
 
 
+def getCachedIdempotencyResult(cacheKey: tuple[str, str], payloadDigest: str, nowMs: int) -> dict[str, Any] | None:
+    """
+    설명: 완료 응답 LRU 조회(DB getEntry/json.loads 생략)
+    실패 동작: 같은 키의 payload가 다르면 ServiceError("IDEMPOTENCY_409_PAYLOAD_MISMATCH")
+    반환값: replay할 결과 dict(읽기 전용으로 공유), 없거나 만료면 None
+    갱신일: 2026-10-18
+    """
+    cached = completedIdempotencyResults.get(cacheKey)
+    if cached is None:
+        return None
+    cachedDigest, result, expiresAtMs = cached
+    if expiresAtMs <= nowMs:
+        completedIdempotencyResults.pop(cacheKey, None)
+        return None
+    if cachedDigest != payloadDigest:
+        raise ServiceError("IDEMPOTENCY_409_PAYLOAD_MISMATCH")
+    completedIdempotencyResults.move_to_end(cacheKey)
+    return result
+
+
+def storeCachedIdempotencyResult(cacheKey: tuple[str, str], payloadDigest: str, result: dict[str, Any], expiresAtMs: int) -> None:
+    maxEntries = idempotencyConfig.resultCacheEntries
+    if maxEntries <= 0:
+        return
+    completedIdempotencyResults[cacheKey] = (payloadDigest, result, expiresAtMs)
+    completedIdempotencyResults.move_to_end(cacheKey)
+    while len(completedIdempotencyResults) > maxEntries:
+        completedIdempotencyResults.popitem(last=False)
+
+
+async def awaitInflightIdempotencyResult(
+    cacheKey: tuple[str, str],
+    payloadDigest: str,
+    nowMs: int,
+) -> dict[str, Any] | None:
+    """
+    설명: 같은 프로세스에서 처리 중인 원 요청이 있으면 그 결과를 기다려 공유(in-flight coalescing)
+    처리 규칙: 원 요청이 실패/폐기되면 None을 받아 호출자가 DB 선점을 다시 시도, 대기 한도(coalesceWaitMs)가 지난 항목은 버림
+    실패 동작: payload 불일치는 409 mismatch, 대기 시간 초과는 409 in-progress
+    반환값: 원 요청 결과 dict 또는 None(진행 중 요청 없음/원 요청 실패)
+    갱신일: 2026-10-18
+    """
+    inflight = inflightIdempotencyRequests.get(cacheKey)
+    if inflight is None:
+        return None
+    if inflight.deadlineMs <= nowMs:
+        inflightIdempotencyRequests.pop(cacheKey, None)
+        return None
+    if inflight.payloadDigest != payloadDigest:
+        raise ServiceError("IDEMPOTENCY_409_PAYLOAD_MISMATCH")
+    try:
+        return await asyncio.wait_for(asyncio.shield(inflight.future), timeout=(inflight.deadlineMs - nowMs) / 1000.0)
+    except asyncio.TimeoutError as error:
+        raise ServiceError("IDEMPOTENCY_409_IN_PROGRESS") from error
+
+
+def releaseInflightIdempotencyRequest(cacheKey: tuple[str, str], result: dict[str, Any] | None) -> None:
+    inflight = inflightIdempotencyRequests.pop(cacheKey, None)
+    if inflight is not None and not inflight.future.done():
+        inflight.future.set_result(result)
+
+
 async def getIdempotencyEntry(scopeType: str, idempotencyKey: str) -> dict[str, Any] | None:
     """
     설명: scope/key 기준 멱등성 저장 항목 조회
@@ -118,33 +219,74 @@ async def getIdempotencyEntry(scopeType: str, idempotencyKey: str) -> dict[str,
 async def beginIdempotencyRequest(scopeType: str, idempotencyKey: str | None, payload: dict[str, Any]) -> dict[str, Any]:
     """
     설명: 멱등성 요청 시작 시 키 선점 또는 기존 결과 판별
-    실패 동작: 동일 키 payload 불일치면 409 mismatch, 처리 중이면 409 in-progress 발생
+    처리 규칙: 완료 응답 LRU → 같은 프로세스의 진행 중 요청 대기 → DB 선점 순으로 판별,
+    선점 충돌 항목이 이미 만료됐으면 그 키만 조건부 삭제 후 한 번 더 선점
+    실패 동작: 동일 키 payload 불일치면 409 mismatch, 다른 worker에서 처리 중이거나 대기 한도 초과면 409 in-progress 발생
     반환값: new/replay 상태와 payloadDigest/result를 담은 dict
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
     normalizedKey = normalizeIdempotencyKey(idempotencyKey)
     if normalizedKey is None:
         return {"status": "new", "payloadDigest": None}
-    manager = await ensureIdempotencyStore()
     payloadDigest = buildIdempotencyPayloadDigest(scopeType, payload)
+    cacheKey = (scopeType, normalizedKey)
+    for _ in range(2):
+        nowMs = int(time.time() * 1000)
+        cached = getCachedIdempotencyResult(cacheKey, payloadDigest, nowMs)
+        if cached is not None:
+            return {"status": "replay", "payloadDigest": payloadDigest, "result": cached}
+        if cacheKey not in inflightIdempotencyRequests:
+            break
+        shared = await awaitInflightIdempotencyResult(cacheKey, payloadDigest, nowMs)
+        if shared is not None:
+            return {"status": "replay", "payloadDigest": payloadDigest, "result": shared}
+
+    decision = await reserveIdempotencyKey(scopeType, normalizedKey, payloadDigest)
+    if decision.get("status") == "new" and idempotencyConfig.coalesceWaitMs > 0:
+        releaseInflightIdempotencyRequest(cacheKey, None)
+        inflightIdempotencyRequests[cacheKey] = InflightIdempotencyRequest(
+            payloadDigest,
+            int(time.time() * 1000) + idempotencyConfig.coalesceWaitMs,
+        )
+    return decision
+
+
+async def reserveIdempotencyKey(scopeType: str, normalizedKey: str, payloadDigest: str) -> dict[str, Any]:
+    """
+    설명: DB 저장소에서 키 선점 또는 기존 항목 판별
+    실패 동작: payload 불일치 409 mismatch, 처리 중 409 in-progress(같은 프로세스 요청이면 결과 대기)
+    반환값: new/replay 상태와 payloadDigest/result를 담은 dict
+    갱신일: 2026-10-18
+    """
+    manager = await ensureIdempotencyStore()
+    nowMs = int(time.time() * 1000)
     params = {
         "scopeType": scopeType,
         "idempotencyKey": normalizedKey,
         "statusCd": IDEMPOTENCY_STATUS_PENDING,
         "payloadDigest": payloadDigest,
         "responseJson": None,
-        "expiresAtMs": int(time.time() * 1000) + IDEMPOTENCY_TTL_MS,
+        "expiresAtMs": nowMs + IDEMPOTENCY_TTL_MS,
     }
-    try:
-        await manager.executeQuery("idempotency.insertEntry", params)
-        return {"status": "new", "payloadDigest": payloadDigest}
-    except Exception as error:
-        if not isDuplicateIdempotencyConstraintError(error):
-            raise
+    for attempt in range(2):
+        try:
+            await manager.executeQuery("idempotency.insertEntry", params)
+            return {"status": "new", "payloadDigest": payloadDigest}
+        except Exception as error:
+            if not isDuplicateIdempotencyConstraintError(error):
+                raise
 
-    existing = await getIdempotencyEntry(scopeType, normalizedKey)
-    if not existing:
-        raise ServiceError("IDEMPOTENCY_409_IN_PROGRESS")
+        existing = await getIdempotencyEntry(scopeType, normalizedKey)
+        if not existing:
+            raise ServiceError("IDEMPOTENCY_409_IN_PROGRESS")
+        if attempt == 0 and int(existing.get("expiresAtMs") or 0) <= nowMs:
+            # sweeper가 아직 지우지 않은 만료 항목은 이 키만 조건부 삭제 후 한 번 더 선점
+            await manager.executeQuery(
+                "idempotency.deleteExpiredEntry",
+                {"scopeType": scopeType, "idempotencyKey": normalizedKey, "nowMs": nowMs},
+            )
+            continue
+        break
     if existing.get("payloadDigest") != payloadDigest:
         raise ServiceError("IDEMPOTENCY_409_PAYLOAD_MISMATCH")
     if existing.get("statusCd") == IDEMPOTENCY_STATUS_DONE:
@@ -153,51 +295,79 @@ async def beginIdempotencyRequest(scopeType: str, idempotencyKey: str | None, pa
             try:
                 parsed = json.loads(responseJson)
                 if isinstance(parsed, dict):
+                    storeCachedIdempotencyResult(
+                        (scopeType, normalizedKey),
+                        payloadDigest,
+                        parsed,
+                        int(existing.get("expiresAtMs") or 0),
+                    )
                     return {"status": "replay", "payloadDigest": payloadDigest, "result": parsed}
             except Exception:
                 pass
+    # DB 선점 사이에 같은 프로세스의 원 요청이 등록됐으면 그 결과를 기다림
+    shared = await awaitInflightIdempotencyResult((scopeType, normalizedKey), payloadDigest, nowMs)
+    if shared is not None:
+        return {"status": "replay", "payloadDigest": payloadDigest, "result": shared}
     raise ServiceError("IDEMPOTENCY_409_IN_PROGRESS")
 
 
 async def completeIdempotencyRequest(scopeType: str, idempotencyKey: str | None, result: dict[str, Any]) -> None:
     """
     설명: 멱등성 처리 완료 후 replay용 응답 payload 저장
-    부작용: 저장 항목 status를 done으로 갱신하고 responseJson을 기록
-    갱신일: 2026-03-06
+    부작용: 저장 항목 status를 done으로 갱신하고 responseJson을 기록, 대기 중인 중복 요청에 결과 전달 후 LRU에 보관
+    갱신일: 2026-10-18
     """
     normalizedKey = normalizeIdempotencyKey(idempotencyKey)
     if normalizedKey is None:
         return
+    cacheKey = (scopeType, normalizedKey)
     manager = await ensureIdempotencyStore()
-    await manager.executeQuery(
-        "idempotency.completeEntry",
-        {
-            "scopeType": scopeType,
-            "idempotencyKey": normalizedKey,
-            "statusCd": IDEMPOTENCY_STATUS_DONE,
-            "responseJson": json.dumps(result, ensure_ascii=False, sort_keys=True, separators=(",", ":")),
-            "expiresAtMs": int(time.time() * 1000) + IDEMPOTENCY_TTL_MS,
-        },
-    )
+    responseJson = json.dumps(result, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    expiresAtMs = int(time.time() * 1000) + IDEMPOTENCY_TTL_MS
+    try:
+        await manager.executeQuery(
+            "idempotency.completeEntry",
+            {
+                "scopeType": scopeType,
+                "idempotencyKey": normalizedKey,
+                "statusCd": IDEMPOTENCY_STATUS_DONE,
+                "responseJson": responseJson,
+                "expiresAtMs": expiresAtMs,
+            },
+        )
+    except Exception:
+        releaseInflightIdempotencyRequest(cacheKey, None)
+        raise
+    # DB replay와 같은 JSON 형태로 정규화해 대기 중인 중복 요청/LRU가 공유
+    replayResult = json.loads(responseJson)
+    inflight = inflightIdempotencyRequests.get(cacheKey)
+    payloadDigest = inflight.payloadDigest if inflight is not None else None
+    releaseInflightIdempotencyRequest(cacheKey, replayResult)
+    if payloadDigest is not None:
+        storeCachedIdempotencyResult(cacheKey, payloadDigest, replayResult, expiresAtMs)
 
 
 async def cancelIdempotencyRequest(scopeType: str, idempotencyKey: str | None) -> None:
     """
     설명: 신규 선점한 pending 멱등성 항목을 실패 시 정리
-    부작용: scope/key 일치 항목을 저장소에서 제거
-    갱신일: 2026-06-24
+    부작용: scope/key 일치 항목을 저장소에서 제거하고 같은 키를 기다리던 중복 요청을 깨움
+    갱신일: 2026-10-18
     """
     normalizedKey = normalizeIdempotencyKey(idempotencyKey)
     if normalizedKey is None:
         return
-    manager = await ensureIdempotencyStore()
-    await manager.executeQuery(
-        "idempotency.deleteEntry",
-        {
-            "scopeType": scopeType,
-            "idempotencyKey": normalizedKey,
-        },
-    )
+    try:
+        manager = await ensureIdempotencyStore()
+        await manager.executeQuery(
+            "idempotency.deleteEntry",
+            {
+                "scopeType": scopeType,
+                "idempotencyKey": normalizedKey,
+            },
+        )
+    finally:
+        # 대기 중인 중복 요청은 None을 받아 DB 선점을 직접 다시 시도
+        releaseInflightIdempotencyRequest((scopeType, normalizedKey), None)
 
 
 async def discardIdempotencyReservation(scopeType: str, idempotencyKey: str | None) -> bool:
@@ -216,3 +386,104 @@ async def discardIdempotencyReservation(scopeType: str, idempotencyKey: str | No
         except Exception:
             pass
         return False
+
+
+def _readIdempotencyInt(section, key: str, envName: str, fallback: int, minimum: int) -> int:
+    rawValue = os.getenv(envName)
+    if rawValue is None and section is not None:
+        rawValue = section.get(key)
+    if rawValue is None or not str(rawValue).strip():
+        return fallback
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"IDEMPOTENCY {key} must be an integer") from error
+    if value < minimum:
+        raise ValueError(f"IDEMPOTENCY {key} must be at least {minimum}")
+    return value
+
+
+def configureIdempotency(config) -> IdempotencyConfig:
+    """
+    설명: [IDEMPOTENCY] purge_interval_ms/purge_batch_size/coalesce_wait_ms/result_cache_entries(ENV 우선) 반영
+    처리 규칙: purge_interval_ms=0이면 주기 정리를 끔(만료 키 재사용은 요청 경로에서 키 단위로 처리),
+    coalesce_wait_ms=0이면 처리 중 중복 요청은 기다리지 않고 즉시 409, result_cache_entries=0이면 완료 응답 LRU를 끔
+    실패 동작: 범위를 벗어난 정수/정수 아님은 ValueError
+    갱신일: 2026-10-18
+    """
+    global idempotencyConfig
+    section = config["IDEMPOTENCY"] if config is not None and "IDEMPOTENCY" in config else None
+    idempotencyConfig = IdempotencyConfig(
+        purgeIntervalMs=_readIdempotencyInt(
+            section, "purge_interval_ms", "IDEMPOTENCY_PURGE_INTERVAL_MS", 60_000, 0
+        ),
+        purgeBatchSize=_readIdempotencyInt(section, "purge_batch_size", "IDEMPOTENCY_PURGE_BATCH_SIZE", 1000, 1),
+        coalesceWaitMs=_readIdempotencyInt(section, "coalesce_wait_ms", "IDEMPOTENCY_COALESCE_WAIT_MS", 10_000, 0),
+        resultCacheEntries=_readIdempotencyInt(
+            section, "result_cache_entries", "IDEMPOTENCY_RESULT_CACHE_ENTRIES", 1024, 0
+        ),
+    )
+    completedIdempotencyResults.clear()
+    return idempotencyConfig
+
+
+async def purgeExpiredIdempotencyEntries(nowMs: int) -> int:
+    """
+    설명: 만료 항목을 purgeBatchSize 단위로 삭제(1회 최대 10배치, 잠금 시간 제한)
+    처리 규칙: DB 매니저가 준비되기 전이면 건너뛰고, 준비됐으면 요청 유입 여부와 무관하게 ensureIdempotencyStore 후 정리
+    (재기동 뒤 멱등성 요청이 없는 worker도 이전 실행이 남긴 만료 행을 지운다)
+    반환값: 삭제한 행 수
+    갱신일: 2026-10-18
+    """
+    if not DB.getManager():
+        return 0
+    manager = await ensureIdempotencyStore()
+    batchSize = idempotencyConfig.purgeBatchSize
+    purged = 0
+    for _ in range(IDEMPOTENCY_PURGE_MAX_BATCHES_PER_RUN):
+        rows = await manager.fetchAllQuery(
+            "idempotency.purgeExpiredBatch",
+            {"nowMs": nowMs, "batchSize": batchSize},
+        )
+        deleted = len(rows or [])
+        purged += deleted
+        if deleted < batchSize:
+            break
+    return purged
+
+
+async def runIdempotencySweeper() -> None:
+    intervalSeconds = idempotencyConfig.purgeIntervalMs / 1000.0
+    while True:
+        await asyncio.sleep(intervalSeconds)
+        try:
+            purged = await purgeExpiredIdempotencyEntries(int(time.time() * 1000))
+            if purged:
+                logger.info(f"idempotency expired entries purged: count={purged}")
+        except Exception as error:
+            logger.warning(f"idempotency purge failed: error={type(error).__name__}")
+
+
+def startIdempotencySweeper() -> bool:
+    """설명: 만료 항목 주기 정리 task 시작 반환값: 비활성 또는 이미 실행 중이면 False. 갱신일: 2026-10-18"""
+    global idempotencySweeperTask
+    if idempotencyConfig.purgeIntervalMs <= 0:
+        return False
+    if idempotencySweeperTask is not None and not idempotencySweeperTask.done():
+        return False
+    idempotencySweeperTask = asyncio.create_task(runIdempotencySweeper())
+    return True
+
+
+async def stopIdempotencySweeper() -> None:
+    """설명: 실행 중인 정리 task 취소 부작용: 전역 task 참조 해제. 갱신일: 2026-10-18"""
+    global idempotencySweeperTask
+    task = idempotencySweeperTask
+    idempotencySweeperTask = None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -0,0 +1,160 @@
+"""
+파일명: backend/lib/ListCursor.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: 목록 keyset(cursor) 페이지네이션용 불투명 cursor 인코딩/디코딩과 목록+전체 건수 조회 보조
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from lib.Casing import convertKeysToCamelCase
+
+LIST_CURSOR_VERSION = 1
+LIST_CURSOR_MAX_LENGTH = 512
+LIST_TOTAL_MODE_ORDER = ("exact", "has_more")
+
+
+def encodeCursorValue(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"t": "dt", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "d", "v": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"t": "dec", "v": str(value)}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def decodeCursorValue(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    typeName = value.get("t")
+    rawValue = value.get("v")
+    if not isinstance(rawValue, str):
+        raise ValueError("invalid cursor value")
+    if typeName == "dt":
+        return datetime.fromisoformat(rawValue)
+    if typeName == "d":
+        return date.fromisoformat(rawValue)
+    if typeName == "dec":
+        try:
+            return Decimal(rawValue)
+        except InvalidOperation as error:
+            raise ValueError("invalid cursor value") from error
+    raise ValueError("invalid cursor value")
+
+
+def encodeListCursor(sort: str, sortKeyValue: Any, rowId: Any) -> str:
+    """
+    설명: 마지막 행의 정렬 키와 PK를 불투명 cursor 문자열로 인코딩
+    처리 규칙: 정렬 키 타입(datetime/date/Decimal)을 보존해 다음 요청에서 DB 바인딩 타입 그대로 복원
+    반환값: base64url(JSON) cursor 문자열(패딩 제거)
+    갱신일: 2026-10-18
+    """
+    payload = {"v": LIST_CURSOR_VERSION, "s": sort, "k": encodeCursorValue(sortKeyValue), "id": int(rowId)}
+    encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+
+def decodeListCursor(rawCursor: str, sort: str) -> tuple[Any, int]:
+    """
+    설명: cursor 문자열을 정렬 키/PK 바인딩 값으로 복원
+    처리 규칙: 마지막 행 정렬 키가 NULL이면 None 그대로 복원(NULL 정렬 위치는 호출 쪽 keyset 쿼리가 정의)
+    실패 동작: 형식 오류/버전 불일치/다른 정렬로 발급된 cursor는 ValueError
+    반환값: (정렬 키 값, 마지막 행 PK)
+    갱신일: 2026-10-18
+    """
+    if not isinstance(rawCursor, str) or not rawCursor or len(rawCursor) > LIST_CURSOR_MAX_LENGTH:
+        raise ValueError("invalid cursor")
+    try:
+        decoded = base64.urlsafe_b64decode(rawCursor + "=" * (-len(rawCursor) % 4))
+        payload = json.loads(decoded.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise ValueError("invalid cursor") from error
+    if not isinstance(payload, dict) or payload.get("v") != LIST_CURSOR_VERSION or payload.get("s") != sort:
+        raise ValueError("invalid cursor")
+    rowId = payload.get("id")
+    if not isinstance(rowId, int) or isinstance(rowId, bool) or "k" not in payload:
+        raise ValueError("invalid cursor")
+    return decodeCursorValue(payload["k"]), rowId
+
+
+def readListTotalMode(endpointPolicy: Any, globalPolicy: Any) -> str:
+    """
+    설명: [API_POLICY.*]/[API_POLICY] list_total_mode 조회(엔드포인트 설정 우선)
+    처리 규칙: exact는 전체 건수 계산, has_more는 COUNT 없이 size+1행으로 다음 페이지 유무만 판단, 그 외 값은 exact
+    갱신일: 2026-10-18
+    """
+    rawValue = endpointPolicy.get("list_total_mode") if endpointPolicy is not None else None
+    if not rawValue and globalPolicy is not None:
+        rawValue = globalPolicy.get("list_total_mode")
+    value = str(rawValue or "").strip().lower()
+    return value if value in LIST_TOTAL_MODE_ORDER else "exact"
+
+
+def supportsWindowCount(db: Any) -> bool:
+    """설명: COUNT(*) OVER ()로 목록과 전체 건수를 한 번에 읽을 DB(PostgreSQL/SQLite) 여부 갱신일: 2026-10-18"""
+    databaseUrl = str(getattr(db, "databaseUrl", "") or "").strip().lower()
+    return databaseUrl.startswith("postgres") or databaseUrl.startswith("sqlite")
+
+
+def readRowTotalCount(row: Any) -> int:
+    try:
+        return int(convertKeysToCamelCase(dict(row or {})).get("totalCount") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+async def fetchListPage(
+    db: Any,
+    listQueryName: str,
+    listBinds: dict[str, Any],
+    countQueryName: str,
+    countBinds: dict[str, Any],
+    *,
+    limit: int,
+    offset: int = 0,
+    totalMode: str = "exact",
+    windowQueryName: str | None = None,
+) -> tuple[list[Any], int, bool, bool]:
+    """
+    설명: 목록 행과 전체 건수를 DB 왕복 1회(또는 동시 2회)로 조회
+    처리 규칙: 항상 limit+1행을 읽어 hasMore를 판단,
+    windowQueryName(COUNT(*) OVER () 포함)이 있으면 첫 행의 totalCount를 사용하고 OFFSET이 끝을 넘어 빈 결과일 때만 COUNT 재조회,
+    없으면 목록/COUNT 쿼리를 별도 task로 동시에 실행해 서로 다른 pool 연결을 사용,
+    has_more 모드는 COUNT를 생략하고 offset+행 수(+다음 페이지 1) 하한값을 total로 반환
+    반환값: (limit 이하 행 목록, total, hasMore, totalExact)
+    갱신일: 2026-10-18
+    """
+    probeBinds = {**listBinds, "limit": limit + 1}
+    if totalMode == "has_more":
+        rows = list(await db.fetchAllQuery(listQueryName, probeBinds) or [])
+        hasMore = len(rows) > limit
+        rows = rows[:limit]
+        return rows, offset + len(rows) + (1 if hasMore else 0), hasMore, False
+    if windowQueryName:
+        rows = list(await db.fetchAllQuery(windowQueryName, probeBinds) or [])
+        if rows:
+            total = readRowTotalCount(rows[0])
+        elif offset <= 0:
+            total = 0
+        else:
+            total = readRowTotalCount(await db.fetchOneQuery(countQueryName, countBinds))
+    else:
+        rowResult, countRow = await asyncio.gather(
+            db.fetchAllQuery(listQueryName, probeBinds),
+            db.fetchOneQuery(countQueryName, countBinds),
+        )
+        rows = list(rowResult or [])
+        total = readRowTotalCount(countRow)
+    hasMore = len(rows) > limit
+    return rows[:limit], total, hasMore, True
@@ -1,15 +1,25 @@
 """
 파일명: backend/lib/Logger.py
 작성자: LSH
-갱신일: 2025-09-07
-설명: 콘솔/파일 로거 설정. 포맷은 JSON 라인(ts/level/requestId/msg 등)
+갱신일: 2026-10-18
+설명: 콘솔/파일 로거 설정. 포맷은 JSON 라인(ts/level/requestId/msg 등), 기본 쓰기 경로는 bounded queue + batching writer 스레드
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
-from typing import Any
-from datetime import datetime
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Any, Callable
+
+try:
+    import orjson  # orjson은 설치된 환경에서만 선택적으로 사용한다.
+except Exception:
+    orjson = None
 
 # requestId는 Middleware에서 ContextVar로 주입된다.
 from .RequestContext import getRequestId
@@ -17,6 +27,114 @@ from .RequestContext import getRequestId
 # 로거 설정
 logger: logging.Logger = logging.getLogger()
 
+# 구조 로그 dict를 LogRecord에 싣는 extra 속성명
+STRUCTURED_LOG_ATTR = "structuredPayload"
+
+# 비동기 로그 큐 기본값(ENV로 재정의)
+DEFAULT_LOG_QUEUE_SIZE = 10_000
+DEFAULT_LOG_BATCH_SIZE = 100
+DEFAULT_LOG_FLUSH_INTERVAL_MS = 200
+DEFAULT_LOG_ROTATE_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_LOG_ROTATE_BACKUP_COUNT = 10
+MAX_LOG_WORKER_SLOTS = 64
+
+# (pid, logDir) -> (슬롯 번호, 잠금 fd). fork된 자식은 pid가 달라 부모 슬롯을 물려받지 않는다.
+_logSlotLocks: dict[tuple[int, str], tuple[int, int]] = {}
+
+
+def encodeLogJson(payload: dict[str, Any]) -> str:
+    """
+    설명: 로그 payload dict를 JSON 한 줄 문자열로 직렬화
+    처리 규칙: orjson이 설치돼 있으면 우선 사용하고, 실패/미설치 시 표준 json(ensure_ascii=False)으로 폴백
+    반환값: JSON 문자열
+    갱신일: 2026-10-18
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str).decode("utf-8")
+        except Exception:
+            pass
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class LazyLogPayload:
+    """
+    설명: 포맷 시점에 한 번만 만들어지는 구조 로그 payload
+    처리 규칙: 핸들러가 실제로 레코드를 출력할 때 factory를 호출하고 결과를 캐시, 실패 시 최소 payload로 대체
+    갱신일: 2026-10-18
+    """
+
+    __slots__ = ("factory", "resolved")
+
+    def __init__(self, factory: Callable[[], dict[str, Any]]):
+        self.factory = factory
+        self.resolved: dict[str, Any] | None = None
+
+    def resolve(self) -> dict[str, Any]:
+        if self.resolved is None:
+            try:
+                self.resolved = self.factory()
+            except Exception as error:
+                self.resolved = {"msg": "log_payload_failed", "errorType": type(error).__name__}
+        return self.resolved
+
+
+def resolveStructuredPayload(value: Any) -> dict[str, Any] | None:
+    """설명: 레코드 extra의 구조 로그 값을 dict로 해석 반환값: dict 또는 None(구조 로그 아님). 갱신일: 2026-10-18"""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, LazyLogPayload):
+        return value.resolve()
+    return None
+
+
+class StructuredLogMessage:
+    """
+    설명: 구조 로그 record.msg 자리표시자
+    처리 규칙: JsonLineFormatter는 extra dict를 직접 쓰고, caplog 등 getMessage() 소비자가 있을 때만 지연 직렬화
+    갱신일: 2026-10-18
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict[str, Any] | LazyLogPayload):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return json.dumps(resolveStructuredPayload(self.payload), ensure_ascii=False, default=str)
+
+
+def logStructured(
+    level: int,
+    payload: dict[str, Any] | Callable[[], dict[str, Any]],
+    *,
+    excInfo: bool = False,
+    targetLogger: logging.Logger | None = None,
+) -> None:
+    """
+    설명: dict payload를 LogRecord extra로 전달하는 구조 로그 기록 API
+    처리 규칙: 레벨이 비활성이면 즉시 반환하고, 직렬화는 포맷터에서 한 번만 수행
+    payload 대신 인자 없는 callable을 넘기면 출력 시점까지 payload 생성을 미룬다
+    부작용: 대상 로거(기본 root)의 레벨별 메서드로 레코드를 발행
+    갱신일: 2026-10-18
+    """
+    activeLogger = targetLogger or logger
+    if not activeLogger.isEnabledFor(level):
+        return
+    if callable(payload):
+        payload = LazyLogPayload(payload)
+    method = getattr(activeLogger, logging.getLevelName(level).lower(), None)
+    if not callable(method):
+        activeLogger.log(level, StructuredLogMessage(payload), extra={STRUCTURED_LOG_ATTR: payload}, exc_info=excInfo)
+        return
+    if excInfo:
+        if level == logging.ERROR:
+            activeLogger.exception(StructuredLogMessage(payload), extra={STRUCTURED_LOG_ATTR: payload})
+            return
+        method(StructuredLogMessage(payload), extra={STRUCTURED_LOG_ATTR: payload}, exc_info=True)
+        return
+    method(StructuredLogMessage(payload), extra={STRUCTURED_LOG_ATTR: payload})
+
 
 def resolveLogLevel() -> int:
     """
@@ -37,17 +155,55 @@ def resolveLogLevel() -> int:
 class JsonLineFormatter(logging.Formatter):
     """
     설명: 로그를 JSON 한 줄로 출력
+    - logStructured로 전달된 extra dict는 그대로 사용해 한 번만 직렬화한다.
     - msg가 이미 JSON(dict) 문자열이면 병합해 구조 로그를 유지한다.
     - requestId는 ContextVar(getRequestId)에서 보강한다.
-    갱신일: 2026-01-15
+    갱신일: 2026-10-18
     """
 
     def format(self, record: logging.LogRecord) -> str:
         """
         설명: logging 레코드를 JSON 한 줄 문자열로 직렬화
-        처리 규칙: msg가 JSON 문자열이면 병합하고, 아니면 문자열 msg로 기록
+        처리 규칙: 구조 로그 extra가 있으면 그 dict를, 없으면 msg 문자열을 해석해 payload를 만든다,
+        queue 핸들러가 고정해 둔 traceback 문자열(exc_text)이 있으면 그대로 사용
         반환값: requestId/예외 정보가 보강된 JSON 라인 문자열을 반환
-        갱신일: 2026-02-24
+        갱신일: 2026-10-18
+        """
+        structuredPayload = resolveStructuredPayload(getattr(record, STRUCTURED_LOG_ATTR, None))
+        if structuredPayload is not None:
+            payload: dict[str, Any] = dict(structuredPayload)
+        else:
+            payload = self.parseMessagePayload(record)
+
+        payload.setdefault("ts", int(record.created * 1000))
+        payload.setdefault("level", record.levelname)
+        payload.setdefault("logger", record.name)
+
+        rid = getattr(record, "requestId", None)
+        if not rid:
+            try:
+                rid = getRequestId()
+            except Exception:
+                rid = None
+        if rid and "requestId" not in payload:
+            payload["requestId"] = rid
+
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        elif record.exc_info:
+            try:
+                payload["exc"] = self.formatException(record.exc_info)
+            except Exception:
+                payload["exc"] = "exception"
+
+        return encodeLogJson(payload)
+
+    def parseMessagePayload(self, record: logging.LogRecord) -> dict[str, Any]:
+        """
+        설명: 문자열 msg 레코드(서드파티/레거시 호출부)를 payload dict로 변환
+        처리 규칙: msg가 JSON 객체 문자열이면 병합하고, 아니면 문자열 msg로 기록
+        반환값: payload dict
+        갱신일: 2026-10-18
         """
         payload: dict[str, Any] = {}
         msg = record.getMessage()
@@ -67,32 +223,105 @@ class JsonLineFormatter(logging.Formatter):
                 payload["msg"] = msg
         else:
             payload["msg"] = str(msg)
+        return payload
+
+
+def readLogEnvInt(name: str, fallback: int) -> int:
+    """
+    설명: 로그 설정용 0 이상 정수 환경변수 조회
+    처리 규칙: 미설정/형식 오류/음수면 fallback을 사용(로깅 초기화는 실패하지 않음)
+    반환값: 정수 설정값
+    갱신일: 2026-10-18
+    """
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return fallback
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        return fallback
+    return value if value >= 0 else fallback
 
-        payload.setdefault("ts", int(record.created * 1000))
-        payload.setdefault("level", record.levelname)
-        payload.setdefault("logger", record.name)
 
-        rid = None
+def isAsyncLoggingEnabled() -> bool:
+    """설명: LOG_ASYNC 조회 반환값: false/0/no/off가 아니면 True(기본 비동기). 갱신일: 2026-10-18"""
+    return str(os.getenv("LOG_ASYNC", "true")).strip().lower() not in {"0", "false", "no", "off"}
+
+
+def claimLogWorkerSlot(logDir: str) -> int | None:
+    """
+    설명: LOG_DIR 안에서 이 프로세스가 쓸 worker 슬롯 번호를 점유
+    처리 규칙: app-<n>.lock을 0번부터 LOCK_EX|LOCK_NB로 잠가 처음 성공한 n을 쓰고, 잠금 fd는 프로세스 종료까지 유지한다.
+    재기동한 worker는 비어 있는 가장 낮은 슬롯을 다시 쓰므로 파일 이름이 worker 수만큼으로 고정된다.
+    실패 동작: fcntl이 없거나 MAX_LOG_WORKER_SLOTS개가 모두 점유 중이면 None
+    반환값: 슬롯 번호 또는 None
+    갱신일: 2026-10-18
+    """
+    key = (os.getpid(), os.path.abspath(logDir))
+    if key in _logSlotLocks:
+        return _logSlotLocks[key][0]
+    try:
+        import fcntl
+    except ImportError:
+        return None
+    for slot in range(MAX_LOG_WORKER_SLOTS):
+        lockFd = os.open(os.path.join(logDir, f"app-{slot}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
         try:
-            rid = getRequestId()
-        except Exception:
-            rid = None
-        if rid and "requestId" not in payload:
-            payload["requestId"] = rid
+            fcntl.flock(lockFd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(lockFd)
+            continue
+        _logSlotLocks[key] = (slot, lockFd)
+        return slot
+    return None
+
+
+def buildLogFileName(logDir: str) -> str:
+    """
+    설명: 이 프로세스가 쓸 로그 파일 이름
+    처리 규칙: 기본은 worker 슬롯별 app-<n>.log(claimLogWorkerSlot). 회전은 파일 이름을 바꾸므로 한 파일에는 한 프로세스만 쓰고,
+    재기동해도 같은 이름을 다시 쓰므로 디렉터리 크기가 worker 수 x (LOG_ROTATE_BACKUP_COUNT + 1)로 제한된다.
+    LOG_WORKER_INDEX가 있으면 그 번호를, LOG_FILE_NAME이 있으면 그 이름을 그대로 사용(프로세스 하나만 쓰는 배포에서만 지정)
+    실패 동작: 슬롯을 점유하지 못하면 app-pid<pid>.log
+    갱신일: 2026-10-18
+    """
+    configuredName = str(os.getenv("LOG_FILE_NAME", "")).strip()
+    if configuredName:
+        return configuredName
+    configuredIndex = str(os.getenv("LOG_WORKER_INDEX", "")).strip()
+    if configuredIndex.isdigit():
+        return f"app-{int(configuredIndex)}.log"
+    slot = claimLogWorkerSlot(logDir)
+    if slot is None:
+        return f"app-pid{os.getpid()}.log"
+    return f"app-{slot}.log"
 
-        if record.exc_info:
-            try:
-                payload["exc"] = self.formatException(record.exc_info)
-            except Exception:
-                payload["exc"] = "exception"
 
-        return json.dumps(payload, ensure_ascii=False)
+def buildFileHandler(logDir: str) -> logging.FileHandler:
+    """
+    설명: 크기 또는 시간 기준 회전 파일 핸들러 생성
+    처리 규칙: LOG_ROTATE_WHEN이 있으면 TimedRotatingFileHandler, 없으면 LOG_ROTATE_MAX_BYTES 기준 RotatingFileHandler,
+    회전은 파일 이름을 바꾸므로 한 파일에는 한 프로세스만 쓴다(buildLogFileName)
+    반환값: LOG_DIR/<buildLogFileName(logDir)>에 쓰는 파일 핸들러
+    갱신일: 2026-10-18
+    """
+    logFilename = os.path.join(logDir, buildLogFileName(logDir))
+    backupCount = readLogEnvInt("LOG_ROTATE_BACKUP_COUNT", DEFAULT_LOG_ROTATE_BACKUP_COUNT)
+    rotateWhen = str(os.getenv("LOG_ROTATE_WHEN", "")).strip()
+    if rotateWhen:
+        return TimedRotatingFileHandler(logFilename, when=rotateWhen, backupCount=backupCount, encoding="utf-8")
+    return RotatingFileHandler(
+        logFilename,
+        maxBytes=readLogEnvInt("LOG_ROTATE_MAX_BYTES", DEFAULT_LOG_ROTATE_MAX_BYTES),
+        backupCount=backupCount,
+        encoding="utf-8",
+    )
 
 
 def _attachFileHandler(targetLogger: logging.Logger, logLevel: int, formatter: logging.Formatter) -> None:
     """
-    설명: 파일 핸들러를 best-effort로 연결. 디렉터리/파일 권한이 없으면 콘솔만 사용한다.
-    갱신일: 2026-06-22
+    설명: 회전 파일 핸들러를 best-effort로 연결. 디렉터리/파일 권한이 없으면 콘솔만 사용한다.
+    갱신일: 2026-10-18
     """
     for handler in targetLogger.handlers:
         if getattr(handler, "_myweb_file_handler", False):
@@ -103,27 +332,244 @@ def _attachFileHandler(targetLogger: logging.Logger, logLevel: int, formatter: l
     logDir = os.getenv("LOG_DIR", "logs")
     try:
         os.makedirs(logDir, exist_ok=True)
-        logFilename = os.path.join(logDir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-        fileHandler = logging.FileHandler(logFilename, encoding="utf-8")
+        fileHandler = buildFileHandler(logDir)
         setattr(fileHandler, "_myweb_file_handler", True)
         fileHandler.setLevel(logLevel)
         fileHandler.setFormatter(formatter)
         targetLogger.addHandler(fileHandler)
-    except OSError:
+    except (OSError, ValueError):
         return
 
 
-def _configureLogger() -> logging.Logger:
+DEFAULT_SINK_FORMATTER = logging.Formatter()
+
+
+class DroppingQueueHandler(QueueHandler):
     """
-    설명: 콘솔 핸들러는 항상 연결하고, 파일 핸들러는 쓰기 가능할 때만 추가한다.
-    갱신일: 2026-06-22
+    설명: 요청 경로에서 레코드를 bounded queue에 넣기만 하는 핸들러
+    처리 규칙: 큐가 가득 차면 대기하지 않고 버린 뒤 drop 수만 누적
+    갱신일: 2026-10-18
     """
-    logLevel = resolveLogLevel()
-    logger.setLevel(logLevel)
-    jsonFormatter = JsonLineFormatter()
 
+    def __init__(self, logQueue: queue.Queue):
+        super().__init__(logQueue)
+        self.dropped = 0
+        self.dropLock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        설명: 호출 스레드에서 레코드 스냅샷을 만들어 큐에 넣음(stdlib QueueHandler.prepare와 같은 취지)
+        처리 규칙: 요청 스코프 requestId 고정, 구조 로그 payload(지연 payload는 여기서 생성)는 얕은 복사,
+        문자열 msg는 args를 적용한 문자열로, 예외는 traceback 문자열(exc_text)로 고정하고 args/exc_info 참조를 끊음,
+        JSON 직렬화와 파일 쓰기만 writer 스레드에서 수행
+        반환값: 원본과 분리된 레코드 복사본
+        갱신일: 2026-10-18
+        """
+        prepared = copy.copy(record)
+        if getattr(prepared, "requestId", None) is None:
+            try:
+                prepared.requestId = getRequestId()
+            except Exception:
+                prepared.requestId = None
+        structuredPayload = resolveStructuredPayload(getattr(record, STRUCTURED_LOG_ATTR, None))
+        if structuredPayload is not None:
+            snapshot = dict(structuredPayload)
+            setattr(prepared, STRUCTURED_LOG_ATTR, snapshot)
+            prepared.msg = StructuredLogMessage(snapshot)
+        else:
+            prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            if not prepared.exc_text:
+                prepared.exc_text = DEFAULT_SINK_FORMATTER.formatException(record.exc_info)
+            prepared.exc_info = None
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.dropLock:
+                self.dropped += 1
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    설명: 큐 레코드를 모아 sink 핸들러별 한 번의 write/flush로 기록하는 writer 스레드
+    처리 규칙: batchSize에 도달하거나 가장 오래된 레코드가 flushIntervalMs를 넘기면 flush,
+    큐 drop이 있었으면 다음 flush에 log_queue_dropped 경고 한 줄을 덧붙인다
+    갱신일: 2026-10-18
+    """
+
+    def __init__(
+        self,
+        logQueue: queue.Queue,
+        sinks: list[logging.Handler],
+        queueHandler: DroppingQueueHandler,
+        batchSize: int = DEFAULT_LOG_BATCH_SIZE,
+        flushIntervalMs: int = DEFAULT_LOG_FLUSH_INTERVAL_MS,
+    ):
+        super().__init__(logQueue, *sinks, respect_handler_level=True)
+        self.queueHandler = queueHandler
+        self.batchSize = max(1, batchSize)
+        self.flushIntervalSeconds = max(1, flushIntervalMs) / 1000.0
+        self.pending: list[logging.LogRecord] = []
+        self.firstPendingAt = 0.0
+        self.reportedDropped = 0
+
+    def _monitor(self) -> None:
+        while True:
+            timeout = self.flushIntervalSeconds
+            if self.pending:
+                timeout = max(0.0, self.firstPendingAt + self.flushIntervalSeconds - time.monotonic())
+            try:
+                record = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self.flushPending()
+                continue
+            if record is self._sentinel:
+                self.flushPending()
+                break
+            if not self.pending:
+                self.firstPendingAt = time.monotonic()
+            self.pending.append(record)
+            if len(self.pending) >= self.batchSize:
+                self.flushPending()
+
+    def collectDropReport(self) -> logging.LogRecord | None:
+        dropped = self.queueHandler.dropped
+        delta = dropped - self.reportedDropped
+        if delta <= 0:
+            return None
+        self.reportedDropped = dropped
+        payload = {"msg": "log_queue_dropped", "dropped": delta, "droppedTotal": dropped}
+        return logging.makeLogRecord(
+            {
+                "name": logger.name,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": StructuredLogMessage(payload),
+                STRUCTURED_LOG_ATTR: payload,
+            }
+        )
+
+    def flushPending(self) -> None:
+        """설명: 누적 레코드를 sink별로 일괄 기록 부작용: 파일 회전 조건을 레코드 단위로 확인. 갱신일: 2026-10-18"""
+        records = self.pending
+        self.pending = []
+        dropReport = self.collectDropReport()
+        if dropReport is not None:
+            records.append(dropReport)
+        if not records:
+            return
+        formattedLines: dict[tuple[int, int], str] = {}
+        for sink in self.handlers:
+            batch = [record for record in records if record.levelno >= sink.level]
+            if not batch:
+                continue
+            if not isinstance(sink, logging.StreamHandler):
+                for record in batch:
+                    sink.handle(record)
+                continue
+            formatter = sink.formatter or DEFAULT_SINK_FORMATTER
+            items: list[tuple[logging.LogRecord, str]] = []
+            for record in batch:
+                cacheKey = (id(formatter), id(record))
+                line = formattedLines.get(cacheKey)
+                if line is None:
+                    line = self.formatSafely(formatter, record)
+                    formattedLines[cacheKey] = line
+                items.append((record, line))
+            writeBatchToStream(sink, items)
+
+    def enqueue_sentinel(self) -> None:
+        # 가득 찬 큐에서도 종료 신호가 유실되지 않도록 잠시 대기한다.
+        try:
+            self.queue.put(self._sentinel, timeout=self.flushIntervalSeconds * 10)
+        except queue.Full:
+            pass
+
+    @staticmethod
+    def formatSafely(formatter: logging.Formatter, record: logging.LogRecord) -> str:
+        try:
+            return formatter.format(record)
+        except Exception:
+            return json.dumps({"msg": "log_format_failed", "level": record.levelname}, ensure_ascii=False)
+
+
+def writeBatchToStream(sink: logging.StreamHandler, batch: list[tuple[logging.LogRecord, str]]) -> None:
+    """
+    설명: 포맷된 라인 묶음을 스트림/파일 sink에 한 번의 flush로 기록
+    처리 규칙: 크기 회전은 현재 위치 + 라인 길이로, 시간 회전은 핸들러 shouldRollover로 판정
+    실패 동작: 쓰기 오류는 logging 표준 handleError로 위임, 종료 중 이미 닫힌 스트림이면 조용히 버림
+    갱신일: 2026-10-18
+    """
+    sink.acquire()
+    try:
+        if not isinstance(sink, logging.FileHandler) and getattr(sink.stream, "closed", False):
+            return
+        for record, line in batch:
+            if isinstance(sink, TimedRotatingFileHandler):
+                if sink.shouldRollover(record):
+                    sink.doRollover()
+            elif isinstance(sink, RotatingFileHandler) and sink.maxBytes > 0:
+                if sink.stream is None:
+                    sink.stream = sink._open()
+                position = sink.stream.tell()
+                if position and position + len(line) + len(sink.terminator) >= sink.maxBytes:
+                    sink.doRollover()
+            if isinstance(sink, logging.FileHandler) and sink.stream is None:
+                sink.stream = sink._open()
+            sink.stream.write(line + sink.terminator)
+        sink.flush()
+    except Exception:
+        sink.handleError(batch[-1][0])
+    finally:
+        sink.release()
+
+
+# 비동기 로깅 상태(재설정 시 이전 listener를 정리하기 위해 보관)
+_asyncLogQueue: queue.Queue | None = None
+_asyncQueueHandler: DroppingQueueHandler | None = None
+_asyncLogListener: BatchingQueueListener | None = None
+_asyncSinkLogger: logging.Logger = logging.getLogger("myweb.log.sink")
+_asyncSinkLogger.propagate = False
+
+
+def stopAsyncLogging() -> None:
+    """설명: writer 스레드를 멈추고 남은 레코드를 flush 부작용: root의 queue 핸들러 제거. 갱신일: 2026-10-18"""
+    global _asyncLogQueue, _asyncQueueHandler, _asyncLogListener
+    listener = _asyncLogListener
+    queueHandler = _asyncQueueHandler
+    _asyncLogListener = None
+    _asyncQueueHandler = None
+    _asyncLogQueue = None
+    for targetLogger in {id(logger): logger, id(logging.getLogger()): logging.getLogger()}.values():
+        for handler in list(targetLogger.handlers):
+            if handler is queueHandler or isinstance(handler, DroppingQueueHandler):
+                targetLogger.removeHandler(handler)
+    if listener is not None:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+def getLogQueueStats() -> dict[str, Any]:
+    """설명: 비동기 로그 큐 상태 조회 반환값: enabled/queued/capacity/dropped dict. 갱신일: 2026-10-18"""
+    if _asyncLogQueue is None or _asyncQueueHandler is None:
+        return {"enabled": False, "queued": 0, "capacity": 0, "dropped": 0}
+    return {
+        "enabled": True,
+        "queued": _asyncLogQueue.qsize(),
+        "capacity": _asyncLogQueue.maxsize,
+        "dropped": _asyncQueueHandler.dropped,
+    }
+
+
+def _attachConsoleHandler(targetLogger: logging.Logger, logLevel: int, formatter: logging.Formatter) -> None:
     consoleHandler = None
-    for handler in logger.handlers:
+    for handler in targetLogger.handlers:
         if getattr(handler, "_myweb_console_handler", False):
             consoleHandler = handler
             break
@@ -131,12 +577,53 @@ def _configureLogger() -> logging.Logger:
     if consoleHandler is None:
         consoleHandler = logging.StreamHandler()
         setattr(consoleHandler, "_myweb_console_handler", True)
-        logger.addHandler(consoleHandler)
+        targetLogger.addHandler(consoleHandler)
     consoleHandler.setLevel(logLevel)
-    consoleHandler.setFormatter(jsonFormatter)
+    consoleHandler.setFormatter(formatter)
+
+
+def _configureLogger() -> logging.Logger:
+    """
+    설명: 콘솔 핸들러는 항상 연결하고, 파일 핸들러는 쓰기 가능할 때만 추가한다.
+    처리 규칙: LOG_ASYNC(기본 true)면 콘솔/파일은 writer 스레드 sink로 두고 root에는 bounded queue 핸들러만 연결
+    갱신일: 2026-10-18
+    """
+    global _asyncLogQueue, _asyncQueueHandler, _asyncLogListener
+    logLevel = resolveLogLevel()
+    logger.setLevel(logLevel)
+    jsonFormatter = JsonLineFormatter()
+
+    if not isAsyncLoggingEnabled():
+        stopAsyncLogging()
+        for handler in list(_asyncSinkLogger.handlers):
+            _asyncSinkLogger.removeHandler(handler)
+            handler.close()
+        _attachConsoleHandler(logger, logLevel, jsonFormatter)
+        _attachFileHandler(logger, logLevel, jsonFormatter)
+        return logger
+
+    stopAsyncLogging()
+    for handler in list(logger.handlers):
+        if getattr(handler, "_myweb_console_handler", False) or getattr(handler, "_myweb_file_handler", False):
+            logger.removeHandler(handler)
+            _asyncSinkLogger.addHandler(handler)
+    _attachConsoleHandler(_asyncSinkLogger, logLevel, jsonFormatter)
+    _attachFileHandler(_asyncSinkLogger, logLevel, jsonFormatter)
 
-    _attachFileHandler(logger, logLevel, jsonFormatter)
+    _asyncLogQueue = queue.Queue(maxsize=readLogEnvInt("LOG_QUEUE_SIZE", DEFAULT_LOG_QUEUE_SIZE))
+    _asyncQueueHandler = DroppingQueueHandler(_asyncLogQueue)
+    _asyncQueueHandler.setLevel(logLevel)
+    _asyncLogListener = BatchingQueueListener(
+        _asyncLogQueue,
+        list(_asyncSinkLogger.handlers),
+        _asyncQueueHandler,
+        batchSize=readLogEnvInt("LOG_BATCH_SIZE", DEFAULT_LOG_BATCH_SIZE),
+        flushIntervalMs=readLogEnvInt("LOG_FLUSH_INTERVAL_MS", DEFAULT_LOG_FLUSH_INTERVAL_MS),
+    )
+    logger.addHandler(_asyncQueueHandler)
+    _asyncLogListener.start()
     return logger
 
 
+atexit.register(stopAsyncLogging)
 _configureLogger()
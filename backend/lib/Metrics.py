@@ -0,0 +1,613 @@
+"""
+파일명: backend/lib/Metrics.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: Prometheus 텍스트 노출 형식(/metrics)용 인프로세스 카운터/히스토그램과 다중 worker 집계
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import glob
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from lib.Logger import logger
+
+HTTP_LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100)
+DB_POOL_WAIT_BUCKETS_SECONDS: tuple[float, ...] = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+PASSWORD_HASH_BUCKETS_SECONDS: tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0)
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_SNAPSHOT_PREFIX = "metrics-"
+METRICS_RETIRED_INSTANCE = "retired"
+METRICS_DIRECTORY_LOCK = ".metrics.lock"
+UNMATCHED_ROUTE_LABEL = "__unmatched__"
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    name: str
+    kind: str
+    help: str
+    labelNames: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = ()
+
+
+METRIC_SPECS: dict[str, MetricSpec] = {
+    spec.name: spec
+    for spec in (
+        MetricSpec(
+            "http_requests_total",
+            "counter",
+            "HTTP requests by method, route template and status.",
+            ("method", "route", "status"),
+        ),
+        MetricSpec(
+            "http_request_duration_seconds",
+            "histogram",
+            "HTTP request latency by method, route template and status.",
+            ("method", "route", "status"),
+            HTTP_LATENCY_BUCKETS_SECONDS,
+        ),
+        MetricSpec(
+            "http_request_sql_queries",
+            "histogram",
+            "SQL statements executed per HTTP request.",
+            ("method", "route"),
+            SQL_COUNT_BUCKETS,
+        ),
+        MetricSpec(
+            "db_transactions_total",
+            "counter",
+            "Transaction attempts by outcome (commit/rollback).",
+            ("outcome",),
+        ),
+        MetricSpec(
+            "db_transaction_duration_seconds",
+            "histogram",
+            "Transaction attempt duration by outcome.",
+            ("outcome",),
+            HTTP_LATENCY_BUCKETS_SECONDS,
+        ),
+        MetricSpec(
+            "rate_limit_rejections_total",
+            "counter",
+            "Requests rejected by the rate limiter by namespace.",
+            ("namespace",),
+        ),
+        MetricSpec(
+            "access_log_tasks_dropped_total",
+            "counter",
+            "User access log rows dropped because the pending task cap or batch buffer limit was reached.",
+        ),
+        MetricSpec(
+            "access_log_tasks_pending",
+            "gauge",
+            "User access log tasks and buffered batch rows currently pending.",
+        ),
+        MetricSpec(
+            "password_hash_queue_wait_seconds",
+            "histogram",
+            "Time password hash jobs waited for a hash pool worker, by pool mode.",
+            ("mode",),
+            DB_POOL_WAIT_BUCKETS_SECONDS,
+        ),
+        MetricSpec(
+            "password_hash_duration_seconds",
+            "histogram",
+            "Password hash/verify execution time on the hash pool, by pool mode.",
+            ("mode",),
+            PASSWORD_HASH_BUCKETS_SECONDS,
+        ),
+        MetricSpec(
+            "password_hash_rejections_total",
+            "counter",
+            "Password hash jobs rejected with 503 because the hash pool queue was full.",
+        ),
+        MetricSpec(
+            "password_hash_pool_queue_depth",
+            "gauge",
+            "Password hash jobs waiting for a hash pool worker.",
+        ),
+        MetricSpec(
+            "password_hash_pool_in_flight",
+            "gauge",
+            "Password hash jobs running or waiting on the hash pool.",
+        ),
+        MetricSpec(
+            "db_pool_connections_in_use",
+            "gauge",
+            "Database pool connections currently checked out, per database.",
+            ("db",),
+        ),
+        MetricSpec(
+            "db_pool_connections_idle",
+            "gauge",
+            "Database pool connections open and idle, per database.",
+            ("db",),
+        ),
+        MetricSpec(
+            "db_pool_waiters",
+            "gauge",
+            "Tasks waiting to acquire a database pool connection, per database.",
+            ("db",),
+        ),
+        MetricSpec(
+            "db_pool_max_size",
+            "gauge",
+            "Configured or driver maximum pool size, per database.",
+            ("db",),
+        ),
+        MetricSpec(
+            "db_statement_cache_entries",
+            "gauge",
+            "Prepared statements cached across open pool connections (asyncpg statement_cache_size), per database.",
+            ("db",),
+        ),
+        MetricSpec(
+            "db_statement_cache_size",
+            "gauge",
+            "Per-connection prepared statement cache capacity, per database.",
+            ("db",),
+        ),
+        MetricSpec(
+            "db_pool_acquire_wait_seconds",
+            "histogram",
+            "Time spent waiting to acquire a database pool connection.",
+            ("db",),
+            DB_POOL_WAIT_BUCKETS_SECONDS,
+        ),
+    )
+}
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    enabled: bool = False
+    multiprocDir: str | None = None
+    flushIntervalMs: int = 1000
+
+
+class MetricsRegistry:
+    """
+    설명: 라벨 조합별 카운터/히스토그램 누적 저장소
+    처리 규칙: 갱신은 dict 조회 + 정수 증가만 하는 짧은 임계구역 하나로 제한하고, 포맷 변환은 수집 시점에만 수행
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: dict[tuple[str, tuple[str, ...]], float] = {}
+        self.histograms: dict[tuple[str, tuple[str, ...]], list[float]] = {}
+        self.gaugeCallbacks: dict[str, Callable[[], float | dict[tuple[str, ...], float]]] = {}
+
+    def inc(self, name: str, labels: tuple[str, ...] = (), value: float = 1.0) -> None:
+        key = (name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: tuple[str, ...], value: float) -> None:
+        """설명: 히스토그램 관측 1건 기록(버킷별 비누적 카운트 + sum + count) 갱신일: 2026-10-18"""
+        buckets = METRIC_SPECS[name].buckets
+        index = bisect.bisect_left(buckets, value)
+        key = (name, labels)
+        with self.lock:
+            state = self.histograms.get(key)
+            if state is None:
+                state = [0.0] * (len(buckets) + 3)
+                self.histograms[key] = state
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def registerGauge(self, name: str, callback: Callable[[], float | dict[tuple[str, ...], float]]) -> None:
+        self.gaugeCallbacks[name] = callback
+
+    def collect(self) -> dict[str, Any]:
+        """설명: 현재 누적값을 JSON 직렬화 가능한 상태로 복사 반환값: counters/histograms/gauges dict. 갱신일: 2026-10-18"""
+        with self.lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self.counters.items()]
+            histograms = [[name, list(labels), list(state)] for (name, labels), state in self.histograms.items()]
+        gauges = []
+        for name, callback in list(self.gaugeCallbacks.items()):
+            try:
+                value = callback()
+                # 라벨이 있는 gauge는 {라벨 값 tuple: 값} dict를 반환
+                if isinstance(value, dict):
+                    gauges.extend([name, list(labels), float(labelValue)] for labels, labelValue in value.items())
+                else:
+                    gauges.append([name, [], float(value)])
+            except Exception:
+                continue
+        return {"counters": counters, "histograms": histograms, "gauges": gauges}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+metricsRegistry = MetricsRegistry()
+metricsConfig = MetricsConfig()
+metricsFlushTask: asyncio.Task[None] | None = None
+
+
+def isMetricsEnabled() -> bool:
+    return metricsConfig.enabled
+
+
+def incCounter(name: str, labels: tuple[str, ...] = (), value: float = 1.0) -> None:
+    """설명: 카운터 증가(비활성이면 no-op) 갱신일: 2026-10-18"""
+    if metricsConfig.enabled:
+        metricsRegistry.inc(name, labels, value)
+
+
+def observeHistogram(name: str, labels: tuple[str, ...], value: float) -> None:
+    """설명: 히스토그램 관측(비활성이면 no-op) 갱신일: 2026-10-18"""
+    if metricsConfig.enabled:
+        metricsRegistry.observe(name, labels, value)
+
+
+def registerGauge(name: str, callback: Callable[[], float | dict[tuple[str, ...], float]]) -> None:
+    """설명: 수집 시점에 값을 읽는 gauge 콜백 등록(라벨이 있으면 {라벨 값 tuple: 값} 반환) 갱신일: 2026-10-18"""
+    metricsRegistry.registerGauge(name, callback)
+
+
+def _readBool(rawValue: object) -> bool:
+    return str(rawValue or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def configureMetrics(config) -> MetricsConfig:
+    """
+    설명: [OBSERVABILITY] metrics_enabled/metrics_multiproc_dir/metrics_flush_interval_ms(ENV 우선) 반영
+    처리 규칙: multiproc 디렉터리가 있으면 worker별 스냅샷 파일을 공유해 /metrics에서 합산
+    실패 동작: flush 주기가 1 미만/정수 아님이거나 디렉터리를 만들 수 없으면 ValueError
+    갱신일: 2026-10-18
+    """
+    global metricsConfig
+    section = config["OBSERVABILITY"] if config is not None and "OBSERVABILITY" in config else None
+
+    def readRaw(key: str, envName: str) -> str | None:
+        rawValue = os.getenv(envName)
+        if rawValue is None and section is not None:
+            rawValue = section.get(key)
+        return rawValue
+
+    rawInterval = readRaw("metrics_flush_interval_ms", "METRICS_FLUSH_INTERVAL_MS")
+    flushIntervalMs = 1000
+    if rawInterval is not None and str(rawInterval).strip():
+        try:
+            flushIntervalMs = int(str(rawInterval).strip())
+        except (TypeError, ValueError) as error:
+            raise ValueError("OBSERVABILITY metrics_flush_interval_ms must be an integer") from error
+        if flushIntervalMs < 1:
+            raise ValueError("OBSERVABILITY metrics_flush_interval_ms must be at least 1")
+
+    multiprocDir = str(readRaw("metrics_multiproc_dir", "METRICS_MULTIPROC_DIR") or "").strip() or None
+    enabled = _readBool(readRaw("metrics_enabled", "METRICS_ENABLED"))
+    if enabled and multiprocDir:
+        try:
+            os.makedirs(multiprocDir, exist_ok=True)
+        except OSError as error:
+            raise ValueError(f"OBSERVABILITY metrics_multiproc_dir is not writable: {multiprocDir}") from error
+    metricsConfig = MetricsConfig(enabled=enabled, multiprocDir=multiprocDir, flushIntervalMs=flushIntervalMs)
+    return metricsConfig
+
+
+def mergeMetricStates(states: list[dict[str, Any]]) -> dict[str, Any]:
+    """설명: 여러 상태의 카운터/히스토그램을 이름/라벨별로 합산(gauge 제외) 반환값: collect() 형식 dict. 갱신일: 2026-10-18"""
+    counters: dict[tuple[str, tuple[str, ...]], float] = {}
+    histograms: dict[tuple[str, tuple[str, ...]], list[float]] = {}
+    for state in states:
+        for name, labels, value in state.get("counters", []):
+            key = (name, tuple(labels))
+            counters[key] = counters.get(key, 0.0) + float(value)
+        for name, labels, values in state.get("histograms", []):
+            key = (name, tuple(labels))
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = [float(value) for value in values]
+            elif len(merged) == len(values):
+                for index, value in enumerate(values):
+                    merged[index] += float(value)
+    return {
+        "counters": [[name, list(labels), value] for (name, labels), value in counters.items()],
+        "histograms": [[name, list(labels), values] for (name, labels), values in histograms.items()],
+        "gauges": [],
+    }
+
+
+def _readSnapshot(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _writeSnapshot(path: str, state: dict[str, Any]) -> None:
+    tempPath = f"{path}.tmp"
+    with open(tempPath, "w", encoding="utf-8") as handle:
+        json.dump(state, handle, separators=(",", ":"))
+    os.replace(tempPath, path)
+
+
+class MetricsSnapshotStore:
+    """
+    설명: multiproc 디렉터리에서 현재 worker 스냅샷 파일 소유와 종료된 worker 파일 정리 담당
+    처리 규칙: 파일 이름은 <pid>-<시작 시각 ns>라 PID가 재사용돼도 다른 worker 파일을 덮어쓰지 않고,
+    같은 이름의 .lock 파일을 프로세스 수명 동안 LOCK_EX로 잡아 생존을 표시(종료 시 OS가 해제).
+    잠글 수 있는 .lock(또는 .lock이 없는 스냅샷)은 종료된 worker로 보고, 그 카운터/히스토그램을 metrics-retired.json에
+    합산(합계 단조 증가 유지)한 뒤 파일을 삭제. 정리는 디렉터리 잠금 LOCK_EX, 수집/등록은 LOCK_SH로 수행해
+    합산 도중의 이중 집계를 막음
+    실패 동작: fcntl이 없는 플랫폼이면 생성 시 ImportError, 파일 I/O 오류는 OSError 전파
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, directory: str):
+        import fcntl
+
+        self.fcntl = fcntl
+        self.directory = directory
+        self.pid = os.getpid()
+        self.instance = f"{self.pid}-{time.time_ns()}"
+        self.snapshotPath = self.pathFor(self.instance, ".json")
+        self.lockFd: int | None = None
+        with self.directoryLock(fcntl.LOCK_SH):
+            lockFd = os.open(self.pathFor(self.instance, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(lockFd, fcntl.LOCK_EX)
+            self.lockFd = lockFd
+
+    def pathFor(self, instance: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{METRICS_SNAPSHOT_PREFIX}{instance}{suffix}")
+
+    @contextmanager
+    def directoryLock(self, operation: int):
+        lockFd = os.open(os.path.join(self.directory, METRICS_DIRECTORY_LOCK), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self.fcntl.flock(lockFd, operation)
+            yield
+        finally:
+            os.close(lockFd)
+
+    def listInstances(self) -> list[str]:
+        instances = set()
+        for suffix in (".json", ".lock"):
+            for path in glob.glob(os.path.join(self.directory, f"{METRICS_SNAPSHOT_PREFIX}*{suffix}")):
+                instances.add(os.path.basename(path)[len(METRICS_SNAPSHOT_PREFIX) : -len(suffix)])
+        instances.discard(METRICS_RETIRED_INSTANCE)
+        instances.discard(self.instance)
+        return sorted(instances)
+
+    def isInstanceAlive(self, instance: str) -> bool:
+        if instance == self.instance:
+            return True
+        try:
+            lockFd = os.open(self.pathFor(instance, ".lock"), os.O_RDWR)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return True
+        try:
+            self.fcntl.flock(lockFd, self.fcntl.LOCK_EX | self.fcntl.LOCK_NB)
+        except OSError:
+            return True
+        finally:
+            os.close(lockFd)
+        return False
+
+    def write(self, state: dict[str, Any]) -> None:
+        _writeSnapshot(self.snapshotPath, {"pid": self.pid, "instance": self.instance, **state})
+
+    def collectOthers(self) -> list[dict[str, Any]]:
+        """설명: 다른 worker와 retired 상태 수집(종료된 worker는 gauge 제외) 반환값: collect() 형식 dict 목록. 갱신일: 2026-10-18"""
+        states = []
+        with self.directoryLock(self.fcntl.LOCK_SH):
+            retired = _readSnapshot(self.pathFor(METRICS_RETIRED_INSTANCE, ".json"))
+            if retired is not None:
+                states.append(retired)
+            for instance in self.listInstances():
+                state = _readSnapshot(self.pathFor(instance, ".json"))
+                if state is None:
+                    continue
+                if not self.isInstanceAlive(instance):
+                    state["gauges"] = []
+                states.append(state)
+        return states
+
+    def pruneDeadSnapshots(self) -> int:
+        """
+        설명: 종료된 worker 스냅샷을 retired 파일에 합산하고 스냅샷/.lock 파일 삭제
+        반환값: 정리한 worker 수
+        갱신일: 2026-10-18
+        """
+        with self.directoryLock(self.fcntl.LOCK_EX):
+            deadInstances = [instance for instance in self.listInstances() if not self.isInstanceAlive(instance)]
+            if not deadInstances:
+                return 0
+            deadStates = [_readSnapshot(self.pathFor(instance, ".json")) for instance in deadInstances]
+            deadStates = [state for state in deadStates if state is not None]
+            if deadStates:
+                retiredPath = self.pathFor(METRICS_RETIRED_INSTANCE, ".json")
+                retired = _readSnapshot(retiredPath) or {}
+                _writeSnapshot(retiredPath, mergeMetricStates([retired, *deadStates]))
+            for instance in deadInstances:
+                for suffix in (".json", ".lock"):
+                    try:
+                        os.remove(self.pathFor(instance, suffix))
+                    except FileNotFoundError:
+                        pass
+        return len(deadInstances)
+
+    def close(self) -> None:
+        if self.lockFd is None:
+            return
+        try:
+            os.close(self.lockFd)
+        except OSError:
+            pass
+        self.lockFd = None
+
+
+metricsSnapshotStore: MetricsSnapshotStore | None = None
+
+
+def _getSnapshotStore(directory: str) -> MetricsSnapshotStore:
+    """설명: 현재 프로세스/디렉터리의 스냅샷 저장소 반환(fork 후 상속된 부모 잠금 fd는 닫고 새로 생성) 갱신일: 2026-10-18"""
+    global metricsSnapshotStore
+    store = metricsSnapshotStore
+    if store is not None and store.pid == os.getpid() and store.directory == directory:
+        return store
+    if store is not None:
+        store.close()
+    metricsSnapshotStore = MetricsSnapshotStore(directory)
+    return metricsSnapshotStore
+
+
+def writeMetricsSnapshot() -> bool:
+    """
+    설명: 현재 worker 누적값을 multiproc 디렉터리에 원자적으로 기록하고 종료된 worker 스냅샷 정리
+    반환값: 기록했으면 True, multiproc 모드가 아니면 False
+    실패 동작: 쓰기 실패는 경고 로그 후 False, 정리 실패는 경고 로그 후 다음 주기에 재시도
+    갱신일: 2026-10-18
+    """
+    directory = metricsConfig.multiprocDir
+    if not metricsConfig.enabled or not directory:
+        return False
+    try:
+        store = _getSnapshotStore(directory)
+        store.write(metricsRegistry.collect())
+    except (OSError, ImportError) as error:
+        logger.warning("metrics snapshot write failed: error=%s", type(error).__name__)
+        return False
+    try:
+        store.pruneDeadSnapshots()
+    except OSError as error:
+        logger.warning("metrics snapshot prune failed: error=%s", type(error).__name__)
+    return True
+
+
+def collectMetricStates() -> list[dict[str, Any]]:
+    """
+    설명: 합산 대상 상태 목록 수집
+    처리 규칙: 현재 worker는 메모리 값을, 다른 worker는 스냅샷 파일을, 종료된 worker 누적분은 retired 파일을 사용하며
+    종료된 worker의 카운터/히스토그램은 유지하되 gauge는 제외
+    실패 동작: 스냅샷 디렉터리를 읽을 수 없으면 경고 로그 후 현재 worker 값만 반환
+    반환값: collect() 형식 dict 목록
+    갱신일: 2026-10-18
+    """
+    states = [metricsRegistry.collect()]
+    directory = metricsConfig.multiprocDir
+    if not directory:
+        return states
+    try:
+        states.extend(_getSnapshotStore(directory).collectOthers())
+    except (OSError, ImportError) as error:
+        logger.warning("metrics snapshot read failed: error=%s", type(error).__name__)
+    return states
+
+
+def _formatValue(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escapeLabelValue(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatLabels(labelNames: tuple[str, ...], labelValues: tuple[str, ...], extra: tuple[str, str] | None = None) -> str:
+    pairs = [f'{name}="{_escapeLabelValue(value)}"' for name, value in zip(labelNames, labelValues)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def renderMetricsText(states: list[dict[str, Any]] | None = None) -> str:
+    """
+    설명: 상태 목록을 합산해 Prometheus 텍스트 노출 형식으로 렌더링
+    처리 규칙: 동일 이름/라벨 조합은 worker 간 합산, 히스토그램 버킷은 누적(le) 형태로 변환
+    반환값: 개행으로 끝나는 exposition 텍스트
+    갱신일: 2026-10-18
+    """
+    if states is None:
+        states = collectMetricStates()
+    scalars: dict[str, dict[tuple[str, ...], float]] = {}
+    histograms: dict[str, dict[tuple[str, ...], list[float]]] = {}
+    for state in states:
+        for name, labels, value in list(state.get("counters", [])) + list(state.get("gauges", [])):
+            if name in METRIC_SPECS:
+                series = scalars.setdefault(name, {})
+                series[tuple(labels)] = series.get(tuple(labels), 0.0) + float(value)
+        for name, labels, values in state.get("histograms", []):
+            spec = METRIC_SPECS.get(name)
+            if spec is None or len(values) != len(spec.buckets) + 3:
+                continue
+            merged = histograms.setdefault(name, {}).setdefault(tuple(labels), [0.0] * len(values))
+            for index, value in enumerate(values):
+                merged[index] += float(value)
+
+    lines: list[str] = []
+    for name, spec in METRIC_SPECS.items():
+        lines.append(f"# HELP {name} {spec.help}")
+        lines.append(f"# TYPE {name} {spec.kind}")
+        if spec.kind == "histogram":
+            for labels, values in sorted(histograms.get(name, {}).items()):
+                cumulative = 0.0
+                for bound, bucketCount in zip(spec.buckets + (math.inf,), values):
+                    cumulative += bucketCount
+                    lines.append(
+                        f"{name}_bucket{_formatLabels(spec.labelNames, labels, ('le', _formatValue(float(bound))))} "
+                        f"{_formatValue(cumulative)}"
+                    )
+                lines.append(f"{name}_sum{_formatLabels(spec.labelNames, labels)} {_formatValue(values[-2])}")
+                lines.append(f"{name}_count{_formatLabels(spec.labelNames, labels)} {_formatValue(values[-1])}")
+            continue
+        for labels, value in sorted(scalars.get(name, {}).items()):
+            lines.append(f"{name}{_formatLabels(spec.labelNames, labels)} {_formatValue(value)}")
+    return "\n".join(lines) + "\n"
+
+
+async def runMetricsFlusher() -> None:
+    """설명: multiproc 모드에서 주기적으로 worker 스냅샷 기록 실패 동작: 개별 실패는 다음 주기에 재시도. 갱신일: 2026-10-18"""
+    intervalSeconds = metricsConfig.flushIntervalMs / 1000.0
+    while True:
+        await asyncio.sleep(intervalSeconds)
+        writeMetricsSnapshot()
+
+
+def startMetricsFlusher() -> bool:
+    """설명: 스냅샷 flush task 시작 반환값: multiproc 모드가 아니거나 이미 실행 중이면 False. 갱신일: 2026-10-18"""
+    global metricsFlushTask
+    if not metricsConfig.enabled or not metricsConfig.multiprocDir:
+        return False
+    if metricsFlushTask is not None and not metricsFlushTask.done():
+        return False
+    metricsFlushTask = asyncio.create_task(runMetricsFlusher())
+    return True
+
+
+async def stopMetricsFlusher() -> None:
+    """설명: flush task 취소 후 마지막 스냅샷 기록 부작용: 전역 task 참조 해제. 갱신일: 2026-10-18"""
+    global metricsFlushTask
+    task = metricsFlushTask
+    metricsFlushTask = None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    writeMetricsSnapshot()
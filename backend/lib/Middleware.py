@@ -6,7 +6,7 @@
 """
 
 import asyncio
-import json
+import logging
 import ipaddress
 import os
 import re
@@ -19,13 +19,19 @@ from starlette.responses import Response as StarletteResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from lib.Logger import logger
+from lib.Logger import logStructured, logger
 from .Masking import maskUserIdentifierForLog
-from .Database import getSqlCount, resetSqlCount
+from .Database import getSqlCount, resetPrimaryReadPin, resetSqlCount
+from .Metrics import UNMATCHED_ROUTE_LABEL, incCounter, isMetricsEnabled, observeHistogram, registerGauge
 from .Config import getConfig
 from .RequestContext import resetRequestId, setRequestId
 from .RequestTrust import getTrustedForwardedIp
-from .UserAccessLog import writeUserAccessLog
+from .UserAccessLog import (
+    enqueueUserAccessLog,
+    getUserAccessLogBufferedCount,
+    isUserAccessLogWriterRunning,
+    writeUserAccessLog,
+)
 
 SECURITY_RESPONSE_HEADERS = (
     ("X-Content-Type-Options", "nosniff"),
@@ -92,48 +98,57 @@ def _finishAccessLogTask(task: asyncio.Task[None]) -> None:
     except asyncio.CancelledError:
         return
     if failure is not None:
-        logger.error(
-            json.dumps(
-                {
-                    "level": "ERROR",
-                    "msg": "user_access_log_task_failed",
-                    "errorType": type(failure).__name__,
-                },
-                ensure_ascii=False,
-            )
+        logStructured(
+            logging.ERROR,
+            {
+                "level": "ERROR",
+                "msg": "user_access_log_task_failed",
+                "errorType": type(failure).__name__,
+            },
         )
 
 
 def scheduleUserAccessLog(**kwargs: object) -> bool:
-    """상한 내에서 접근 로그 태스크를 강한 참조로 보존한다."""
+    """상한 내에서 접근 로그 태스크를 강한 참조로 보존한다. 배치 writer가 실행 중이면 그 버퍼에 적재한다."""
+    if isUserAccessLogWriterRunning():
+        if enqueueUserAccessLog(**kwargs):
+            return True
+        incCounter("access_log_tasks_dropped_total")
+        logStructured(
+            logging.WARNING,
+            {
+                "level": "WARNING",
+                "msg": "user_access_log_buffer_full",
+                "buffered": getUserAccessLogBufferedCount(),
+                "requestId": kwargs.get("requestId"),
+            },
+        )
+        return False
     cap = getAccessLogPendingTaskCap()
     if len(_pendingAccessLogTasks) >= cap:
-        logger.warning(
-            json.dumps(
-                {
-                    "level": "WARNING",
-                    "msg": "user_access_log_task_dropped",
-                    "pending": len(_pendingAccessLogTasks),
-                    "pendingCap": cap,
-                    "requestId": kwargs.get("requestId"),
-                },
-                ensure_ascii=False,
-            )
+        incCounter("access_log_tasks_dropped_total")
+        logStructured(
+            logging.WARNING,
+            {
+                "level": "WARNING",
+                "msg": "user_access_log_task_dropped",
+                "pending": len(_pendingAccessLogTasks),
+                "pendingCap": cap,
+                "requestId": kwargs.get("requestId"),
+            },
         )
         return False
     try:
         task = asyncio.create_task(writeUserAccessLogSafely(**kwargs))
     except Exception as failure:
-        logger.error(
-            json.dumps(
-                {
-                    "level": "ERROR",
-                    "msg": "user_access_log_task_create_failed",
-                    "errorType": type(failure).__name__,
-                    "requestId": kwargs.get("requestId"),
-                },
-                ensure_ascii=False,
-            )
+        logStructured(
+            logging.ERROR,
+            {
+                "level": "ERROR",
+                "msg": "user_access_log_task_create_failed",
+                "errorType": type(failure).__name__,
+                "requestId": kwargs.get("requestId"),
+            },
         )
         return False
     _pendingAccessLogTasks.add(task)
@@ -148,15 +163,13 @@ async def drainUserAccessLogTasks(timeout: float = 5.0) -> None:
         return
     done, stillPending = await asyncio.wait(pending, timeout=max(0.0, timeout))
     if stillPending:
-        logger.warning(
-            json.dumps(
-                {
-                    "level": "WARNING",
-                    "msg": "user_access_log_task_drain_timeout",
-                    "pending": len(stillPending),
-                },
-                ensure_ascii=False,
-            )
+        logStructured(
+            logging.WARNING,
+            {
+                "level": "WARNING",
+                "msg": "user_access_log_task_drain_timeout",
+                "pending": len(stillPending),
+            },
         )
         for task in stillPending:
             task.cancel()
@@ -165,6 +178,26 @@ async def drainUserAccessLogTasks(timeout: float = 5.0) -> None:
         _finishAccessLogTask(task)
 
 
+registerGauge("access_log_tasks_pending", lambda: len(_pendingAccessLogTasks) + getUserAccessLogBufferedCount())
+
+
+def resolveRouteTemplate(scope: Scope) -> str:
+    """설명: 매칭된 라우트의 경로 템플릿 조회(메트릭 라벨 카디널리티 제한) 반환값: 예) /api/v1/dashboard/{id}. 갱신일: 2026-10-18"""
+    routePath = getattr(scope.get("route"), "path", None)
+    return routePath if isinstance(routePath, str) and routePath else UNMATCHED_ROUTE_LABEL
+
+
+def recordRequestMetrics(scope: Scope, method: str, statusCode: int, elapsedSeconds: float, sqlCount: int) -> None:
+    """설명: 요청 수/지연/SQL 수 메트릭 기록 부작용: /metrics 누적값 갱신(비활성이면 no-op). 갱신일: 2026-10-18"""
+    if not isMetricsEnabled():
+        return
+    route = resolveRouteTemplate(scope)
+    labels = (method, route, str(statusCode))
+    incCounter("http_requests_total", labels)
+    observeHistogram("http_request_duration_seconds", labels, elapsedSeconds)
+    observeHistogram("http_request_sql_queries", (method, route), sqlCount)
+
+
 def parsePositiveInt(rawValue: object) -> int | None:
     """
     설명: 양의 정수 값만 파싱해서 반환. 호출 맥락의 제약을 기준으로 동작 기준 확정
@@ -336,6 +369,7 @@ class RequestLogMiddleware:
         scope.setdefault("state", {})["requestId"] = reqId
         token = setRequestId(reqId)
         resetSqlCount()
+        resetPrimaryReadPin()
         statusCode = 500
 
         async def sendWithRequestId(message: Message) -> None:
@@ -355,8 +389,10 @@ class RequestLogMiddleware:
             raise
         finally:
             try:
-                elapsedMs = int((time.perf_counter() - started) * 1000)
+                elapsedSeconds = time.perf_counter() - started
+                elapsedMs = int(elapsedSeconds * 1000)
                 sqlCount = getSqlCount()
+                recordRequestMetrics(scope, request.method, statusCode, elapsedSeconds, sqlCount)
                 username = resolveAuthUsername(request)
                 clientIp = resolveClientIp(request)
                 maskedUsername = maskUserIdentifierForLog(username)
@@ -378,7 +414,7 @@ class RequestLogMiddleware:
                 if maskedClientIp:
                     logObj["clientIpMasked"] = maskedClientIp
 
-                logger.info(json.dumps(logObj, ensure_ascii=False))
+                logStructured(logging.INFO, logObj)
                 threshold = getSqlWarnThreshold()
                 if sqlCount >= threshold:
                     warnObj = {
@@ -392,7 +428,7 @@ class RequestLogMiddleware:
                         "sql_warn_threshold": threshold,
                         "msg": "sql_count_high",
                     }
-                    logger.warning(json.dumps(warnObj, ensure_ascii=False))
+                    logStructured(logging.WARNING, warnObj)
                 if username:
                     scheduleUserAccessLog(
                         username=username,
@@ -407,3 +443,4 @@ class RequestLogMiddleware:
             finally:
                 resetRequestId(token)
                 resetSqlCount()
+                resetPrimaryReadPin()
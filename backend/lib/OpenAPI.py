@@ -14,11 +14,13 @@ from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from lib.Logger import logger
 from lib.OpenAPIHelpers import (
+    buildNotModifiedResponse,
     buildStandardErrorResponses,
     ensureErrorResponseRef,
     ensureHeaderRef,
     ensureJavaScriptCodeSample,
     ensureNoStoreResponse,
+    ensureRevalidatedResponse,
     isOpenapiPatchStrictEnabled,
     resolveServersFromConfig,
     schemaRef,
@@ -506,6 +508,16 @@ def attachOpenAPI(app: FastAPI, config) -> None:
                         "q": {"type": "string", "example": "테스트"},
                         "status": {"type": "string", "example": "ready"},
                         "totalCount": {"type": "integer", "minimum": 0, "example": 1},
+                        "totalExact": {
+                            "type": "boolean",
+                            "description": "False when list_total_mode=has_more skipped COUNT; totalCount is then a lower bound.",
+                            "example": True,
+                        },
+                        "hasMore": {"type": "boolean", "example": False},
+                        "nextCursor": {
+                            "anyOf": [{"type": "string"}, {"type": "null"}],
+                            "description": "Present only in cursor mode (cursor query parameter sent). Pass it back as cursor to fetch the next page; null on the last page.",
+                        },
                     },
                     "required": ["page", "size", "sort", "q", "status", "totalCount"],
                 }
@@ -686,6 +698,16 @@ def attachOpenAPI(app: FastAPI, config) -> None:
                         "fromDate": {"type": "string", "example": "2026-03-01"},
                         "toDate": {"type": "string", "example": "2026-03-31"},
                         "totalCount": {"type": "integer", "minimum": 0, "example": 3},
+                        "totalExact": {
+                            "type": "boolean",
+                            "description": "False when list_total_mode=has_more skipped COUNT; totalCount is then a lower bound.",
+                            "example": True,
+                        },
+                        "hasMore": {"type": "boolean", "example": False},
+                        "nextCursor": {
+                            "anyOf": [{"type": "string"}, {"type": "null"}],
+                            "description": "Present only in cursor mode (cursor query parameter sent). Pass it back as cursor to fetch the next page; null on the last page.",
+                        },
                     },
                     "required": ["page", "size", "q", "status", "fromDate", "toDate", "totalCount"],
                 }
@@ -1636,11 +1658,12 @@ def attachOpenAPI(app: FastAPI, config) -> None:
             sampleOverview = paths.get("/api/v1/sample/overview", {}).get("get")
             if isinstance(sampleOverview, dict):
                 responses = sampleOverview.setdefault("responses", {})
-                ensureNoStoreResponse(
+                ensureRevalidatedResponse(
                     responses.setdefault("200", {"description": "OK"}),
                     "OK (returns public sample overview counters)",
                     "SampleOverviewResponse",
                 )
+                responses["304"] = buildNotModifiedResponse()
                 ensureErrorResponseRef(sampleOverview, "503", "ServiceUnavailableErrorResponse")
                 ensureJavaScriptCodeSample(
                     sampleOverview,
@@ -1655,11 +1678,12 @@ def attachOpenAPI(app: FastAPI, config) -> None:
             sampleDashboard = paths.get("/api/v1/sample/dashboard", {}).get("get")
             if isinstance(sampleDashboard, dict):
                 responses = sampleDashboard.setdefault("responses", {})
-                ensureNoStoreResponse(
+                ensureRevalidatedResponse(
                     responses.setdefault("200", {"description": "OK"}),
                     "OK (returns public sample dashboard KPI, trend, and recent task bundles)",
                     "SampleDashboardResponse",
                 )
+                responses["304"] = buildNotModifiedResponse()
                 ensureErrorResponseRef(sampleDashboard, "503", "ServiceUnavailableErrorResponse")
                 ensureJavaScriptCodeSample(
                     sampleDashboard,
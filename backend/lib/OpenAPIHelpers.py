@@ -37,6 +37,29 @@ def buildNoStoreHeader(description: str = "Responses with Cache-Control: no-stor
     }
 
 
+def ensureRevalidatedResponse(response: Dict[str, Any], description: str, schemaName: str) -> None:
+    response["description"] = description
+    headers = response.setdefault("headers", {})
+    headers["Cache-Control"] = {
+        "description": "Clients must revalidate with If-None-Match before reusing a stored response.",
+        "schema": {"type": "string", "example": "no-cache"},
+    }
+    headers["ETag"] = {
+        "description": "Strong validator of the result payload; send it back as If-None-Match to receive 304.",
+        "schema": {"type": "string", "example": '"3f2a9c1e5b7d4a608e1f2c3b4a5d6e7f"'},
+    }
+    response.setdefault("content", {}).update(jsonSchemaContent(schemaName))
+
+
+def buildNotModifiedResponse() -> Dict[str, Any]:
+    return {
+        "description": "Not Modified (If-None-Match matched the current ETag)",
+        "headers": {
+            "ETag": {"description": "Current ETag of the result payload.", "schema": {"type": "string"}},
+        },
+    }
+
+
 def ensureJavaScriptCodeSample(operation: Dict[str, Any], source: str) -> None:
     samples = operation.setdefault("x-codeSamples", [])
     hasSample = any(
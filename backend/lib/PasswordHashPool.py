@@ -0,0 +1,227 @@
+"""
+파일명: backend/lib/PasswordHashPool.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: 비밀번호 해시/검증(PBKDF2·bcrypt)을 이벤트 루프 밖 전용 worker pool에서 실행하는 bounded executor
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from lib.Metrics import incCounter, observeHistogram, registerGauge
+from lib.QueryMetrics import QueryLatencyHistogram
+from lib.ServiceError import ServiceError
+
+HASH_POOL_MODES = frozenset({"thread", "process"})
+HASH_POOL_BUSY_CODE = "AUTH_503_HASH_BUSY"
+
+
+@dataclass(frozen=True)
+class PasswordHashPoolConfig:
+    mode: str = "thread"
+    workers: int = 2
+    queueLimit: int = 32
+
+
+def runTimedHashJob(fn: Callable[..., Any], args: tuple[Any, ...], submittedAt: float) -> tuple[Any, float, float]:
+    """
+    설명: worker 안에서 해시 함수를 실행하고 대기/실행 시간을 함께 반환
+    처리 규칙: 프로세스 간에도 비교 가능한 time.monotonic 기준으로 queue wait/hash time(ms)을 계산
+    반환값: (함수 결과, 큐 대기 ms, 해시 실행 ms)
+    갱신일: 2026-10-18
+    """
+    startedAt = time.monotonic()
+    result = fn(*args)
+    finishedAt = time.monotonic()
+    return result, max(0.0, (startedAt - submittedAt) * 1000.0), (finishedAt - startedAt) * 1000.0
+
+
+def summarizeHashTimings(prefix: str, histogram: QueryLatencyHistogram) -> dict[str, float]:
+    return {
+        f"{prefix}Avg": round(histogram.totalMs / histogram.count, 3) if histogram.count else 0.0,
+        f"{prefix}P50": round(histogram.percentile(0.50), 3),
+        f"{prefix}P95": round(histogram.percentile(0.95), 3),
+        f"{prefix}Max": round(histogram.maxMs, 3),
+    }
+
+
+class PasswordHashPool:
+    """
+    설명: 해시 작업 동시 보유량(workers + queueLimit)을 제한하는 전용 executor 래퍼
+    처리 규칙: 상한 초과 시 대기열에 쌓지 않고 즉시 ServiceError(AUTH_503_HASH_BUSY)로 거절
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, config: PasswordHashPoolConfig | None = None):
+        self.config = config or PasswordHashPoolConfig()
+        self.executor: Executor | None = None
+        self.lock = threading.Lock()
+        self.inFlight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.queueWait = QueryLatencyHistogram()
+        self.hashTime = QueryLatencyHistogram()
+
+    @property
+    def capacity(self) -> int:
+        """설명: 실행 중 + 대기 중 작업의 허용 상한 반환값: workers + queueLimit. 갱신일: 2026-10-18"""
+        return self.config.workers + self.config.queueLimit
+
+    @property
+    def queueDepth(self) -> int:
+        """설명: worker를 기다리는 작업 수 반환값: in-flight 중 worker 수를 넘는 만큼. 갱신일: 2026-10-18"""
+        return max(0, self.inFlight - self.config.workers)
+
+    def getExecutor(self) -> Executor:
+        """설명: 설정 mode에 맞는 executor를 최초 사용 시점에 생성 반환값: Thread/ProcessPoolExecutor. 갱신일: 2026-10-18"""
+        with self.lock:
+            if self.executor is None:
+                if self.config.mode == "process":
+                    self.executor = ProcessPoolExecutor(max_workers=self.config.workers)
+                else:
+                    self.executor = ThreadPoolExecutor(
+                        max_workers=self.config.workers,
+                        thread_name_prefix="password-hash",
+                    )
+            return self.executor
+
+    def tryAcquireSlot(self) -> bool:
+        """설명: 상한 내에서 in-flight 슬롯 확보 반환값: 확보 성공 여부. 갱신일: 2026-10-18"""
+        with self.lock:
+            if self.inFlight >= self.capacity:
+                self.rejected += 1
+                incCounter("password_hash_rejections_total")
+                return False
+            self.inFlight += 1
+            return True
+
+    def releaseSlot(self, queueWaitMs: float | None, hashMs: float | None) -> None:
+        """설명: in-flight 슬롯 반환과 대기/해시 시간 누적 부작용: 내부 통계와 /metrics 히스토그램 갱신. 갱신일: 2026-10-18"""
+        with self.lock:
+            self.inFlight = max(0, self.inFlight - 1)
+            if queueWaitMs is None or hashMs is None:
+                self.failed += 1
+                return
+            self.completed += 1
+            self.queueWait.observe(queueWaitMs, None, False, False)
+            self.hashTime.observe(hashMs, None, False, False)
+        observeHistogram("password_hash_queue_wait_seconds", (self.config.mode,), queueWaitMs / 1000.0)
+        observeHistogram("password_hash_duration_seconds", (self.config.mode,), hashMs / 1000.0)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        설명: 해시 함수를 전용 pool에서 실행하고 결과를 반환
+        실패 동작: 대기열이 가득 차면 ServiceError(AUTH_503_HASH_BUSY), 함수 예외는 그대로 전파
+        갱신일: 2026-10-18
+        """
+        if not self.tryAcquireSlot():
+            raise ServiceError(HASH_POOL_BUSY_CODE)
+        queueWaitMs: float | None = None
+        hashMs: float | None = None
+        try:
+            loop = asyncio.get_running_loop()
+            result, queueWaitMs, hashMs = await loop.run_in_executor(
+                self.getExecutor(),
+                runTimedHashJob,
+                fn,
+                args,
+                time.monotonic(),
+            )
+            return result
+        finally:
+            self.releaseSlot(queueWaitMs, hashMs)
+
+    def snapshot(self) -> dict[str, Any]:
+        """설명: 관측용 pool 통계 스냅샷 반환값: mode/용량/in-flight/대기열 깊이/거절 수/대기·해시 시간 avg·p50·p95·max dict. 갱신일: 2026-10-18"""
+        with self.lock:
+            completed = self.completed
+            return {
+                "mode": self.config.mode,
+                "workers": self.config.workers,
+                "queueLimit": self.config.queueLimit,
+                "inFlight": self.inFlight,
+                "queueDepth": self.queueDepth,
+                "completed": completed,
+                "rejected": self.rejected,
+                "failed": self.failed,
+                **summarizeHashTimings("queueWaitMs", self.queueWait),
+                **summarizeHashTimings("hashMs", self.hashTime),
+            }
+
+    def shutdown(self) -> None:
+        """설명: 내부 executor 종료 부작용: 실행 중 작업 완료를 기다린 뒤 worker 해제. 갱신일: 2026-10-18"""
+        with self.lock:
+            executor = self.executor
+            self.executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+passwordHashPool = PasswordHashPool()
+registerGauge("password_hash_pool_queue_depth", lambda: passwordHashPool.queueDepth)
+registerGauge("password_hash_pool_in_flight", lambda: passwordHashPool.inFlight)
+
+
+def _readPositiveInt(section, key: str, envName: str, fallback: int) -> int:
+    rawValue = os.getenv(envName)
+    if rawValue is None and section is not None:
+        rawValue = section.get(key)
+    if rawValue is None or not str(rawValue).strip():
+        return fallback
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"AUTH {key} must be an integer") from error
+    if value < 1:
+        raise ValueError(f"AUTH {key} must be at least 1")
+    return value
+
+
+def configurePasswordHashPool(config) -> PasswordHashPoolConfig:
+    """
+    설명: [AUTH] hash_pool_mode/hash_pool_workers/hash_pool_queue_limit(ENV 우선)로 전역 pool 재구성
+    실패 동작: 미지원 mode 또는 1 미만 정수는 ValueError
+    부작용: 기존 pool executor를 종료하고 새 pool로 교체
+    갱신일: 2026-10-18
+    """
+    global passwordHashPool
+    section = config["AUTH"] if config is not None and "AUTH" in config else None
+    rawMode = os.getenv("AUTH_HASH_POOL_MODE")
+    if rawMode is None and section is not None:
+        rawMode = section.get("hash_pool_mode")
+    mode = str(rawMode or "thread").strip().lower()
+    if mode not in HASH_POOL_MODES:
+        raise ValueError("AUTH hash_pool_mode must be thread or process")
+    defaultWorkers = max(1, min(4, os.cpu_count() or 1))
+    poolConfig = PasswordHashPoolConfig(
+        mode=mode,
+        workers=_readPositiveInt(section, "hash_pool_workers", "AUTH_HASH_POOL_WORKERS", defaultWorkers),
+        queueLimit=_readPositiveInt(section, "hash_pool_queue_limit", "AUTH_HASH_POOL_QUEUE_LIMIT", 32),
+    )
+    previousPool = passwordHashPool
+    passwordHashPool = PasswordHashPool(poolConfig)
+    previousPool.shutdown()
+    return poolConfig
+
+
+async def runPasswordHashJob(fn: Callable[..., Any], *args: Any) -> Any:
+    """설명: 전역 pool에서 해시 작업 실행 반환값: fn(*args) 결과. 갱신일: 2026-10-18"""
+    return await passwordHashPool.run(fn, *args)
+
+
+def getPasswordHashPoolStats() -> dict[str, Any]:
+    """설명: 전역 pool 통계 조회 반환값: PasswordHashPool.snapshot() 결과. 갱신일: 2026-10-18"""
+    return passwordHashPool.snapshot()
+
+
+def shutdownPasswordHashPool() -> None:
+    """설명: 전역 pool executor 종료 부작용: 종료 시점 worker 스레드/프로세스 해제. 갱신일: 2026-10-18"""
+    passwordHashPool.shutdown()
@@ -0,0 +1,227 @@
+"""
+파일명: backend/lib/QueryMetrics.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: queryName별 SQL 실행 시간 히스토그램과 느린 쿼리(db.query.slow) 감지
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from lib.Logger import logStructured
+from lib.RequestContext import getRequestId
+
+# 누적 버킷 상한(ms). 마지막 버킷(+Inf)은 상한을 넘는 나머지 전부
+QUERY_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+QUERY_METRICS_OVERFLOW_NAME = "__other__"
+
+
+@dataclass(frozen=True)
+class QueryMetricsConfig:
+    slowQueryMs: int = 500
+    maxQueryNames: int = 1000
+    internalStatsEnabled: bool = False
+
+
+class QueryLatencyHistogram:
+    """설명: 고정 버킷 기반 지연 분포(호출/실패 수, 합계, 최대, 반환·영향 행 수) 갱신일: 2026-10-18"""
+
+    __slots__ = ("bucketCounts", "count", "errors", "totalMs", "maxMs", "rows", "slow")
+
+    def __init__(self):
+        self.bucketCounts = [0] * (len(QUERY_LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.totalMs = 0.0
+        self.maxMs = 0.0
+        self.rows = 0
+        self.slow = 0
+
+    def observe(self, durationMs: float, rowCount: int | None, failed: bool, slow: bool) -> None:
+        self.bucketCounts[bisect.bisect_left(QUERY_LATENCY_BUCKETS_MS, durationMs)] += 1
+        self.count += 1
+        self.totalMs += durationMs
+        self.maxMs = max(self.maxMs, durationMs)
+        if failed:
+            self.errors += 1
+        if slow:
+            self.slow += 1
+        if rowCount is not None and rowCount > 0:
+            self.rows += rowCount
+
+    def percentile(self, ratio: float) -> float:
+        """
+        설명: 버킷 상한 기준 분위수 추정
+        처리 규칙: 해당 순위가 속한 버킷의 상한을 반환하되 관측 최대값을 넘지 않음
+        반환값: ms(관측 없음이면 0)
+        갱신일: 2026-10-18
+        """
+        if self.count <= 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * ratio))
+        seen = 0
+        for index, bucketCount in enumerate(self.bucketCounts):
+            seen += bucketCount
+            if seen >= rank:
+                if index < len(QUERY_LATENCY_BUCKETS_MS):
+                    return min(QUERY_LATENCY_BUCKETS_MS[index], self.maxMs)
+                return self.maxMs
+        return self.maxMs
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "slow": self.slow,
+            "rows": self.rows,
+            "totalMs": round(self.totalMs, 3),
+            "avgMs": round(self.totalMs / self.count, 3) if self.count else 0.0,
+            "p50Ms": round(self.percentile(0.50), 3),
+            "p95Ms": round(self.percentile(0.95), 3),
+            "p99Ms": round(self.percentile(0.99), 3),
+            "maxMs": round(self.maxMs, 3),
+            "buckets": list(self.bucketCounts),
+        }
+
+
+class QueryMetricsRegistry:
+    """
+    설명: queryName → 히스토그램 레지스트리
+    처리 규칙: 이름 수가 maxQueryNames를 넘으면 이후 신규 이름은 __other__로 합산(메모리 상한)
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, config: QueryMetricsConfig | None = None):
+        self.config = config or QueryMetricsConfig()
+        self.lock = threading.Lock()
+        self.histograms: dict[str, QueryLatencyHistogram] = {}
+
+    def isSlow(self, durationMs: float) -> bool:
+        return self.config.slowQueryMs > 0 and durationMs >= self.config.slowQueryMs
+
+    def observe(self, queryName: str, durationMs: float, rowCount: int | None, failed: bool) -> bool:
+        """설명: 실행 1건 기록 반환값: 느린 쿼리 기준 초과 여부. 갱신일: 2026-10-18"""
+        slow = self.isSlow(durationMs)
+        with self.lock:
+            histogram = self.histograms.get(queryName)
+            if histogram is None:
+                if len(self.histograms) >= self.config.maxQueryNames:
+                    queryName = QUERY_METRICS_OVERFLOW_NAME
+                    histogram = self.histograms.get(queryName)
+                if histogram is None:
+                    histogram = QueryLatencyHistogram()
+                    self.histograms[queryName] = histogram
+            histogram.observe(durationMs, rowCount, failed, slow)
+        return slow
+
+    def snapshot(self) -> dict[str, Any]:
+        """설명: 관측용 전체 스냅샷 반환값: 버킷 경계/느린 쿼리 기준/queryName별 통계 dict. 갱신일: 2026-10-18"""
+        with self.lock:
+            queries = {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+        return {
+            "slowQueryMs": self.config.slowQueryMs,
+            "bucketBoundsMs": list(QUERY_LATENCY_BUCKETS_MS),
+            "queries": dict(sorted(queries.items())),
+        }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.histograms.clear()
+
+
+queryMetrics = QueryMetricsRegistry()
+
+
+def _readInt(section, key: str, envName: str, fallback: int, minimum: int) -> int:
+    rawValue = os.getenv(envName)
+    if rawValue is None and section is not None:
+        rawValue = section.get(key)
+    if rawValue is None or not str(rawValue).strip():
+        return fallback
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"OBSERVABILITY {key} must be an integer") from error
+    if value < minimum:
+        raise ValueError(f"OBSERVABILITY {key} must be at least {minimum}")
+    return value
+
+
+def configureQueryMetrics(config) -> QueryMetricsConfig:
+    """
+    설명: [OBSERVABILITY] slow_query_ms/query_metrics_max_names/internal_stats_enabled(ENV 우선) 반영
+    처리 규칙: slow_query_ms=0이면 db.query.slow 이벤트를 끄고 히스토그램만 유지, 기존 누적값은 보존
+    실패 동작: 범위를 벗어난 정수/정수 아님은 ValueError
+    갱신일: 2026-10-18
+    """
+    section = config["OBSERVABILITY"] if config is not None and "OBSERVABILITY" in config else None
+    rawEnabled = os.getenv("INTERNAL_STATS_ENABLED")
+    if rawEnabled is None and section is not None:
+        rawEnabled = section.get("internal_stats_enabled")
+    metricsConfig = QueryMetricsConfig(
+        slowQueryMs=_readInt(section, "slow_query_ms", "DB_SLOW_QUERY_MS", 500, 0),
+        maxQueryNames=_readInt(section, "query_metrics_max_names", "DB_QUERY_METRICS_MAX_NAMES", 1000, 1),
+        internalStatsEnabled=str(rawEnabled or "").strip().lower() in ("1", "true", "yes", "on"),
+    )
+    queryMetrics.config = metricsConfig
+    return metricsConfig
+
+
+def recordQueryTiming(
+    queryName: str,
+    durationMs: float,
+    rowCount: int | None = None,
+    failed: bool = False,
+) -> None:
+    """
+    설명: SQL 1건의 실행 시간을 히스토그램에 기록하고 기준 초과 시 db.query.slow 이벤트 출력
+    부작용: 느린 쿼리는 requestId와 함께 WARNING 구조 로그(SQL 본문 제외)
+    갱신일: 2026-10-18
+    """
+    if not queryMetrics.observe(queryName, durationMs, rowCount, failed):
+        return
+    payload: dict[str, Any] = {
+        "event": "db.query.slow",
+        "queryName": queryName,
+        "durationMs": round(durationMs, 3),
+        "thresholdMs": queryMetrics.config.slowQueryMs,
+        "requestId": getRequestId(),
+    }
+    if rowCount is not None:
+        payload["rows"] = rowCount
+    if failed:
+        payload["failed"] = True
+    logStructured(logging.WARNING, payload)
+
+
+def getQueryMetricsSnapshot() -> dict[str, Any]:
+    return queryMetrics.snapshot()
+
+
+def isInternalStatsEnabled() -> bool:
+    return queryMetrics.config.internalStatsEnabled
+
+
+def resetQueryMetrics() -> None:
+    queryMetrics.reset()
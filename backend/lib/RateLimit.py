@@ -1,22 +1,36 @@
 """
 파일명: backend/lib/RateLimit.py
 작성자: LSH
-갱신일: 2026-02-24
-설명: 간단한 인메모리 속도 제한기와 FastAPI용 체크 헬퍼
+갱신일: 2026-10-18
+설명: 속도 제한기(인메모리/호스트 공유 메모리/DB 공유 저장소)와 FastAPI용 체크 헬퍼
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
+import math
+import mmap
 import os
 import re
+import struct
+import tempfile
 import time
 from collections import deque
-from threading import RLock
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from threading import Lock, RLock
 from typing import Optional
 
+from lib import Database as DB
+from lib.ExpiryIndex import ExpiryIndex
+from lib.Logger import logger
+
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
+from lib.Metrics import incCounter
 from lib.RequestTrust import getTrustedForwardedIp, isTrustedProxyRequest
 from lib.Response import errorResponse
 
@@ -32,13 +46,14 @@ class RateLimiter:
     def __init__(self, limit: int = 5, windowSec: int = 60, sweepEvery: int = 256):
         """
         설명: 제한 횟수/윈도우/청소 주기 초기화
-        처리 규칙: sweepEvery는 최소 1로 보정하고 내부 store/hitCount를 초기화
+        처리 규칙: sweepEvery는 최소 1로 보정하고 내부 store/hitCount/만료 색인을 초기화
         부작용: 인메모리 카운터 상태를 새로 생성
-        갱신일: 2026-02-27
+        갱신일: 2026-10-18
         """
         self.limit = int(limit)
         self.window = int(windowSec)
         self.store = {}
+        self.expiryIndex = ExpiryIndex(resolution=1.0)
         self.sweepEvery = max(1, int(sweepEvery))
         self.hitCount = 0
         self.lock = RLock()
@@ -55,20 +70,23 @@ class RateLimiter:
 
     def sweepExpired(self, nowSec: float) -> None:
         """
-        설명: 윈도우를 벗어난 키를 일괄 정리해 메모리 증 완화
-        처리 규칙: 각 키의 오래된 타임스탬프를 제거하고 비어 있는 키는 store에서 제거
+        설명: 윈도우를 벗어난 키를 정리해 메모리 증가 완화
+        처리 규칙: 만료 색인에서 마지막 hit + window가 지난 키만 꺼내 확인하고(전체 키 순회 없음),
+        비었으면 store에서 제거, 아직 남은 timestamp가 있으면 최신 hit 기준으로 재등록
         부작용: self.store 내부 상태를 직접 변경
-        갱신일: 2026-02-24
+        갱신일: 2026-10-18
         """
         with self.lock:
-            expiredKeys = []
-            for key, timestamps in list(self.store.items()):
+            for key in self.expiryIndex.popExpired(nowSec):
+                timestamps = self.store.get(key)
+                if timestamps is None:
+                    continue
                 while timestamps and nowSec - timestamps[0] > self.window:
                     timestamps.popleft()
-                if not timestamps:
-                    expiredKeys.append(key)
-            for key in expiredKeys:
-                self.store.pop(key, None)
+                if timestamps:
+                    self.expiryIndex.schedule(key, timestamps[-1] + self.window)
+                else:
+                    self.store.pop(key, None)
 
     def hit(self, key: str, *, commit: bool = True):
         """
@@ -92,12 +110,14 @@ class RateLimiter:
                 timestamps.popleft()
             if not timestamps and not commit:
                 self.store.pop(key, None)
+                self.expiryIndex.discard(key)
                 return True, 0
             if len(timestamps) >= self.limit:
                 retryAfter = max(1, int(self.window - (now - timestamps[0])))
                 return False, retryAfter
             if commit:
                 timestamps.append(now)
+                self.expiryIndex.schedule(key, now + self.window)
             return True, 0
 
     def reserve(self, keys):
@@ -125,6 +145,7 @@ class RateLimiter:
                     timestamps.popleft()
                 if not timestamps:
                     self.store.pop(key, None)
+                    self.expiryIndex.discard(key)
                     continue
                 if len(timestamps) >= self.limit:
                     retryAfter = max(1, int(self.window - (now - timestamps[0])))
@@ -139,6 +160,7 @@ class RateLimiter:
                     timestamps = deque()
                     self.store[key] = timestamps
                 timestamps.append(now)
+                self.expiryIndex.schedule(key, now + self.window)
                 reservationEntries.append((key, now))
             self.reservations[reservationId] = tuple(reservationEntries)
             return True, 0, reservationId
@@ -167,7 +189,494 @@ class RateLimiter:
                     continue
                 if not timestamps:
                     self.store.pop(key, None)
+                    self.expiryIndex.discard(key)
+            return True
+
+
+class SlidingWindowCounter:
+    """
+    설명: 키당 고정 크기(윈도우 번호 + 현재/이전 윈도우 카운트) sliding-window counter 레코드
+    처리 규칙: 추정치 = 이전 윈도우 수 x (1 - 경과 비율) + 현재 윈도우 수, 타임스탬프를 hit마다 저장하지 않음
+    갱신일: 2026-10-18
+    """
+
+    __slots__ = ("windowIdx", "current", "previous")
+
+    def __init__(self, windowIdx: int):
+        self.windowIdx = windowIdx
+        self.current = 0
+        self.previous = 0
+
+    def roll(self, windowIdx: int) -> "SlidingWindowCounter":
+        if self.windowIdx != windowIdx:
+            self.previous = self.current if self.windowIdx == windowIdx - 1 else 0
+            self.current = 0
+            self.windowIdx = windowIdx
+        return self
+
+    def release(self, windowIdx: int, reservedIdx: int) -> None:
+        """설명: reservedIdx 윈도우에 기록한 1건을 되돌림(이미 두 윈도우 이상 지났으면 no-op) 갱신일: 2026-10-18"""
+        self.roll(windowIdx)
+        if reservedIdx == windowIdx:
+            self.current = max(0, self.current - 1)
+        elif reservedIdx == windowIdx - 1:
+            self.previous = max(0, self.previous - 1)
+
+    def isIdle(self, windowIdx: int) -> bool:
+        return self.windowIdx < windowIdx - 1 or (self.current == 0 and self.previous == 0)
+
+    def retryAfter(self, limit: int, windowSec: int, elapsedSec: float) -> int | None:
+        """설명: 추정치가 limit 미만이면 None, 초과면 통과 가능 시점까지 초 갱신일: 2026-10-18"""
+        estimate = self.previous * (1 - elapsedSec / windowSec) + self.current
+        if estimate < limit:
+            return None
+        if self.current >= limit or self.previous <= 0:
+            return max(1, math.ceil(windowSec - elapsedSec))
+        waitSec = windowSec * (1 - (limit - self.current) / self.previous) - elapsedSec
+        return max(1, math.ceil(waitSec))
+
+
+class SlidingWindowRateLimiter:
+    """
+    설명: 키당 SlidingWindowCounter 1개만 두는 O(1) 메모리 근사 속도 제한기(프로세스 단위)
+    처리 규칙: 키 해시로 stripe를 골라 stripe별 Lock/dict만 잠그고, multi-key 예약은 stripe 번호 순으로 잠가 교착을 피함,
+    만료 정리는 sweepEvery hit마다 stripe 하나씩 순환(전체 스캔 정지 없음)
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, limit: int = 5, windowSec: int = 60, stripes: int = 64, sweepEvery: int = 256):
+        self.limit = int(limit)
+        self.window = max(1, int(windowSec))
+        self.stripeCount = max(1, int(stripes))
+        self.sweepEvery = max(1, int(sweepEvery))
+        self.shards: list[dict[str, SlidingWindowCounter]] = [{} for _ in range(self.stripeCount)]
+        self.locks = [Lock() for _ in range(self.stripeCount)]
+        self.hitCounter = itertools.count(1)
+        self.reservationCounter = itertools.count(1)
+        self.reservations = {}
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def windowPosition(self, nowSec: float) -> tuple[int, float]:
+        windowIdx = int(nowSec // self.window)
+        return windowIdx, nowSec - windowIdx * self.window
+
+    def stripeFor(self, key: str) -> int:
+        return hash(key) % self.stripeCount
+
+    def keyCount(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def maybeSweep(self, windowIdx: int) -> None:
+        hitNumber = next(self.hitCounter)
+        if hitNumber % self.sweepEvery:
+            return
+        stripe = (hitNumber // self.sweepEvery) % self.stripeCount
+        with self.locks[stripe]:
+            shard = self.shards[stripe]
+            for key in [key for key, counter in shard.items() if counter.roll(windowIdx).isIdle(windowIdx)]:
+                del shard[key]
+
+    def hit(self, key: str, *, commit: bool = True):
+        """설명: RateLimiter.hit과 같은 계약(근사 sliding window) 갱신일: 2026-10-18"""
+        windowIdx, elapsedSec = self.windowPosition(self.now())
+        self.maybeSweep(windowIdx)
+        stripe = self.stripeFor(key)
+        with self.locks[stripe]:
+            shard = self.shards[stripe]
+            counter = shard.get(key)
+            if counter is None:
+                if not commit:
+                    return True, 0
+                counter = shard[key] = SlidingWindowCounter(windowIdx)
+            retryAfter = counter.roll(windowIdx).retryAfter(self.limit, self.window, elapsedSec)
+            if retryAfter is not None:
+                return False, retryAfter
+            if commit:
+                counter.current += 1
+            return True, 0
+
+    def reserve(self, keys):
+        """설명: RateLimiter.reserve와 같은 계약으로 여러 키를 원자적으로 예약 갱신일: 2026-10-18"""
+        uniqueKeys = tuple(dict.fromkeys(str(key) for key in keys if str(key)))
+        if not uniqueKeys:
+            raise ValueError("rate-limit reservation requires at least one key")
+        windowIdx, elapsedSec = self.windowPosition(self.now())
+        self.maybeSweep(windowIdx)
+        stripes = sorted({self.stripeFor(key) for key in uniqueKeys})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self.locks[stripe])
+            for key in uniqueKeys:
+                counter = self.shards[self.stripeFor(key)].get(key)
+                if counter is None:
+                    continue
+                retryAfter = counter.roll(windowIdx).retryAfter(self.limit, self.window, elapsedSec)
+                if retryAfter is not None:
+                    return False, retryAfter, None
+            for key in uniqueKeys:
+                shard = self.shards[self.stripeFor(key)]
+                counter = shard.get(key)
+                if counter is None:
+                    counter = shard[key] = SlidingWindowCounter(windowIdx)
+                counter.current += 1
+            reservationId = next(self.reservationCounter)
+            self.reservations[reservationId] = (uniqueKeys, windowIdx)
+            return True, 0, reservationId
+
+    def finalizeReservation(self, reservationId, *, keep: bool) -> bool:
+        """설명: RateLimiter.finalizeReservation과 같은 계약(해제 시 예약 윈도우에서 1 감소) 갱신일: 2026-10-18"""
+        reservation = self.reservations.pop(reservationId, None)
+        if reservation is None:
+            return False
+        if keep:
             return True
+        uniqueKeys, reservedIdx = reservation
+        windowIdx, _ = self.windowPosition(self.now())
+        for key in uniqueKeys:
+            stripe = self.stripeFor(key)
+            with self.locks[stripe]:
+                counter = self.shards[stripe].get(key)
+                if counter is not None:
+                    counter.release(windowIdx, reservedIdx)
+        return True
+
+
+SHARED_RATE_LIMIT_MAGIC = b"RLSHM001"
+SHARED_RATE_LIMIT_HEADER = struct.Struct("<8sIIQ")
+SHARED_RATE_LIMIT_HEADER_BYTES = 64
+SHARED_RATE_LIMIT_MAX_PROBE = 16
+
+
+class SharedMemoryRateLimiter:
+    """
+    설명: 같은 호스트의 모든 worker가 mmap 파일 하나를 공유하는 고정 크기 속도 제한 테이블
+    처리 규칙: 슬롯 = 키 해시(8B) + limit개 wall-clock 타임스탬프, 선형 탐사(최대 16칸)로 찾고
+    빈/만료 슬롯을 재사용하며 탐사 범위가 가득 차면 가장 오래 쓰이지 않은 슬롯을 축출,
+    검사/기록은 프로세스 내 Lock + 파일 flock으로 직렬화(호출당 syscall 2회)
+    실패 동작: fcntl이 없는 플랫폼이면 생성 시 RuntimeError
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, limit: int, windowSec: int, path: str, slotCount: int = 65_536):
+        import fcntl
+
+        self.fcntl = fcntl
+        self.limit = int(limit)
+        self.window = int(windowSec)
+        self.path = path
+        self.slotCount = max(SHARED_RATE_LIMIT_MAX_PROBE, int(slotCount))
+        self.slotStruct = struct.Struct(f"<Q{self.limit}d")
+        self.slotBytes = self.slotStruct.size
+        self.lock = Lock()
+        self.reservationSequence = 0
+        self.reservations = {}
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        totalBytes = SHARED_RATE_LIMIT_HEADER_BYTES + self.slotCount * self.slotBytes
+        expectedHeader = SHARED_RATE_LIMIT_HEADER.pack(
+            SHARED_RATE_LIMIT_MAGIC, self.slotCount, self.limit, self.window * 1000
+        )
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            currentHeader = os.pread(self.fd, SHARED_RATE_LIMIT_HEADER.size, 0)
+            if os.fstat(self.fd).st_size != totalBytes or currentHeader != expectedHeader:
+                # 설정(limit/window/slot 수)이 다른 테이블은 해석할 수 없으므로 새로 초기화
+                os.ftruncate(self.fd, 0)
+                os.ftruncate(self.fd, totalBytes)
+                os.pwrite(self.fd, expectedHeader, 0)
+            self.mm = mmap.mmap(self.fd, totalBytes)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def now(self) -> float:
+        """설명: 프로세스 간 비교 가능한 wall-clock 초(monotonic은 프로세스마다 기준이 달라 사용 불가) 갱신일: 2026-10-18"""
+        return time.time()
+
+    def hashKey(self, key: str) -> int:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little") | 1
+
+    def slotOffset(self, index: int) -> int:
+        return SHARED_RATE_LIMIT_HEADER_BYTES + index * self.slotBytes
+
+    def readSlot(self, index: int) -> tuple[int, list[float]]:
+        values = self.slotStruct.unpack_from(self.mm, self.slotOffset(index))
+        return values[0], list(values[1:])
+
+    def writeSlot(self, index: int, keyHash: int, timestamps: list[float]) -> None:
+        padded = sorted(timestamps)[-self.limit :] + [0.0] * (self.limit - len(timestamps))
+        self.slotStruct.pack_into(self.mm, self.slotOffset(index), keyHash, *padded)
+
+    def activeTimestamps(self, timestamps: list[float], nowSec: float) -> list[float]:
+        return [stamp for stamp in timestamps if stamp > 0.0 and nowSec - stamp <= self.window]
+
+    def findSlot(self, keyHash: int, nowSec: float, create: bool) -> int | None:
+        """
+        설명: 키 해시의 슬롯 위치 탐색(필요 시 확보)
+        처리 규칙: 탐사 범위 전체에서 일치 슬롯을 먼저 찾고, 없을 때만 첫 빈/만료 슬롯 또는 가장 오래된 슬롯을 재사용
+        반환값: 슬롯 index, create=False이고 없으면 None
+        갱신일: 2026-10-18
+        """
+        start = keyHash % self.slotCount
+        reusable = None
+        oldestIndex = start
+        oldestStamp = math.inf
+        for probe in range(SHARED_RATE_LIMIT_MAX_PROBE):
+            index = (start + probe) % self.slotCount
+            slotHash, timestamps = self.readSlot(index)
+            if slotHash == keyHash:
+                return index
+            if not create or reusable is not None:
+                continue
+            if slotHash == 0 or not self.activeTimestamps(timestamps, nowSec):
+                reusable = index
+                continue
+            newestStamp = max(timestamps)
+            if newestStamp < oldestStamp:
+                oldestIndex, oldestStamp = index, newestStamp
+        if not create:
+            return None
+        index = reusable if reusable is not None else oldestIndex
+        self.writeSlot(index, keyHash, [])
+        return index
+
+    @contextmanager
+    def locked(self):
+        with self.lock:
+            self.fcntl.flock(self.fd, self.fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                self.fcntl.flock(self.fd, self.fcntl.LOCK_UN)
+
+    def retryAfterFor(self, active: list[float], nowSec: float) -> int:
+        return max(1, int(self.window - (nowSec - min(active))))
+
+    def hit(self, key: str, *, commit: bool = True):
+        """설명: RateLimiter.hit과 같은 계약으로 공유 테이블에 검사/기록 갱신일: 2026-10-18"""
+        keyHash = self.hashKey(key)
+        with self.locked():
+            nowSec = self.now()
+            index = self.findSlot(keyHash, nowSec, create=commit)
+            if index is None:
+                return True, 0
+            active = self.activeTimestamps(self.readSlot(index)[1], nowSec)
+            if len(active) >= self.limit:
+                return False, self.retryAfterFor(active, nowSec)
+            if commit:
+                self.writeSlot(index, keyHash, active + [nowSec])
+            return True, 0
+
+    def reserve(self, keys):
+        """설명: RateLimiter.reserve와 같은 계약으로 여러 키를 원자적으로 예약 갱신일: 2026-10-18"""
+        uniqueKeys = tuple(dict.fromkeys(str(key) for key in keys if str(key)))
+        if not uniqueKeys:
+            raise ValueError("rate-limit reservation requires at least one key")
+        with self.locked():
+            nowSec = self.now()
+            for key in uniqueKeys:
+                index = self.findSlot(self.hashKey(key), nowSec, create=False)
+                if index is None:
+                    continue
+                active = self.activeTimestamps(self.readSlot(index)[1], nowSec)
+                if len(active) >= self.limit:
+                    return False, self.retryAfterFor(active, nowSec), None
+            reservationEntries = []
+            for key in uniqueKeys:
+                keyHash = self.hashKey(key)
+                index = self.findSlot(keyHash, nowSec, create=True)
+                active = self.activeTimestamps(self.readSlot(index)[1], nowSec)
+                self.writeSlot(index, keyHash, active + [nowSec])
+                reservationEntries.append((key, nowSec))
+            self.reservationSequence += 1
+            reservationId = self.reservationSequence
+            self.reservations[reservationId] = tuple(reservationEntries)
+            return True, 0, reservationId
+
+    def finalizeReservation(self, reservationId, *, keep: bool) -> bool:
+        """설명: RateLimiter.finalizeReservation과 같은 계약(예약 기록은 예약한 worker만 보유) 갱신일: 2026-10-18"""
+        with self.locked():
+            reservationEntries = self.reservations.pop(reservationId, None)
+            if reservationEntries is None:
+                return False
+            if keep:
+                return True
+            nowSec = self.now()
+            for key, reservedAt in reservationEntries:
+                keyHash = self.hashKey(key)
+                index = self.findSlot(keyHash, nowSec, create=False)
+                if index is None:
+                    continue
+                timestamps = [stamp for stamp in self.readSlot(index)[1] if stamp > 0.0]
+                if reservedAt in timestamps:
+                    timestamps.remove(reservedAt)
+                    self.writeSlot(index, keyHash, timestamps)
+            return True
+
+    def close(self) -> None:
+        try:
+            self.mm.close()
+        finally:
+            os.close(self.fd)
+
+
+class DatabaseRateLimiter:
+    """
+    설명: T_RATE_LIMIT의 (키, 윈도우) 카운터를 worker 간 공유하는 sliding-window counter 속도 제한기
+    처리 규칙: 판정 시점마다 원자적 upsert(HIT_CNT + 1 RETURNING 현재/이전 윈도우 수)로 공유 카운트를 먼저 올리고,
+    추정치(이전 윈도우 수 x 남은 비율 + 현재 윈도우 수)가 limit을 넘으면 방금 올린 1을 되돌린 뒤 거절.
+    증가 후 판정하므로 동시에 들어온 요청이 함께 통과할 수 없어 worker 수와 관계없이 limit이 유지됨,
+    검사 전용(commit=False)은 두 윈도우 카운트만 조회
+    실패 동작: DB 미연결/오류면 경고 로그 후 worker 로컬 SlidingWindowRateLimiter로 판정(장애 동안은 worker별 한도)
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, limit: int, windowSec: int, purgeIntervalMs: int = 60_000):
+        self.limit = int(limit)
+        self.window = max(1, int(windowSec))
+        self.purgeIntervalMs = max(1, int(purgeIntervalMs))
+        self.fallback = SlidingWindowRateLimiter(self.limit, self.window)
+        self.reservationCounter = itertools.count(1)
+        self.reservations = {}
+        self.task: asyncio.Task[None] | None = None
+
+    def now(self) -> float:
+        return time.time()
+
+    def windowPosition(self, nowSec: float) -> tuple[int, float]:
+        windowIdx = int(nowSec // self.window)
+        return windowIdx, nowSec - windowIdx * self.window
+
+    def retryAfterFor(self, current: int, previous: int, elapsedSec: float) -> int | None:
+        counter = SlidingWindowCounter(0)
+        counter.current = max(0, int(current or 0))
+        counter.previous = max(0, int(previous or 0))
+        return counter.retryAfter(self.limit, self.window, elapsedSec)
+
+    def getDatabase(self):
+        db = DB.getManager(DB.getPrimaryDbName())
+        if not db:
+            raise RuntimeError("rate limit database is not configured")
+        return db
+
+    async def addHit(self, db, key: str, windowIdx: int, delta: int) -> tuple[int, int]:
+        row = await db.fetchOneQuery(
+            "rateLimit.addHits",
+            {"rlKey": key, "windowIdx": windowIdx, "previousWindowIdx": windowIdx - 1, "hitDelta": delta},
+        )
+        return int((row or {}).get("hitCnt") or 0), int((row or {}).get("previousCnt") or 0)
+
+    async def takeHits(self, db, keys: tuple[str, ...], windowIdx: int, elapsedSec: float) -> int | None:
+        """
+        설명: 키마다 1씩 올리고 모두 허용 범위인지 판정
+        처리 규칙: 하나라도 넘으면 지금까지 올린 키를 모두 1씩 되돌림(되돌리기 실패는 다음 윈도우에 자연 소멸)
+        반환값: 허용이면 None, 거절이면 Retry-After 초
+        갱신일: 2026-10-18
+        """
+        taken: list[str] = []
+        try:
+            for key in keys:
+                current, previous = await self.addHit(db, key, windowIdx, 1)
+                taken.append(key)
+                # 증가분을 포함한 추정치가 limit을 넘을 때만 거절(증가 전 추정치 >= limit과 동일)
+                retryAfter = self.retryAfterFor(current - 1, previous, elapsedSec)
+                if retryAfter is not None:
+                    await self.releaseHits(db, taken, windowIdx)
+                    return retryAfter
+        except Exception:
+            if taken:
+                await self.releaseHits(db, taken, windowIdx)
+            raise
+        return None
+
+    async def releaseHits(self, db, keys, windowIdx: int) -> None:
+        for key in keys:
+            try:
+                await db.executeQuery(
+                    "rateLimit.addHits",
+                    {"rlKey": key, "windowIdx": windowIdx, "previousWindowIdx": windowIdx - 1, "hitDelta": -1},
+                )
+            except Exception as error:
+                logger.warning("rate limit release failed: error=%s", type(error).__name__)
+
+    async def hitAsync(self, key: str, *, commit: bool = True):
+        """설명: RateLimiter.hit과 같은 계약을 공유 카운터로 판정 실패 동작: DB 오류 시 로컬 fallback 판정. 갱신일: 2026-10-18"""
+        windowIdx, elapsedSec = self.windowPosition(self.now())
+        try:
+            db = self.getDatabase()
+            if commit:
+                retryAfter = await self.takeHits(db, (key,), windowIdx, elapsedSec)
+            else:
+                counts = {windowIdx: 0, windowIdx - 1: 0}
+                for row in await db.fetchAllQuery(
+                    "rateLimit.getCounts", {"rlKey": key, "previousWindowIdx": windowIdx - 1}
+                ) or []:
+                    counts[int(row["windowIdx"])] = int(row["hitCnt"])
+                retryAfter = self.retryAfterFor(counts[windowIdx], counts[windowIdx - 1], elapsedSec)
+        except Exception as error:
+            logger.warning("rate limit db check failed, using local limiter: error=%s", type(error).__name__)
+            return self.fallback.hit(key, commit=commit)
+        if retryAfter is not None:
+            return False, retryAfter
+        return True, 0
+
+    async def reserveAsync(self, keys):
+        """설명: RateLimiter.reserve와 같은 계약으로 여러 키를 공유 카운터에 예약 실패 동작: DB 오류 시 로컬 fallback 예약. 갱신일: 2026-10-18"""
+        uniqueKeys = tuple(dict.fromkeys(str(key) for key in keys if str(key)))
+        if not uniqueKeys:
+            raise ValueError("rate-limit reservation requires at least one key")
+        windowIdx, elapsedSec = self.windowPosition(self.now())
+        try:
+            retryAfter = await self.takeHits(self.getDatabase(), uniqueKeys, windowIdx, elapsedSec)
+        except Exception as error:
+            logger.warning("rate limit db reserve failed, using local limiter: error=%s", type(error).__name__)
+            ok, retryAfter, fallbackId = self.fallback.reserve(uniqueKeys)
+            if not ok:
+                return False, retryAfter, None
+            reservationId = next(self.reservationCounter)
+            self.reservations[reservationId] = ("local", fallbackId)
+            return True, 0, reservationId
+        if retryAfter is not None:
+            return False, retryAfter, None
+        reservationId = next(self.reservationCounter)
+        self.reservations[reservationId] = ("db", (uniqueKeys, windowIdx))
+        return True, 0, reservationId
+
+    async def finalizeReservationAsync(self, reservationId, *, keep: bool) -> bool:
+        """설명: 해제 시 예약한 윈도우의 공유 카운트를 1 감소(윈도우가 이미 지났으면 해당 행만 감소) 갱신일: 2026-10-18"""
+        reservation = self.reservations.pop(reservationId, None)
+        if reservation is None:
+            return False
+        store, payload = reservation
+        if store == "local":
+            return self.fallback.finalizeReservation(payload, keep=keep)
+        if keep:
+            return True
+        uniqueKeys, reservedIdx = payload
+        try:
+            db = self.getDatabase()
+        except RuntimeError as error:
+            logger.warning("rate limit release failed: error=%s", type(error).__name__)
+            return True
+        await self.releaseHits(db, uniqueKeys, reservedIdx)
+        return True
+
+    async def purgeExpired(self) -> bool:
+        """설명: 이전 윈도우보다 오래된 카운터 행 삭제 반환값: 성공 여부 실패 동작: 오류는 경고 로그 후 False. 갱신일: 2026-10-18"""
+        windowIdx, _ = self.windowPosition(self.now())
+        try:
+            await self.getDatabase().executeQuery("rateLimit.deleteExpired", {"minWindowIdx": windowIdx - 1})
+        except Exception as error:
+            logger.warning("rate limit purge failed: error=%s", type(error).__name__)
+            return False
+        return True
+
+    async def run(self) -> None:
+        """설명: purgeIntervalMs 주기 만료 행 정리 루프(T_RATE_LIMIT는 migrations/20261018_rate_limit로 배포 시 생성, 런타임 DDL 없음) 갱신일: 2026-10-18"""
+        while True:
+            await asyncio.sleep(self.purgeIntervalMs / 1000.0)
+            await self.purgeExpired()
 
 
 def parseRateLimitLimit(defaultValue: int = 5) -> int:
@@ -188,6 +697,122 @@ def parseRateLimitLimit(defaultValue: int = 5) -> int:
 
 
 globalRateLimiter = RateLimiter(limit=parseRateLimitLimit(), windowSec=60)
+RATE_LIMIT_BACKENDS = ("memory", "shared", "db")
+RATE_LIMIT_ALGORITHMS = ("exact", "sliding")
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    backend: str = "memory"
+    algorithm: str = "exact"
+    lockStripes: int = 64
+    sharedPath: str = ""
+    sharedSlots: int = 65_536
+    dbPurgeIntervalMs: int = 60_000
+
+
+rateLimitConfig = RateLimitConfig()
+
+
+def getDefaultSharedRateLimitPath() -> str:
+    baseDir = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(baseDir, "backend-rate-limit.bin")
+
+
+def _readRateLimitInt(section, key: str, envName: str, fallback: int, minimum: int) -> int:
+    rawValue = os.getenv(envName)
+    if rawValue is None and section is not None:
+        rawValue = section.get(key)
+    if rawValue is None or not str(rawValue).strip():
+        return fallback
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"AUTH {key} must be an integer") from error
+    if value < minimum:
+        raise ValueError(f"AUTH {key} must be at least {minimum}")
+    return value
+
+
+def configureRateLimit(config) -> RateLimitConfig:
+    """
+    설명: [AUTH] rate_limit_backend/rate_limit_algorithm/rate_limit_lock_stripes/rate_limit_shared_path/
+    rate_limit_shared_slots/rate_limit_db_purge_interval_ms(ENV 우선) 반영
+    처리 규칙: memory=프로세스 단위(기존), shared=같은 호스트 worker 공유 mmap 테이블, db=T_RATE_LIMIT 공유 카운터,
+    memory backend의 algorithm=exact는 hit별 타임스탬프 deque(기존), sliding은 키당 고정 크기 근사 카운터 + stripe lock,
+    limit은 AUTH_RATE_LIMIT, 윈도우는 60초로 기존과 동일
+    실패 동작: 알 수 없는 backend/정수 범위 오류는 ValueError, shared 파일을 열 수 없으면 ValueError
+    부작용: globalRateLimiter 교체
+    갱신일: 2026-10-18
+    """
+    global globalRateLimiter, rateLimitConfig
+    section = config["AUTH"] if config is not None and "AUTH" in config else None
+    rawBackend = os.getenv("AUTH_RATE_LIMIT_BACKEND")
+    if rawBackend is None and section is not None:
+        rawBackend = section.get("rate_limit_backend")
+    backend = str(rawBackend or "memory").strip().lower()
+    if backend not in RATE_LIMIT_BACKENDS:
+        raise ValueError(f"AUTH rate_limit_backend must be one of {', '.join(RATE_LIMIT_BACKENDS)}")
+    rawAlgorithm = os.getenv("AUTH_RATE_LIMIT_ALGORITHM")
+    if rawAlgorithm is None and section is not None:
+        rawAlgorithm = section.get("rate_limit_algorithm")
+    algorithm = str(rawAlgorithm or "exact").strip().lower()
+    if algorithm not in RATE_LIMIT_ALGORITHMS:
+        raise ValueError(f"AUTH rate_limit_algorithm must be one of {', '.join(RATE_LIMIT_ALGORITHMS)}")
+    rawPath = os.getenv("AUTH_RATE_LIMIT_SHARED_PATH")
+    if rawPath is None and section is not None:
+        rawPath = section.get("rate_limit_shared_path")
+    nextConfig = RateLimitConfig(
+        backend=backend,
+        algorithm=algorithm,
+        lockStripes=_readRateLimitInt(section, "rate_limit_lock_stripes", "AUTH_RATE_LIMIT_LOCK_STRIPES", 64, 1),
+        sharedPath=str(rawPath or "").strip() or getDefaultSharedRateLimitPath(),
+        sharedSlots=_readRateLimitInt(
+            section, "rate_limit_shared_slots", "AUTH_RATE_LIMIT_SHARED_SLOTS", 65_536, SHARED_RATE_LIMIT_MAX_PROBE
+        ),
+        dbPurgeIntervalMs=_readRateLimitInt(
+            section, "rate_limit_db_purge_interval_ms", "AUTH_RATE_LIMIT_DB_PURGE_INTERVAL_MS", 60_000, 1000
+        ),
+    )
+    limit = parseRateLimitLimit()
+    if backend == "shared":
+        try:
+            globalRateLimiter = SharedMemoryRateLimiter(limit, 60, nextConfig.sharedPath, nextConfig.sharedSlots)
+        except (ImportError, OSError) as error:
+            raise ValueError(f"AUTH rate_limit_shared_path is not usable: {type(error).__name__}") from error
+    elif backend == "db":
+        globalRateLimiter = DatabaseRateLimiter(limit, 60, nextConfig.dbPurgeIntervalMs)
+    elif algorithm == "sliding":
+        globalRateLimiter = SlidingWindowRateLimiter(limit, 60, nextConfig.lockStripes)
+    elif not isinstance(globalRateLimiter, RateLimiter):
+        globalRateLimiter = RateLimiter(limit=limit, windowSec=60)
+    rateLimitConfig = nextConfig
+    return nextConfig
+
+
+def startRateLimitPurge() -> bool:
+    """설명: db backend의 만료 행 정리 task 시작 반환값: 다른 backend이거나 이미 실행 중이면 False. 갱신일: 2026-10-18"""
+    limiter = globalRateLimiter
+    if not isinstance(limiter, DatabaseRateLimiter):
+        return False
+    if limiter.task is not None and not limiter.task.done():
+        return False
+    limiter.task = asyncio.create_task(limiter.run())
+    return True
+
+
+async def stopRateLimitPurge() -> None:
+    """설명: 만료 행 정리 task 취소 부작용: task 참조 해제. 갱신일: 2026-10-18"""
+    limiter = globalRateLimiter
+    if not isinstance(limiter, DatabaseRateLimiter) or limiter.task is None:
+        return
+    task, limiter.task = limiter.task, None
+    if not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
 
 RATE_LIMIT_NAMESPACE_PATTERN = re.compile(r"^[a-z0-9][a-z0-9._-]{0,47}$")
@@ -246,7 +871,15 @@ def buildRateLimitResponse(retryAfter: int) -> JSONResponse:
     )
 
 
-def checkRateLimit(
+async def applyRateLimitHit(limiter, key: str, *, commit: bool):
+    """설명: limiter의 hit 호출(공유 DB 저장소처럼 판정에 I/O가 필요한 limiter는 hitAsync 사용) 갱신일: 2026-10-18"""
+    hitAsync = getattr(limiter, "hitAsync", None)
+    if hitAsync is not None:
+        return await hitAsync(key, commit=commit)
+    return limiter.hit(key, commit=commit)
+
+
+async def checkRateLimit(
     request: Request,
     username: Optional[str] = None,
     *,
@@ -257,16 +890,18 @@ def checkRateLimit(
     설명: IP/사용자별 속도 제한 검사
     처리 규칙: 키(ip:{ip}, user:{username})를 순회해 하나라도 초과면 즉시 429를 반환
     반환값: 제한 초과 시 Retry-After/no-store 헤더가 포함된 JSONResponse, 통과 시 None을 반환
-    갱신일: 2026-01-15
+    갱신일: 2026-10-18
     """
+    limiter = globalRateLimiter
     for key in buildRateLimitKeys(request, username, namespace=namespace):
-        ok, retryAfter = globalRateLimiter.hit(key, commit=commit)
+        ok, retryAfter = await applyRateLimitHit(limiter, key, commit=commit)
         if not ok:
+            incCounter("rate_limit_rejections_total", (namespace,))
             return buildRateLimitResponse(retryAfter)
     return None
 
 
-def reserveRateLimit(
+async def reserveRateLimit(
     request: Request,
     username: Optional[str] = None,
     *,
@@ -275,23 +910,31 @@ def reserveRateLimit(
     """
     설명: 현재 limiter에 IP/사용자 multi-key in-flight 슬롯 예약
     반환값: (제한 응답 또는 None, limiter instance와 reservation id를 묶은 handle)
-    갱신일: 2026-07-13
+    갱신일: 2026-10-18
     """
     limiter = globalRateLimiter
     keys = buildRateLimitKeys(request, username, namespace=namespace)
-    ok, retryAfter, reservationId = limiter.reserve(keys)
+    reserveAsync = getattr(limiter, "reserveAsync", None)
+    if reserveAsync is not None:
+        ok, retryAfter, reservationId = await reserveAsync(keys)
+    else:
+        ok, retryAfter, reservationId = limiter.reserve(keys)
     if not ok:
+        incCounter("rate_limit_rejections_total", (namespace,))
         return buildRateLimitResponse(retryAfter), None
     return None, (limiter, reservationId)
 
 
-def finalizeRateLimitReservation(reservationHandle, *, keep: bool) -> bool:
+async def finalizeRateLimitReservation(reservationHandle, *, keep: bool) -> bool:
     """
     설명: 예약 당시 limiter에 handle을 확정 또는 해제
     반환값: 유효 예약을 처음 처리했으면 True, 없거나 재처리면 False
-    갱신일: 2026-07-13
+    갱신일: 2026-10-18
     """
     if reservationHandle is None:
         return False
     limiter, reservationId = reservationHandle
+    finalizeAsync = getattr(limiter, "finalizeReservationAsync", None)
+    if finalizeAsync is not None:
+        return await finalizeAsync(reservationId, keep=keep)
     return limiter.finalizeReservation(reservationId, keep=keep)
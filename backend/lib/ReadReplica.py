@@ -0,0 +1,195 @@
+"""
+파일명: backend/lib/ReadReplica.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: [DATABASE*] 읽기 replica 설정, replica 선택(round robin/least latency)과 상태(lag/장애) 기반 제외·복귀
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from lib.DatabasePool import DatabasePoolConfig, DatabasePoolTelemetry, DatabasePoolTimeoutError
+from lib.Logger import logStructured
+
+REPLICA_SELECTION_ORDER = ("round_robin", "least_latency")
+DEFAULT_REPLICA_QUERY_PREFIXES = ("dashboard.", "sample.")
+REPLICA_LATENCY_EWMA_WEIGHT = 0.2
+
+# replica 상태 점검 SQL(드라이버 직접 실행). WAL 수신/재생 위치가 같으면 유휴 primary에서도 lag 0으로 본다.
+REPLICA_LAG_SQL_POSTGRESQL = """
+SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())) * 1000, 0)
+       END AS "lagMs"
+"""
+REPLICA_PING_SQL = 'SELECT 1 AS "ok"'
+
+
+@dataclass(frozen=True)
+class ReplicaConfig:
+    urls: tuple[str, ...] = ()
+    selection: str = "round_robin"
+    maxLagMs: int = 5000
+    healthIntervalMs: int = 5000
+    queryPrefixes: tuple[str, ...] = DEFAULT_REPLICA_QUERY_PREFIXES
+
+
+def parseReplicaHosts(rawValue: Any, sectionName: str = "DATABASE") -> list[tuple[str, str | None]]:
+    """
+    설명: replica_hosts(쉼표 구분 host[:port]) 파싱
+    실패 동작: 빈 host/숫자가 아닌 port는 ValueError
+    반환값: (host, port 또는 None) 목록
+    갱신일: 2026-10-18
+    """
+    hosts: list[tuple[str, str | None]] = []
+    for item in str(rawValue or "").split(","):
+        value = item.strip()
+        if not value:
+            continue
+        host, _, port = value.rpartition(":") if ":" in value else (value, "", "")
+        host = host.strip()
+        port = port.strip()
+        if not host or (port and not port.isdigit()):
+            raise ValueError(f"{sectionName} replica_hosts has an invalid entry: {value}")
+        hosts.append((host, port or None))
+    return hosts
+
+
+def readReplicaConfig(section, sectionName: str, urls: list[str] | tuple[str, ...]) -> ReplicaConfig:
+    """
+    설명: [DATABASE*] replica_selection/replica_max_lag_ms/replica_health_interval_ms/replica_query_prefixes 조회
+    처리 규칙: replica_query_prefixes는 쉼표 구분 queryName 접두사(기본 dashboard.,sample.), 일치하는 읽기 전용 쿼리만 replica로 보냄
+    실패 동작: 알 수 없는 선택 방식/정수 아님/범위 밖은 ValueError
+    갱신일: 2026-10-18
+    """
+
+    def readInt(key: str, fallback: int, minimum: int) -> int:
+        rawValue = section.get(key) if section is not None else None
+        if rawValue is None or not str(rawValue).strip():
+            return fallback
+        try:
+            value = int(str(rawValue).strip())
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"{sectionName} {key} must be an integer") from error
+        if value < minimum:
+            raise ValueError(f"{sectionName} {key} must be at least {minimum}")
+        return value
+
+    selection = str((section.get("replica_selection") if section is not None else None) or "round_robin").strip().lower()
+    if selection not in REPLICA_SELECTION_ORDER:
+        raise ValueError(f"{sectionName} replica_selection must be one of {', '.join(REPLICA_SELECTION_ORDER)}")
+    rawPrefixes = section.get("replica_query_prefixes") if section is not None else None
+    if rawPrefixes is None:
+        queryPrefixes = DEFAULT_REPLICA_QUERY_PREFIXES
+    else:
+        queryPrefixes = tuple(prefix.strip() for prefix in str(rawPrefixes).split(",") if prefix.strip())
+    return ReplicaConfig(
+        urls=tuple(urls),
+        selection=selection,
+        maxLagMs=readInt("replica_max_lag_ms", 5000, 0),
+        healthIntervalMs=readInt("replica_health_interval_ms", 5000, 100),
+        queryPrefixes=queryPrefixes,
+    )
+
+
+def isReplicaUnavailableError(error: BaseException) -> bool:
+    """설명: replica 연결 자체의 장애(접속 불가/연결 끊김/풀 대기 초과)인지 판별. SQL 오류는 False. 갱신일: 2026-10-18"""
+    if isinstance(error, (OSError, TimeoutError, DatabasePoolTimeoutError)):
+        return True
+    errorName = type(error).__name__
+    return "Connection" in errorName or "CannotConnect" in errorName
+
+
+class ReplicaTarget:
+    """설명: replica 1개의 연결(databases.Database)과 풀 계측, 상태(healthy/lag/지연 EWMA) 갱신일: 2026-10-18"""
+
+    def __init__(self, databaseUrl: str, database: Any, label: str):
+        self.databaseUrl = databaseUrl
+        self.database = database
+        self.label = label
+        self.telemetry = DatabasePoolTelemetry(label)
+        self.driverPool: Any | None = None
+        self.healthy = False
+        self.lagMs: float | None = None
+        self.latencyEwmaMs = 0.0
+        self.reads = 0
+        self.ejections = 0
+        self.lastError: str | None = None
+
+    def observeLatency(self, durationMs: float) -> None:
+        if self.latencyEwmaMs <= 0:
+            self.latencyEwmaMs = durationMs
+        else:
+            self.latencyEwmaMs += REPLICA_LATENCY_EWMA_WEIGHT * (durationMs - self.latencyEwmaMs)
+
+    def snapshot(self, poolConfig: DatabasePoolConfig | None = None) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "healthy": self.healthy,
+            "lagMs": None if self.lagMs is None else round(self.lagMs, 3),
+            "latencyEwmaMs": round(self.latencyEwmaMs, 3),
+            "reads": self.reads,
+            "ejections": self.ejections,
+            "lastError": self.lastError,
+            **self.telemetry.snapshot(self.driverPool, poolConfig),
+        }
+
+
+class ReplicaRouter:
+    """
+    설명: 읽기 쿼리를 받을 replica 선택과 상태 전이 관리
+    처리 규칙: healthy replica 중 round_robin은 순환, least_latency는 지연 EWMA 최소값 선택.
+    lag가 replica_max_lag_ms를 넘거나 연결 장애가 나면 제외하고, 다음 상태 점검에서 기준을 만족하면 복귀
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, config: ReplicaConfig, targets: list[ReplicaTarget]):
+        self.config = config
+        self.targets = targets
+        self.cursor = 0
+
+    def isEligibleQuery(self, queryName: str | None) -> bool:
+        return bool(queryName) and any(str(queryName).startswith(prefix) for prefix in self.config.queryPrefixes)
+
+    def choose(self) -> ReplicaTarget | None:
+        healthyTargets = [target for target in self.targets if target.healthy]
+        if not healthyTargets:
+            return None
+        if self.config.selection == "least_latency":
+            return min(healthyTargets, key=lambda target: target.latencyEwmaMs)
+        self.cursor = (self.cursor + 1) % len(healthyTargets)
+        return healthyTargets[self.cursor]
+
+    def markHealth(
+        self,
+        target: ReplicaTarget,
+        healthy: bool,
+        lagMs: float | None = None,
+        error: BaseException | str | None = None,
+    ) -> None:
+        """설명: 상태 점검/조회 결과 반영 부작용: 제외·복귀 전이 시 db.replica.ejected/db.replica.restored 구조 로그. 갱신일: 2026-10-18"""
+        if lagMs is not None:
+            target.lagMs = lagMs
+        if error is not None:
+            target.lastError = error if isinstance(error, str) else type(error).__name__
+        elif healthy:
+            target.lastError = None
+        if target.healthy == healthy:
+            return
+        target.healthy = healthy
+        if healthy:
+            logStructured(logging.INFO, {"event": "db.replica.restored", "replica": target.label, "lagMs": target.lagMs})
+            return
+        target.ejections += 1
+        logStructured(
+            logging.WARNING,
+            {
+                "event": "db.replica.ejected",
+                "replica": target.label,
+                "lagMs": target.lagMs,
+                "maxLagMs": self.config.maxLagMs,
+                "error": target.lastError,
+            },
+        )
@@ -1,12 +1,17 @@
 """
 파일명: backend/lib/Response.py
 작성자: LSH
-갱신일: 2026-01-18
-설명: 공통 응답 스키마/헬퍼. { status, message, result, count. , code. , requestId }
+갱신일: 2026-10-18
+설명: 공통 응답 스키마/헬퍼. { status, message, result, count. , code. , requestId }, 대용량 행 스트리밍(NDJSON/CSV) 응답
 """
 
-from typing import Any, Optional, Dict
+import csv
+import io
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Optional, Dict
+from urllib.parse import quote
 
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from .RequestContext import getRequestId
@@ -72,3 +77,65 @@ def errorResponse(message: str = "error", result: Any = None, *, code: str) -> D
             requestId=getRequestId(),
         )
     )
+
+
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def toCsvCell(value: Any) -> Any:
+    """설명: CSV 셀 값 정규화(None은 빈 칸, 수식으로 해석될 문자열은 ' 접두) 갱신일: 2026-10-18"""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def encodeNdjsonChunks(batches: AsyncIterable[list[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in batch).encode("utf-8")
+
+
+async def encodeCsvChunks(
+    batches: AsyncIterable[list[Dict[str, Any]]], columns: Optional[list[str]] = None
+) -> AsyncIterator[bytes]:
+    header = list(columns) if columns else None
+    if header is not None:
+        yield ("\ufeff" + ",".join(header) + "\r\n").encode("utf-8")
+    async for batch in batches:
+        if not batch:
+            continue
+        buffer = io.StringIO()
+        if header is None:
+            header = list(batch[0].keys())
+            buffer.write("\ufeff")
+            csv.writer(buffer).writerow(header)
+        writer = csv.writer(buffer)
+        for row in batch:
+            writer.writerow([toCsvCell(row.get(column)) for column in header])
+        yield buffer.getvalue().encode("utf-8")
+
+
+def streamRowsResponse(
+    batches: AsyncIterable[list[Dict[str, Any]]],
+    format: str = "ndjson",
+    columns: Optional[list[str]] = None,
+    filename: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    설명: DatabaseManager.iterateQuery 같은 행 batch 스트림을 NDJSON 또는 CSV 청크로 내보내는 응답 생성
+    처리 규칙: batch마다 한 청크로 인코딩해 즉시 전송하므로 메모리는 batch 1개 크기로 일정.
+    NDJSON은 행당 JSON 한 줄(날짜/Decimal은 문자열), CSV는 UTF-8 BOM + 헤더(columns 또는 첫 행 키) 후 행 출력
+    실패 동작: 지원하지 않는 format은 ValueError
+    반환값: StreamingResponse(filename 지정 시 attachment Content-Disposition 포함)
+    갱신일: 2026-10-18
+    """
+    mediaType = STREAM_MEDIA_TYPES.get(format)
+    if mediaType is None:
+        raise ValueError(f"unsupported stream format: {format}")
+    chunks = encodeCsvChunks(batches, columns) if format == "csv" else encodeNdjsonChunks(batches)
+    headers = {"Cache-Control": "no-store"}
+    if filename:
+        headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    return StreamingResponse(chunks, media_type=mediaType, headers=headers)
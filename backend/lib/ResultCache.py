@@ -0,0 +1,163 @@
+"""
+파일명: backend/lib/ResultCache.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: 익명 공개 조회용 키 단위 TTL 결과 캐시(single-flight 로드, 쓰기 무효화, ETag 계산)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+
+def readMonotonicMs() -> int:
+    return int(time.monotonic() * 1000)
+
+
+def buildResultEtag(result: Any) -> str:
+    """
+    설명: 결과 dict의 정규화 JSON으로 strong ETag 생성
+    반환값: 따옴표를 포함한 ETag 문자열
+    갱신일: 2026-10-18
+    """
+    encoded = json.dumps(result, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def isEtagMatched(ifNoneMatch: str | None, etag: str) -> bool:
+    """
+    설명: If-None-Match 헤더가 현재 ETag와 일치하는지 판별
+    처리 규칙: 쉼표 목록/와일드카드(*)/약한 비교(W/ 접두사 무시) 지원
+    갱신일: 2026-10-18
+    """
+    if not ifNoneMatch:
+        return False
+    for candidate in ifNoneMatch.split(","):
+        value = candidate.strip()
+        if value == "*":
+            return True
+        if value.startswith("W/"):
+            value = value[2:]
+        if value == etag:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    value: Any
+    etag: str
+    expiresAtMs: int
+
+
+class SingleFlightResultCache:
+    """
+    설명: TTL과 최대 항목 수로 제한한 async 결과 캐시
+    처리 규칙: 같은 키의 동시 miss는 로더 1회만 실행하고 결과를 공유(single-flight),
+    invalidate는 세대를 올려 무효화 이전에 시작한 로드 결과가 캐시에 다시 들어가지 않게 함
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, ttlMs: int = 0, maxEntries: int = 64):
+        self.ttlMs = ttlMs
+        self.maxEntries = maxEntries
+        self.entries: OrderedDict[str, CachedResult] = OrderedDict()
+        self.inflight: dict[str, asyncio.Future[CachedResult]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttlMs > 0 and self.maxEntries > 0
+
+    def peek(self, key: str) -> CachedResult | None:
+        """설명: 만료 전 항목 조회(로드 없음) 반환값: CachedResult 또는 None. 갱신일: 2026-10-18"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expiresAtMs <= readMonotonicMs():
+            self.entries.pop(key, None)
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    async def getOrLoad(self, key: str, loader: Callable[[], Awaitable[Any]]) -> CachedResult:
+        """
+        설명: 캐시 hit면 저장 항목, miss면 로더 결과를 ETag와 함께 반환
+        처리 규칙: 비활성(TTL 0)이면 매번 로더 실행, 로더 예외는 대기 중인 호출자 모두에게 그대로 전달하고 캐시하지 않음
+        반환값: CachedResult(value/etag/expiresAtMs)
+        갱신일: 2026-10-18
+        """
+        if not self.enabled:
+            value = await loader()
+            return CachedResult(value, buildResultEtag(value), 0)
+        entry = self.peek(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        pending = self.inflight.get(key)
+        if pending is not None:
+            try:
+                entry = await asyncio.shield(pending)
+                self.hits += 1
+                return entry
+            except asyncio.CancelledError:
+                # 선행 로더가 취소된 경우에만 직접 로드, 이 호출 자체의 취소는 그대로 전파
+                if not pending.cancelled():
+                    raise
+        self.misses += 1
+        generation = self.generation
+        future: asyncio.Future[CachedResult] = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            value = await loader()
+            entry = CachedResult(value, buildResultEtag(value), readMonotonicMs() + self.ttlMs)
+            if generation == self.generation:
+                self.entries[key] = entry
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.maxEntries:
+                    self.entries.popitem(last=False)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # 대기자가 없으면 "exception was never retrieved" 경고를 남기지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            if self.inflight.get(key) is future:
+                self.inflight.pop(key, None)
+
+    def invalidate(self, *keys: str) -> None:
+        """설명: 지정 키(미지정 시 전체) 무효화 부작용: 진행 중 로드 결과의 재캐시 차단. 갱신일: 2026-10-18"""
+        self.generation += 1
+        self.invalidations += 1
+        if not keys:
+            self.entries.clear()
+            self.inflight.clear()
+            return
+        for key in keys:
+            self.entries.pop(key, None)
+            self.inflight.pop(key, None)
+
+    def snapshot(self) -> dict[str, int | bool]:
+        """설명: 관측용 캐시 통계 반환값: 활성 여부/TTL/항목 수/hit·miss·무효화 수 dict. 갱신일: 2026-10-18"""
+        return {
+            "enabled": self.enabled,
+            "ttlMs": self.ttlMs,
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
@@ -51,6 +51,11 @@ SERVICE_ERROR_SPECS: dict[str, ServiceErrorSpec] = {
         responseCode="AUTH_503_DB_NOT_READY",
         defaultMessage="database not ready",
     ),
+    "AUTH_503_HASH_BUSY": ServiceErrorSpec(
+        statusCode=503,
+        responseCode="AUTH_503_HASH_BUSY",
+        defaultMessage="authentication is busy, retry shortly",
+    ),
     "IDEMPOTENCY_422_INVALID_INPUT": ServiceErrorSpec(
         statusCode=422,
         responseCode="IDEMPOTENCY_422_INVALID_INPUT",
@@ -106,6 +111,11 @@ SERVICE_ERROR_SPECS: dict[str, ServiceErrorSpec] = {
         responseCode="SAMPLE_500_CREATE_FAILED",
         defaultMessage="create failed",
     ),
+    "OBS_404_NOT_FOUND": ServiceErrorSpec(
+        statusCode=404,
+        responseCode="OBS_404_NOT_FOUND",
+        defaultMessage="not found",
+    ),
     "OBS_503_NOT_READY": ServiceErrorSpec(
         statusCode=503,
         responseCode="OBS_503_NOT_READY",
@@ -1,24 +1,83 @@
 """
 파일명: backend/lib/SqlLoader.py
 작성자: LSH
-갱신일: 2025-09-07
-설명: sql 파일에서 `-- name:` 블록을 파싱하여 쿼리 레지스트리 구성
+갱신일: 2026-10-18
+설명: sql 파일에서 `-- name:` 블록을 파싱하여 쿼리 레지스트리 구성(`-- slot:` 템플릿 블록은 로드 시점에 변형 쿼리로 전개)
 """
 
+import itertools
 import os
+import re
 from typing import Dict, List, Tuple, Set, Optional
 
 from lib.Logger import logger
 
 
 nameMark = "-- name:"
+slotLinePattern = re.compile(r"^\s*--\s*slot:\s*([A-Za-z_][A-Za-z0-9_]*)\s+([A-Za-z0-9_]+)\s*=(.*)$")
+slotNamePattern = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+slotBodyPattern = re.compile(r"\{\{([A-Za-z_][A-Za-z0-9_]*)\}\}")
+
+
+def expandSqlTemplate(filePath: str, name: str, lines: List[str]) -> List[Tuple[str, str]]:
+    """
+    설명: `-- slot:` 선언이 있는 블록을 슬롯 선택지의 모든 조합으로 전개
+    처리 규칙: `-- slot: <슬롯> <키> = <SQL 조각>` 선언을 모아 이름의 {슬롯}은 키로, 본문의 {{슬롯}}은 SQL 조각으로 치환.
+    조각은 파일에 적힌 고정 SQL뿐이며 요청 값은 항상 바인딩으로만 전달되므로 런타임 문자열 조립이 없음
+    실패 동작: 이름/본문 슬롯 불일치, 미선언 슬롯, 중복 키는 ValueError
+    반환값: (전개된 쿼리 이름, SQL) 목록. slot 선언이 없으면 원 블록 1건
+    갱신일: 2026-10-18
+    """
+    slotOptions: Dict[str, Dict[str, str]] = {}
+    bodyLines: List[str] = []
+    for raw in lines:
+        match = slotLinePattern.match(raw)
+        if match is None:
+            bodyLines.append(raw)
+            continue
+        slotName, optionKey, fragment = match.group(1), match.group(2), match.group(3).strip()
+        options = slotOptions.setdefault(slotName, {})
+        if optionKey in options:
+            raise ValueError(f"duplicate slot option in {filePath}: {name} {slotName}={optionKey}")
+        options[optionKey] = fragment
+    body = ("\n".join(bodyLines)).strip()
+    if not slotOptions:
+        return [(name, body)] if body else []
+
+    nameSlots = slotNamePattern.findall(name)
+    bodySlots = set(slotBodyPattern.findall(body))
+    if len(nameSlots) != len(set(nameSlots)) or set(nameSlots) != set(slotOptions) or bodySlots != set(slotOptions):
+        raise ValueError(f"slot mismatch in {filePath}: {name}")
+
+    expanded: List[Tuple[str, str]] = []
+    for optionKeys in itertools.product(*(list(slotOptions[slot]) for slot in nameSlots)):
+        choice = dict(zip(nameSlots, optionKeys))
+        variantName = slotNamePattern.sub(lambda m: choice[m.group(1)], name)
+        variantSql = slotBodyPattern.sub(lambda m: slotOptions[m.group(1)][choice[m.group(1)]], body)
+        expanded.append((variantName, variantSql))
+    return expanded
+
+
+def buildQueryVariantName(template: str, **slotKeys: str) -> str:
+    """
+    설명: 템플릿 쿼리 이름의 {슬롯}을 선택 키로 채워 레지스트리 이름 생성
+    실패 동작: 누락된 슬롯은 ValueError
+    갱신일: 2026-10-18
+    """
+    def replaceSlot(match: "re.Match[str]") -> str:
+        slotName = match.group(1)
+        if slotName not in slotKeys:
+            raise ValueError(f"missing query slot: {slotName}")
+        return str(slotKeys[slotName])
+
+    return slotNamePattern.sub(replaceSlot, template)
 
 
 def parseSqlFile(filePath: str) -> List[Tuple[str, str]]:
     """
     설명: 단일 SQL 파일을 name/sql 쌍 목록으로 파싱
-    제약: 파일 내 중복 금지 / UTF-8.
-    갱신일: 2025-11-12
+    제약: 파일 내 중복 금지(템플릿 전개 이름 포함) / UTF-8.
+    갱신일: 2026-10-18
     """
     entries: List[Tuple[str, str]] = []
     if not os.path.exists(filePath):
@@ -26,6 +85,13 @@ def parseSqlFile(filePath: str) -> List[Tuple[str, str]]:
 
     currentName: Optional[str] = None
     currentBuf: List[str] = []
+
+    def flushBlock() -> None:
+        for name, sql in expandSqlTemplate(filePath, currentName, currentBuf):
+            if any(n == name for (n, _) in entries):
+                raise ValueError(f"duplicate query name in {filePath}: {name}")
+            entries.append((name, sql))
+
     with open(filePath, "r", encoding="utf-8") as f:
         for raw in f:
             line = raw.rstrip("\n")
@@ -33,9 +99,7 @@ def parseSqlFile(filePath: str) -> List[Tuple[str, str]]:
 
                 # 이전 버퍼를 먼저 기록
                 if currentName is not None:
-                    sql = ("\n".join(currentBuf)).strip()
-                    if sql:
-                        entries.append((currentName, sql))
+                    flushBlock()
                     currentBuf = []
 
                 # 마커 뒤에서 이름 문자열 추출
@@ -52,9 +116,7 @@ def parseSqlFile(filePath: str) -> List[Tuple[str, str]]:
                     currentBuf.append(raw)
 
     if currentName is not None and currentBuf:
-        sql = ("\n".join(currentBuf)).strip()
-        if sql:
-            entries.append((currentName, sql))
+        flushBlock()
 
     return entries
 
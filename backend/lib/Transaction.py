@@ -18,6 +18,7 @@ from lib.Database import dbManagers
 from lib import Database as DB
 from lib.RequestContext import getRequestId
 from lib.Logger import logger
+from lib.Metrics import incCounter, observeHistogram
 
 
 class TransactionError(Exception):
@@ -27,6 +28,12 @@ class TransactionError(Exception):
 TransactionResult = TypeVar("TransactionResult")
 
 
+def recordTransactionOutcome(outcome: str, started: float) -> None:
+    """설명: 트랜잭션 시도 결과(commit/rollback) 수와 소요 시간 메트릭 기록 갱신일: 2026-10-18"""
+    incCounter("db_transactions_total", (outcome,))
+    observeHistogram("db_transaction_duration_seconds", (outcome,), time.perf_counter() - started)
+
+
 def transaction(
     dbNames: Union[str, List[str]],
     *,
@@ -67,8 +74,7 @@ def transaction(
         갱신일: 2026-02-28
         """
 
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
+        async def runAttempts(*args, **kwargs):
             """
             설명: 대상 함수 실행 경로에 트랜잭션/재시도 정책 적용
             실패 동작: 예외 발생 시 롤백 로그를 남기고 retryOn/retries 조건에 따라 재시도 후 최종 예외를 재전파
@@ -102,6 +108,7 @@ def transaction(
                     # 정상 종료(커밋)가 완료된 뒤에만 성공 로그와 결과를 노출한다.
                     await stack.aclose()
                     stack = None
+                    recordTransactionOutcome("commit", started)
 
                     try:
                         elapsedMs = int((time.perf_counter() - started) * 1000)
@@ -121,6 +128,7 @@ def transaction(
                             pass
                         finally:
                             stack = None
+                    recordTransactionOutcome("rollback", started)
                     try:
                         sqlCount = max(0, DB.getSqlCount() - startCount)
                         logger.error(f"tx.rollback txId={txId} error={e} sql_count={sqlCount} requestId={getRequestId()}")
@@ -146,6 +154,19 @@ def transaction(
             assert lastExc is not None
             raise lastExc
 
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            """
+            설명: 트랜잭션 경계 표시 후 runAttempts 실행
+            처리 규칙: 경계 안의 조회는 읽기 replica로 보내지 않고 트랜잭션 연결(primary)에서 수행
+            갱신일: 2026-10-18
+            """
+            activeToken = DB.markTransactionActive()
+            try:
+                return await runAttempts(*args, **kwargs)
+            finally:
+                DB.resetTransactionActive(activeToken)
+
         return wrapper
 
     return decorator
@@ -1,24 +1,28 @@
 """
 파일명: backend/lib/UserAccessLog.py
 작성자: LSH
-갱신일: 2026-02-25
-설명: 인증 사용자 접근 로그를 DB 테이블(T_USER_LOG)에 적재
+갱신일: 2026-10-18
+설명: 인증 사용자 접근 로그를 배치 writer로 DB 테이블(T_USER_LOG)에 적재, DB 장애 시 로컬 spool에 보관 후 재적재
 """
 
 from __future__ import annotations
 
 import asyncio
 import ipaddress
-import json
+import logging
 import os
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import httpx
 
 from lib import Database as DB
-from lib.Logger import logger
+from lib.AccessLogSpool import AccessLogSpool
+from lib.Logger import logStructured, logger
 from .Masking import maskUserIdentifierForLog
 from .Config import getConfig
 
@@ -284,61 +288,53 @@ async def getIpGeoFromRemote(ipValue: str, requestId: Optional[str] = None) -> O
         async with httpx.AsyncClient(timeout=timeoutSec) as client:
             response = await client.get(url, headers={"Accept": "application/json"})
             if response.status_code != 200:
-                logger.warning(
-                    json.dumps(
-                        {
-                            "event": "ip_geo.lookup.failed",
-                            "target": IP_GEO_PROVIDER_TARGET,
-                            "timeoutMs": timeoutMs,
-                            "requestId": requestId,
-                            "statusCode": response.status_code,
-                        },
-                        ensure_ascii=False,
-                    )
+                logStructured(
+                    logging.WARNING,
+                    {
+                        "event": "ip_geo.lookup.failed",
+                        "target": IP_GEO_PROVIDER_TARGET,
+                        "timeoutMs": timeoutMs,
+                        "requestId": requestId,
+                        "statusCode": response.status_code,
+                    },
                 )
                 return None
             data = response.json()
             if not isinstance(data, dict):
-                logger.warning(
-                    json.dumps(
-                        {
-                            "event": "ip_geo.lookup.failed",
-                            "target": IP_GEO_PROVIDER_TARGET,
-                            "timeoutMs": timeoutMs,
-                            "requestId": requestId,
-                            "reason": "INVALID_JSON_BODY",
-                        },
-                        ensure_ascii=False,
-                    )
+                logStructured(
+                    logging.WARNING,
+                    {
+                        "event": "ip_geo.lookup.failed",
+                        "target": IP_GEO_PROVIDER_TARGET,
+                        "timeoutMs": timeoutMs,
+                        "requestId": requestId,
+                        "reason": "INVALID_JSON_BODY",
+                    },
                 )
                 return None
             if data.get("success") is False:
-                logger.warning(
-                    json.dumps(
-                        {
-                            "event": "ip_geo.lookup.failed",
-                            "target": IP_GEO_PROVIDER_TARGET,
-                            "timeoutMs": timeoutMs,
-                            "requestId": requestId,
-                            "reason": "REMOTE_SUCCESS_FALSE",
-                        },
-                        ensure_ascii=False,
-                    )
+                logStructured(
+                    logging.WARNING,
+                    {
+                        "event": "ip_geo.lookup.failed",
+                        "target": IP_GEO_PROVIDER_TARGET,
+                        "timeoutMs": timeoutMs,
+                        "requestId": requestId,
+                        "reason": "REMOTE_SUCCESS_FALSE",
+                    },
                 )
                 return None
             return data
     except Exception as exc:
-        logger.warning(
-            json.dumps(
-                {
-                    "event": "ip_geo.lookup.failed",
-                    "target": IP_GEO_PROVIDER_TARGET,
-                    "timeoutMs": timeoutMs,
-                    "requestId": requestId,
-                    "reason": type(exc).__name__,
-                },
-                ensure_ascii=False,
-            )
+        logStructured(
+            logging.WARNING,
+            {
+                "event": "ip_geo.lookup.failed",
+                "target": IP_GEO_PROVIDER_TARGET,
+                "timeoutMs": timeoutMs,
+                "requestId": requestId,
+                "reason": type(exc).__name__,
+            },
         )
         raise
 
@@ -408,6 +404,33 @@ async def resolveIpLocation(clientIp: Optional[str], requestId: Optional[str] =
     return await asyncio.shield(remoteTask)
 
 
+def buildUserAccessLogRow(
+    *,
+    username: str,
+    requestId: Optional[str],
+    method: Optional[str],
+    path: Optional[str],
+    statusCode: int,
+    latencyMs: int,
+    sqlCount: int,
+    clientIp: Optional[str],
+) -> dict[str, object]:
+    """설명: T_USER_LOG INSERT 바인드 값 구성 반환값: 위치 컬럼이 비어 있는 행 dict. 갱신일: 2026-10-18"""
+    return {
+        "logId": uuid.uuid4().hex,
+        "userId": username,
+        "reqId": (requestId or "").strip() or None,
+        "reqMthd": (method or "").strip() or "UNKNOWN",
+        "reqPath": (path or "").strip() or "/",
+        "resCd": int(statusCode),
+        "latencyMs": max(0, int(latencyMs)),
+        "sqlCnt": max(0, int(sqlCount)),
+        "clientIp": (clientIp or "").strip() or None,
+        "ipLocTxt": None,
+        "ipLocSrc": None,
+    }
+
+
 async def writeUserAccessLog(
     *,
     username: Optional[str],
@@ -436,33 +459,28 @@ async def writeUserAccessLog(
     if not db:
         return
 
-    bindValues = {
-        "logId": uuid.uuid4().hex,
-        "userId": userId,
-        "reqId": (requestId or "").strip() or None,
-        "reqMthd": (method or "").strip() or "UNKNOWN",
-        "reqPath": (path or "").strip() or "/",
-        "resCd": int(statusCode),
-        "latencyMs": max(0, int(latencyMs)),
-        "sqlCnt": max(0, int(sqlCount)),
-        "clientIp": (clientIp or "").strip() or None,
-        "ipLocTxt": None,
-        "ipLocSrc": None,
-    }
+    bindValues = buildUserAccessLogRow(
+        username=userId,
+        requestId=requestId,
+        method=method,
+        path=path,
+        statusCode=statusCode,
+        latencyMs=latencyMs,
+        sqlCount=sqlCount,
+        clientIp=clientIp,
+    )
     try:
         await db.executeQuery("common.userAccessLogInsert", bindValues)
     except Exception as e:
-        logger.warning(
-            json.dumps(
-                {
-                    "event": "db.user_log.insert.failed",
-                    "dbName": targetDbName,
-                    "requestId": requestId,
-                    "usernameMasked": maskUserIdentifierForLog(userId),
-                    "error": str(e),
-                },
-                ensure_ascii=False,
-            )
+        logStructured(
+            logging.WARNING,
+            {
+                "event": "db.user_log.insert.failed",
+                "dbName": targetDbName,
+                "requestId": requestId,
+                "usernameMasked": maskUserIdentifierForLog(userId),
+                "error": str(e),
+            },
         )
         return
 
@@ -479,15 +497,458 @@ async def writeUserAccessLog(
             },
         )
     except Exception as e:
-        logger.warning(
-            json.dumps(
+        logStructured(
+            logging.WARNING,
+            {
+                "event": "db.user_log.location_update.failed",
+                "dbName": targetDbName,
+                "requestId": requestId,
+                "usernameMasked": maskUserIdentifierForLog(userId),
+                "error": type(e).__name__,
+            },
+        )
+
+
+# =========================
+# 접근 로그 배치 writer
+# =========================
+
+USER_ACCESS_LOG_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("LOG_ID", "logId"),
+    ("USER_ID", "userId"),
+    ("REQ_ID", "reqId"),
+    ("REQ_MTHD", "reqMthd"),
+    ("REQ_PATH", "reqPath"),
+    ("RES_CD", "resCd"),
+    ("LATENCY_MS", "latencyMs"),
+    ("SQL_CNT", "sqlCnt"),
+    ("CLIENT_IP", "clientIp"),
+    ("IP_LOC_TXT", "ipLocTxt"),
+    ("IP_LOC_SRC", "ipLocSrc"),
+)
+USER_ACCESS_LOG_BATCH_QUERY_NAME = "common.userAccessLogBatchInsert"
+# PostgreSQL 바인드 파라미터 상한(32767)을 넘지 않도록 11컬럼 기준 배치 행 수 상한
+USER_ACCESS_LOG_MAX_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class UserAccessLogWriterConfig:
+    batchSize: int = 100
+    flushIntervalMs: int = 500
+    bufferLimit: int = 10_000
+    spoolDir: str = ""
+    spoolMaxBytes: int = 0
+    spoolSegmentBytes: int = 8 * 1024 * 1024
+    replayRowsPerSec: int = 500
+
+    @property
+    def enabled(self) -> bool:
+        return self.batchSize > 0
+
+    @property
+    def spoolEnabled(self) -> bool:
+        return self.enabled and self.spoolMaxBytes > 0 and bool(self.spoolDir)
+
+
+def getUserAccessLogDatabaseFamily(db: object) -> str:
+    databaseUrl = str(getattr(db, "databaseUrl", "") or "").strip().lower()
+    return "mysql" if databaseUrl.startswith("mysql") else "default"
+
+
+@lru_cache(maxsize=64)
+def buildUserAccessLogBatchInsert(rowCount: int, family: str = "default") -> str:
+    """
+    설명: rowCount행 multi-row INSERT 문 생성(행 수/DB 계열별 캐시)
+    처리 규칙: 스풀 재생이 at-least-once라도 중복 행이 생기지 않도록 LOG_ID 충돌은 무시(MySQL INSERT IGNORE, 그 외 ON CONFLICT DO NOTHING)
+    반환값: :컬럼_행번호 바인드를 쓰는 SQL
+    갱신일: 2026-10-18
+    """
+    columnList = ", ".join(column for column, _ in USER_ACCESS_LOG_COLUMNS)
+    rowsSql = ",\n".join(
+        "(" + ", ".join(f":{key}_{index}" for _, key in USER_ACCESS_LOG_COLUMNS) + ")"
+        for index in range(rowCount)
+    )
+    if family == "mysql":
+        return f"INSERT IGNORE INTO T_USER_LOG ({columnList})\nVALUES\n{rowsSql}"
+    return f"INSERT INTO T_USER_LOG ({columnList})\nVALUES\n{rowsSql}\nON CONFLICT (LOG_ID) DO NOTHING"
+
+
+USER_ACCESS_LOG_ROW_ERROR_NAMES = frozenset({"IntegrityError", "DataError", "IntegrityConstraintViolationError"})
+
+
+def isRowLevelInsertError(error: BaseException) -> bool:
+    """설명: 특정 행의 값 때문에 실패한 INSERT(무결성/데이터 형식 오류)인지 판별. 연결 끊김/타임아웃 등 DB 장애는 False 갱신일: 2026-10-18"""
+    return any(errorType.__name__ in USER_ACCESS_LOG_ROW_ERROR_NAMES for errorType in type(error).__mro__)
+
+
+class UserAccessLogBatchWriter:
+    """
+    설명: 요청별 태스크 대신 접근 로그 행을 메모리 버퍼에 모아 N행 또는 T ms마다 multi-row INSERT로 적재
+    처리 규칙: INSERT 전에 배치 내 고유 IP의 위치를 한 번씩 해석해 후속 UPDATE를 없앰,
+    스풀이 켜져 있으면 버퍼 초과분/실패 배치를 디스크에 보관하고 DB 회복 후 초당 행 수 제한으로 재생
+    실패 동작: 스풀이 없거나 디스크 상한을 넘으면 드롭(카운트/경고)
+    갱신일: 2026-10-18
+    """
+
+    def __init__(self, config: UserAccessLogWriterConfig, spool: AccessLogSpool | None = None):
+        self.config = config
+        self.spool = spool
+        self.buffer: deque[dict[str, object]] = deque()
+        self.spillPending: list[dict[str, object]] = []
+        self.wakeEvent = asyncio.Event()
+        self.stopping = False
+        self.task: asyncio.Task[None] | None = None
+        self.written = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.discarded = 0
+        self.failedBatches = 0
+        self.replayFailures = 0
+        self.replayNotBefore = 0.0
+        self.replayBudget = float(config.replayRowsPerSec)
+        self.replayCheckedAt = time.monotonic()
+
+    async def spill(self, rows: list[dict[str, object]]) -> bool:
+        """설명: 행 목록을 스풀에 보관(파일 쓰기는 to_thread) 반환값: 스풀 없음/디스크 상한 초과면 False. 갱신일: 2026-10-18"""
+        if self.spool is None or not await asyncio.to_thread(self.spool.append, rows):
+            return False
+        self.spilled += len(rows)
+        return True
+
+    def enqueue(self, row: dict[str, object]) -> bool:
+        """
+        설명: 행 1건 버퍼 적재
+        처리 규칙: 버퍼가 가득 차면 스풀 대기열(최대 bufferLimit행)에 넣고 writer task가 디스크에 기록(요청 경로에서 파일 I/O 없음)
+        반환값: 보관하지 못하고 버렸으면 False
+        갱신일: 2026-10-18
+        """
+        if len(self.buffer) >= self.config.bufferLimit:
+            if self.spool is None or len(self.spillPending) >= self.config.bufferLimit:
+                self.dropped += 1
+                return False
+            self.spillPending.append(row)
+            self.wakeEvent.set()
+            return True
+        self.buffer.append(row)
+        if len(self.buffer) >= self.config.batchSize:
+            self.wakeEvent.set()
+        return True
+
+    async def drainSpillPending(self) -> None:
+        """설명: 버퍼 초과로 대기 중인 행을 스풀에 기록 실패 동작: 스풀 상한 초과/I/O 실패분은 드롭 카운트. 갱신일: 2026-10-18"""
+        if not self.spillPending:
+            return
+        rows = self.spillPending
+        self.spillPending = []
+        if not await self.spill(rows):
+            self.dropped += len(rows)
+
+    async def run(self) -> None:
+        """설명: 주기/배치 크기마다 적재와 스풀 재생 실패 동작: 한 주기의 예외는 로그 후 다음 주기에 계속(writer task 유지). 갱신일: 2026-10-18"""
+        intervalSeconds = self.config.flushIntervalMs / 1000.0
+        while not self.stopping:
+            try:
+                await asyncio.wait_for(self.wakeEvent.wait(), timeout=intervalSeconds)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeEvent.clear()
+            try:
+                await self.flush()
+                await self.replaySpool()
+            except Exception:
+                logger.exception("user access log writer cycle failed")
+
+    async def flush(self) -> None:
+        """설명: 스풀 대기열을 기록하고 버퍼를 batchSize 단위로 모두 적재 부작용: 스풀 파일 쓰기, T_USER_LOG INSERT. 갱신일: 2026-10-18"""
+        await self.drainSpillPending()
+        while self.buffer:
+            batchSize = min(self.config.batchSize, len(self.buffer))
+            batch = [self.buffer.popleft() for _ in range(batchSize)]
+            await self.writeBatch(batch)
+
+    async def writeBatch(self, batch: list[dict[str, object]]) -> None:
+        """설명: 실시간 배치 적재 실패 동작: INSERT 실패 배치는 스풀로 보관, 불가하면 드롭 경고. 갱신일: 2026-10-18"""
+        await self.resolveLocations(batch)
+        error = await self.insertRows(batch)
+        if error is None:
+            self.written += len(batch)
+            return
+        self.failedBatches += 1
+        spilled = await self.spill(batch)
+        if not spilled:
+            self.dropped += len(batch)
+        logStructured(
+            logging.WARNING,
+            {
+                "event": "db.user_log.batch_insert.failed",
+                "rows": len(batch),
+                "spooled": spilled,
+                "error": type(error).__name__,
+            },
+        )
+
+    async def insertRows(self, rows: list[dict[str, object]]) -> Exception | None:
+        """설명: 기본 DB에 multi-row INSERT 실행 반환값: 성공이면 None, 실패면 발생한 예외. 갱신일: 2026-10-18"""
+        db = DB.getManager(DB.getPrimaryDbName())
+        if not db:
+            return RuntimeError("user access log database is not configured")
+        values: dict[str, object] = {}
+        for index, row in enumerate(rows):
+            for _, key in USER_ACCESS_LOG_COLUMNS:
+                values[f"{key}_{index}"] = row.get(key)
+        try:
+            await db.execute(
+                buildUserAccessLogBatchInsert(len(rows), getUserAccessLogDatabaseFamily(db)),
+                values,
+                queryName=USER_ACCESS_LOG_BATCH_QUERY_NAME,
+            )
+        except Exception as e:
+            return e
+        return None
+
+    async def resolveLocations(self, batch: list[dict[str, object]]) -> None:
+        """설명: 위치가 비어 있는 행의 고유 IP를 동시에 해석해 채움 실패 동작: 조회 실패 IP는 위치 없이 적재. 갱신일: 2026-10-18"""
+        pendingRows = [row for row in batch if row.get("clientIp") and row.get("ipLocSrc") is None]
+        uniqueIps = list(dict.fromkeys(str(row["clientIp"]) for row in pendingRows))
+        if not uniqueIps:
+            return
+        results = await asyncio.gather(
+            *(resolveIpLocation(ipValue) for ipValue in uniqueIps),
+            return_exceptions=True,
+        )
+        locations = {
+            ipValue: result
+            for ipValue, result in zip(uniqueIps, results)
+            if isinstance(result, tuple)
+        }
+        for row in pendingRows:
+            ipLocTxt, ipLocSrc = locations.get(str(row.get("clientIp")), (None, None))
+            row["ipLocTxt"] = ipLocTxt
+            row["ipLocSrc"] = ipLocSrc
+
+    async def replaySpool(self) -> int:
+        """
+        설명: 스풀 보관분을 replayRowsPerSec 예산 안에서 배치로 재적재
+        처리 규칙: 무결성/데이터 오류로 실패한 배치만 행 단위로 재시도해 불량 행을 폐기하고,
+        연결/타임아웃 등 DB 장애로 실패하면 행 단위 재시도 없이 즉시 지수 backoff(실시간 flush를 막지 않음)
+        반환값: 이번 호출에서 재적재한 행 수
+        갱신일: 2026-10-18
+        """
+        if self.spool is None or not self.spool.hasPending():
+            return 0
+        nowSec = time.monotonic()
+        self.replayBudget = min(
+            float(self.config.replayRowsPerSec),
+            self.replayBudget + (nowSec - self.replayCheckedAt) * self.config.replayRowsPerSec,
+        )
+        self.replayCheckedAt = nowSec
+        if nowSec < self.replayNotBefore:
+            return 0
+        replayedNow = 0
+        while self.replayBudget >= 1 and not self.buffer:
+            rows, cursor = await asyncio.to_thread(
+                self.spool.readBatch, min(self.config.batchSize, int(self.replayBudget))
+            )
+            if cursor is None:
+                break
+            if rows:
+                await self.resolveLocations(rows)
+                error = await self.insertRows(rows)
+                if error is not None and not (isRowLevelInsertError(error) and await self.insertRowsIndividually(rows)):
+                    self.replayFailures += 1
+                    backoffSec = min(30.0, (self.config.flushIntervalMs / 1000.0) * (2 ** min(self.replayFailures, 6)))
+                    self.replayNotBefore = time.monotonic() + backoffSec
+                    break
+            await asyncio.to_thread(self.spool.commit, cursor)
+            self.replayFailures = 0
+            self.replayBudget -= len(rows)
+            self.replayed += len(rows)
+            replayedNow += len(rows)
+        return replayedNow
+
+    async def insertRowsIndividually(self, rows: list[dict[str, object]]) -> bool:
+        """
+        설명: 무결성/데이터 오류로 실패한 재생 배치를 행 단위로 재시도
+        처리 규칙: 행 자체 오류는 그 행만 폐기하고, 도중에 DB 장애 오류가 나면 남은 행을 시도하지 않고 중단
+        반환값: 모든 행을 적재 또는 폐기했으면 True, DB 장애로 중단했으면 False(배치는 스풀에 남아 재시도, LOG_ID 충돌은 무시)
+        갱신일: 2026-10-18
+        """
+        discardedTypes: list[str] = []
+        for row in rows:
+            error = await self.insertRows([row])
+            if error is None:
+                continue
+            if not isRowLevelInsertError(error):
+                return False
+            discardedTypes.append(type(error).__name__)
+        if discardedTypes:
+            self.discarded += len(discardedTypes)
+            logStructured(
+                logging.WARNING,
                 {
-                    "event": "db.user_log.location_update.failed",
-                    "dbName": targetDbName,
-                    "requestId": requestId,
-                    "usernameMasked": maskUserIdentifierForLog(userId),
-                    "error": type(e).__name__,
+                    "event": "db.user_log.spool_row.discarded",
+                    "rows": len(discardedTypes),
+                    "error": discardedTypes[0],
                 },
-                ensure_ascii=False,
             )
+        return True
+
+    async def stop(self) -> None:
+        """설명: 주기 루프를 멈추고 남은 버퍼를 적재(실패분은 스풀 보관) 부작용: 실행 중 task 종료 대기, 스풀 파일 닫기. 갱신일: 2026-10-18"""
+        self.stopping = True
+        self.wakeEvent.set()
+        if self.task is not None:
+            try:
+                await self.task
+            except Exception:
+                pass
+            self.task = None
+        await self.flush()
+        if self.spool is not None:
+            self.spool.close()
+
+    def snapshot(self) -> dict[str, int | bool]:
+        """설명: 관측용 writer/스풀 통계 반환값: 버퍼/적재/스풀/재생/드롭 수 dict. 갱신일: 2026-10-18"""
+        return {
+            "buffered": len(self.buffer) + len(self.spillPending),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failedBatches": self.failedBatches,
+            "spoolEnabled": self.spool is not None,
+            "spoolBytes": self.spool.totalBytes if self.spool is not None else 0,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "discarded": self.discarded,
+        }
+
+
+userAccessLogWriterConfig = UserAccessLogWriterConfig()
+userAccessLogWriter: UserAccessLogBatchWriter | None = None
+
+
+def _readWriterInt(section, key: str, envName: str, fallback: int, minimum: int) -> int:
+    rawValue = os.getenv(envName)
+    if rawValue is None and section is not None:
+        rawValue = section.get(key)
+    if rawValue is None or not str(rawValue).strip():
+        return fallback
+    try:
+        value = int(str(rawValue).strip())
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"OBSERVABILITY {key} must be an integer") from error
+    if value < minimum:
+        raise ValueError(f"OBSERVABILITY {key} must be at least {minimum}")
+    return value
+
+
+def configureUserAccessLogWriter(config) -> UserAccessLogWriterConfig:
+    """
+    설명: [OBSERVABILITY] access_log_batch_size/access_log_flush_interval_ms/access_log_buffer_limit,
+    access_log_spool_dir/access_log_spool_max_mb/access_log_spool_segment_mb/access_log_spool_replay_rows_per_sec(ENV 우선) 반영
+    처리 규칙: batch_size=0이면 배치 writer를 끄고 요청별 태스크 적재(기존 동작) 사용, batch_size는 1000으로 상한,
+    spool_max_mb=0이면 스풀 없이 드롭, 스풀 기본 위치는 LOG_DIR/access-log-spool(worker마다 worker-<pid> 하위 디렉터리)
+    실패 동작: 범위를 벗어난 정수/정수 아님은 ValueError
+    갱신일: 2026-10-18
+    """
+    global userAccessLogWriterConfig
+    section = config["OBSERVABILITY"] if config is not None and "OBSERVABILITY" in config else None
+    batchSize = _readWriterInt(section, "access_log_batch_size", "ACCESS_LOG_BATCH_SIZE", 100, 0)
+    spoolDir = os.getenv("ACCESS_LOG_SPOOL_DIR")
+    if spoolDir is None and section is not None:
+        spoolDir = section.get("access_log_spool_dir")
+    spoolDir = str(spoolDir or "").strip() or os.path.join(os.getenv("LOG_DIR", "logs"), "access-log-spool")
+    userAccessLogWriterConfig = UserAccessLogWriterConfig(
+        batchSize=min(batchSize, USER_ACCESS_LOG_MAX_BATCH_SIZE),
+        flushIntervalMs=_readWriterInt(
+            section, "access_log_flush_interval_ms", "ACCESS_LOG_FLUSH_INTERVAL_MS", 500, 1
+        ),
+        bufferLimit=_readWriterInt(section, "access_log_buffer_limit", "ACCESS_LOG_BUFFER_LIMIT", 10_000, 1),
+        spoolDir=spoolDir,
+        spoolMaxBytes=_readWriterInt(section, "access_log_spool_max_mb", "ACCESS_LOG_SPOOL_MAX_MB", 256, 0)
+        * 1024
+        * 1024,
+        spoolSegmentBytes=_readWriterInt(
+            section, "access_log_spool_segment_mb", "ACCESS_LOG_SPOOL_SEGMENT_MB", 8, 1
+        )
+        * 1024
+        * 1024,
+        replayRowsPerSec=_readWriterInt(
+            section, "access_log_spool_replay_rows_per_sec", "ACCESS_LOG_SPOOL_REPLAY_ROWS_PER_SEC", 500, 1
+        ),
+    )
+    return userAccessLogWriterConfig
+
+
+def startUserAccessLogWriter() -> bool:
+    """설명: 현재 이벤트 루프에서 배치 writer 시작 반환값: 비활성이거나 이미 실행 중이면 False. 갱신일: 2026-10-18"""
+    global userAccessLogWriter
+    if not userAccessLogWriterConfig.enabled or userAccessLogWriter is not None:
+        return False
+    spool = None
+    if userAccessLogWriterConfig.spoolEnabled:
+        try:
+            spool = AccessLogSpool(
+                userAccessLogWriterConfig.spoolDir,
+                userAccessLogWriterConfig.spoolMaxBytes,
+                userAccessLogWriterConfig.spoolSegmentBytes,
+            )
+        except (OSError, ImportError) as error:
+            logger.warning("access log spool unavailable: error=%s", type(error).__name__)
+    writer = UserAccessLogBatchWriter(userAccessLogWriterConfig, spool)
+    writer.task = asyncio.create_task(writer.run())
+    userAccessLogWriter = writer
+    return True
+
+
+async def stopUserAccessLogWriter() -> None:
+    """설명: 배치 writer 종료와 잔여 행 적재(onShutdown에서 DB 연결 해제 전에 호출) 갱신일: 2026-10-18"""
+    global userAccessLogWriter
+    writer = userAccessLogWriter
+    userAccessLogWriter = None
+    if writer is not None:
+        await writer.stop()
+
+
+def isUserAccessLogWriterRunning() -> bool:
+    return userAccessLogWriter is not None
+
+
+def enqueueUserAccessLog(
+    *,
+    username: str,
+    requestId: Optional[str],
+    method: Optional[str],
+    path: Optional[str],
+    statusCode: int,
+    latencyMs: int,
+    sqlCount: int,
+    clientIp: Optional[str],
+) -> bool:
+    """설명: 실행 중인 배치 writer 버퍼에 접근 로그 1건 적재 반환값: writer 없음/상한 초과면 False. 갱신일: 2026-10-18"""
+    writer = userAccessLogWriter
+    userId = (username or "").strip()
+    if writer is None or not userId:
+        return False
+    return writer.enqueue(
+        buildUserAccessLogRow(
+            username=userId,
+            requestId=requestId,
+            method=method,
+            path=path,
+            statusCode=statusCode,
+            latencyMs=latencyMs,
+            sqlCount=sqlCount,
+            clientIp=clientIp,
         )
+    )
+
+
+def getUserAccessLogWriterStats() -> dict[str, int | bool]:
+    writer = userAccessLogWriter
+    return writer.snapshot() if writer is not None else {"buffered": 0, "spoolEnabled": False}
+
+
+def getUserAccessLogBufferedCount() -> int:
+    writer = userAccessLogWriter
+    return len(writer.buffer) + len(writer.spillPending) if writer is not None else 0
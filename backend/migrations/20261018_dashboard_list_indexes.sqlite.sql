@@ -0,0 +1,18 @@
+-- SQLite source migration for dashboard list indexes.
+-- dashboard.list.* variants filter by USER_ID (and STAT_CD when a status is given) and order by the sort column, then DATA_NO.
+-- name: migration.dashboardListRegDt
+CREATE INDEX IF NOT EXISTS IX_DATA_USER_REG_DT
+    ON T_DATA (USER_ID, REG_DT, DATA_NO);
+
+-- name: migration.dashboardListStatusRegDt
+CREATE INDEX IF NOT EXISTS IX_DATA_USER_STAT_REG_DT
+    ON T_DATA (USER_ID, STAT_CD, REG_DT, DATA_NO);
+
+-- name: migration.dashboardListAmt
+-- amt_* variants sort and compare on COALESCE(AMT, 0) so NULL amounts keep a defined keyset position.
+CREATE INDEX IF NOT EXISTS IX_DATA_USER_AMT_KEY
+    ON T_DATA (USER_ID, COALESCE(AMT, 0), DATA_NO);
+
+-- name: migration.dashboardListTitle
+CREATE INDEX IF NOT EXISTS IX_DATA_USER_DATA_NM
+    ON T_DATA (USER_ID, DATA_NM, DATA_NO);
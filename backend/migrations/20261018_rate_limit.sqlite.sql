@@ -0,0 +1,10 @@
+-- SQLite source migration for the shared rate limit counters (rate_limit_backend = db).
+-- Apply explicitly during deployment; workers no longer create T_RATE_LIMIT at startup.
+-- name: migration.rateLimit
+CREATE TABLE IF NOT EXISTS T_RATE_LIMIT (
+    RL_KEY TEXT NOT NULL,
+    WINDOW_IDX BIGINT NOT NULL,
+    HIT_CNT INTEGER NOT NULL DEFAULT 0,
+    UPD_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (RL_KEY, WINDOW_IDX)
+);
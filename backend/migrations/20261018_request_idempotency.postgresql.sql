@@ -0,0 +1,18 @@
+-- PostgreSQL source migration for the request idempotency store.
+-- Apply explicitly during deployment; request handlers no longer purge expired rows inline.
+-- name: migration.requestIdempotency
+CREATE TABLE IF NOT EXISTS T_REQUEST_IDEMPOTENCY (
+    SCOPE_TP TEXT NOT NULL,
+    IDEMPOTENCY_KEY TEXT NOT NULL,
+    STATUS_CD TEXT NOT NULL,
+    PAYLOAD_DIGEST TEXT NOT NULL,
+    RESPONSE_JSON TEXT,
+    EXPIRES_AT_MS BIGINT NOT NULL,
+    REG_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UPD_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (SCOPE_TP, IDEMPOTENCY_KEY)
+);
+
+-- name: migration.requestIdempotencyExpiry
+CREATE INDEX IF NOT EXISTS IX_REQUEST_IDEMPOTENCY_EXPIRES
+    ON T_REQUEST_IDEMPOTENCY (EXPIRES_AT_MS);
@@ -147,3 +147,11 @@ VALUES ( :stateType
 DELETE FROM T_TOKEN
  WHERE STATE_TP = :stateType
    AND TOKEN_JTI = :tokenJti;
+
+-- name: auth.listAuthVersionEvents
+SELECT TOKEN_JTI AS "tokenJti"
+     , EXPIRES_AT_MS AS "expiresAtMs"
+  FROM T_TOKEN
+ WHERE STATE_TP = :stateType
+   AND EXPIRES_AT_MS > :afterMs
+ ORDER BY EXPIRES_AT_MS;
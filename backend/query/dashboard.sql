@@ -1,4 +1,19 @@
--- name: dashboard.list
+-- 목록 쿼리는 검색/상태/정렬 조합별 변형으로 전개된다(lib/SqlLoader.expandSqlTemplate).
+-- 사용하지 않는 조건을 ( :q = '' OR ... ) 형태로 남기지 않아 (USER_ID, STAT_CD, 정렬 컬럼) 인덱스를 그대로 탈 수 있다.
+-- AMT는 NULL 허용이라 금액 정렬은 화면 표시(NULL→0)와 같게 COALESCE(AMT, 0)으로 정렬/비교해 DB마다 다른 NULL 정렬 위치와
+-- keyset 비교에서 NULL 행이 빠지는 문제를 없앤다(인덱스도 같은 식으로 생성).
+-- 동순위는 DATA_NO를 정렬 방향과 같은 방향으로 두어 (USER_ID, 정렬 컬럼, DATA_NO) 인덱스를 한 방향으로 스캔한다(TEMP B-TREE 없음).
+-- name: dashboard.list.{search}.{status}.{sort}
+-- slot: search any =
+-- slot: search match = AND ( LOWER(DATA_NM) LIKE LOWER(:qLike) OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike) )
+-- slot: status any =
+-- slot: status eq = AND STAT_CD = :status
+-- slot: sort reg_dt_desc = REG_DT DESC, DATA_NO DESC
+-- slot: sort reg_dt_asc = REG_DT ASC, DATA_NO ASC
+-- slot: sort amt_desc = COALESCE(AMT, 0) DESC, DATA_NO DESC
+-- slot: sort amt_asc = COALESCE(AMT, 0) ASC, DATA_NO ASC
+-- slot: sort title_desc = DATA_NM DESC, DATA_NO DESC
+-- slot: sort title_asc = DATA_NM ASC, DATA_NO ASC
 SELECT DATA_NO AS "dataNo"
      , DATA_NM AS "dataNm"
      , DATA_DESC AS "dataDesc"
@@ -7,35 +22,75 @@ SELECT DATA_NO AS "dataNo"
      , TAG_JSON AS "tagJson"
      , REG_DT AS "regDt"
   FROM T_DATA
- WHERE ( :q = ''
-         OR LOWER(DATA_NM) LIKE LOWER(:qLike)
-         OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike)
-       )
-   AND USER_ID = :userId
-   AND ( :status = ''
-         OR STAT_CD = :status
-       )
- ORDER BY CASE WHEN :sort = 'reg_dt_asc' THEN REG_DT END ASC
-        , CASE WHEN :sort = 'reg_dt_desc' THEN REG_DT END DESC
-        , CASE WHEN :sort = 'amt_asc' THEN AMT END ASC
-        , CASE WHEN :sort = 'amt_desc' THEN AMT END DESC
-        , CASE WHEN :sort = 'title_asc' THEN DATA_NM END ASC
-        , CASE WHEN :sort = 'title_desc' THEN DATA_NM END DESC
-        , DATA_NO DESC
+ WHERE USER_ID = :userId
+       {{search}}
+       {{status}}
+ ORDER BY {{sort}}
+ LIMIT :limit
+OFFSET :offset;
+
+-- name: dashboard.listWithTotal.{search}.{status}.{sort}
+-- slot: search any =
+-- slot: search match = AND ( LOWER(DATA_NM) LIKE LOWER(:qLike) OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike) )
+-- slot: status any =
+-- slot: status eq = AND STAT_CD = :status
+-- slot: sort reg_dt_desc = REG_DT DESC, DATA_NO DESC
+-- slot: sort reg_dt_asc = REG_DT ASC, DATA_NO ASC
+-- slot: sort amt_desc = COALESCE(AMT, 0) DESC, DATA_NO DESC
+-- slot: sort amt_asc = COALESCE(AMT, 0) ASC, DATA_NO ASC
+-- slot: sort title_desc = DATA_NM DESC, DATA_NO DESC
+-- slot: sort title_asc = DATA_NM ASC, DATA_NO ASC
+SELECT DATA_NO AS "dataNo"
+     , DATA_NM AS "dataNm"
+     , DATA_DESC AS "dataDesc"
+     , STAT_CD AS "statCd"
+     , AMT AS "amt"
+     , TAG_JSON AS "tagJson"
+     , REG_DT AS "regDt"
+     , COUNT(*) OVER () AS "totalCount"
+  FROM T_DATA
+ WHERE USER_ID = :userId
+       {{search}}
+       {{status}}
+ ORDER BY {{sort}}
  LIMIT :limit
 OFFSET :offset;
 
--- name: dashboard.listCount
+-- name: dashboard.listCount.{search}.{status}
+-- slot: search any =
+-- slot: search match = AND ( LOWER(DATA_NM) LIKE LOWER(:qLike) OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike) )
+-- slot: status any =
+-- slot: status eq = AND STAT_CD = :status
 SELECT COUNT(*) AS "totalCount"
   FROM T_DATA
- WHERE ( :q = ''
-         OR LOWER(DATA_NM) LIKE LOWER(:qLike)
-         OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike)
-       )
-   AND USER_ID = :userId
-   AND ( :status = ''
-         OR STAT_CD = :status
-       );
+ WHERE USER_ID = :userId
+       {{search}}
+       {{status}};
+
+-- name: dashboard.listAfter.{search}.{status}.{sort}
+-- slot: search any =
+-- slot: search match = AND ( LOWER(DATA_NM) LIKE LOWER(:qLike) OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike) )
+-- slot: status any =
+-- slot: status eq = AND STAT_CD = :status
+-- slot: sort reg_dt_desc = AND ( REG_DT < :cursorKey OR ( REG_DT = :cursorKey AND DATA_NO < :cursorId ) ) ORDER BY REG_DT DESC, DATA_NO DESC
+-- slot: sort reg_dt_asc = AND ( REG_DT > :cursorKey OR ( REG_DT = :cursorKey AND DATA_NO > :cursorId ) ) ORDER BY REG_DT ASC, DATA_NO ASC
+-- slot: sort amt_desc = AND ( COALESCE(AMT, 0) < :cursorKey OR ( COALESCE(AMT, 0) = :cursorKey AND DATA_NO < :cursorId ) ) ORDER BY COALESCE(AMT, 0) DESC, DATA_NO DESC
+-- slot: sort amt_asc = AND ( COALESCE(AMT, 0) > :cursorKey OR ( COALESCE(AMT, 0) = :cursorKey AND DATA_NO > :cursorId ) ) ORDER BY COALESCE(AMT, 0) ASC, DATA_NO ASC
+-- slot: sort title_desc = AND ( DATA_NM < :cursorKey OR ( DATA_NM = :cursorKey AND DATA_NO < :cursorId ) ) ORDER BY DATA_NM DESC, DATA_NO DESC
+-- slot: sort title_asc = AND ( DATA_NM > :cursorKey OR ( DATA_NM = :cursorKey AND DATA_NO > :cursorId ) ) ORDER BY DATA_NM ASC, DATA_NO ASC
+SELECT DATA_NO AS "dataNo"
+     , DATA_NM AS "dataNm"
+     , DATA_DESC AS "dataDesc"
+     , STAT_CD AS "statCd"
+     , AMT AS "amt"
+     , TAG_JSON AS "tagJson"
+     , REG_DT AS "regDt"
+  FROM T_DATA
+ WHERE USER_ID = :userId
+       {{search}}
+       {{status}}
+       {{sort}}
+ LIMIT :limit;
 
 -- name: dashboard.detail
 SELECT DATA_NO AS "dataNo"
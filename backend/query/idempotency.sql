@@ -11,10 +11,23 @@ CREATE TABLE IF NOT EXISTS T_REQUEST_IDEMPOTENCY (
        PRIMARY KEY (SCOPE_TP, IDEMPOTENCY_KEY)
 );
 
--- name: idempotency.deleteExpired
+-- name: idempotency.purgeExpiredBatch
 DELETE
   FROM T_REQUEST_IDEMPOTENCY
- WHERE EXPIRES_AT_MS <= :nowMs;
+ WHERE (SCOPE_TP, IDEMPOTENCY_KEY) IN (
+       SELECT SCOPE_TP, IDEMPOTENCY_KEY
+         FROM T_REQUEST_IDEMPOTENCY
+        WHERE EXPIRES_AT_MS <= :nowMs
+        LIMIT :batchSize
+       )
+RETURNING SCOPE_TP AS "scopeTp";
+
+-- name: idempotency.deleteExpiredEntry
+DELETE
+  FROM T_REQUEST_IDEMPOTENCY
+ WHERE SCOPE_TP = :scopeType
+   AND IDEMPOTENCY_KEY = :idempotencyKey
+   AND EXPIRES_AT_MS <= :nowMs;
 
 -- name: idempotency.getEntry
 SELECT SCOPE_TP AS "scopeTp"
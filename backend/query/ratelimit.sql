@@ -0,0 +1,31 @@
+-- name: rateLimit.addHits
+INSERT INTO T_RATE_LIMIT (
+       RL_KEY,
+       WINDOW_IDX,
+       HIT_CNT
+)
+VALUES ( :rlKey,
+         :windowIdx,
+         :hitDelta
+       )
+ON CONFLICT (RL_KEY, WINDOW_IDX) DO UPDATE
+   SET HIT_CNT = T_RATE_LIMIT.HIT_CNT + EXCLUDED.HIT_CNT
+     , UPD_DT = CURRENT_TIMESTAMP
+RETURNING HIT_CNT AS "hitCnt",
+          ( SELECT PREV.HIT_CNT
+              FROM T_RATE_LIMIT PREV
+             WHERE PREV.RL_KEY = :rlKey
+               AND PREV.WINDOW_IDX = :previousWindowIdx
+          ) AS "previousCnt";
+
+-- name: rateLimit.getCounts
+SELECT WINDOW_IDX AS "windowIdx",
+       HIT_CNT AS "hitCnt"
+  FROM T_RATE_LIMIT
+ WHERE RL_KEY = :rlKey
+   AND WINDOW_IDX >= :previousWindowIdx;
+
+-- name: rateLimit.deleteExpired
+DELETE
+  FROM T_RATE_LIMIT
+ WHERE WINDOW_IDX < :minWindowIdx;
@@ -169,6 +169,91 @@ SELECT TASK_NO AS "taskNo"
  LIMIT :limit
 OFFSET :offset;
 
+-- name: sample.taskListWithTotal
+SELECT TASK_NO AS "taskNo"
+     , DATA_NM AS "dataNm"
+     , DATA_DESC AS "dataDesc"
+     , OWNER_NM AS "ownerNm"
+     , STAT_CD AS "statCd"
+     , AMT AS "amt"
+     , ATTACH_NM AS "attachNm"
+     , REG_DT AS "regDt"
+     , COUNT(*) OVER () AS "totalCount"
+  FROM T_SAMPLE_TASK
+ WHERE ( :q = ''
+         OR LOWER(DATA_NM) LIKE LOWER(:qLike)
+         OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike)
+         OR LOWER(COALESCE(OWNER_NM, '')) LIKE LOWER(:qLike)
+         OR DATA_NM IN ( :publicTitleMatch01,
+                         :publicTitleMatch02,
+                         :publicTitleMatch03,
+                         :publicTitleMatch04,
+                         :publicTitleMatch05,
+                         :publicTitleMatch06,
+                         :publicTitleMatch07,
+                         :publicTitleMatch08,
+                         :publicTitleMatch09,
+                         :publicTitleMatch10,
+                         :publicTitleMatch11,
+                         :publicTitleMatch12,
+                         :publicTitleMatch13,
+                         :publicTitleMatch14,
+                         :publicTitleMatch15
+                       )
+       )
+   AND ( :status = ''
+         OR STAT_CD = :status
+       )
+   AND REG_DT >= :fromDate
+   AND REG_DT < :toDateExclusive
+ ORDER BY REG_DT DESC,
+       TASK_NO DESC
+ LIMIT :limit
+OFFSET :offset;
+
+-- name: sample.taskListAfter
+SELECT TASK_NO AS "taskNo"
+     , DATA_NM AS "dataNm"
+     , DATA_DESC AS "dataDesc"
+     , OWNER_NM AS "ownerNm"
+     , STAT_CD AS "statCd"
+     , AMT AS "amt"
+     , ATTACH_NM AS "attachNm"
+     , REG_DT AS "regDt"
+  FROM T_SAMPLE_TASK
+ WHERE ( :q = ''
+         OR LOWER(DATA_NM) LIKE LOWER(:qLike)
+         OR LOWER(COALESCE(DATA_DESC, '')) LIKE LOWER(:qLike)
+         OR LOWER(COALESCE(OWNER_NM, '')) LIKE LOWER(:qLike)
+         OR DATA_NM IN ( :publicTitleMatch01,
+                         :publicTitleMatch02,
+                         :publicTitleMatch03,
+                         :publicTitleMatch04,
+                         :publicTitleMatch05,
+                         :publicTitleMatch06,
+                         :publicTitleMatch07,
+                         :publicTitleMatch08,
+                         :publicTitleMatch09,
+                         :publicTitleMatch10,
+                         :publicTitleMatch11,
+                         :publicTitleMatch12,
+                         :publicTitleMatch13,
+                         :publicTitleMatch14,
+                         :publicTitleMatch15
+                       )
+       )
+   AND ( :status = ''
+         OR STAT_CD = :status
+       )
+   AND REG_DT >= :fromDate
+   AND REG_DT < :toDateExclusive
+   AND ( REG_DT < :cursorKey
+         OR ( REG_DT = :cursorKey AND TASK_NO < :cursorId )
+       )
+ ORDER BY REG_DT DESC,
+       TASK_NO DESC
+ LIMIT :limit;
+
 -- name: sample.taskListCount
 SELECT COUNT(*) AS "totalCount"
   FROM T_SAMPLE_TASK
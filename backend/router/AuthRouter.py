@@ -1,7 +1,7 @@
 """
 파일명: backend/router/AuthRouter.py
 작성자: LSH
-갱신일: 2026-04-08
+갱신일: 2026-10-18
 설명: 인증 API 라우터. Access/Refresh 쿠키 기반 토큰 흐름 담당
 """
 
@@ -411,7 +411,7 @@ async def login(request: Request):
         )
 
     # 레이트리밋(선체크): 이미 초과된 상태면 인증 로직(쿼리/해시)을 타기 전에 차단한다.
-    limited = checkRateLimit(
+    limited = await checkRateLimit(
         request,
         username=canonicalUsername,
         commit=False,
@@ -427,6 +427,7 @@ async def login(request: Request):
             exc,
             messageByCode={
                 "AUTH_503_DB_NOT_READY": i18nTranslate("error.db_not_ready", "database not ready", loc),
+                "AUTH_503_HASH_BUSY": i18nTranslate("auth.hash_busy", "authentication is busy, retry shortly", loc),
             },
             includeNoStore=True,
         )
@@ -436,7 +437,7 @@ async def login(request: Request):
     if not authResult:
 
         # 레이트리밋(실패 기록): 로그인 실패 시에만 카운트를 증가시킨다.
-        limited = checkRateLimit(
+        limited = await checkRateLimit(
             request,
             username=canonicalUsername,
             commit=True,
@@ -484,7 +485,7 @@ async def signup(request: Request):
     except ServiceError:
         return invalidInputResponse(loc)
     canonicalEmail = AuthService.normalizeLoginUsername(payload.get("email"))
-    limited = checkRateLimit(
+    limited = await checkRateLimit(
         request,
         username=canonicalEmail,
         commit=True,
@@ -501,6 +502,7 @@ async def signup(request: Request):
                 "AUTH_422_INVALID_INPUT": i18nTranslate("error.invalid_input", "invalid input", loc),
                 "AUTH_409_USER_EXISTS": i18nTranslate("auth.user_exists", "user already exists", loc),
                 "AUTH_503_DB_NOT_READY": i18nTranslate("error.db_not_ready", "database not ready", loc),
+                "AUTH_503_HASH_BUSY": i18nTranslate("auth.hash_busy", "authentication is busy, retry shortly", loc),
             },
             includeNoStore=True,
         )
@@ -541,7 +543,7 @@ async def requestPasswordReset(request: Request, backgroundTasks: BackgroundTask
     except ServiceError:
         return invalidInputResponse(loc)
     canonicalEmail = AuthService.normalizeLoginUsername(payload.get("email"))
-    limited = checkRateLimit(
+    limited = await checkRateLimit(
         request,
         username=canonicalEmail,
         commit=True,
@@ -606,6 +608,15 @@ async def completePasswordReset(request: Request):
             ),
             headers={"Cache-Control": "no-store"},
         )
+    if errorCode == "AUTH_503_HASH_BUSY":
+        return JSONResponse(
+            status_code=503,
+            content=errorResponse(
+                message=i18nTranslate("auth.hash_busy", "authentication is busy, retry shortly", loc),
+                code="AUTH_503_HASH_BUSY",
+            ),
+            headers={"Cache-Control": "no-store"},
+        )
     if errorCode == "AUTH_503_DB_NOT_READY":
         return JSONResponse(
             status_code=503,
@@ -652,7 +663,7 @@ async def changePassword(request: Request, user=Depends(getCurrentUser)):
         return invalidInputResponse(loc)
 
     canonicalUsername = AuthService.normalizeLoginUsername(user.username)
-    limited, reservationHandle = reserveRateLimit(
+    limited, reservationHandle = await reserveRateLimit(
         request,
         username=canonicalUsername,
         namespace="auth.password_change",
@@ -665,7 +676,7 @@ async def changePassword(request: Request, user=Depends(getCurrentUser)):
         result, errorCode = await AuthService.changePassword(user.username, payload)
         keepFailedAttempt = errorCode == "AUTH_400_CURRENT_PASSWORD_INVALID"
     finally:
-        finalizeRateLimitReservation(reservationHandle, keep=keepFailedAttempt)
+        await finalizeRateLimitReservation(reservationHandle, keep=keepFailedAttempt)
     if errorCode == "AUTH_422_INVALID_INPUT":
         return invalidInputResponse(loc)
     if errorCode == "AUTH_400_CURRENT_PASSWORD_INVALID":
@@ -681,6 +692,15 @@ async def changePassword(request: Request, user=Depends(getCurrentUser)):
             ),
             headers={"Cache-Control": "no-store"},
         )
+    if errorCode == "AUTH_503_HASH_BUSY":
+        return JSONResponse(
+            status_code=503,
+            content=errorResponse(
+                message=i18nTranslate("auth.hash_busy", "authentication is busy, retry shortly", loc),
+                code="AUTH_503_HASH_BUSY",
+            ),
+            headers={"Cache-Control": "no-store"},
+        )
     if errorCode == "AUTH_503_DB_NOT_READY":
         return JSONResponse(
             status_code=503,
@@ -810,7 +830,7 @@ async def appLogin(request: Request):
             headers={"WWW-Authenticate": "Bearer", "Cache-Control": "no-store"},
         )
 
-    limited = checkRateLimit(
+    limited = await checkRateLimit(
         request,
         username=canonicalUsername,
         commit=False,
@@ -826,6 +846,7 @@ async def appLogin(request: Request):
             exc,
             messageByCode={
                 "AUTH_503_DB_NOT_READY": i18nTranslate("error.db_not_ready", "database not ready", loc),
+                "AUTH_503_HASH_BUSY": i18nTranslate("auth.hash_busy", "authentication is busy, retry shortly", loc),
             },
             includeNoStore=True,
         )
@@ -833,7 +854,7 @@ async def appLogin(request: Request):
             return mappedResponse
         raise
     if not authResult:
-        limited = checkRateLimit(
+        limited = await checkRateLimit(
             request,
             username=canonicalUsername,
             commit=True,
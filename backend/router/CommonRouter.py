@@ -6,8 +6,9 @@
 """
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from lib.Metrics import METRICS_CONTENT_TYPE
 from lib.I18n import detectLocale, translate as i18nTranslate
 from lib.Response import errorResponse, successResponse
 from lib.ServiceError import buildMappedErrorResponse
@@ -67,3 +68,51 @@ async def readyz(request: Request):
     )
     errorJsonResponse.headers["Cache-Control"] = "no-store"
     return errorJsonResponse
+
+
+@router.get("/internal/db/query-stats", include_in_schema=False)
+async def internalQueryStats(request: Request):
+    """
+    설명: queryName별 SQL 실행 시간 히스토그램(count/p50/p95/p99/max/rows)과 DB별 연결 풀·읽기 replica 상태(pools)를 반환하는 내부 진단 엔드포인트
+    처리 규칙: internal_stats_enabled=false(기본)면 엔드포인트 존재를 숨기도록 404(OBS_404_NOT_FOUND) 반환
+    반환값: Cache-Control=no-store가 적용된 표준 JSONResponse
+    갱신일: 2026-10-18
+    """
+    result, isEnabled = await CommonService.queryStats({})
+    if isEnabled:
+        r = JSONResponse(content=successResponse(result=result), status_code=200)
+        r.headers["Cache-Control"] = "no-store"
+        return r
+
+    loc = detectLocale(request)
+    return buildMappedErrorResponse(
+        "OBS_404_NOT_FOUND",
+        messageByCode={
+            "OBS_404_NOT_FOUND": i18nTranslate("obs.not_found", "not found", loc),
+        },
+        includeNoStore=True,
+    )
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """
+    설명: Prometheus 스크레이프용 텍스트 노출 형식(version 0.0.4) 메트릭 반환
+    처리 규칙: metrics_enabled=false(기본)면 404(OBS_404_NOT_FOUND) 반환
+    반환값: Cache-Control=no-store가 적용된 text/plain 응답
+    갱신일: 2026-10-18
+    """
+    body, isEnabled = await CommonService.metrics({})
+    if isEnabled:
+        r = PlainTextResponse(content=body, status_code=200, media_type=METRICS_CONTENT_TYPE)
+        r.headers["Cache-Control"] = "no-store"
+        return r
+
+    loc = detectLocale(request)
+    return buildMappedErrorResponse(
+        "OBS_404_NOT_FOUND",
+        messageByCode={
+            "OBS_404_NOT_FOUND": i18nTranslate("obs.not_found", "not found", loc),
+        },
+        includeNoStore=True,
+    )
@@ -37,12 +37,14 @@ async def listDataTemplates(
     page: int | None = None,
     size: int | None = None,
     sort: str | None = None,
+    cursor: str | None = None,
     user=Depends(getCurrentUser),
 ):
     """
     설명: 목록 쿼리 파라미터를 서비스로 위임하고 응답 본문(meta 포함)으로 직렬화하 라우터
+    처리 규칙: cursor 파라미터가 있으면(빈 값은 첫 페이지) keyset 모드로 listMetaObj.nextCursor를 함께 반환
     실패 동작: 서비스 예외는 handleDashboardError에서 코드별 HTTP 응답으로 변환
-    갱신일: 2026-02-22
+    갱신일: 2026-10-18
     """
     try:
         result = await DashboardService.listDataTemplates(
@@ -52,21 +54,27 @@ async def listDataTemplates(
             page=page,
             size=size,
             sort=sort,
+            cursor=cursor,
         )
+        listMetaObj = {
+            "page": result["page"],
+            "size": result["size"],
+            "sort": result["sort"],
+            "q": result["q"],
+            "status": result["status"],
+            "totalCount": result["total"],
+            "totalExact": result.get("totalExact", True),
+            "hasMore": result.get("hasMore", False),
+        }
+        if "nextCursor" in result:
+            listMetaObj["nextCursor"] = result["nextCursor"]
         response = JSONResponse(
             status_code=200,
             content={
                 **successResponse(
                     result={
                         "dataTemplateList": [*result["dataTemplateList"]],
-                        "listMetaObj": {
-                            "page": result["page"],
-                            "size": result["size"],
-                            "sort": result["sort"],
-                            "q": result["q"],
-                            "status": result["status"],
-                            "totalCount": result["total"],
-                        },
+                        "listMetaObj": listMetaObj,
                     }
                 ),
                 "count": result["total"],
@@ -6,10 +6,11 @@
 """
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from lib.RequestPayloadValidator import readJsonPayloadDict, validatePayloadTypes
 from lib.Response import successResponse
+from lib.ResultCache import CachedResult, isEtagMatched
 from lib.ServiceError import buildMappedErrorResponse
 from service import SampleService
 
@@ -21,44 +22,57 @@ adminRouter = APIRouter(prefix="/admin", tags=["sample"])
 def handleSampleError(exc: Exception) -> JSONResponse:
     """
     설명: 공개 sample 서비스 예외를 표준 에러 응답으로 매핑
-    처리 규칙: 등록된 sample 코드만 상태코드/code/message로 고정 변환
+    처리 규칙: 등록된 sample 코드만 상태코드/code/message로 고정 변환, 테이블 누락 예외는 다음 호출에서 재부트스트랩되도록 표시
     반환값: 매핑된 JSONResponse
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
+    SampleService.noteSampleStorageError(exc)
     mappedResponse = buildMappedErrorResponse(exc, includeNoStore=True)
     if mappedResponse is not None:
         return mappedResponse
     raise exc
 
 
+def buildRevalidatedResponse(request: Request, entry: CachedResult) -> Response:
+    """
+    설명: 캐시된 공개 집계 결과를 ETag 재검증 응답으로 변환
+    처리 규칙: If-None-Match가 현재 ETag와 같으면 본문 없이 304, 아니면 200 + ETag,
+    Cache-Control은 no-cache로 두어 브라우저가 매번 재검증하도록 함
+    반환값: 304 Response 또는 200 JSONResponse
+    갱신일: 2026-10-18
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if isEtagMatched(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(status_code=200, content=successResponse(result=entry.value), headers=headers)
+
+
 @router.get("/overview")
-async def getSampleOverview():
+async def getSampleOverview(request: Request):
     """
     설명: 공개 sample 허브/포트폴리오용 전체 요약 카운트 조회
+    처리 규칙: 짧은 TTL 캐시 결과의 ETag가 If-None-Match와 같으면 DB 조회 없이 304
     반환값: taskCount/adminUserCount/formSubmissionCount를 담은 successResponse
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
     try:
-        result = await SampleService.getSampleOverview()
-        response = JSONResponse(status_code=200, content=successResponse(result=result))
-        response.headers["Cache-Control"] = "no-store"
-        return response
+        entry = await SampleService.readSampleOverviewEntry()
+        return buildRevalidatedResponse(request, entry)
     except Exception as exc:
         return handleSampleError(exc)
 
 
 @router.get("/dashboard")
-async def getSampleDashboard():
+async def getSampleDashboard(request: Request):
     """
     설명: 공개 sample 대시보드용 KPI/차트/최근 업무 묶음 조회
+    처리 규칙: 짧은 TTL 캐시 결과의 ETag가 If-None-Match와 같으면 DB 조회 없이 304
     반환값: dashboard result dict를 담은 successResponse
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
     try:
-        result = await SampleService.getSampleDashboard()
-        response = JSONResponse(status_code=200, content=successResponse(result=result))
-        response.headers["Cache-Control"] = "no-store"
-        return response
+        entry = await SampleService.readSampleDashboardEntry()
+        return buildRevalidatedResponse(request, entry)
     except Exception as exc:
         return handleSampleError(exc)
 
@@ -71,11 +85,13 @@ async def listSampleTasks(
     toDate: str | None = None,
     page: int | None = None,
     size: int | None = None,
+    cursor: str | None = None,
 ):
     """
     설명: 공개 sample CRUD 목록을 검색/필터 조건으로 조회
+    처리 규칙: cursor 파라미터가 있으면(빈 값은 첫 페이지) keyset 모드로 listMetaObj.nextCursor를 함께 반환
     반환값: sampleTaskList/total/page/size meta를 담은 successResponse
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
     try:
         result = await SampleService.listSampleTasks(
@@ -85,22 +101,28 @@ async def listSampleTasks(
             toDate=toDate,
             page=page,
             size=size,
+            cursor=cursor,
         )
+        listMetaObj = {
+            "page": result["page"],
+            "size": result["size"],
+            "q": result["q"],
+            "status": result["status"],
+            "fromDate": result["fromDate"],
+            "toDate": result["toDate"],
+            "totalCount": result["total"],
+            "totalExact": result.get("totalExact", True),
+            "hasMore": result.get("hasMore", False),
+        }
+        if "nextCursor" in result:
+            listMetaObj["nextCursor"] = result["nextCursor"]
         response = JSONResponse(
             status_code=200,
             content={
                 **successResponse(
                     result={
                         "sampleTaskList": [*result["sampleTaskList"]],
-                        "listMetaObj": {
-                            "page": result["page"],
-                            "size": result["size"],
-                            "q": result["q"],
-                            "status": result["status"],
-                            "fromDate": result["fromDate"],
-                            "toDate": result["toDate"],
-                            "totalCount": result["total"],
-                        },
+                        "listMetaObj": listMetaObj,
                     }
                 ),
                 "count": result["total"],
@@ -1,13 +1,15 @@
 """
 파일명: backend/server.py
 작성자: LSH
-갱신일: 2025-11-12
+갱신일: 2026-10-18
 설명: FastAPI 서버 기동, DB/CORS/라우터 전체 초기화 담당
 """
 
 import importlib
+import inspect
 import ipaddress
 import json
+import logging
 import os
 import pkgutil
 import re
@@ -35,7 +37,7 @@ from lib.Database import (
     setQueryConfig,
 )
 from lib import Database as DB
-from lib.Logger import logger
+from lib.Logger import logStructured, logger
 from lib.Response import errorResponse
 from lib.Middleware import (
     RequestLogMiddleware,
@@ -45,7 +47,22 @@ from lib.Middleware import (
 )
 from lib.OpenAPI import attachOpenAPI
 from lib.Config import getConfig
+from lib.AuthVersionCache import (
+    configureAuthVersionCache,
+    startAuthVersionInvalidationPoller,
+    stopAuthVersionInvalidationPoller,
+)
+from lib.DatabasePool import readDatabasePoolConfig
+from lib.ReadReplica import parseReplicaHosts, readReplicaConfig
+from lib.Idempotency import configureIdempotency, startIdempotencySweeper, stopIdempotencySweeper
+from lib.Metrics import configureMetrics, startMetricsFlusher, stopMetricsFlusher
+from lib.PasswordHashPool import configurePasswordHashPool, shutdownPasswordHashPool
 from lib.PasswordResetMail import configurePasswordResetMail
+from lib.UserAccessLog import configureUserAccessLogWriter, startUserAccessLogWriter, stopUserAccessLogWriter
+from lib.QueryMetrics import configureQueryMetrics
+from lib.RateLimit import configureRateLimit, startRateLimitPurge, stopRateLimitPurge
+from service.AuthService import fetchAuthVersionInvalidations, readCurrentEpochMs
+from service.SampleService import configureSampleReadCache
 
 app = FastAPI()
 
@@ -149,12 +166,29 @@ def validateCorsOriginRegex(value: str):
 
 async def onShutdown():
     """
-    설명: 애플리케이션 종료 시 DB 연결과 쿼리 워처 리소스 정리
-    처리 규칙: 등록된 DB 매니저마다 disconnect를 호출하고, 워처 스레드는 stop/join으로 종료
+    설명: 애플리케이션 종료 시 백그라운드 작업, DB 연결과 쿼리 워처 리소스 정리
+    처리 규칙: 접근 로그/폴러/rate limit 정리/스위퍼/메트릭/해시 풀을 순서대로 멈춘 뒤 등록된 DB 매니저마다 disconnect를 호출하고,
+    워처 스레드는 stop/join으로 종료
+    실패 동작: 단계별 예외는 로그로 남기고 다음 단계를 계속 진행(한 단계 실패로 DB 해제/워처 종료가 빠지지 않음)
     부작용: 전역 DB 커넥션과 파일 감시 스레드를 해제
-    갱신일: 2026-02-24
+    갱신일: 2026-10-18
     """
-    await drainUserAccessLogTasks()
+    shutdownSteps = (
+        ("user access log task drain", drainUserAccessLogTasks),
+        ("user access log writer stop", stopUserAccessLogWriter),
+        ("auth version poller stop", stopAuthVersionInvalidationPoller),
+        ("rate limit purge stop", stopRateLimitPurge),
+        ("idempotency sweeper stop", stopIdempotencySweeper),
+        ("metrics flusher stop", stopMetricsFlusher),
+        ("password hash pool shutdown", shutdownPasswordHashPool),
+    )
+    for stepName, step in shutdownSteps:
+        try:
+            result = step()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception("%s failed during shutdown", stepName)
 
     for manager in DB.dbManagers.values():
         if not hasattr(manager, "disconnect"):
@@ -182,9 +216,9 @@ async def onShutdown():
 async def onStartup():
     """
     설명: 서버 시작 시 DB 연결, 쿼리 로더, 인증 설정 초기화
-    처리 규칙: DB 섹션을 순회해 매니저를 생성/연결하고, query watcher 및 AuthConfig를 초기화
-    실패 동작: 개별 DB 연결 실패는 로그로 남기고 나머지 초기화는 계속 진행
-    갱신일: 2026-02-24
+    처리 규칙: DB 섹션을 순회해 매니저를 생성/연결(섹션별 pool_*/replica_* 설정 반영)하고, query watcher 및 AuthConfig를 초기화
+    실패 동작: 개별 DB 연결 실패는 로그로 남기고 나머지 초기화는 계속 진행, 잘못된 pool/replica 설정은 기동 실패
+    갱신일: 2026-10-18
     """
     logger.info("database connect start")
     global sqlObserver
@@ -196,6 +230,7 @@ async def onStartup():
         dbConfig = config[section]
         dbName = dbConfig.get("name", section.lower())
         dbType = dbConfig.get("type")
+        replicaScheme: str | None = None
 
         if dbType == "sqlite":
 
@@ -218,8 +253,9 @@ async def onStartup():
             password = dbConfig.get("password")
 
             # databases 패키지와의 호환을 위해 async 드라이버를 사용
+            replicaScheme = "mysql+aiomysql"
             dbUrl = buildNetworkDbUrl(
-                scheme="mysql+aiomysql",
+                scheme=replicaScheme,
                 host=host,
                 port=port,
                 database=database,
@@ -232,8 +268,9 @@ async def onStartup():
             database = dbConfig.get("database")
             user = dbConfig.get("user")
             password = dbConfig.get("password")
+            replicaScheme = "postgresql"
             dbUrl = buildNetworkDbUrl(
-                scheme="postgresql",
+                scheme=replicaScheme,
                 host=host,
                 port=port,
                 database=database,
@@ -244,9 +281,33 @@ async def onStartup():
             logger.warning(f"unsupported database type: {dbType}")
             continue
 
+        try:
+            poolConfig = readDatabasePoolConfig(dbConfig, section)
+        except ValueError as error:
+            raise RuntimeError(f"invalid {section} pool configuration: {error}") from error
+
+        # 읽기 replica는 primary와 같은 계정/DB 이름을 쓰고 host[:port]만 다르다(SQLite는 미지원).
+        replicaConfig = None
+        if replicaScheme is not None and str(dbConfig.get("replica_hosts") or "").strip():
+            try:
+                replicaUrls = [
+                    buildNetworkDbUrl(
+                        scheme=replicaScheme,
+                        host=replicaHost,
+                        port=replicaPort or port,
+                        database=database,
+                        user=user,
+                        password=password,
+                    )
+                    for replicaHost, replicaPort in parseReplicaHosts(dbConfig.get("replica_hosts"), section)
+                ]
+                replicaConfig = readReplicaConfig(dbConfig, section, replicaUrls)
+            except ValueError as error:
+                raise RuntimeError(f"invalid {section} replica configuration: {error}") from error
+
         try:
             if dbName not in DB.dbManagers or not getattr(DB.dbManagers[dbName], "databaseUrl", None):
-                DB.dbManagers[dbName] = DatabaseManager(dbUrl)
+                DB.dbManagers[dbName] = DatabaseManager(dbUrl, poolConfig, name=dbName, replicaConfig=replicaConfig)
             if hasattr(DB.dbManagers[dbName], "connect"):
                 await DB.dbManagers[dbName].connect()
             logger.info(f"database connected: {dbName}")
@@ -354,6 +415,48 @@ async def onStartup():
         configurePasswordResetMail(config, runtime=runtime)
     except (TypeError, ValueError) as error:
         raise RuntimeError(f"invalid PASSWORD_RESET configuration: {error}") from error
+    try:
+        configurePasswordHashPool(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid AUTH hash pool configuration: {error}") from error
+    try:
+        configureAuthVersionCache(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid AUTH version cache configuration: {error}") from error
+    try:
+        configureRateLimit(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid AUTH rate limit configuration: {error}") from error
+    if startRateLimitPurge():
+        logger.info("rate limit db purge started")
+    try:
+        configureQueryMetrics(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid OBSERVABILITY query metrics configuration: {error}") from error
+    try:
+        configureMetrics(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid OBSERVABILITY metrics configuration: {error}") from error
+    if startMetricsFlusher():
+        logger.info("metrics multiprocess snapshot flusher started")
+    try:
+        configureUserAccessLogWriter(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid OBSERVABILITY access log writer configuration: {error}") from error
+    if startUserAccessLogWriter():
+        logger.info("user access log batch writer started")
+    if startAuthVersionInvalidationPoller(fetchAuthVersionInvalidations, readCurrentEpochMs()):
+        logger.info("auth version invalidation poller started")
+    try:
+        configureIdempotency(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid IDEMPOTENCY configuration: {error}") from error
+    if startIdempotencySweeper():
+        logger.info("idempotency purge sweeper started")
+    try:
+        configureSampleReadCache(config)
+    except ValueError as error:
+        raise RuntimeError(f"invalid SAMPLE read cache configuration: {error}") from error
 
     # 사용자 테이블 생성/시드는 스크립트나 AuthService가 담당하므로 여기서는 건드리지 않는다.
     # 외부 DB를 존중하기 위해 스타트업 단계에서 묵시적 DDL/DML을 수행하지 않는다.
@@ -475,13 +578,17 @@ async def globalExceptionHandler(request: Request, exc: Exception):
     """
     requestId = getattr(request.state, "requestId", None)
     try:
-        logger.exception(json.dumps({
-            "level": "ERROR",
-            "msg": "unhandled_exception",
-            "path": request.url.path,
-            "requestId": requestId,
-            "errorType": type(exc).__name__,
-        }, ensure_ascii=False))
+        logStructured(
+            logging.ERROR,
+            {
+                "level": "ERROR",
+                "msg": "unhandled_exception",
+                "path": request.url.path,
+                "requestId": requestId,
+                "errorType": type(exc).__name__,
+            },
+            excInfo=True,
+        )
     except Exception:
         pass
     content = errorResponse(
@@ -13,6 +13,7 @@ import base64
 import hashlib
 import hmac
 import json
+import logging
 import re
 import secrets
 from datetime import datetime, timezone
@@ -31,12 +32,20 @@ from lib.Auth import (
     createRefreshToken,
     decodeAuthToken,
 )
+from lib.AuthVersionCache import (
+    AUTH_VERSION_EVENT_STATE_TYPE,
+    getAuthVersionEventRetentionMs,
+    invalidateCachedAuthVersion,
+    isAuthVersionInvalidationChannelEnabled,
+)
 from lib import Database as DB
 from lib.Casing import convertKeysToCamelCase
+from lib.ExpiryIndex import ExpiringStore
 from lib.Idempotency import beginIdempotencyRequest, completeIdempotencyRequest, discardIdempotencyReservation
-from lib.Logger import logger
+from lib.Logger import logStructured, logger
 from lib.Masking import maskUserIdentifierForLog
 from lib import PasswordResetMail
+from lib.PasswordHashPool import runPasswordHashJob
 from lib.RequestContext import getRequestId
 from lib.ServiceError import ServiceError
 from lib.ServiceError import resolveServiceErrorCode
@@ -54,11 +63,23 @@ PASSWORD_RESET_TOKEN_PATTERN = re.compile(r"^[A-Za-z0-9_-]{43}$")
 tokenStateStoreReady = False
 
 # 인메모리 폴백 스토어(DB 저장소 사용 불가 시 사용)
+# 만료 색인으로 정리하며, 상한 초과 시 만료가 가장 이른 항목부터 축출한다.
+REVOKED_REFRESH_JTI_MAX_ENTRIES = 200_000
+REFRESH_GRACE_MAX_ENTRIES = 5000
+
 # 키는 refresh jti, 값은 refresh 만료 기준 ms TTL
-revokedRefreshJtiStore: dict[str, int] = {}
+revokedRefreshJtiStore: ExpiringStore = ExpiringStore(
+    lambda expiresAtMs: int(expiresAtMs or 0),
+    resolution=1000,
+    maxEntries=REVOKED_REFRESH_JTI_MAX_ENTRIES,
+)
 
 # 키는 이전 refresh jti, 값은 expiresAtMs/tokenPayload 객체
-refreshGraceStore: dict[str, dict[str, Any]] = {}
+refreshGraceStore: ExpiringStore = ExpiringStore(
+    lambda entry: int(entry.get("expiresAtMs", 0) or 0),
+    resolution=1000,
+    maxEntries=REFRESH_GRACE_MAX_ENTRIES,
+)
 
 
 def tokenStateStoreUnavailableError(reason: str) -> RuntimeError:
@@ -237,48 +258,67 @@ async def deleteTokenStateEntry(stateType: str, tokenJti: str) -> bool:
         raise tokenStateStoreUnavailableError(f"delete_failed:{type(e).__name__}") from e
 
 
+async def publishAuthVersionInvalidation(userId: str, nowMs: int) -> None:
+    """
+    설명: authVersion 증가를 현재 worker 캐시와 교차 worker 무효화 채널에 알림
+    처리 규칙: 채널 사용 시 같은 트랜잭션에서 T_TOKEN(auth_version) 이벤트를 기록해 비밀번호 변경과 원자적으로 커밋
+    실패 동작: 이벤트 기록 실패는 RuntimeError로 올려 비밀번호 변경을 롤백
+    갱신일: 2026-10-18
+    """
+    invalidateCachedAuthVersion(userId)
+    if not isAuthVersionInvalidationChannelEnabled():
+        return
+    await upsertTokenStateEntry(
+        AUTH_VERSION_EVENT_STATE_TYPE,
+        userId,
+        nowMs + getAuthVersionEventRetentionMs(),
+        {"changedAtMs": nowMs},
+    )
+
+
+async def fetchAuthVersionInvalidations(afterMs: int) -> list[tuple[str, int]]:
+    """
+    설명: 다른 worker가 기록한 authVersion 무효화 이벤트 조회
+    반환값: (userId, 이벤트 만료 ms) 목록(만료 시각 오름차순)
+    갱신일: 2026-10-18
+    """
+    useDbTokenStateStore = await ensureTokenStateStore()
+    if not useDbTokenStateStore:
+        return []
+    manager = getTokenStateStoreDbManager()
+    if not manager:
+        raise tokenStateStoreUnavailableError("db manager missing after store ready")
+    rows = await manager.fetchAllQuery(
+        "auth.listAuthVersionEvents",
+        {"stateType": AUTH_VERSION_EVENT_STATE_TYPE, "afterMs": int(afterMs)},
+    )
+    events: list[tuple[str, int]] = []
+    for row in rows or []:
+        event = convertKeysToCamelCase(dict(row))
+        tokenJti = event.get("tokenJti")
+        if isinstance(tokenJti, str) and tokenJti:
+            events.append((tokenJti, int(event.get("expiresAtMs") or 0)))
+    return events
+
+
 def cleanupRefreshGraceStore(nowMs: int) -> None:
     """
     설명: refresh grace 캐시에서 만료된 항목 제거
+    처리 규칙: 만료 색인에서 만료 tick에 도달한 항목만 꺼내므로 저장소 크기와 무관하게 만료 항목 수에 비례
     부작용: 전역 refreshGraceStore를 직접 갱신
-    갱신일: 2026-01-17
+    갱신일: 2026-10-18
     """
-    try:
-        expired = [
-            jti for jti, entry in list(refreshGraceStore.items()) if int(entry.get("expiresAtMs", 0) or 0) <= nowMs
-        ]
-        for jti in expired:
-            refreshGraceStore.pop(jti, None)
-
-        # 과도한 메모리 사용 방지(템플릿 기본값)
-        if len(refreshGraceStore) > 5000:
-
-            # 임의로 오래된 순서 보장이 없으므로, 일부를 삭제해 폭주만 막는다.
-            for jti in list(refreshGraceStore.keys())[:1000]:
-                refreshGraceStore.pop(jti, None)
-    except Exception:
-        return
+    refreshGraceStore.sweep(nowMs)
 
 
 def cleanupRevokedRefreshJtiStore(nowMs: int) -> None:
     """
     설명: revoked refresh jti store에서 만료된 항목 제거(TTL)
+    처리 규칙: 만료 색인에서 만료 tick에 도달한 항목만 꺼냄(요청마다 전체 복사/스캔 없음)
     부작용: 전역 revokedRefreshJtiStore를 직접 갱신
-    갱신일: 2026-01-18
+    갱신일: 2026-10-18
     """
-    try:
-        expired = [
-            jti for jti, expiresAtMs in list(revokedRefreshJtiStore.items()) if int(expiresAtMs or 0) <= nowMs
-        ]
-        for jti in expired:
-            revokedRefreshJtiStore.pop(jti, None)
-
-        # 과도한 메모리 사용 방지(템플릿 기본값)
-        if len(revokedRefreshJtiStore) > 200_000:
-            for jti in list(revokedRefreshJtiStore.keys())[:50_000]:
-                revokedRefreshJtiStore.pop(jti, None)
-    except Exception:
-        return
+    revokedRefreshJtiStore.sweep(nowMs)
 
 
 def readCurrentEpochMs() -> int:
@@ -309,7 +349,7 @@ def auditLog(event: str, username: str | None, success: bool, meta: dict[str, An
             auditEntry["usernameMasked"] = maskedUsername
         if meta and isinstance(meta, dict):
             auditEntry.update(meta)
-        logger.info(json.dumps(auditEntry, ensure_ascii=False))
+        logStructured(logging.INFO, auditEntry)
     except Exception:
 
         # 로깅 실패가 인증 흐름을 막지 않도록 방어
@@ -544,11 +584,11 @@ async def changePasswordInTransaction(
         return False
     lockedUser = convertKeysToCamelCase(lockedUserRow)
     storedPassword = lockedUser.get("passwordHash") or lockedUser.get("userPw") or ""
-    if not isinstance(storedPassword, str) or not verifyPassword(currentPassword, storedPassword):
+    if not isinstance(storedPassword, str) or not await verifyPasswordAsync(currentPassword, storedPassword):
         return False
     updated = await db.fetchOneQuery(
         "auth.updatePasswordAndAuthVersion",
-        {"userId": userId, "userPw": hashPasswordPbkdf2(newPassword)},
+        {"userId": userId, "userPw": await hashPasswordAsync(newPassword)},
     )
     if not updated:
         raise ServiceError("AUTH_500_PASSWORD_CHANGE_FAILED")
@@ -556,6 +596,7 @@ async def changePasswordInTransaction(
         "auth.supersedePasswordResetTokens",
         {"userId": userId, "usedAtMs": usedAtMs},
     )
+    await publishAuthVersionInvalidation(userId, usedAtMs)
     return True
 
 
@@ -594,6 +635,8 @@ async def changePassword(
         errorCode = resolveServiceErrorCode(error)
         if errorCode in {"AUTH_503_DB_NOT_READY", "DB_NOT_READY"}:
             return None, "AUTH_503_DB_NOT_READY"
+        if errorCode == "AUTH_503_HASH_BUSY":
+            return None, errorCode
         logger.error("password change failed: error=%s", type(error).__name__)
         return None, "AUTH_500_PASSWORD_CHANGE_FAILED"
     except Exception as error:
@@ -644,10 +687,11 @@ async def completePasswordResetInTransaction(tokenHash: str, newPassword: str, n
         raise ServiceError("AUTH_400_RESET_INVALID_OR_EXPIRED")
     updated = await db.fetchOneQuery(
         "auth.updatePasswordAndAuthVersion",
-        {"userId": userId, "userPw": hashPasswordPbkdf2(newPassword)},
+        {"userId": userId, "userPw": await hashPasswordAsync(newPassword)},
     )
     if not updated:
         raise ServiceError("AUTH_400_RESET_INVALID_OR_EXPIRED")
+    await publishAuthVersionInvalidation(userId, nowMs)
     return True
 
 
@@ -675,7 +719,7 @@ async def completePasswordReset(payload: dict) -> tuple[dict | None, str | None]
         errorCode = resolveServiceErrorCode(error)
         if errorCode == "AUTH_400_RESET_INVALID_OR_EXPIRED":
             return None, errorCode
-        if errorCode == "AUTH_503_DB_NOT_READY":
+        if errorCode in {"AUTH_503_DB_NOT_READY", "AUTH_503_HASH_BUSY"}:
             return None, errorCode
         return None, "AUTH_500_PASSWORD_RESET_FAILED"
     except Exception as error:
@@ -698,6 +742,15 @@ def hashPasswordPbkdf2(plain: str, iterations: int = 260000) -> str:
     return f"pbkdf2${iterations}${base64.b64encode(salt).decode()}${base64.b64encode(derivedKey).decode()}"
 
 
+async def hashPasswordAsync(plain: str) -> str:
+    """
+    설명: hashPasswordPbkdf2를 전용 해시 worker pool에서 실행해 이벤트 루프 정지를 방지
+    실패 동작: pool 대기열이 가득 차면 ServiceError(AUTH_503_HASH_BUSY)
+    갱신일: 2026-10-18
+    """
+    return await runPasswordHashJob(hashPasswordPbkdf2, plain)
+
+
 def isValidEmail(value: str) -> bool:
     """
     설명: 기본 이메일 형식 검사
@@ -824,7 +877,7 @@ async def signupInTransaction(name: str, email: str, password: str) -> dict:
     if exists:
         raise ServiceError("AUTH_409_USER_EXISTS")
 
-    passwordHash = hashPasswordPbkdf2(password)
+    passwordHash = await hashPasswordAsync(password)
     try:
         await db.executeQuery(
             "auth.insertUser",
@@ -883,7 +936,7 @@ async def ensureSeedUser(payload: dict) -> dict:
 
     userParams = {
         "userId": email,
-        "userPw": hashPasswordPbkdf2(password),
+        "userPw": await hashPasswordAsync(password),
         "userNm": name,
         "userEml": email,
         "roleCd": roleCd,
@@ -1080,6 +1133,15 @@ def verifyPassword(plain: str, stored: str) -> bool:
         return False
 
 
+async def verifyPasswordAsync(plain: str, stored: str) -> bool:
+    """
+    설명: verifyPassword를 전용 해시 worker pool에서 실행해 이벤트 루프 정지를 방지
+    실패 동작: pool 대기열이 가득 차면 ServiceError(AUTH_503_HASH_BUSY)
+    갱신일: 2026-10-18
+    """
+    return bool(await runPasswordHashJob(verifyPassword, plain, stored))
+
+
 async def authenticateUser(payload: dict) -> tuple[dict | None, str | None]:
     """
     설명: 로그인 payload에서 자격 증명 확인 후 사용자 도메인 객체를 조회하는 인증 단계
@@ -1105,7 +1167,7 @@ async def authenticateUser(payload: dict) -> tuple[dict | None, str | None]:
         return None, None
     authUser = convertKeysToCamelCase(user)
     passwordHash = authUser.get("passwordHash") or authUser.get("userPw") or ""
-    if not verifyPassword(password, passwordHash):
+    if not await verifyPasswordAsync(password, passwordHash):
         return None, None
     authUser.pop("userPw", None)
     authUser.pop("passwordHash", None)
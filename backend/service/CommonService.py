@@ -1,7 +1,7 @@
 """
 파일명: backend/service/CommonService.py
 작성자: LSH
-갱신일: 2026-02-24
+갱신일: 2026-10-18
 설명: 공통(헬스체크 및 레디니스) 서비스 로직
 """
 
@@ -12,6 +12,9 @@ from datetime import datetime, timezone
 from typing import Dict, Tuple, Any, List
 
 from lib import Database as DB
+from lib.Metrics import isMetricsEnabled, renderMetricsText
+from lib.PasswordHashPool import getPasswordHashPoolStats
+from lib.QueryMetrics import getQueryMetricsSnapshot, isInternalStatsEnabled
 
 startedAt = datetime.now(timezone.utc)
 
@@ -145,3 +148,31 @@ async def readyz(_: Dict | None = None) -> Tuple[Dict[str, Any], bool]:
 
     payload: Dict[str, Any] = {"ok": ok, **checks}
     return payload, ok
+
+
+async def queryStats(_: Dict | None = None) -> Tuple[Dict[str, Any] | None, bool]:
+    """
+    설명: queryName별 SQL 지연 히스토그램, DB별 연결 풀 통계와 비밀번호 해시 pool 통계 스냅샷 조회(내부 진단용)
+    처리 규칙: OBSERVABILITY.internal_stats_enabled가 꺼져 있으면 데이터 없이 비활성으로 반환
+    반환값: (스냅샷 dict 또는 None, 활성 여부 bool) 튜플
+    갱신일: 2026-10-18
+    """
+    if not isInternalStatsEnabled():
+        return None, False
+    return {
+        **getQueryMetricsSnapshot(),
+        "pools": DB.getDatabasePoolStats(),
+        "passwordHashPool": getPasswordHashPoolStats(),
+    }, True
+
+
+async def metrics(_: Dict | None = None) -> Tuple[str | None, bool]:
+    """
+    설명: Prometheus 텍스트 노출 형식 메트릭 렌더링
+    처리 규칙: OBSERVABILITY.metrics_enabled가 꺼져 있으면 본문 없이 비활성으로 반환, multiproc 모드면 전체 worker 합산
+    반환값: (exposition 텍스트 또는 None, 활성 여부 bool) 튜플
+    갱신일: 2026-10-18
+    """
+    if not isMetricsEnabled():
+        return None, False
+    return renderMetricsText(), True
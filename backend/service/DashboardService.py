@@ -1,7 +1,7 @@
 """
 파일명: backend/service/DashboardService.py
 작성자: LSH
-갱신일: 2026-02-22
+갱신일: 2026-10-18
 설명: 대시보드 업무(T_DATA) 목록/상세/CRUD/집계 서비스 로직
 """
 
@@ -9,13 +9,22 @@ import json
 import math
 import sqlite3
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 from lib import Database as DB
 from lib.Casing import convertKeysToCamelCase
 from lib.Config import getConfig
 from lib.Idempotency import beginIdempotencyRequest, completeIdempotencyRequest, discardIdempotencyReservation
+from lib.ListCursor import (
+    decodeListCursor,
+    encodeListCursor,
+    fetchListPage,
+    readListTotalMode,
+    supportsWindowCount,
+)
 from lib.ServiceError import ServiceError
+from lib.SqlLoader import buildQueryVariantName
 from lib.Transaction import transaction
 
 DASHBOARD_STATUS_ORDER = ("ready", "pending", "running", "done", "failed")
@@ -30,6 +39,24 @@ ALLOWED_SORT_ORDER = (
     "title_asc",
 )
 ALLOWED_SORT = frozenset(ALLOWED_SORT_ORDER)
+# cursor 모드: 정렬별 cursor에 담을 정렬 키 컬럼(행 alias)
+DASHBOARD_KEYSET_KEY = MappingProxyType({
+    "reg_dt_desc": "regDt",
+    "reg_dt_asc": "regDt",
+    "amt_desc": "amt",
+    "amt_asc": "amt",
+    "title_desc": "dataNm",
+    "title_asc": "dataNm",
+})
+# keyset 쿼리가 NULL 정렬 키를 대체하는 값(amt_*는 COALESCE(AMT, 0)으로 정렬/비교)
+DASHBOARD_KEYSET_NULL_VALUE = MappingProxyType({
+    "amt": 0,
+})
+# 검색/상태/정렬 조합별로 전개되는 목록 쿼리 템플릿 이름(query/dashboard.sql의 -- slot: 선언)
+DASHBOARD_LIST_QUERY = "dashboard.list.{search}.{status}.{sort}"
+DASHBOARD_LIST_WITH_TOTAL_QUERY = "dashboard.listWithTotal.{search}.{status}.{sort}"
+DASHBOARD_LIST_AFTER_QUERY = "dashboard.listAfter.{search}.{status}.{sort}"
+DASHBOARD_LIST_COUNT_QUERY = "dashboard.listCount.{search}.{status}"
 
 
 def toIntOrDefault(rawValue: Optional[Any], defaultValue: int) -> int:
@@ -366,11 +393,18 @@ async def listDataTemplates(
     page: Optional[int] = None,
     size: Optional[int] = None,
     sort: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     설명: 검색/필터/페이지네이션 파라미터를 안전값으로 보정해 업무 목록을 조회하 서비스
-    반환값: dataTemplateList/total/page/size/sort를 포함한 목록 조회 결과 dict
-    갱신일: 2026-02-22
+    처리 규칙: cursor가 None이면 기존 page/OFFSET 방식, 문자열이면 cursor 모드로 page를 무시하고
+    정렬 키+DATA_NO keyset 조건으로 다음 구간만 읽음(빈 문자열은 첫 페이지), size+1행 조회로 nextCursor 발급 여부 판단,
+    NULL 금액은 쿼리와 같게 0으로 보고 cursor 키를 발급/복원,
+    전체 건수는 fetchListPage로 목록과 함께 조회하고 list_total_mode=has_more면 COUNT 생략(total은 하한값, totalExact=False),
+    쿼리는 검색어/상태 필터 사용 여부와 정렬에 맞춘 변형(dashboard.list.<search>.<status>.<sort> 등)을 선택
+    실패 동작: 형식 오류/다른 정렬로 발급된 cursor는 ServiceError("DASH_422_INVALID_INPUT")
+    반환값: dataTemplateList/total/totalExact/hasMore/page/size/sort(cursor 모드면 nextCursor 포함)를 담은 목록 조회 결과 dict
+    갱신일: 2026-10-18
     """
     db = ensureDbManager()
     ownerUserId = normalizeUserId(userId)
@@ -397,37 +431,81 @@ async def listDataTemplates(
     sizeValue = min(clampValue(size, 20, 1, absoluteListSizeCap), listSizeMax)
     offsetValue = (pageValue - 1) * sizeValue
 
-    binds = {
-        "userId": ownerUserId,
-        "q": keywordValue,
-        "qLike": f"%{keywordValue}%" if keywordValue else "",
-        "status": statusValue,
+    # 쓰지 않는 조건은 쿼리에서 빠진 변형을 골라 (USER_ID, STAT_CD, 정렬 컬럼) 인덱스로 처리되게 한다.
+    slotKeys = {
+        "search": "match" if keywordValue else "any",
+        "status": "eq" if statusValue else "any",
         "sort": sortValue,
-        "limit": sizeValue,
-        "offset": offsetValue,
-    }
-    countBinds = {
-        "userId": ownerUserId,
-        "q": keywordValue,
-        "qLike": f"%{keywordValue}%" if keywordValue else "",
-        "status": statusValue,
     }
-    rows = await db.fetchAllQuery("dashboard.list", binds) or []
-    countRow = await db.fetchOneQuery("dashboard.listCount", countBinds) or {}
+    countBinds: Dict[str, Any] = {"userId": ownerUserId}
+    if keywordValue:
+        countBinds["qLike"] = f"%{keywordValue}%"
+    if statusValue:
+        countBinds["status"] = statusValue
+    countQueryName = buildQueryVariantName(DASHBOARD_LIST_COUNT_QUERY, **slotKeys)
+    totalMode = readListTotalMode(dashboardListPolicy, globalPolicy)
+    cursorMode = cursor is not None
+    if cursorMode and cursor:
+        try:
+            cursorKey, cursorId = decodeListCursor(cursor, sortValue)
+        except ValueError as error:
+            raise ServiceError("DASH_422_INVALID_INPUT") from error
+        if cursorKey is None:
+            cursorKey = DASHBOARD_KEYSET_NULL_VALUE.get(DASHBOARD_KEYSET_KEY[sortValue])
+            if cursorKey is None:
+                raise ServiceError("DASH_422_INVALID_INPUT")
+        rows, totalCount, hasMore, totalExact = await fetchListPage(
+            db,
+            buildQueryVariantName(DASHBOARD_LIST_AFTER_QUERY, **slotKeys),
+            {**countBinds, "cursorKey": cursorKey, "cursorId": cursorId},
+            countQueryName,
+            countBinds,
+            limit=sizeValue,
+            totalMode=totalMode,
+        )
+    else:
+        if cursorMode:
+            offsetValue = 0
+        # COUNT(*) OVER ()를 지원하는 DB는 목록과 전체 건수를 한 번에, 그 외는 두 쿼리를 동시에 실행
+        useWindowTotal = supportsWindowCount(db)
+        rows, totalCount, hasMore, totalExact = await fetchListPage(
+            db,
+            buildQueryVariantName(DASHBOARD_LIST_QUERY, **slotKeys),
+            {**countBinds, "limit": sizeValue, "offset": offsetValue},
+            countQueryName,
+            countBinds,
+            limit=sizeValue,
+            offset=offsetValue,
+            totalMode=totalMode,
+            windowQueryName=buildQueryVariantName(DASHBOARD_LIST_WITH_TOTAL_QUERY, **slotKeys) if useWindowTotal else None,
+        )
+    nextCursor = None
+    if cursorMode and hasMore and rows:
+        lastRow = convertKeysToCamelCase(dict(rows[-1]))
+        keysetKey = DASHBOARD_KEYSET_KEY[sortValue]
+        lastSortKey = lastRow.get(keysetKey)
+        nextCursor = encodeListCursor(
+            sortValue,
+            DASHBOARD_KEYSET_NULL_VALUE.get(keysetKey) if lastSortKey is None else lastSortKey,
+            lastRow.get("dataNo"),
+        )
     dataTemplateList = [convertDashboardRow(row) for row in rows]
-    countResult = convertKeysToCamelCase(countRow)
-    totalCount = int(countResult.get("totalCount", 0) or 0)
 
-    return {
+    result = {
         "dataTemplateList": dataTemplateList,
         "count": len(dataTemplateList),
         "total": totalCount,
+        "totalExact": totalExact,
+        "hasMore": hasMore,
         "page": pageValue,
         "size": sizeValue,
         "sort": sortValue,
         "q": keywordValue,
         "status": statusValue,
     }
+    if cursorMode:
+        result["nextCursor"] = nextCursor
+    return result
 
 
 async def getDataTemplateDetail(dataId: int, userId: str) -> Dict[str, Any]:
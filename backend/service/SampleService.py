@@ -1,12 +1,13 @@
 """
 파일명: backend/service/SampleService.py
 작성자: LSH
-갱신일: 2026-04-08
+갱신일: 2026-10-18
 설명: 공개 sample 페이지용 DB 부트스트랩/조회/CRUD 서비스 로직
 """
 
 import asyncio
 import json
+import os
 import re
 from datetime import date, timedelta
 from types import MappingProxyType
@@ -16,6 +17,14 @@ from lib import Database as DB
 from lib.Casing import convertKeysToCamelCase
 from lib.Config import getConfig
 from lib.Idempotency import beginIdempotencyRequest, completeIdempotencyRequest, discardIdempotencyReservation
+from lib.ListCursor import (
+    decodeListCursor,
+    encodeListCursor,
+    fetchListPage,
+    readListTotalMode,
+    supportsWindowCount,
+)
+from lib.ResultCache import CachedResult, SingleFlightResultCache
 from lib.ServiceError import ServiceError
 from lib.Transaction import transaction
 
@@ -68,7 +77,20 @@ DEFAULT_ROLE_PERMISSION_MAP = MappingProxyType({
 DEFAULT_FORM_CATEGORY_CODE_LIST = ("web", "app", "api", "etc")
 DEFAULT_FORM_FEATURE_CODE_LIST = ("login", "board", "payment", "chart", "admin")
 SAMPLE_TASK_SEED_DAY_OFFSET_LIST = (12, 10, 8, 6, 5, 5, 4, 4, 3, 2, 1, 0)
+SAMPLE_TASK_LIST_CURSOR_SORT = "reg_dt_desc"
 BOOTSTRAP_LOCK = asyncio.Lock()
+SCHEMA_MISSING_ERROR_NAMES = frozenset({"UndefinedTable", "UndefinedTableError", "NoSuchTableError"})
+
+# 부트스트랩을 마친 DB 매니저(매니저 교체/스키마 유실 감지/명시 요청 시에만 다시 실행)
+sampleBootstrapManager: Any = None
+
+# 익명 공개 집계 조회(overview/dashboard) 결과 캐시, 쓰기 API가 영향 키를 무효화
+SAMPLE_READ_CACHE_KEY = MappingProxyType({
+    "OVERVIEW": "sample.overview",
+    "DASHBOARD": "sample.dashboard",
+})
+DEFAULT_SAMPLE_READ_CACHE_TTL_MS = 3000
+sampleReadCache = SingleFlightResultCache(DEFAULT_SAMPLE_READ_CACHE_TTL_MS)
 
 
 def readDefaultAdminSetting() -> dict[str, Any]:
@@ -726,9 +748,9 @@ async def saveConfigJson(configKey: str, value: Any) -> Any:
 async def ensureBootstrapStorage() -> None:
     """
     설명: 공개 sample 전용 테이블/기본 시드/설정 JSON을 DB에 1회 보장
-    처리 규칙: create table 후 bootstrap version 키 존재 여부로 시드 실행 결정
+    처리 규칙: create table 후 bootstrap version 키 존재 여부로 시드 실행 결정, 기본 설정 레코드는 executeManyQuery 한 번으로 적재
     부작용: T_SAMPLE_* 테이블 및 기본 데이터/설정 레코드 생성 가능
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
     db = ensureDbManager()
     await db.executeQuery("sampleBootstrap.createConfigTable")
@@ -743,58 +765,151 @@ async def ensureBootstrapStorage() -> None:
         return
     await db.executeQuery("sampleBootstrap.seedTasks", buildSampleTaskSeedDateBind())
     await db.executeQuery("sampleBootstrap.seedAdminUsers")
-    await db.executeQuery(
-        "sample.configInsert",
-        {
-            "configKey": SAMPLE_CONFIG_KEY["ADMIN_SETTING"],
-            "configJson": json.dumps(readDefaultAdminSetting(), ensure_ascii=False),
-        },
-    )
-    await db.executeQuery(
-        "sample.configInsert",
-        {
-            "configKey": SAMPLE_CONFIG_KEY["ROLE_PERMISSION_MAP"],
-            "configJson": json.dumps(readDefaultRolePermissionMap(), ensure_ascii=False),
-        },
-    )
-    await db.executeQuery(
-        "sample.configInsert",
-        {
-            "configKey": SAMPLE_CONFIG_KEY["FORM_CATEGORY_CODE_LIST"],
-            "configJson": json.dumps(list(DEFAULT_FORM_CATEGORY_CODE_LIST), ensure_ascii=False),
-        },
-    )
-    await db.executeQuery(
-        "sample.configInsert",
-        {
-            "configKey": SAMPLE_CONFIG_KEY["FORM_FEATURE_CODE_LIST"],
-            "configJson": json.dumps(list(DEFAULT_FORM_FEATURE_CODE_LIST), ensure_ascii=False),
-        },
-    )
-    await db.executeQuery(
+    # 기본 설정과 bootstrap version 키를 한 문장으로 넣어, version 키만 남고 설정이 빠지는 부분 시드를 막는다.
+    await db.executeManyQuery(
         "sample.configInsert",
-        {
-            "configKey": SAMPLE_CONFIG_KEY["BOOTSTRAP_VERSION"],
-            "configJson": json.dumps({"version": 1}, ensure_ascii=False),
-        },
+        [
+            {
+                "configKey": SAMPLE_CONFIG_KEY["ADMIN_SETTING"],
+                "configJson": json.dumps(readDefaultAdminSetting(), ensure_ascii=False),
+            },
+            {
+                "configKey": SAMPLE_CONFIG_KEY["ROLE_PERMISSION_MAP"],
+                "configJson": json.dumps(readDefaultRolePermissionMap(), ensure_ascii=False),
+            },
+            {
+                "configKey": SAMPLE_CONFIG_KEY["FORM_CATEGORY_CODE_LIST"],
+                "configJson": json.dumps(list(DEFAULT_FORM_CATEGORY_CODE_LIST), ensure_ascii=False),
+            },
+            {
+                "configKey": SAMPLE_CONFIG_KEY["FORM_FEATURE_CODE_LIST"],
+                "configJson": json.dumps(list(DEFAULT_FORM_FEATURE_CODE_LIST), ensure_ascii=False),
+            },
+            {
+                "configKey": SAMPLE_CONFIG_KEY["BOOTSTRAP_VERSION"],
+                "configJson": json.dumps({"version": 1}, ensure_ascii=False),
+            },
+        ],
     )
 
 
-async def ensureBootstrap() -> None:
+async def ensureBootstrap(force: bool = False) -> None:
     """
     설명: 공개 sample 전용 테이블/기본 시드/설정 JSON을 DB에 1회 보장
-    처리 규칙: create table 후 bootstrap version 키 존재 여부로 시드 실행 결정
+    처리 규칙: 현재 DB 매니저로 부트스트랩을 마쳤으면 lock 없이 즉시 반환,
+    첫 호출/매니저 교체/force=True/resetSampleBootstrap 이후에만 lock 안에서 재확인 후 ensureBootstrapStorage 실행
     부작용: T_SAMPLE_* 테이블 및 기본 데이터/설정 레코드 생성 가능
-    갱신일: 2026-03-06
+    갱신일: 2026-10-18
     """
+    global sampleBootstrapManager
+    if not force and sampleBootstrapManager is not None and sampleBootstrapManager is DB.getManager():
+        return
     async with BOOTSTRAP_LOCK:
+        manager = DB.getManager()
+        if not force and manager is not None and manager is sampleBootstrapManager:
+            return
         await ensureBootstrapStorage()
+        sampleBootstrapManager = manager
+        invalidateSampleReadCache()
+
+
+def resetSampleBootstrap() -> None:
+    """
+    설명: 부트스트랩 완료 표시를 지워 다음 sample 호출에서 ensureBootstrapStorage를 다시 실행
+    갱신일: 2026-10-18
+    """
+    global sampleBootstrapManager
+    sampleBootstrapManager = None
+
+
+def isSampleSchemaMissingError(error: BaseException | None) -> bool:
+    """
+    설명: DB 드라이버 예외가 테이블 누락(스키마 유실)인지 판별
+    처리 규칙: 예외 체인(__cause__/__context__)을 따라 PostgreSQL UndefinedTable/42P01, MySQL 1146, SQLite no such table 메시지 확인
+    반환값: 테이블 누락이면 True
+    갱신일: 2026-10-18
+    """
+    seen: set[int] = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if type(error).__name__ in SCHEMA_MISSING_ERROR_NAMES or getattr(error, "sqlstate", None) == "42P01":
+            return True
+        if error.args and error.args[0] == 1146:
+            return True
+        message = str(error).lower()
+        if "no such table" in message or ("does not exist" in message and "relation" in message):
+            return True
+        if "doesn't exist" in message and "table" in message:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def noteSampleStorageError(error: BaseException) -> bool:
+    """
+    설명: sample 처리 중 테이블 누락 예외가 보이면 부트스트랩 완료 표시를 해제
+    반환값: 재부트스트랩 예약 여부
+    부작용: 테이블 누락이면 sampleBootstrapManager 초기화
+    갱신일: 2026-10-18
+    """
+    if not isSampleSchemaMissingError(error):
+        return False
+    resetSampleBootstrap()
+    return True
+
+
+def configureSampleReadCache(config) -> int:
+    """
+    설명: [SAMPLE] read_cache_ttl_ms(ENV SAMPLE_READ_CACHE_TTL_MS 우선) 반영
+    처리 규칙: 0이면 캐시를 끄고 매 요청 집계 쿼리 실행, TTL이 다른 worker 쓰기 반영 지연 상한
+    실패 동작: 음수/정수 아님은 ValueError
+    반환값: 적용한 TTL(ms)
+    갱신일: 2026-10-18
+    """
+    global sampleReadCache
+    section = config["SAMPLE"] if config is not None and "SAMPLE" in config else None
+    rawValue = os.getenv("SAMPLE_READ_CACHE_TTL_MS")
+    if rawValue is None and section is not None:
+        rawValue = section.get("read_cache_ttl_ms")
+    ttlMs = DEFAULT_SAMPLE_READ_CACHE_TTL_MS
+    if rawValue is not None and str(rawValue).strip():
+        try:
+            ttlMs = int(str(rawValue).strip())
+        except (TypeError, ValueError) as error:
+            raise ValueError("SAMPLE read_cache_ttl_ms must be an integer") from error
+        if ttlMs < 0:
+            raise ValueError("SAMPLE read_cache_ttl_ms must not be negative")
+    sampleReadCache = SingleFlightResultCache(ttlMs)
+    return ttlMs
+
+
+def invalidateSampleReadCache(*keys: str) -> None:
+    """설명: 쓰기 후 영향받는 공개 집계 캐시 키 무효화(미지정 시 전체) 갱신일: 2026-10-18"""
+    sampleReadCache.invalidate(*keys)
+
+
+async def readSampleOverviewEntry() -> CachedResult:
+    """
+    설명: 공개 sample overview를 짧은 TTL 캐시(single-flight)로 조회
+    반환값: value(overview dict, 읽기 전용 공유)와 ETag를 담은 CachedResult
+    갱신일: 2026-10-18
+    """
+    return await sampleReadCache.getOrLoad(SAMPLE_READ_CACHE_KEY["OVERVIEW"], loadSampleOverview)
 
 
 async def getSampleOverview() -> dict[str, Any]:
     """
     설명: 공개 sample 허브/포트폴리오용 전체 카운트 요약 조회
     반환값: taskCount/adminUserCount/formSubmissionCount를 포함한 overview dict
+    갱신일: 2026-10-18
+    """
+    return (await readSampleOverviewEntry()).value
+
+
+async def loadSampleOverview() -> dict[str, Any]:
+    """
+    설명: 공개 sample 허브/포트폴리오용 전체 카운트 요약을 DB에서 집계
+    반환값: taskCount/adminUserCount/formSubmissionCount를 포함한 overview dict
     갱신일: 2026-03-06
     """
     await ensureBootstrap()
@@ -807,10 +922,28 @@ async def getSampleOverview() -> dict[str, Any]:
     return result
 
 
+async def readSampleDashboardEntry() -> CachedResult:
+    """
+    설명: 공개 sample 대시보드를 짧은 TTL 캐시(single-flight)로 조회
+    반환값: value(dashboard dict, 읽기 전용 공유)와 ETag를 담은 CachedResult
+    갱신일: 2026-10-18
+    """
+    return await sampleReadCache.getOrLoad(SAMPLE_READ_CACHE_KEY["DASHBOARD"], loadSampleDashboard)
+
+
 async def getSampleDashboard() -> dict[str, Any]:
     """
     설명: 공개 sample 대시보드용 KPI/월별 추이/최근 업무 묶음 조회
     반환값: statusSummaryList/trendList/recentList를 담은 dict
+    갱신일: 2026-10-18
+    """
+    return (await readSampleDashboardEntry()).value
+
+
+async def loadSampleDashboard() -> dict[str, Any]:
+    """
+    설명: 공개 sample 대시보드용 KPI/월별 추이/최근 업무 묶음을 DB에서 집계
+    반환값: statusSummaryList/trendList/recentList를 담은 dict
     갱신일: 2026-03-06
     """
     await ensureBootstrap()
@@ -866,11 +999,16 @@ async def listSampleTasks(
     toDate: str | None = None,
     page: int | None = None,
     size: int | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     설명: 공개 sample CRUD 목록을 검색/필터/페이지네이션 조건으로 조회
-    반환값: sampleTaskList/total/page/size 구조의 목록 결과 dict
-    갱신일: 2026-03-06
+    처리 규칙: cursor가 None이면 page/OFFSET 방식, 문자열이면 page를 무시하고 (REG_DT, TASK_NO) keyset으로 다음 구간 조회
+    (빈 문자열은 첫 페이지), size+1행 조회로 nextCursor 발급 여부 판단,
+    전체 건수는 fetchListPage로 목록과 함께 조회하고 list_total_mode=has_more면 COUNT 생략(total은 하한값, totalExact=False)
+    실패 동작: 형식 오류 cursor는 ServiceError("SAMPLE_422_INVALID_INPUT")
+    반환값: sampleTaskList/total/totalExact/hasMore/page/size(cursor 모드면 nextCursor 포함) 구조의 목록 결과 dict
+    갱신일: 2026-10-18
     """
     await ensureBootstrap()
     db = ensureDbManager()
@@ -910,25 +1048,57 @@ async def listSampleTasks(
         "limit": sizeValue,
         "offset": (pageValue - 1) * sizeValue,
     }
-    rowList = await db.fetchAllQuery("sample.taskList", bind)
-    countRow = await db.fetchOneQuery(
-        "sample.taskListCount",
-        {
-            "q": bind["q"],
-            "qLike": bind["qLike"],
-            **{
-                key: value
-                for key, value in bind.items()
-                if key.startswith("publicTitleMatch")
-            },
-            "status": bind["status"],
-            "fromDate": bind["fromDate"],
-            "toDateExclusive": bind["toDateExclusive"],
+    countBind = {
+        "q": bind["q"],
+        "qLike": bind["qLike"],
+        **{
+            key: value
+            for key, value in bind.items()
+            if key.startswith("publicTitleMatch")
         },
-    )
-    return {
-        "sampleTaskList": [toTaskModel(row) for row in (rowList or [])],
-        "total": readTotalCount(countRow),
+        "status": bind["status"],
+        "fromDate": bind["fromDate"],
+        "toDateExclusive": bind["toDateExclusive"],
+    }
+    totalMode = readListTotalMode(taskListPolicy, globalPolicy)
+    cursorMode = cursor is not None
+    if cursorMode and cursor:
+        try:
+            cursorKey, cursorId = decodeListCursor(cursor, SAMPLE_TASK_LIST_CURSOR_SORT)
+        except ValueError as error:
+            raise ServiceError("SAMPLE_422_INVALID_INPUT") from error
+        rowList, totalCount, hasMore, totalExact = await fetchListPage(
+            db,
+            "sample.taskListAfter",
+            {**countBind, "cursorKey": cursorKey, "cursorId": cursorId},
+            "sample.taskListCount",
+            countBind,
+            limit=sizeValue,
+            totalMode=totalMode,
+        )
+    else:
+        if cursorMode:
+            bind["offset"] = 0
+        rowList, totalCount, hasMore, totalExact = await fetchListPage(
+            db,
+            "sample.taskList",
+            bind,
+            "sample.taskListCount",
+            countBind,
+            limit=sizeValue,
+            offset=bind["offset"],
+            totalMode=totalMode,
+            windowQueryName="sample.taskListWithTotal" if supportsWindowCount(db) else None,
+        )
+    nextCursor = None
+    if cursorMode and hasMore and rowList:
+        lastRow = convertKeysToCamelCase(dict(rowList[-1]))
+        nextCursor = encodeListCursor(SAMPLE_TASK_LIST_CURSOR_SORT, lastRow.get("regDt"), lastRow.get("taskNo"))
+    result = {
+        "sampleTaskList": [toTaskModel(row) for row in rowList],
+        "total": totalCount,
+        "totalExact": totalExact,
+        "hasMore": hasMore,
         "page": pageValue,
         "size": sizeValue,
         "q": keyword,
@@ -936,6 +1106,9 @@ async def listSampleTasks(
         "fromDate": fromDateValue,
         "toDate": toDateValue,
     }
+    if cursorMode:
+        result["nextCursor"] = nextCursor
+    return result
 
 
 async def getSampleTaskDetail(taskId: Any) -> dict[str, Any]:
@@ -975,7 +1148,8 @@ async def createSampleTask(payload: dict[str, Any], idempotencyKey: str | None =
     설명: 공개 sample 업무 신규 생성
     실패 동작: 생성 후 조회 실패 시 ServiceError("SAMPLE_500_CREATE_FAILED") 발생
     반환값: 생성된 공개 sample 업무 dict
-    갱신일: 2026-03-06
+    부작용: 저장 성공 시 overview/dashboard 공개 집계 캐시 무효화
+    갱신일: 2026-10-18
     """
     await ensureBootstrap()
     scopeType = "sample.taskCreate"
@@ -990,6 +1164,7 @@ async def createSampleTask(payload: dict[str, Any], idempotencyKey: str | None =
         if createdPendingEntry:
             await discardIdempotencyReservation(scopeType, idempotencyKey)
         raise
+    invalidateSampleReadCache(SAMPLE_READ_CACHE_KEY["OVERVIEW"], SAMPLE_READ_CACHE_KEY["DASHBOARD"])
     await completeIdempotencyRequest(scopeType, idempotencyKey, result)
     return result
 
@@ -999,7 +1174,8 @@ async def updateSampleTask(taskId: Any, payload: dict[str, Any]) -> dict[str, An
     설명: 공개 sample 업무 단건 수정
     실패 동작: 대상 ID가 없으면 ServiceError("SAMPLE_404_NOT_FOUND") 발생
     반환값: 수정 후 최신 공개 sample 업무 dict
-    갱신일: 2026-03-06
+    부작용: 저장 성공 시 dashboard 공개 집계 캐시 무효화
+    갱신일: 2026-10-18
     """
     await ensureBootstrap()
     db = ensureDbManager()
@@ -1011,6 +1187,7 @@ async def updateSampleTask(taskId: Any, payload: dict[str, Any]) -> dict[str, An
     updatePayload = toTaskPayload(payload, taskModel)
     updatePayload["id"] = idValue
     await db.executeQuery("sample.taskUpdate", updatePayload)
+    invalidateSampleReadCache(SAMPLE_READ_CACHE_KEY["DASHBOARD"])
     updatedRow = await db.fetchOneQuery("sample.taskDetail", {"id": idValue})
     if not updatedRow:
         raise ServiceError("SAMPLE_404_NOT_FOUND")
@@ -1022,7 +1199,8 @@ async def deleteSampleTask(taskId: Any) -> dict[str, Any]:
     설명: 공개 sample 업무 단건 삭제
     실패 동작: 대상 ID가 없으면 ServiceError("SAMPLE_404_NOT_FOUND") 발생
     반환값: 삭제 완료된 ID 메타 dict
-    갱신일: 2026-03-06
+    부작용: 저장 성공 시 overview/dashboard 공개 집계 캐시 무효화
+    갱신일: 2026-10-18
     """
     await ensureBootstrap()
     db = ensureDbManager()
@@ -1031,6 +1209,7 @@ async def deleteSampleTask(taskId: Any) -> dict[str, Any]:
     if not currentRow:
         raise ServiceError("SAMPLE_404_NOT_FOUND")
     await db.executeQuery("sample.taskDelete", {"id": idValue})
+    invalidateSampleReadCache(SAMPLE_READ_CACHE_KEY["OVERVIEW"], SAMPLE_READ_CACHE_KEY["DASHBOARD"])
     return {"id": idValue}
 
 
@@ -1075,7 +1254,8 @@ async def submitSampleForm(payload: dict[str, Any], idempotencyKey: str | None =
     """
     설명: 공개 sample 복합 폼 제출값 저장 전 idempotency replay를 선처리
     반환값: 저장된 최신 제출 행을 camelCase 모델로 반환
-    갱신일: 2026-06-24
+    부작용: 저장 성공 시 overview 공개 집계 캐시 무효화
+    갱신일: 2026-10-18
     """
     scopeType = "sample.formSubmit"
     createPayload = toFormPayload(payload)
@@ -1089,6 +1269,7 @@ async def submitSampleForm(payload: dict[str, Any], idempotencyKey: str | None =
         if createdPendingEntry:
             await discardIdempotencyReservation(scopeType, idempotencyKey)
         raise
+    invalidateSampleReadCache(SAMPLE_READ_CACHE_KEY["OVERVIEW"])
     await completeIdempotencyRequest(scopeType, idempotencyKey, result)
     return result
 
@@ -1159,7 +1340,8 @@ async def createSampleAdminUser(payload: dict[str, Any], idempotencyKey: str | N
     설명: 공개 sample 관리자 사용자 신규 생성
     실패 동작: 이메일 중복 시 ServiceError("SAMPLE_409_ALREADY_EXISTS") 발생
     반환값: 생성된 사용자 모델 dict
-    갱신일: 2026-03-06
+    부작용: 저장 성공 시 overview 공개 집계 캐시 무효화
+    갱신일: 2026-10-18
     """
     await ensureBootstrap()
     scopeType = "sample.adminUserCreate"
@@ -1174,6 +1356,7 @@ async def createSampleAdminUser(payload: dict[str, Any], idempotencyKey: str | N
         if createdPendingEntry:
             await discardIdempotencyReservation(scopeType, idempotencyKey)
         raise
+    invalidateSampleReadCache(SAMPLE_READ_CACHE_KEY["OVERVIEW"])
     await completeIdempotencyRequest(scopeType, idempotencyKey, result)
     return result
 
@@ -0,0 +1,82 @@
+"""
+파일명: backend/tests/bench_execute_many.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: 행별 executeQuery 루프와 executeManyQuery(다중 행 VALUES chunk)의 INSERT 처리량 비교 벤치마크
+실행: backend 디렉터리에서 python -m tests.bench_execute_many [--rows 20000] [--chunk 500] [--database-url sqlite:///...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+from lib.Database import DatabaseManager
+
+BENCH_QUERIES = {
+    "bench.insertItem": "INSERT INTO T_BENCH_ITEM (ITEM_NO, ITEM_NM, AMT) VALUES (:itemNo, :itemNm, :amt)",
+}
+
+
+def buildRows(rowCount: int) -> list[dict[str, object]]:
+    return [{"itemNo": index, "itemNm": f"item-{index}", "amt": index % 1000} for index in range(rowCount)]
+
+
+async def resetTable(manager: DatabaseManager) -> None:
+    await manager.database.execute("DROP TABLE IF EXISTS T_BENCH_ITEM")
+    await manager.database.execute("CREATE TABLE T_BENCH_ITEM (ITEM_NO INTEGER PRIMARY KEY, ITEM_NM VARCHAR(64), AMT INTEGER)")
+
+
+async def measureLoop(manager: DatabaseManager, rows: list[dict[str, object]]) -> float:
+    await resetTable(manager)
+    started = time.perf_counter()
+    async with manager.database.transaction():
+        for row in rows:
+            await manager.executeQuery("bench.insertItem", row)
+    return len(rows) / (time.perf_counter() - started)
+
+
+async def measureExecuteMany(manager: DatabaseManager, rows: list[dict[str, object]], chunkSize: int) -> float:
+    await resetTable(manager)
+    started = time.perf_counter()
+    async with manager.database.transaction():
+        await manager.executeManyQuery("bench.insertItem", rows, chunkSize=chunkSize)
+    return len(rows) / (time.perf_counter() - started)
+
+
+async def run(databaseUrl: str, rowCount: int, chunkSize: int) -> None:
+    manager = DatabaseManager(databaseUrl)
+    manager.queryManager.setAll(BENCH_QUERIES, {}, {})
+    await manager.connect()
+    try:
+        rows = buildRows(rowCount)
+        loopRate = await measureLoop(manager, rows)
+        manyRate = await measureExecuteMany(manager, rows, chunkSize)
+        await manager.database.execute("DROP TABLE IF EXISTS T_BENCH_ITEM")
+    finally:
+        await manager.disconnect()
+    print(f"rows={rowCount} chunk={chunkSize} backend={databaseUrl.split(':', 1)[0]}")
+    print(f"{'mode':<16} {'rows/s':>12}")
+    print(f"{'executeQuery':<16} {loopRate:>12,.0f}")
+    print(f"{'executeManyQuery':<16} {manyRate:>12,.0f}  (x{manyRate / loopRate:.1f})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--chunk", type=int, default=500)
+    parser.add_argument("--database-url", default="")
+    args = parser.parse_args()
+
+    # 행별 db.query 로그 출력 비용이 아니라 실행 경로 차이만 비교한다.
+    logging.disable(logging.INFO)
+    databaseUrl = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    asyncio.run(run(databaseUrl, args.rows, args.chunk))
+
+
+if __name__ == "__main__":
+    main()
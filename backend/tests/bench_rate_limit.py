@@ -0,0 +1,77 @@
+"""
+파일명: backend/tests/bench_rate_limit.py
+작성자: LSH
+갱신일: 2026-10-18
+설명: RateLimiter(exact deque)와 SlidingWindowRateLimiter(sliding)의 메모리/처리량 비교 벤치마크
+실행: backend 디렉터리에서 python -m tests.bench_rate_limit [--keys 100000] [--hits 5] [--threads 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import threading
+import time
+import tracemalloc
+
+from lib.RateLimit import RateLimiter, SlidingWindowRateLimiter
+
+
+def buildLimiters(limit: int):
+    return {
+        "exact": lambda: RateLimiter(limit=limit, windowSec=60),
+        "sliding": lambda: SlidingWindowRateLimiter(limit=limit, windowSec=60),
+    }
+
+
+def measureMemory(factory, keys: list[str], hitsPerKey: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    limiter = factory()
+    for _ in range(hitsPerKey):
+        for key in keys:
+            limiter.hit(key)
+    currentBytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del limiter
+    return currentBytes / (1024 * 1024)
+
+
+def measureThroughput(factory, keys: list[str], hitsPerKey: int, threadCount: int) -> float:
+    limiter = factory()
+    chunks = [keys[index::threadCount] for index in range(threadCount)]
+
+    def worker(chunk: list[str]) -> None:
+        for _ in range(hitsPerKey):
+            for key in chunk:
+                limiter.hit(key)
+
+    threads = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return len(keys) * hitsPerKey / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--hits", type=int, default=5, help="hits per key (= limit)")
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    keys = [f"auth.login:ip:10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}" for index in range(args.keys)]
+    print(f"keys={args.keys} hitsPerKey={args.hits} threads={args.threads}")
+    print(f"{'mode':<8} {'memory MiB':>12} {'hits/s (1T)':>14} {'hits/s (' + str(args.threads) + 'T)':>14}")
+    for mode, factory in buildLimiters(args.hits).items():
+        memoryMiB = measureMemory(factory, keys, args.hits)
+        singleThread = measureThroughput(factory, keys, args.hits, 1)
+        multiThread = measureThroughput(factory, keys, args.hits, args.threads)
+        print(f"{mode:<8} {memoryMiB:>12.1f} {singleThread:>14,.0f} {multiThread:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -190,6 +190,8 @@ def resetIntegrationDbState() -> None:
         SampleService.sampleTaskStoreReady = False
         SampleService.sampleFormStoreReady = False
         SampleService.sampleAdminStoreReady = False
+        SampleService.resetSampleBootstrap()
+        SampleService.invalidateSampleReadCache()
     except Exception:
         pass
 
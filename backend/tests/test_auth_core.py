@@ -229,6 +229,82 @@ def testAccessAuthVersionInvalidatesOnlyChangedUser(monkeypatch):
     assert accepted.username == "other@example.com"
 
 
+def testAccessAuthVersionCacheSkipsRepeatLookupsUntilInvalidated(monkeypatch):
+    from lib import AuthVersionCache
+
+    configureTestAuth()
+    versions = {"cached@example.com": 0}
+    lookups = []
+
+    class FakeDb:
+        async def fetchOneQuery(self, queryName, values):
+            lookups.append((queryName, values["userId"]))
+            return {"authVersion": versions[values["userId"]]}
+
+    config = ConfigParser()
+    config.read_dict({"AUTH": {"auth_version_cache_ttl_ms": "60000", "auth_version_cache_max_entries": "8"}})
+    AuthVersionCache.configureAuthVersionCache(config)
+    monkeypatch.setattr("lib.Auth.DB.getManager", lambda: FakeDb())
+    try:
+        token = createAccessToken({"sub": "cached@example.com", "authVersion": 0})
+        for _ in range(3):
+            accepted = asyncio.run(getCurrentUser(makeRequest(), token.accessToken))
+            assert accepted.username == "cached@example.com"
+        assert lookups == [("auth.userAuthVersion", "cached@example.com")]
+
+        versions["cached@example.com"] = 1
+        AuthVersionCache.invalidateCachedAuthVersion("cached@example.com")
+        for _ in range(2):
+            with pytest.raises(HTTPException) as rejected:
+                asyncio.run(getCurrentUser(makeRequest(), token.accessToken))
+            assert rejected.value.status_code == 401
+        assert len(lookups) == 3
+        assert AuthVersionCache.getAuthVersionCacheStats()["entries"] == 0
+    finally:
+        AuthVersionCache.configureAuthVersionCache(None)
+
+
+def testAuthVersionInvalidationChannelPublishesAndPollsEvents(monkeypatch):
+    from lib import AuthVersionCache
+
+    config = ConfigParser()
+    config.read_dict({"AUTH": {"auth_version_cache_ttl_ms": "60000", "auth_version_invalidation_poll_ms": "1"}})
+    AuthVersionCache.configureAuthVersionCache(config)
+    published = []
+
+    async def fakeUpsert(stateType, tokenJti, expiresAtMs, tokenPayload=None):
+        published.append((stateType, tokenJti, expiresAtMs, tokenPayload))
+        return True
+
+    monkeypatch.setattr(AuthService, "upsertTokenStateEntry", fakeUpsert)
+    try:
+        asyncio.run(AuthService.publishAuthVersionInvalidation("changed@example.com", 1_000))
+        assert published == [
+            ("auth_version", "changed@example.com", 1_000 + 240_000, {"changedAtMs": 1_000})
+        ]
+
+        AuthVersionCache.storeCachedAuthVersion("remote@example.com", 0)
+        assert AuthVersionCache.getCachedAuthVersion("remote@example.com") == 0
+        polledCursors = []
+
+        async def fetchEvents(afterMs):
+            polledCursors.append(afterMs)
+            return [("remote@example.com", 500_000)] if len(polledCursors) == 1 else []
+
+        async def scenario():
+            assert AuthVersionCache.startAuthVersionInvalidationPoller(fetchEvents, 100_000)
+            while len(polledCursors) < 2:
+                await asyncio.sleep(0.005)
+            await AuthVersionCache.stopAuthVersionInvalidationPoller()
+
+        asyncio.run(scenario())
+        assert polledCursors[0] == 100_000 + 240_000 - AuthVersionCache.AUTH_VERSION_EVENT_OVERLAP_MS
+        assert polledCursors[1] == 500_000 - AuthVersionCache.AUTH_VERSION_EVENT_OVERLAP_MS
+        assert AuthVersionCache.getCachedAuthVersion("remote@example.com") is None
+    finally:
+        AuthVersionCache.configureAuthVersionCache(None)
+
+
 def testRefreshAuthVersionInvalidatesOnlyChangedUser(monkeypatch):
     configureTestAuth()
     versions = {"changed@example.com": 2, "other@example.com": 0}
@@ -262,6 +338,26 @@ def testRefreshAuthVersionInvalidatesOnlyChangedUser(monkeypatch):
     assert refreshedPayload["authVersion"] == 0
 
 
+def testRefreshFallbackStoresExpireByIndexAndEvictOldestFirst(monkeypatch):
+    revokedStore = AuthService.ExpiringStore(lambda expiresAtMs: int(expiresAtMs or 0), resolution=1000, maxEntries=2)
+    graceStore = AuthService.ExpiringStore(
+        lambda entry: int(entry.get("expiresAtMs", 0) or 0), resolution=1000, maxEntries=2
+    )
+    monkeypatch.setattr(AuthService, "revokedRefreshJtiStore", revokedStore)
+    monkeypatch.setattr(AuthService, "refreshGraceStore", graceStore)
+    AuthService.revokedRefreshJtiStore["late"] = 90_000
+    AuthService.revokedRefreshJtiStore["early"] = 10_000
+    AuthService.revokedRefreshJtiStore["middle"] = 50_000
+    AuthService.refreshGraceStore["grace"] = {"expiresAtMs": 5_000, "tokenPayload": {}}
+
+    assert sorted(AuthService.revokedRefreshJtiStore) == ["late", "middle"]
+    AuthService.cleanupRevokedRefreshJtiStore(60_000)
+    AuthService.cleanupRefreshGraceStore(60_000)
+
+    assert dict(AuthService.revokedRefreshJtiStore) == {"late": 90_000}
+    assert len(AuthService.refreshGraceStore) == 0
+
+
 def testPasswordResetRequestUsesHashOnlyAndKeepsGenericResult(monkeypatch):
     scheduled = []
 
@@ -701,6 +797,96 @@ def testPasswordChangeMapsDbNotReadyAndAuditsWithoutPlaintext(monkeypatch):
     assert "new-secret-123" not in repr(auditCalls)
 
 
+def testPasswordHashPoolRejectsWhenQueueIsFullAndRecordsTimings(monkeypatch):
+    import threading
+
+    from lib import Metrics, PasswordHashPool as PasswordHashPoolModule
+    from lib.PasswordHashPool import PasswordHashPool, PasswordHashPoolConfig
+
+    registry = Metrics.MetricsRegistry()
+    registry.gaugeCallbacks = dict(Metrics.metricsRegistry.gaugeCallbacks)
+    monkeypatch.setattr(Metrics, "metricsRegistry", registry)
+    monkeypatch.setattr(Metrics, "metricsConfig", Metrics.MetricsConfig(enabled=True))
+
+    pool = PasswordHashPool(PasswordHashPoolConfig(mode="thread", workers=1, queueLimit=1))
+    release = threading.Event()
+
+    def blockingHash(value: str) -> str:
+        release.wait(5)
+        return f"hashed:{value}"
+
+    async def scenario():
+        first = asyncio.create_task(pool.run(blockingHash, "a"))
+        second = asyncio.create_task(pool.run(blockingHash, "b"))
+        await asyncio.sleep(0)
+        assert pool.queueDepth == 1
+        with pytest.raises(ServiceError) as busyError:
+            await pool.run(blockingHash, "c")
+        release.set()
+        return busyError.value, await asyncio.gather(first, second)
+
+    try:
+        busyError, results = asyncio.run(scenario())
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert str(busyError) == "AUTH_503_HASH_BUSY"
+    assert results == ["hashed:a", "hashed:b"]
+    stats = pool.snapshot()
+    assert stats["inFlight"] == 0
+    assert stats["completed"] == 2
+    assert stats["rejected"] == 1
+    assert stats["queueDepth"] == 0
+    assert stats["hashMsMax"] >= stats["hashMsP95"] >= stats["hashMsP50"] >= 0.0
+    assert stats["queueWaitMsMax"] >= stats["queueWaitMsP50"] >= 0.0
+
+    monkeypatch.setattr(PasswordHashPoolModule, "passwordHashPool", pool)
+    body = Metrics.renderMetricsText()
+    assert "password_hash_rejections_total 1" in body
+    assert 'password_hash_duration_seconds_count{mode="thread"} 2' in body
+    assert 'password_hash_queue_wait_seconds_count{mode="thread"} 2' in body
+    assert "password_hash_pool_queue_depth 0" in body
+
+
+def testPasswordHashPoolConfigReadsAuthSectionAndRejectsInvalidValues(monkeypatch):
+    from lib import PasswordHashPool
+
+    for envName in ("AUTH_HASH_POOL_MODE", "AUTH_HASH_POOL_WORKERS", "AUTH_HASH_POOL_QUEUE_LIMIT"):
+        monkeypatch.delenv(envName, raising=False)
+    config = ConfigParser()
+    config.read_dict({"AUTH": {"hash_pool_mode": "thread", "hash_pool_workers": "3", "hash_pool_queue_limit": "7"}})
+    try:
+        poolConfig = PasswordHashPool.configurePasswordHashPool(config)
+        assert (poolConfig.mode, poolConfig.workers, poolConfig.queueLimit) == ("thread", 3, 7)
+        assert PasswordHashPool.getPasswordHashPoolStats()["queueLimit"] == 7
+
+        config["AUTH"]["hash_pool_mode"] = "fiber"
+        with pytest.raises(ValueError):
+            PasswordHashPool.configurePasswordHashPool(config)
+        config["AUTH"]["hash_pool_mode"] = "process"
+        config["AUTH"]["hash_pool_queue_limit"] = "0"
+        with pytest.raises(ValueError):
+            PasswordHashPool.configurePasswordHashPool(config)
+    finally:
+        PasswordHashPool.configurePasswordHashPool(None)
+
+
+def testPasswordChangeMapsHashPoolBusyToRetryableCode(monkeypatch):
+    async def hashBusy(*_args, **_kwargs):
+        raise ServiceError("AUTH_503_HASH_BUSY")
+
+    monkeypatch.setattr(AuthService, "changePasswordInTransaction", hashBusy)
+    result = asyncio.run(
+        AuthService.changePassword(
+            "user@example.com",
+            {"currentPassword": "current-secret", "newPassword": "new-secret-123"},
+        )
+    )
+
+    assert result == (None, "AUTH_503_HASH_BUSY")
+
+
 def testPasswordResetConditionalConsumeAllowsOnlyOneConcurrentCompletion(monkeypatch):
     class TxContext:
         def __init__(self, lock):
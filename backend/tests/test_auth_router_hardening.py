@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from starlette.requests import Request
@@ -32,6 +34,10 @@ def makeAuthenticatedApp(username: str = "demo@example.com") -> FastAPI:
     return app
 
 
+async def allowRateLimit(*args, **kwargs):
+    return None
+
+
 def makeRequest() -> Request:
     return Request(
         {
@@ -79,7 +85,7 @@ def testProdRuntimeForcesSecureCookieSetAndLogout503Delete(monkeypatch):
 
     monkeypatch.setattr(AuthService, "login", fakeLogin)
     monkeypatch.setattr(AuthService, "revokeRefreshToken", failRevoke)
-    monkeypatch.setattr(AuthRouter, "checkRateLimit", lambda *args, **kwargs: None)
+    monkeypatch.setattr(AuthRouter, "checkRateLimit", allowRateLimit)
 
     with TestClient(makeApp()) as client:
         loginResponse = client.post(
@@ -127,18 +133,18 @@ def testNamespacedRateLimiterSeparatesSignupAndPasswordReset(monkeypatch):
     monkeypatch.setattr(RateLimit, "globalRateLimiter", limiter)
     request = makeRequest()
 
-    assert RateLimit.checkRateLimit(
+    assert asyncio.run(RateLimit.checkRateLimit(
         request,
         username="demo@example.com",
         commit=True,
         namespace="auth.signup",
-    ) is None
-    assert RateLimit.checkRateLimit(
+    )) is None
+    assert asyncio.run(RateLimit.checkRateLimit(
         request,
         username="demo@example.com",
         commit=True,
         namespace="auth.password_reset",
-    ) is None
+    )) is None
 
     assert set(limiter.store) == {
         "auth.signup:ip:127.0.0.1",
@@ -151,7 +157,7 @@ def testNamespacedRateLimiterSeparatesSignupAndPasswordReset(monkeypatch):
 def testWebAndAppLoginUseCanonicalEquivalentThrottleKey(monkeypatch):
     calls = []
 
-    def captureRateLimit(request, username=None, *, commit=True, namespace="auth.login"):
+    async def captureRateLimit(request, username=None, *, commit=True, namespace="auth.login"):
         calls.append((username, commit, namespace))
         return None
 
@@ -180,7 +186,7 @@ def testWebAndAppLoginUseCanonicalEquivalentThrottleKey(monkeypatch):
 def testSignupAndAllPasswordResetRoutesCommitNormalizedNamespacedThrottle(monkeypatch):
     calls = []
 
-    def captureRateLimit(request, username=None, *, commit=True, namespace="auth.login"):
+    async def captureRateLimit(request, username=None, *, commit=True, namespace="auth.login"):
         calls.append((username, commit, namespace))
         return None
 
@@ -229,7 +235,7 @@ def testJsonMediaTypeAndSuppliedWebOriginPolicy(monkeypatch):
 
     monkeypatch.setattr(AuthService, "login", fakeLogin)
     monkeypatch.setattr(AuthService, "revokeRefreshToken", fakeRevoke)
-    monkeypatch.setattr(AuthRouter, "checkRateLimit", lambda *args, **kwargs: None)
+    monkeypatch.setattr(AuthRouter, "checkRateLimit", allowRateLimit)
 
     loginBody = '{"username":"demo@demo.demo","password":"password123"}'
     hostileBodies = {
@@ -289,7 +295,7 @@ def testSignupFallbackSanitizesArbitraryServiceCode(monkeypatch):
         return None, "INTERNAL_DATABASE_DETAIL"
 
     monkeypatch.setattr(AuthService, "signup", failSignup)
-    monkeypatch.setattr(AuthRouter, "checkRateLimit", lambda *args, **kwargs: None)
+    monkeypatch.setattr(AuthRouter, "checkRateLimit", allowRateLimit)
 
     with TestClient(makeApp()) as client:
         response = client.post(
@@ -307,7 +313,7 @@ def testPasswordResetFallbackSanitizesArbitraryServiceCode(monkeypatch):
         return None, "INTERNAL_PROVIDER_DETAIL"
 
     monkeypatch.setattr(AuthService, "requestPasswordReset", failPasswordReset)
-    monkeypatch.setattr(AuthRouter, "checkRateLimit", lambda *args, **kwargs: None)
+    monkeypatch.setattr(AuthRouter, "checkRateLimit", allowRateLimit)
 
     with TestClient(makeApp()) as client:
         response = client.post(
@@ -385,11 +391,11 @@ def testPasswordChangeCallsServiceExactlyAndClearsCookiesWithoutTokens(monkeypat
     rateLimitEvents = []
     reservationHandle = object()
 
-    def captureReservation(request, username=None, *, namespace="auth.login"):
+    async def captureReservation(request, username=None, *, namespace="auth.login"):
         rateLimitEvents.append(("reserve", username, namespace))
         return None, reservationHandle
 
-    def captureFinalization(handle, *, keep):
+    async def captureFinalization(handle, *, keep):
         rateLimitEvents.append(("finalize", handle, keep))
         return True
 
@@ -436,11 +442,11 @@ def testPasswordChangeMismatchPrechecksCanonicalUserAndIpThenCommits(monkeypatch
     events = []
     reservationHandle = object()
 
-    def captureReservation(request, username=None, *, namespace="auth.login"):
+    async def captureReservation(request, username=None, *, namespace="auth.login"):
         events.append(("reserve", request.client.host, username, namespace))
         return None, reservationHandle
 
-    def captureFinalization(handle, *, keep):
+    async def captureFinalization(handle, *, keep):
         events.append(("finalize", handle, keep))
         return True
 
@@ -581,13 +587,13 @@ def testPasswordChangeMapsExpectedAndUnexpectedServiceErrorsSafely(monkeypatch):
     rateLimitEvents = []
     reservationSequence = {"value": 0}
 
-    def captureReservation(request, username=None, *, namespace="auth.login"):
+    async def captureReservation(request, username=None, *, namespace="auth.login"):
         reservationSequence["value"] += 1
         handle = f"reservation-{reservationSequence['value']}"
         rateLimitEvents.append(("reserve", username, namespace, handle))
         return None, handle
 
-    def captureFinalization(handle, *, keep):
+    async def captureFinalization(handle, *, keep):
         rateLimitEvents.append(("finalize", handle, keep))
         return True
 
@@ -645,10 +651,10 @@ def testPasswordChangeReleasesReservationWhenServiceRaises(monkeypatch):
     reservationHandle = object()
     finalizations = []
 
-    def captureReservation(request, username=None, *, namespace="auth.login"):
+    async def captureReservation(request, username=None, *, namespace="auth.login"):
         return None, reservationHandle
 
-    def captureFinalization(handle, *, keep):
+    async def captureFinalization(handle, *, keep):
         finalizations.append((handle, keep))
         return True
 
@@ -742,7 +748,7 @@ def testPasswordResetMailFailureDoesNotChangePublicRequestResponse(monkeypatch):
     monkeypatch.setattr(AuthService, "createPasswordResetTokenInTransaction", createToken)
     monkeypatch.setattr(AuthService.PasswordResetMail, "sendPasswordReset", failDelivery)
     monkeypatch.setattr(AuthService.logger, "error", lambda *args, **kwargs: logCalls.append(args))
-    monkeypatch.setattr(AuthRouter, "checkRateLimit", lambda *args, **kwargs: None)
+    monkeypatch.setattr(AuthRouter, "checkRateLimit", allowRateLimit)
 
     with TestClient(makeApp()) as client:
         response = client.post(
@@ -763,7 +769,7 @@ def testPasswordResetRequestSchedulesOneBackgroundTaskForEveryValidEmail(monkeyp
         processed.append(email)
 
     monkeypatch.setattr(AuthService, "processPasswordResetRequest", captureProcessing)
-    monkeypatch.setattr(AuthRouter, "checkRateLimit", lambda *args, **kwargs: None)
+    monkeypatch.setattr(AuthRouter, "checkRateLimit", allowRateLimit)
 
     with TestClient(makeApp()) as client:
         existing = client.post(
@@ -778,3 +784,134 @@ def testPasswordResetRequestSchedulesOneBackgroundTaskForEveryValidEmail(monkeyp
     assert existing.status_code == missing.status_code == 200
     assert existing.json() == missing.json()
     assert processed == ["exists@example.com", "missing@example.com"]
+
+
+def testSharedMemoryRateLimiterIsSharedAcrossInstancesAndReleasesReservations(tmp_path):
+    path = str(tmp_path / "rate-limit.bin")
+    workerA = RateLimit.SharedMemoryRateLimiter(limit=2, windowSec=60, path=path, slotCount=64)
+    workerB = RateLimit.SharedMemoryRateLimiter(limit=2, windowSec=60, path=path, slotCount=64)
+    try:
+        assert workerA.hit("auth.login:ip:10.0.0.1") == (True, 0)
+        assert workerB.hit("auth.login:ip:10.0.0.1", commit=False) == (True, 0)
+        assert workerB.hit("auth.login:ip:10.0.0.1") == (True, 0)
+        allowed, retryAfter = workerA.hit("auth.login:ip:10.0.0.1", commit=False)
+        assert allowed is False and retryAfter >= 1
+
+        ok, _, reservationId = workerA.reserve(("auth.password_change:ip:10.0.0.2", "auth.password_change:user:a"))
+        assert ok is True
+        assert workerB.reserve(("auth.password_change:user:a",))[0] is True
+        assert workerB.reserve(("auth.password_change:user:a",))[0] is False
+        assert workerA.finalizeReservation(reservationId, keep=False) is True
+        assert workerA.finalizeReservation(reservationId, keep=False) is False
+        assert workerB.reserve(("auth.password_change:user:a",))[0] is True
+    finally:
+        workerA.close()
+        workerB.close()
+
+
+def buildRateLimitDatabase(tmp_path):
+    from pathlib import Path
+
+    from lib.Database import DatabaseManager
+    from lib.SqlLoader import parseSqlFile
+
+    baseDir = Path(__file__).resolve().parents[1]
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'ratelimit.db'}")
+    manager.queryManager.setAll(dict(parseSqlFile(str(baseDir / "query" / "ratelimit.sql"))), {}, {})
+    migrationSql = (baseDir / "migrations" / "20261018_rate_limit.sqlite.sql").read_text(encoding="utf-8")
+    return manager, migrationSql
+
+
+def testDatabaseRateLimiterEnforcesSharedLimitAcrossWorkersAtDecisionTime(monkeypatch, tmp_path):
+    from lib import Database as DB
+
+    manager, migrationSql = buildRateLimitDatabase(tmp_path)
+    monkeypatch.setattr(DB, "getManager", lambda dbName=None: manager)
+    # 같은 T_RATE_LIMIT를 쓰는 두 worker
+    workerA = RateLimit.DatabaseRateLimiter(limit=3, windowSec=60)
+    workerB = RateLimit.DatabaseRateLimiter(limit=3, windowSec=60)
+    for limiter in (workerA, workerB):
+        monkeypatch.setattr(limiter, "now", lambda: 6000.0)
+
+    async def scenario():
+        await manager.connect()
+        try:
+            await manager.database.execute(migrationSql.split("-- name: migration.rateLimit", 1)[1])
+            key = "auth.login:user:a"
+            results = await asyncio.gather(*(worker.hitAsync(key) for worker in (workerA, workerB) * 3))
+            precheck = await workerB.hitAsync(key, commit=False)
+            rows = await manager.fetchAllQuery("rateLimit.getCounts", {"rlKey": key, "previousWindowIdx": 99})
+
+            ok, _, reservationId = await workerA.reserveAsync(("auth.password_change:user:a",))
+            assert ok is True
+            assert await workerA.finalizeReservationAsync(reservationId, keep=False) is True
+            assert await workerA.finalizeReservationAsync(reservationId, keep=False) is False
+            released = await manager.fetchAllQuery(
+                "rateLimit.getCounts", {"rlKey": "auth.password_change:user:a", "previousWindowIdx": 99}
+            )
+            return results, precheck, rows, released
+        finally:
+            await manager.disconnect()
+
+    results, precheck, rows, released = asyncio.run(scenario())
+    assert sum(1 for allowed, _ in results if allowed) == 3
+    assert all(retryAfter == 60 for allowed, retryAfter in results if not allowed)
+    assert precheck == (False, 60)
+    # 거절된 시도는 되돌리므로 공유 카운트는 허용된 수만 남는다.
+    assert rows == [{"windowIdx": 100, "hitCnt": 3}]
+    assert released == [{"windowIdx": 100, "hitCnt": 0}]
+
+
+def testDatabaseRateLimiterFallsBackToLocalLimiterWhenDatabaseFails(monkeypatch):
+    from lib import Database as DB
+
+    class FailingDb:
+        async def fetchOneQuery(self, queryName, values=None):
+            raise ConnectionError("database down")
+
+        async def executeQuery(self, queryName, values=None):
+            raise ConnectionError("database down")
+
+    monkeypatch.setattr(DB, "getManager", lambda dbName=None: FailingDb())
+    limiter = RateLimit.DatabaseRateLimiter(limit=2, windowSec=60)
+    monkeypatch.setattr(limiter, "now", lambda: 6000.0)
+    monkeypatch.setattr(limiter.fallback, "now", lambda: 6000.0)
+
+    async def scenario():
+        hits = [await limiter.hitAsync("auth.login:user:a") for _ in range(3)]
+        ok, _, reservationId = await limiter.reserveAsync(("auth.password_change:user:a",))
+        assert ok is True
+        assert await limiter.finalizeReservationAsync(reservationId, keep=False) is True
+        return hits
+
+    assert asyncio.run(scenario()) == [(True, 0), (True, 0), (False, 60)]
+    assert limiter.fallback.shards[limiter.fallback.stripeFor("auth.password_change:user:a")][
+        "auth.password_change:user:a"
+    ].current == 0
+
+
+def testSlidingWindowRateLimiterWeightsPreviousWindowAndSweepsIdleKeys(monkeypatch):
+    limiter = RateLimit.SlidingWindowRateLimiter(limit=4, windowSec=60, stripes=4, sweepEvery=1)
+    clock = {"now": 600.0}
+    monkeypatch.setattr(limiter, "now", lambda: clock["now"])
+
+    for _ in range(4):
+        assert limiter.hit("auth.login:ip:10.0.0.1") == (True, 0)
+    assert limiter.hit("auth.login:ip:10.0.0.1") == (False, 60)
+
+    clock["now"] = 675.0
+    allowed, retryAfter = limiter.hit("auth.login:ip:10.0.0.1", commit=False)
+    assert allowed is True and retryAfter == 0
+    assert limiter.hit("auth.login:ip:10.0.0.1") == (True, 0)
+    allowed, retryAfter = limiter.hit("auth.login:ip:10.0.0.1", commit=False)
+    assert allowed is False and retryAfter == 1
+
+    ok, _, reservationId = limiter.reserve(("auth.password_change:ip:10.0.0.2", "auth.password_change:user:a"))
+    assert ok is True
+    assert limiter.finalizeReservation(reservationId, keep=False) is True
+    assert limiter.finalizeReservation(reservationId, keep=False) is False
+
+    clock["now"] = 900.0
+    for _ in range(limiter.stripeCount):
+        limiter.hit("auth.login:ip:10.0.0.9", commit=False)
+    assert limiter.keyCount() == 0
@@ -238,3 +238,228 @@ def testDashboardIdempotencyCompletionRunsInsideCreateTransaction(monkeypatch):
         )
 
     assert state == {"inTransaction": False, "discarded": True, "completed": True}
+
+
+class SqliteQueryDb:
+    """Runs the real query registry against an in-memory sqlite3 connection."""
+
+    def __init__(self, databaseUrl="sqlite:///:memory:"):
+        import sqlite3
+
+        from lib.SqlLoader import loadSqlQueries
+
+        self.queries = loadSqlQueries(str(Path(baseDir) / "query"))
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.row_factory = sqlite3.Row
+        self.databaseUrl = databaseUrl
+        self.calls = []
+
+    async def fetchAllQuery(self, queryName, binds=None):
+        self.calls.append(queryName)
+        cursor = self.connection.execute(self.queries[queryName].rstrip().rstrip(";"), binds or {})
+        return [dict(row) for row in cursor.fetchall()]
+
+    async def fetchOneQuery(self, queryName, binds=None):
+        rows = await self.fetchAllQuery(queryName, binds)
+        return rows[0] if rows else None
+
+
+def buildSqliteDashboardDb(databaseUrl="sqlite:///:memory:"):
+    sqliteDb = SqliteQueryDb(databaseUrl)
+    sqliteDb.connection.execute(
+        """
+        CREATE TABLE T_DATA (
+            DATA_NO INTEGER PRIMARY KEY,
+            USER_ID TEXT NOT NULL,
+            DATA_NM TEXT NOT NULL,
+            DATA_DESC TEXT,
+            STAT_CD TEXT NOT NULL,
+            AMT NUMERIC,
+            TAG_JSON TEXT,
+            REG_DT TIMESTAMP
+        )
+        """
+    )
+    for index in range(1, 24):
+        sqliteDb.connection.execute(
+            "INSERT INTO T_DATA VALUES (?, ?, ?, '', ?, ?, '[]', ?)",
+            (
+                index,
+                "demo@demo.demo" if index != 7 else "other@demo.demo",
+                f"업무 {index % 5}",
+                "ready" if index % 3 else "done",
+                None if index % 5 == 0 else (index % 4) * 100,
+                f"2026-10-{(index % 6) + 1:02d} 09:00:00",
+            ),
+        )
+    return sqliteDb
+
+
+def testDashboardCursorModeMatchesOffsetOrderForEverySort(monkeypatch):
+    from lib.ServiceError import ServiceError
+    from service import DashboardService
+
+    sqliteDb = buildSqliteDashboardDb()
+    monkeypatch.setattr(DashboardService, "ensureDbManager", lambda: sqliteDb)
+
+    async def collect(sort, status, q):
+        offsetPage = await DashboardService.listDataTemplates("demo@demo.demo", q=q, status=status, size=50, sort=sort)
+        cursorIdList = []
+        cursor = ""
+        while True:
+            page = await DashboardService.listDataTemplates(
+                "demo@demo.demo", q=q, status=status, size=4, sort=sort, cursor=cursor
+            )
+            cursorIdList.extend(item["id"] for item in page["dataTemplateList"])
+            assert page["total"] == offsetPage["total"]
+            if page["nextCursor"] is None:
+                break
+            cursor = page["nextCursor"]
+        return [item["id"] for item in offsetPage["dataTemplateList"]], cursorIdList
+
+    for sort in DashboardService.ALLOWED_SORT_ORDER:
+        for status, q in ((None, None), ("ready", None), ("ready", "업무"), (None, "업무 2")):
+            offsetIdList, cursorIdList = asyncio.run(collect(sort, status, q))
+            assert cursorIdList == offsetIdList
+            assert 7 not in cursorIdList
+    assert {f"dashboard.listAfter.any.eq.{sort}" for sort in DashboardService.ALLOWED_SORT_ORDER} <= set(sqliteDb.calls)
+    assert "dashboard.listAfter.match.eq.title_asc" in sqliteDb.calls
+
+    with pytest.raises(ServiceError) as invalidCursor:
+        firstPage = asyncio.run(DashboardService.listDataTemplates("demo@demo.demo", size=2, sort="amt_desc", cursor=""))
+        asyncio.run(
+            DashboardService.listDataTemplates("demo@demo.demo", size=2, sort="title_asc", cursor=firstPage["nextCursor"])
+        )
+    assert invalidCursor.value.code == "DASH_422_INVALID_INPUT"
+
+
+def testDashboardAmountCursorKeepsNullAmountRows(monkeypatch):
+    from lib.ListCursor import decodeListCursor, encodeListCursor
+    from service import DashboardService
+
+    sqliteDb = buildSqliteDashboardDb()
+    monkeypatch.setattr(DashboardService, "ensureDbManager", lambda: sqliteDb)
+    nullAmountIds = {5, 10, 15, 20}
+
+    async def collect(sort, size):
+        cursorIdList = []
+        endedOnNull = False
+        cursor = ""
+        while True:
+            page = await DashboardService.listDataTemplates("demo@demo.demo", size=size, sort=sort, cursor=cursor)
+            cursorIdList.extend(item["id"] for item in page["dataTemplateList"])
+            if page["nextCursor"] is None:
+                return cursorIdList, endedOnNull
+            endedOnNull = endedOnNull or page["dataTemplateList"][-1]["id"] in nullAmountIds
+            cursor = page["nextCursor"]
+
+    for sort in ("amt_desc", "amt_asc"):
+        offsetPage = asyncio.run(DashboardService.listDataTemplates("demo@demo.demo", size=50, sort=sort))
+        offsetIdList = [item["id"] for item in offsetPage["dataTemplateList"]]
+        assert nullAmountIds <= set(offsetIdList)
+        for size in (1, 2, 3):
+            cursorIdList, endedOnNull = asyncio.run(collect(sort, size))
+            assert cursorIdList == offsetIdList
+            assert endedOnNull or size > 1
+
+    # NULL 정렬 키로 발급된 cursor도 거절하지 않고 쿼리와 같은 대체값(0)으로 이어서 조회
+    assert decodeListCursor(encodeListCursor("amt_asc", None, 20), "amt_asc") == (None, 20)
+    legacyPage = asyncio.run(
+        DashboardService.listDataTemplates(
+            "demo@demo.demo", size=50, sort="amt_asc", cursor=encodeListCursor("amt_asc", None, 20)
+        )
+    )
+    offsetPage = asyncio.run(DashboardService.listDataTemplates("demo@demo.demo", size=50, sort="amt_asc"))
+    offsetIdList = [item["id"] for item in offsetPage["dataTemplateList"]]
+    assert [item["id"] for item in legacyPage["dataTemplateList"]] == offsetIdList[offsetIdList.index(20) + 1 :]
+
+def testDashboardListFetchesTotalWithRowsOrSkipsCountByPolicy(monkeypatch):
+    import configparser
+
+    from service import DashboardService
+
+    def listWith(sqliteDb, config, **kwargs):
+        monkeypatch.setattr(DashboardService, "ensureDbManager", lambda: sqliteDb)
+        monkeypatch.setattr(DashboardService, "getConfig", lambda: config)
+        sqliteDb.calls.clear()
+        return asyncio.run(DashboardService.listDataTemplates("demo@demo.demo", size=5, **kwargs))
+
+    exactConfig = configparser.ConfigParser()
+    windowDb = buildSqliteDashboardDb()
+    firstPage = listWith(windowDb, exactConfig)
+    assert windowDb.calls == ["dashboard.listWithTotal.any.any.reg_dt_desc"]
+    assert (firstPage["total"], firstPage["totalExact"], firstPage["hasMore"]) == (22, True, True)
+    pastEnd = listWith(windowDb, exactConfig, page=9)
+    assert windowDb.calls == ["dashboard.listWithTotal.any.any.reg_dt_desc", "dashboard.listCount.any.any"]
+    assert (pastEnd["dataTemplateList"], pastEnd["total"], pastEnd["hasMore"]) == ([], 22, False)
+
+    concurrentDb = buildSqliteDashboardDb("mysql+aiomysql://db/app")
+    lastPage = listWith(concurrentDb, exactConfig, page=5)
+    assert sorted(concurrentDb.calls) == ["dashboard.list.any.any.reg_dt_desc", "dashboard.listCount.any.any"]
+    assert ([item["id"] for item in lastPage["dataTemplateList"]], lastPage["total"], lastPage["hasMore"]) == (
+        [item["id"] for item in listWith(windowDb, exactConfig, page=5)["dataTemplateList"]],
+        22,
+        False,
+    )
+
+    hasMoreConfig = configparser.ConfigParser()
+    hasMoreConfig.read_dict({"API_POLICY.dashboard.list": {"list_total_mode": "has_more"}})
+    secondPage = listWith(windowDb, hasMoreConfig, page=2)
+    assert windowDb.calls == ["dashboard.list.any.any.reg_dt_desc"]
+    assert (len(secondPage["dataTemplateList"]), secondPage["total"], secondPage["totalExact"], secondPage["hasMore"]) == (
+        5,
+        11,
+        False,
+        True,
+    )
+
+
+def testDashboardListVariantsUseIndexesFromMigration():
+    sqliteDb = buildSqliteDashboardDb()
+    migrationPath = Path(baseDir) / "migrations" / "20261018_dashboard_list_indexes.sqlite.sql"
+    sqliteDb.connection.executescript(migrationPath.read_text(encoding="utf-8"))
+
+    listQuery = sqliteDb.queries["dashboard.list.any.eq.reg_dt_desc"]
+    assert ":q " not in listQuery and "CASE WHEN" not in listQuery
+    plan = " ".join(
+        str(row["detail"])
+        for row in sqliteDb.connection.execute(
+            "EXPLAIN QUERY PLAN " + listQuery.rstrip().rstrip(";"),
+            {"userId": "demo@demo.demo", "status": "ready", "limit": 5, "offset": 0},
+        )
+    )
+    assert "IX_DATA_USER_STAT_REG_DT" in plan
+    assert "TEMP B-TREE" not in plan
+
+    amountQuery = sqliteDb.queries["dashboard.listAfter.any.any.amt_desc"]
+    amountPlan = " ".join(
+        str(row["detail"])
+        for row in sqliteDb.connection.execute(
+            "EXPLAIN QUERY PLAN " + amountQuery.rstrip().rstrip(";"),
+            {"userId": "demo@demo.demo", "cursorKey": 100, "cursorId": 9, "limit": 5},
+        )
+    )
+    assert "IX_DATA_USER_AMT_KEY" in amountPlan
+    assert "TEMP B-TREE" not in amountPlan
+
+    # 오름차순도 DATA_NO를 같은 방향으로 두어 인덱스 정방향 스캔만으로 정렬
+    for sort, indexName in (
+        ("reg_dt_asc", "IX_DATA_USER_REG_DT"),
+        ("amt_asc", "IX_DATA_USER_AMT_KEY"),
+        ("title_asc", "IX_DATA_USER_DATA_NM"),
+    ):
+        for queryName, binds in (
+            (f"dashboard.list.any.any.{sort}", {"userId": "demo@demo.demo", "limit": 5, "offset": 0}),
+            (
+                f"dashboard.listAfter.any.any.{sort}",
+                {"userId": "demo@demo.demo", "cursorKey": 100, "cursorId": 9, "limit": 5},
+            ),
+        ):
+            ascPlan = " ".join(
+                str(row["detail"])
+                for row in sqliteDb.connection.execute(
+                    "EXPLAIN QUERY PLAN " + sqliteDb.queries[queryName].rstrip().rstrip(";"), binds
+                )
+            )
+            assert indexName in ascPlan, queryName
+            assert "TEMP B-TREE" not in ascPlan, queryName
@@ -394,3 +394,499 @@ def test_dollar_and_escape_static_literals_follow_default_and_reveal_masking():
     assert jwtValue not in revealed
     assert "Bearer secret-token" not in revealed
     assert revealed.count("'***'") == 3
+
+
+def test_named_query_is_prepared_once_and_reused_across_calls(monkeypatch):
+    from lib import Database
+    from lib.Database import DatabaseManager
+
+    manager = DatabaseManager(DATABASE_URL)
+    query = "SELECT * FROM account WHERE tenant_id = :tenant_id AND status = 'active'"
+    manager.queryManager.setAll({"account.active": query}, {}, {})
+    prepared = manager.queryManager.getPreparedQuery("account.active")
+
+    assert prepared.placeholders == frozenset({"tenant_id"})
+
+    def unexpectedScan(query: str):
+        raise AssertionError("named query path must not rescan SQL per call")
+
+    monkeypatch.setattr(Database, "scanSqlSegments", unexpectedScan)
+    monkeypatch.setattr(Database, "hasUnsafeInlineLiteralPredicate", unexpectedScan)
+
+    async def fakeFetchAll(*, query: str, values: dict[str, object]):
+        return []
+
+    manager.database.fetch_all = fakeFetchAll
+
+    assert asyncio.run(manager.fetchAllQuery("account.active", {"tenant_id": 7})) == []
+    with pytest.raises(ValueError, match="DB_400_PARAM_MISSING"):
+        asyncio.run(manager.fetchAllQuery("account.active", {}))
+
+    monkeypatch.undo()
+    manager.queryManager.setAll({"account.active": query, "other.ping": "SELECT 1"}, {}, {})
+    assert manager.queryManager.getPreparedQuery("account.active") is prepared
+
+
+def test_prepared_query_is_replaced_when_reloaded_sql_changes():
+    from lib.Database import DatabaseManager
+
+    manager = DatabaseManager(DATABASE_URL)
+    manager.queryManager.setAll({"account.byId": "SELECT * FROM account WHERE id = :id"}, {}, {})
+    before = manager.queryManager.getPreparedQuery("account.byId")
+
+    manager.queryManager.setAll({"account.byId": "SELECT * FROM account WHERE uid = :uid"}, {}, {})
+    after = manager.queryManager.getPreparedQuery("account.byId")
+
+    assert after is not before
+    assert after.placeholders == frozenset({"uid"})
+    with pytest.raises(ValueError, match="DB_400_PARAM_UNUSED"):
+        manager.validatePreparedBindParameters(after, {"uid": 1, "id": 1})
+
+
+def test_sql_log_rendering_is_skipped_when_info_is_disabled(monkeypatch):
+    import logging
+
+    from lib import Database
+    from lib.Database import DatabaseManager
+
+    manager = DatabaseManager(DATABASE_URL)
+    manager.queryManager.setAll({"account.byId": "SELECT * FROM account WHERE id = :id"}, {}, {})
+
+    async def fakeFetchOne(*, query: str, values: dict[str, object]):
+        return {"id": values["id"]}
+
+    def forbiddenRender(*_args, **_kwargs):
+        raise AssertionError("SQL log rendering must be skipped when INFO is disabled")
+
+    manager.database.fetch_one = fakeFetchOne
+    monkeypatch.setattr(manager, "renderQueryForLog", forbiddenRender)
+    monkeypatch.setattr(Database.logger, "level", logging.WARNING)
+
+    assert asyncio.run(manager.fetchOneQuery("account.byId", {"id": 1})) == {"id": 1}
+
+
+def test_sql_log_sampling_keeps_one_in_n_plus_slow_and_failed_queries(monkeypatch):
+    from lib import Database
+    from lib.Database import DatabaseManager
+
+    manager = DatabaseManager(DATABASE_URL)
+    manager.queryManager.setAll({"account.byId": "SELECT * FROM account WHERE id = :id"}, {}, {})
+    emitted: list[dict[str, object]] = []
+    failNext = {"value": False}
+
+    async def fakeFetchOne(*, query: str, values: dict[str, object]):
+        if failNext["value"]:
+            raise RuntimeError("driver failure")
+        return {"id": values["id"]}
+
+    def captureLog(level, payload, **_kwargs):
+        emitted.append(payload() if callable(payload) else payload)
+
+    manager.database.fetch_one = fakeFetchOne
+    monkeypatch.setattr(Database, "logStructured", captureLog)
+    monkeypatch.setenv("SQL_LOG_SAMPLE_RATE", "3")
+    monkeypatch.setenv("SQL_LOG_SLOW_MS", "100000")
+
+    for index in range(6):
+        asyncio.run(manager.fetchOneQuery("account.byId", {"id": index}))
+    assert [item["rowsReturned"] for item in emitted] == [1, 1]
+    assert all(item["queryName"] == "account.byId" and "durationMs" in item for item in emitted)
+
+    monkeypatch.setenv("SQL_LOG_SLOW_MS", "0")
+    asyncio.run(manager.fetchOneQuery("account.byId", {"id": 7}))
+    assert len(emitted) == 3
+
+    monkeypatch.setenv("SQL_LOG_SLOW_MS", "100000")
+    failNext["value"] = True
+    with pytest.raises(RuntimeError):
+        asyncio.run(manager.fetchOneQuery("account.byId", {"id": 8}))
+    assert emitted[-1]["errorType"] == "RuntimeError"
+    assert "rowsReturned" not in emitted[-1]
+
+
+def test_pool_config_is_mapped_to_driver_pool_options():
+    from lib.Database import DatabaseManager
+    from lib.DatabasePool import buildDatabasePoolOptions, readDatabasePoolConfig
+
+    poolConfig = readDatabasePoolConfig(
+        {
+            "pool_min_size": "2",
+            "pool_max_size": "8",
+            "pool_acquire_timeout_ms": "1500",
+            "pool_max_idle_sec": "120",
+            "pool_max_lifetime_sec": "300",
+            "statement_cache_size": "0",
+        },
+        "DATABASE",
+    )
+
+    assert buildDatabasePoolOptions(DATABASE_URL, poolConfig) == {
+        "min_size": 2,
+        "max_size": 8,
+        "max_inactive_connection_lifetime": 120.0,
+        "statement_cache_size": 0,
+    }
+    assert buildDatabasePoolOptions("mysql+aiomysql://u:p@127.0.0.1/db", poolConfig) == {
+        "min_size": 2,
+        "max_size": 8,
+        "pool_recycle": 300,
+    }
+    assert buildDatabasePoolOptions("sqlite:///./data/main.db", poolConfig) == {}
+    assert buildDatabasePoolOptions(DATABASE_URL, readDatabasePoolConfig({}, "DATABASE")) == {}
+    assert DatabaseManager(DATABASE_URL, poolConfig).database._backend._options["max_size"] == 8
+
+    with pytest.raises(ValueError, match="pool_min_size must not exceed pool_max_size"):
+        readDatabasePoolConfig({"pool_min_size": "9", "pool_max_size": "8"}, "DATABASE_REPLICA")
+    with pytest.raises(ValueError, match="pool_acquire_timeout_ms must be an integer"):
+        readDatabasePoolConfig({"pool_acquire_timeout_ms": "soon"}, "DATABASE")
+
+
+def test_pool_stats_track_checkouts_and_acquire_timeout_maps_to_db_not_ready(tmp_path):
+    from lib.Database import DatabaseManager, getDatabasePoolStats
+    from lib import Database as DB
+    from lib.DatabasePool import DatabasePoolConfig
+    from lib.ServiceError import ServiceError
+
+    manager = DatabaseManager(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        DatabasePoolConfig(acquireTimeoutMs=50),
+        name="pool_db",
+    )
+
+    async def exercise():
+        await manager.connect()
+        try:
+            assert await manager.fetchOne("SELECT 1 AS one") == {"one": 1}
+            async with manager.database.connection():
+                assert (manager.getPoolStats()["inUse"], manager.getPoolStats()["waiters"]) == (1, 0)
+            assert manager.getPoolStats()["inUse"] == 0
+
+            async def blockedAcquire():
+                await asyncio.sleep(1)
+
+            manager.database._backend._pool.pool.acquire = blockedAcquire
+            with pytest.raises(ServiceError) as timedOut:
+                await manager.fetchOne("SELECT 3 AS three")
+            assert timedOut.value.code == "DB_NOT_READY"
+        finally:
+            await manager.disconnect()
+
+    asyncio.run(exercise())
+
+    stats = manager.getPoolStats()
+    assert stats["backend"] == "sqlite"
+    # connect 시 SQLite PRAGMA 3회 + 조회 1회 + 명시적 connection 1회
+    assert (stats["acquired"], stats["acquireTimeouts"], stats["inUse"], stats["waiters"]) == (5, 1, 0, 0)
+    assert stats["acquireTimeoutMs"] == 50
+    assert stats["acquireWaitMaxMs"] >= 50
+
+    previousManagers = dict(DB.dbManagers)
+    DB.dbManagers.clear()
+    DB.dbManagers["pool_db"] = manager
+    try:
+        assert getDatabasePoolStats() == {"pool_db": stats}
+        assert DB.collectPoolGauge("acquired") == {("pool_db",): 5.0}
+    finally:
+        DB.dbManagers.clear()
+        DB.dbManagers.update(previousManagers)
+
+
+def test_pool_stats_report_asyncpg_statement_cache_occupancy(monkeypatch):
+    from types import SimpleNamespace
+
+    from lib import Database as DB
+    from lib import Metrics
+    from lib.DatabasePool import DatabasePoolTelemetry, readStatementCacheStats
+
+    class FakeStatementCache:
+        def __init__(self, entries: int):
+            self.entries = entries
+
+        def __len__(self):
+            return self.entries
+
+        def get_max_size(self):
+            return 100
+
+    pool = SimpleNamespace(
+        _holders=[
+            SimpleNamespace(_con=SimpleNamespace(_stmt_cache=FakeStatementCache(7))),
+            SimpleNamespace(_con=SimpleNamespace(_stmt_cache=FakeStatementCache(5))),
+            SimpleNamespace(_con=None),
+        ]
+    )
+    assert readStatementCacheStats(pool) == (100, 12)
+    assert readStatementCacheStats(None) == (None, 0)
+
+    stats = DatabasePoolTelemetry("pg_db").snapshot(pool)
+    assert (stats["statementCacheSize"], stats["statementCacheEntries"]) == (100, 12)
+
+    monkeypatch.setattr(DB, "getDatabasePoolStats", lambda: {"pg_db": stats})
+    monkeypatch.setattr(Metrics, "metricsConfig", Metrics.MetricsConfig(enabled=True))
+    body = Metrics.renderMetricsText([Metrics.metricsRegistry.collect()])
+    assert 'db_statement_cache_entries{db="pg_db"} 12' in body
+    assert 'db_statement_cache_size{db="pg_db"} 100' in body
+
+
+def test_read_only_classification_keeps_writes_locks_and_session_reads_on_primary():
+    from lib.Database import prepareQuery
+
+    assert prepareQuery("q.select", "SELECT * FROM T_DATA WHERE NOTE = 'update me'").isReadOnly
+    assert prepareQuery("q.cte", "WITH recent AS (SELECT 1 AS n) SELECT n FROM recent -- delete").isReadOnly
+    for sql in (
+        "INSERT INTO T_DATA (DATA_NM) VALUES (:name) RETURNING DATA_NO",
+        "WITH moved AS (DELETE FROM T_DATA RETURNING *) SELECT COUNT(*) FROM moved",
+        "SELECT * FROM T_DATA WHERE DATA_NO = :id FOR UPDATE",
+        "SELECT * FROM T_DATA FOR SHARE",
+        "SELECT changes() AS affected",
+        "SELECT ROW_COUNT() AS affected",
+        "UPDATE T_DATA SET DATA_NM = :name",
+    ):
+        assert not prepareQuery("q.write", sql).isReadOnly, sql
+
+
+def test_replica_config_reads_selection_lag_and_prefixes():
+    from lib.ReadReplica import parseReplicaHosts, readReplicaConfig
+
+    assert parseReplicaHosts(" db-r1:6432, db-r2 ,", "DATABASE") == [("db-r1", "6432"), ("db-r2", None)]
+    with pytest.raises(ValueError):
+        parseReplicaHosts("db-r1:abc", "DATABASE")
+
+    replicaConfig = readReplicaConfig(
+        {"replica_selection": "least_latency", "replica_max_lag_ms": "250", "replica_query_prefixes": "report., dashboard.statusSummary"},
+        "DATABASE",
+        ["postgresql://u:p@db-r1:6432/app"],
+    )
+    assert replicaConfig.selection == "least_latency"
+    assert replicaConfig.maxLagMs == 250
+    assert replicaConfig.queryPrefixes == ("report.", "dashboard.statusSummary")
+    assert readReplicaConfig({}, "DATABASE", []).queryPrefixes == ("dashboard.", "sample.")
+    for badSection in ({"replica_selection": "random"}, {"replica_health_interval_ms": "10"}):
+        with pytest.raises(ValueError):
+            readReplicaConfig(badSection, "DATABASE", [])
+
+
+def test_replica_router_balances_healthy_replicas_and_ejects_lagging_ones():
+    from lib.ReadReplica import ReplicaConfig, ReplicaRouter, ReplicaTarget
+
+    targets = [ReplicaTarget(f"postgresql://r{index}", None, f"main_db:replica{index}") for index in (1, 2, 3)]
+    router = ReplicaRouter(ReplicaConfig(maxLagMs=100), targets)
+    for target in targets:
+        router.markHealth(target, True, lagMs=0)
+    assert {router.choose().label for _ in range(3)} == {target.label for target in targets}
+
+    router.markHealth(targets[1], False, lagMs=900, error="replication lag exceeded")
+    assert targets[1].ejections == 1
+    assert {router.choose().label for _ in range(4)} == {"main_db:replica1", "main_db:replica3"}
+
+    router.config = ReplicaConfig(selection="least_latency")
+    targets[0].observeLatency(8.0)
+    targets[2].observeLatency(2.0)
+    assert router.choose() is targets[2]
+
+    for target in targets:
+        router.markHealth(target, False)
+    assert router.choose() is None
+
+
+def test_eligible_reads_use_replica_until_write_or_transaction_pins_primary(tmp_path):
+    from lib.Database import DatabaseManager, resetPrimaryReadPin
+    from lib import Database as DB
+    from lib.ReadReplica import ReplicaConfig
+    from lib.Transaction import transaction
+
+    primaryUrl = f"sqlite:///{tmp_path / 'primary.db'}"
+    replicaUrl = f"sqlite:///{tmp_path / 'replica.db'}"
+    manager = DatabaseManager(
+        primaryUrl,
+        name="replica_db",
+        replicaConfig=ReplicaConfig(urls=(replicaUrl,), healthIntervalMs=60000),
+    )
+    replica = manager.replicaRouter.targets[0]
+    queries = {
+        "dashboard.readSource": 'SELECT SOURCE AS "source" FROM T_SOURCE',
+        "dashboard.touchSource": "UPDATE T_SOURCE SET SOURCE = SOURCE",
+        "auth.readSource": 'SELECT SOURCE AS "source" FROM T_SOURCE',
+    }
+    previousQueries = dict(manager.queryManager.queries)
+    previousManagers = dict(DB.dbManagers)
+    manager.queryManager.setAll(queries, {}, {})
+    DB.dbManagers["replica_db"] = manager
+
+    async def readSource(queryName: str = "dashboard.readSource") -> str:
+        row = await manager.fetchOneQuery(queryName)
+        return row["source"]
+
+    @transaction("replica_db")
+    async def readInTransaction() -> str:
+        return await readSource()
+
+    async def exercise():
+        for database, source in ((manager.database, "primary"), (replica.database, "replica")):
+            await database.connect()
+            await database.execute("CREATE TABLE T_SOURCE (SOURCE TEXT)")
+            await database.execute(f"INSERT INTO T_SOURCE (SOURCE) VALUES ('{source}')")
+            await database.disconnect()
+        await manager.connect()
+        try:
+            resetPrimaryReadPin()
+            assert replica.healthy
+            assert await readSource() == "replica"
+            assert await readSource("auth.readSource") == "primary"
+            assert await readInTransaction() == "primary"
+            assert await readSource() == "replica"
+
+            await manager.executeQuery("dashboard.touchSource")
+            assert await readSource() == "primary"
+            resetPrimaryReadPin()
+            assert await readSource() == "replica"
+
+            originalFetchOne = replica.database.fetch_one
+
+            async def brokenFetchOne(**kwargs):
+                raise ConnectionResetError("replica went away")
+
+            replica.database.fetch_one = brokenFetchOne
+            assert await readSource() == "primary"
+            assert (replica.healthy, replica.ejections, replica.lastError) == (False, 1, "ConnectionResetError")
+            assert await readSource() == "primary"
+
+            replica.database.fetch_one = originalFetchOne
+            await manager.refreshReplicaHealth()
+            assert replica.healthy
+            assert await readSource() == "replica"
+        finally:
+            await manager.disconnect()
+
+    try:
+        asyncio.run(exercise())
+        stats = manager.getPoolStats()
+        assert [replicaStats["label"] for replicaStats in stats["replicas"]] == ["replica_db:replica1"]
+        assert stats["replicas"][0]["reads"] == 4
+        assert ("replica_db:replica1",) in DB.collectPoolGauge("acquired")
+    finally:
+        manager.queryManager.setAll(previousQueries, {}, {})
+        DB.dbManagers.clear()
+        DB.dbManagers.update(previousManagers)
+
+
+def test_iterate_query_streams_batches_with_one_sql_count_and_log(tmp_path, monkeypatch):
+    from lib.Database import DatabaseManager, getSqlCount, resetSqlCount
+
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'iterate.db'}")
+    previousQueries = dict(manager.queryManager.queries)
+    manager.queryManager.setAll(
+        {"export.items": 'SELECT ITEM_NO AS "itemNo", ITEM_NM AS "itemNm" FROM T_ITEM WHERE ITEM_NO > :minNo ORDER BY ITEM_NO'},
+        {},
+        {},
+    )
+    loggedRows: list[tuple[str, int | None, str | None]] = []
+
+    def recordLog(op, query, values=None, queryName=None, prepared=None, durationMs=None, rowCount=None, errorType=None):
+        loggedRows.append((op, rowCount, errorType))
+
+    monkeypatch.setattr(manager, "logQuery", recordLog)
+
+    async def exercise():
+        await manager.connect()
+        try:
+            await manager.execute("CREATE TABLE T_ITEM (ITEM_NO INTEGER PRIMARY KEY, ITEM_NM TEXT)")
+            for itemNo in range(1, 6):
+                await manager.execute(
+                    "INSERT INTO T_ITEM (ITEM_NO, ITEM_NM) VALUES (:itemNo, :itemNm)",
+                    {"itemNo": itemNo, "itemNm": f"item-{itemNo}"},
+                )
+            loggedRows.clear()
+            resetSqlCount()
+            batches = [batch async for batch in manager.iterateQuery("export.items", {"minNo": 0}, batchSize=2)]
+            sqlCount = getSqlCount()
+
+            partial = manager.iterateQuery("export.items", {"minNo": 0}, batchSize=2)
+            firstBatch = await partial.__anext__()
+            await partial.aclose()
+
+            with pytest.raises(ValueError, match="DB_400_PARAM_MISSING"):
+                await manager.iterateQuery("export.items", {}).__anext__()
+            return batches, sqlCount, firstBatch
+        finally:
+            await manager.disconnect()
+
+    try:
+        batches, sqlCount, firstBatch = asyncio.run(exercise())
+    finally:
+        manager.queryManager.setAll(previousQueries, {}, {})
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0] == {"itemNo": 1, "itemNm": "item-1"}
+    assert firstBatch == batches[0]
+    assert sqlCount == 1
+    assert loggedRows == [("iterate", 5, None)]
+
+
+def test_multi_values_template_only_expands_single_row_inserts():
+    from lib.Database import buildMultiValuesSql, buildMultiValuesTemplate
+
+    template = buildMultiValuesTemplate(
+        "INSERT INTO T_ITEM (ITEM_NO, NOTE) VALUES (:itemNo, COALESCE(:note, ':kept')) ON CONFLICT (ITEM_NO) DO NOTHING"
+    )
+    assert buildMultiValuesSql(template, 2) == (
+        "INSERT INTO T_ITEM (ITEM_NO, NOTE) VALUES (:itemNo__0, COALESCE(:note__0, ':kept')),\n"
+        "(:itemNo__1, COALESCE(:note__1, ':kept')) ON CONFLICT (ITEM_NO) DO NOTHING"
+    )
+    for sql in (
+        "UPDATE T_ITEM SET NOTE = :note WHERE ITEM_NO = :itemNo",
+        "INSERT INTO T_ITEM (ITEM_NO) SELECT ITEM_NO FROM T_SRC WHERE ITEM_NO > :minNo",
+        "INSERT INTO T_ITEM (ITEM_NO) VALUES (:a), (:b)",
+        "INSERT INTO T_ITEM (ITEM_NO, NOTE) VALUES (:itemNo, :note) ON CONFLICT (ITEM_NO) DO UPDATE SET NOTE = :note",
+    ):
+        assert buildMultiValuesTemplate(sql) is None, sql
+
+
+def test_execute_many_query_validates_once_and_counts_each_chunk(tmp_path, monkeypatch):
+    from lib.Database import DatabaseManager, getSqlCount, resetSqlCount
+
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'execute_many.db'}")
+    previousQueries = dict(manager.queryManager.queries)
+    manager.queryManager.setAll(
+        {
+            "item.insert": "INSERT INTO T_ITEM (ITEM_NO, ITEM_NM) VALUES (:itemNo, :itemNm)",
+            "item.rename": "UPDATE T_ITEM SET ITEM_NM = :itemNm WHERE ITEM_NO = :itemNo",
+        },
+        {},
+        {},
+    )
+    loggedRows: list[tuple[str, str, int | None, str | None]] = []
+
+    def recordLog(op, query, values=None, queryName=None, prepared=None, durationMs=None, rowCount=None, errorType=None):
+        loggedRows.append((op, queryName, rowCount, errorType))
+
+    monkeypatch.setattr(manager, "logQuery", recordLog)
+
+    async def exercise():
+        await manager.connect()
+        try:
+            await manager.database.execute("CREATE TABLE T_ITEM (ITEM_NO INTEGER PRIMARY KEY, ITEM_NM TEXT)")
+            resetSqlCount()
+            rows = [{"itemNo": itemNo, "itemNm": f"item-{itemNo}"} for itemNo in range(1, 8)]
+            assert await manager.executeManyQuery("item.insert", rows, chunkSize=3) == 7
+            insertSqlCount = getSqlCount()
+
+            assert await manager.executeManyQuery("item.rename", [{"itemNm": "renamed", "itemNo": 2}, {"itemNo": 5, "itemNm": "renamed"}]) == 2
+            assert await manager.executeManyQuery("item.insert", []) == 0
+
+            with pytest.raises(ValueError, match="DB_400_PARAM_MISSING"):
+                await manager.executeManyQuery("item.insert", [{"itemNo": 8, "itemNm": "ok"}, {"itemNo": 9}])
+            stored = await manager.database.fetch_all("SELECT ITEM_NO, ITEM_NM FROM T_ITEM ORDER BY ITEM_NO")
+            return insertSqlCount, [(row["ITEM_NO"], row["ITEM_NM"]) for row in stored]
+        finally:
+            await manager.disconnect()
+
+    try:
+        insertSqlCount, stored = asyncio.run(exercise())
+    finally:
+        manager.queryManager.setAll(previousQueries, {}, {})
+
+    assert insertSqlCount == 3
+    assert len(stored) == 7
+    assert [row for row in stored if row[1] == "renamed"] == [(2, "renamed"), (5, "renamed")]
+    assert loggedRows == [("executeMany", "item.insert", 7, None), ("executeMany", "item.rename", 2, None)]
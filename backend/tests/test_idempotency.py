@@ -17,13 +17,10 @@ class FakeDbManager:
         self.calls.append((queryName, params))
         if queryName == "idempotency.ensureTable":
             return None
-        if queryName == "idempotency.deleteExpired":
-            nowMs = int(params["nowMs"])
-            self.entries = {
-                key: value
-                for key, value in self.entries.items()
-                if int(value["expiresAtMs"]) > nowMs
-            }
+        if queryName == "idempotency.deleteExpiredEntry":
+            key = (params["scopeType"], params["idempotencyKey"])
+            if key in self.entries and int(self.entries[key]["expiresAtMs"]) <= int(params["nowMs"]):
+                self.entries.pop(key)
             return None
         if queryName == "idempotency.insertEntry":
             if self.yieldBeforeInsertEntry:
@@ -58,6 +55,18 @@ class FakeDbManager:
             return 1
         raise AssertionError(f"unexpected queryName: {queryName}")
 
+    async def fetchAllQuery(self, queryName: str, values=None):
+        params = dict(values or {})
+        self.calls.append((queryName, params))
+        if queryName != "idempotency.purgeExpiredBatch":
+            raise AssertionError(f"unexpected queryName: {queryName}")
+        expiredKeys = [
+            key for key, value in self.entries.items() if int(value["expiresAtMs"]) <= int(params["nowMs"])
+        ][: int(params["batchSize"])]
+        for key in expiredKeys:
+            self.entries.pop(key)
+        return [{"scopeTp": key[0]} for key in expiredKeys]
+
     async def fetchOneQuery(self, queryName: str, values=None):
         params = dict(values or {})
         self.calls.append((queryName, params))
@@ -68,6 +77,14 @@ class FakeDbManager:
         return dict(row) if row else None
 
 
+@pytest.fixture(autouse=True)
+def resetIdempotencyProcessState(monkeypatch):
+    import lib.Idempotency as Idempotency
+
+    monkeypatch.setattr(Idempotency, "inflightIdempotencyRequests", {})
+    monkeypatch.setattr(Idempotency, "completedIdempotencyResults", Idempotency.OrderedDict())
+
+
 def testNormalizeIdempotencyKeyValidation():
     from lib.Idempotency import normalizeIdempotencyKey
 
@@ -99,6 +116,7 @@ def testBeginCompleteAndReplayIdempotencyRequest(monkeypatch):
 
     fakeManager = FakeDbManager()
     monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    monkeypatch.setattr(Idempotency, "idempotencyConfig", Idempotency.IdempotencyConfig(coalesceWaitMs=0))
 
     async def scenario():
         first = await Idempotency.beginIdempotencyRequest(
@@ -157,6 +175,7 @@ def testConcurrentBeginIdempotencyRequestAllowsOnlyOneNew(monkeypatch):
     fakeManager = FakeDbManager()
     fakeManager.yieldBeforeInsertEntry = True
     monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    monkeypatch.setattr(Idempotency, "idempotencyConfig", Idempotency.IdempotencyConfig(coalesceWaitMs=0))
 
     async def tryBegin():
         try:
@@ -178,6 +197,63 @@ def testConcurrentBeginIdempotencyRequestAllowsOnlyOneNew(monkeypatch):
     assert results.count("IDEMPOTENCY_409_IN_PROGRESS") == 1
 
 
+def testDuplicateInflightRequestSharesResultAndCompletedReplaySkipsStore(monkeypatch):
+    import lib.Idempotency as Idempotency
+
+    fakeManager = FakeDbManager()
+    fakeManager.yieldBeforeInsertEntry = True
+    monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    payload = {"userId": "demo", "resumeId": 7}
+
+    async def scenario():
+        first = await Idempotency.beginIdempotencyRequest("resume.create", "idem-key:coalesce", payload)
+        assert first["status"] == "new"
+        waiters = [
+            asyncio.create_task(Idempotency.beginIdempotencyRequest("resume.create", "idem-key:coalesce", payload))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceError) as mismatch:
+            await Idempotency.beginIdempotencyRequest("resume.create", "idem-key:coalesce", {"resumeId": 8})
+        assert mismatch.value.code == "IDEMPOTENCY_409_PAYLOAD_MISMATCH"
+
+        await Idempotency.completeIdempotencyRequest("resume.create", "idem-key:coalesce", {"ok": True, "resultId": 99})
+        shared = await asyncio.gather(*waiters)
+        replay = await Idempotency.beginIdempotencyRequest("resume.create", "idem-key:coalesce", payload)
+        return shared, replay
+
+    shared, replay = asyncio.run(scenario())
+
+    assert [item["status"] for item in shared] == ["replay", "replay", "replay"]
+    assert all(item["result"] == {"ok": True, "resultId": 99} for item in shared)
+    assert replay["result"] == {"ok": True, "resultId": 99}
+    executedNames = [name for name, ignoredParams in fakeManager.calls]
+    assert executedNames.count("idempotency.insertEntry") == 1
+    assert "idempotency.getEntry" not in executedNames
+    assert Idempotency.inflightIdempotencyRequests == {}
+
+
+def testCancelledInflightRequestLetsWaiterReserveKey(monkeypatch):
+    import lib.Idempotency as Idempotency
+
+    fakeManager = FakeDbManager()
+    monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    payload = {"userId": "demo", "resumeId": 7}
+
+    async def scenario():
+        first = await Idempotency.beginIdempotencyRequest("resume.create", "idem-key:retry", payload)
+        assert first["status"] == "new"
+        waiter = asyncio.create_task(Idempotency.beginIdempotencyRequest("resume.create", "idem-key:retry", payload))
+        await asyncio.sleep(0)
+        await Idempotency.cancelIdempotencyRequest("resume.create", "idem-key:retry")
+        return await waiter
+
+    second = asyncio.run(scenario())
+
+    assert second["status"] == "new"
+    assert [name for name, ignoredParams in fakeManager.calls].count("idempotency.insertEntry") == 2
+
+
 def testCancelIdempotencyRequestDeletesPendingEntry(monkeypatch):
     import lib.Idempotency as Idempotency
 
@@ -226,3 +302,83 @@ def testDiscardIdempotencyReservationDoesNotRaiseOnDeleteFailure(monkeypatch):
         assert await Idempotency.getIdempotencyEntry("resume.create", "idem-key:9012") is not None
 
     asyncio.run(scenario())
+
+
+def testRequestPathEnsuresTableOncePerManagerAndReusesExpiredKey(monkeypatch):
+    import lib.Idempotency as Idempotency
+
+    fakeManager = FakeDbManager()
+    monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    monkeypatch.setattr(Idempotency, "idempotencyStoreManager", None)
+    fakeManager.entries[("resume.create", "idem-key:expired")] = {
+        "scopeTp": "resume.create",
+        "idempotencyKey": "idem-key:expired",
+        "statusCd": Idempotency.IDEMPOTENCY_STATUS_DONE,
+        "payloadDigest": "stale",
+        "responseJson": '{"ok":true}',
+        "expiresAtMs": 1,
+    }
+
+    async def scenario():
+        first = await Idempotency.beginIdempotencyRequest("resume.create", "idem-key:expired", {"resumeId": 1})
+        await Idempotency.completeIdempotencyRequest("resume.create", "idem-key:expired", {"ok": True})
+        return first
+
+    first = asyncio.run(scenario())
+
+    assert first["status"] == "new"
+    executedNames = [name for name, ignoredParams in fakeManager.calls]
+    assert executedNames.count("idempotency.ensureTable") == 1
+    assert "idempotency.deleteExpiredEntry" in executedNames
+    assert "idempotency.purgeExpiredBatch" not in executedNames
+
+
+def testPurgeSweeperDeletesExpiredEntriesInBatches(monkeypatch):
+    import lib.Idempotency as Idempotency
+
+    fakeManager = FakeDbManager()
+    monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    monkeypatch.setattr(Idempotency, "idempotencyStoreManager", None)
+    monkeypatch.setattr(
+        Idempotency,
+        "idempotencyConfig",
+        Idempotency.IdempotencyConfig(purgeIntervalMs=1000, purgeBatchSize=2),
+    )
+    for index in range(5):
+        fakeManager.entries[("resume.create", f"idem-key:{index}")] = {"expiresAtMs": 10 if index < 4 else 10_000}
+
+    monkeypatch.setattr(Idempotency.DB, "getManager", lambda: None)
+    assert asyncio.run(Idempotency.purgeExpiredIdempotencyEntries(100)) == 0
+    monkeypatch.setattr(Idempotency.DB, "getManager", lambda: fakeManager)
+    assert asyncio.run(Idempotency.purgeExpiredIdempotencyEntries(100)) == 4
+
+    executedNames = [name for name, ignoredParams in fakeManager.calls]
+    assert executedNames.count("idempotency.ensureTable") == 1
+    assert Idempotency.idempotencyStoreManager is fakeManager
+    purgeCalls = [params for name, params in fakeManager.calls if name == "idempotency.purgeExpiredBatch"]
+    assert [params["batchSize"] for params in purgeCalls] == [2, 2, 2]
+    assert list(fakeManager.entries) == [("resume.create", "idem-key:4")]
+
+
+def testIdempotencyConfigReadsSectionAndRejectsInvalidValues(monkeypatch):
+    import configparser
+
+    import lib.Idempotency as Idempotency
+
+    monkeypatch.delenv("IDEMPOTENCY_PURGE_INTERVAL_MS", raising=False)
+    monkeypatch.delenv("IDEMPOTENCY_PURGE_BATCH_SIZE", raising=False)
+    monkeypatch.delenv("IDEMPOTENCY_COALESCE_WAIT_MS", raising=False)
+    monkeypatch.delenv("IDEMPOTENCY_RESULT_CACHE_ENTRIES", raising=False)
+    config = configparser.ConfigParser()
+    config.read_dict({"IDEMPOTENCY": {"purge_interval_ms": "0", "purge_batch_size": "50"}})
+    try:
+        assert Idempotency.configureIdempotency(config) == Idempotency.IdempotencyConfig(0, 50)
+        config["IDEMPOTENCY"]["coalesce_wait_ms"] = "0"
+        config["IDEMPOTENCY"]["result_cache_entries"] = "0"
+        assert Idempotency.configureIdempotency(config) == Idempotency.IdempotencyConfig(0, 50, 0, 0)
+        assert Idempotency.startIdempotencySweeper() is False
+        config["IDEMPOTENCY"]["purge_batch_size"] = "0"
+        with pytest.raises(ValueError):
+            Idempotency.configureIdempotency(config)
+    finally:
+        Idempotency.configureIdempotency(None)
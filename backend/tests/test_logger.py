@@ -4,6 +4,8 @@
 """
 
 import logging
+import logging.handlers
+import os
 
 
 def testConfigureLoggerDoesNotDuplicateManagedHandlers(monkeypatch):
@@ -27,6 +29,7 @@ def testConfigureLoggerDoesNotDuplicateManagedHandlers(monkeypatch):
         targetLogger.addHandler(fileHandler)
         attachedFileHandlers.append(fileHandler)
 
+    monkeypatch.setenv("LOG_ASYNC", "false")
     monkeypatch.setattr(Logger, "logger", testLogger)
     monkeypatch.setattr(Logger, "_attachFileHandler", fakeAttachFileHandler)
 
@@ -58,3 +61,189 @@ def testAttachFileHandlerSkipsWhenLogDirectoryIsUnavailable(monkeypatch):
     Logger._attachFileHandler(testLogger, logging.INFO, Logger.JsonLineFormatter())
 
     assert not [handler for handler in testLogger.handlers if getattr(handler, "_myweb_file_handler", False)]
+
+
+def testStructuredLogIsSerializedOnceFromRecordExtra(monkeypatch):
+    import json
+
+    from lib import Logger
+
+    testLogger = logging.getLogger("myweb.test.logger.structured")
+    testLogger.handlers.clear()
+    testLogger.propagate = False
+    testLogger.setLevel(logging.INFO)
+    records = []
+
+    class CaptureHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    testLogger.addHandler(CaptureHandler())
+    encodeCalls = []
+    originalEncode = Logger.encodeLogJson
+
+    def countingEncode(payload):
+        encodeCalls.append(payload)
+        return originalEncode(payload)
+
+    def forbiddenParse(*_args, **_kwargs):
+        raise AssertionError("structured records must not be re-parsed")
+
+    monkeypatch.setattr(Logger, "encodeLogJson", countingEncode)
+    monkeypatch.setattr(Logger.json, "loads", forbiddenParse)
+
+    Logger.logStructured(logging.INFO, {"event": "db.query", "queryName": "q", "한글": "값"}, targetLogger=testLogger)
+    Logger.logStructured(logging.DEBUG, {"event": "skipped"}, targetLogger=testLogger)
+
+    assert len(records) == 1
+    line = Logger.JsonLineFormatter().format(records[0])
+    monkeypatch.undo()
+    parsed = json.loads(line)
+    assert parsed["event"] == "db.query"
+    assert parsed["한글"] == "값"
+    assert parsed["level"] == "INFO"
+    assert len(encodeCalls) == 1
+    assert json.loads(records[0].getMessage())["queryName"] == "q"
+
+
+def testEncodeLogJsonFallsBackToStdlibWithoutFastEncoder(monkeypatch):
+    import json
+
+    from lib import Logger
+
+    monkeypatch.setattr(Logger, "orjson", None)
+    encoded = Logger.encodeLogJson({"msg": "접근", "value": object.__name__})
+
+    assert json.loads(encoded) == {"msg": "접근", "value": "object"}
+    assert "접근" in encoded
+
+
+def testBatchingQueueListenerFlushesBatchesCountsDropsAndRotatesBySize(tmp_path):
+    import json
+    import queue
+
+    from lib import Logger
+
+    logFile = tmp_path / "app.log"
+    fileHandler = logging.handlers.RotatingFileHandler(logFile, maxBytes=400, backupCount=20, encoding="utf-8")
+    fileHandler.setFormatter(Logger.JsonLineFormatter())
+    logQueue = queue.Queue(maxsize=3)
+    queueHandler = Logger.DroppingQueueHandler(logQueue)
+    listener = Logger.BatchingQueueListener(logQueue, [fileHandler], queueHandler, batchSize=2, flushIntervalMs=20)
+
+    def makeRecord(index):
+        payload = {"msg": "line", "index": index, "padding": "x" * 60}
+        return logging.makeLogRecord(
+            {"levelno": logging.INFO, "levelname": "INFO", "msg": Logger.StructuredLogMessage(payload), Logger.STRUCTURED_LOG_ATTR: payload}
+        )
+
+    for index in range(5):
+        queueHandler.handle(makeRecord(index))
+    assert queueHandler.dropped == 2
+
+    listener.start()
+    for index in range(3, 10):
+        queueHandler.handle(makeRecord(index))
+    listener.stop()
+    fileHandler.close()
+
+    lines = []
+    rotatedPaths = sorted(tmp_path.glob("app.log.*"), key=lambda path: int(path.suffix[1:]), reverse=True)
+    for path in [*rotatedPaths, logFile]:
+        lines.extend(json.loads(line) for line in path.read_text(encoding="utf-8").splitlines())
+    indexes = [line["index"] for line in lines if line["msg"] == "line"]
+    dropReports = [line for line in lines if line["msg"] == "log_queue_dropped"]
+    assert indexes[:3] == [0, 1, 2]
+    assert len(indexes) == 3 + 7 - (queueHandler.dropped - 2)
+    assert dropReports and dropReports[0]["droppedTotal"] >= 2
+    assert len(list(tmp_path.glob("app.log.*"))) >= 1
+    assert all(path.stat().st_size <= 400 for path in tmp_path.glob("app.log*"))
+
+
+def testAsyncLoggingRoutesRootThroughSingleQueueHandler(monkeypatch, tmp_path):
+    from lib import Logger
+
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("LOG_ASYNC", "true")
+    try:
+        Logger._configureLogger()
+        Logger._configureLogger()
+        queueHandlers = [h for h in Logger.logger.handlers if isinstance(h, Logger.DroppingQueueHandler)]
+        assert len(queueHandlers) == 1
+        assert not [h for h in Logger.logger.handlers if getattr(h, "_myweb_console_handler", False)]
+        assert Logger.getLogQueueStats()["enabled"] is True
+        assert len(list(tmp_path.glob("app-*.log"))) == 1
+    finally:
+        monkeypatch.undo()
+        Logger._configureLogger()
+
+
+def testQueueHandlerSnapshotsRecordOnCallerThread():
+    import json
+    import queue
+    import sys
+
+    from lib import Logger
+
+    logQueue = queue.Queue()
+    queueHandler = Logger.DroppingQueueHandler(logQueue)
+    state = {"count": 1}
+    args = [["first"]]
+    lazyRecord = logging.makeLogRecord({"levelno": logging.INFO, "levelname": "INFO"})
+    lazyPayload = Logger.LazyLogPayload(lambda: {"msg": "lazy", "count": state["count"]})
+    lazyRecord.msg = Logger.StructuredLogMessage(lazyPayload)
+    setattr(lazyRecord, Logger.STRUCTURED_LOG_ATTR, lazyPayload)
+    textRecord = logging.makeLogRecord({"levelno": logging.INFO, "levelname": "INFO", "msg": "items=%s", "args": tuple(args)})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        errorRecord = logging.makeLogRecord(
+            {"levelno": logging.ERROR, "levelname": "ERROR", "msg": "failed", "exc_info": sys.exc_info()}
+        )
+
+    for record in (lazyRecord, textRecord, errorRecord):
+        queueHandler.handle(record)
+    state["count"] = 2
+    args[0].append("mutated")
+
+    formatter = Logger.JsonLineFormatter()
+    lines = [json.loads(formatter.format(logQueue.get_nowait())) for _ in range(3)]
+    assert (lines[0]["msg"], lines[0]["count"]) == ("lazy", 1)
+    assert lines[1]["msg"] == "items=['first']"
+    assert "ValueError: boom" in lines[2]["exc"]
+    assert errorRecord.exc_info is not None
+
+
+def testLogFileUsesStableWorkerSlotUnlessNameIsConfigured(monkeypatch, tmp_path):
+    import fcntl
+
+    from lib import Logger
+
+    monkeypatch.delenv("LOG_FILE_NAME", raising=False)
+    monkeypatch.delenv("LOG_WORKER_INDEX", raising=False)
+    monkeypatch.setattr(Logger, "_logSlotLocks", {})
+    otherWorkerFd = os.open(str(tmp_path / "app-0.lock"), os.O_RDWR | os.O_CREAT)
+    fcntl.flock(otherWorkerFd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    try:
+        assert Logger.buildLogFileName(str(tmp_path)) == "app-1.log"
+        assert Logger.buildLogFileName(str(tmp_path)) == "app-1.log"
+    finally:
+        os.close(otherWorkerFd)
+        for _, lockFd in Logger._logSlotLocks.values():
+            os.close(lockFd)
+
+    monkeypatch.setattr(Logger, "_logSlotLocks", {})
+    try:
+        assert Logger.buildLogFileName(str(tmp_path)) == "app-0.log"
+    finally:
+        for _, lockFd in Logger._logSlotLocks.values():
+            os.close(lockFd)
+
+    monkeypatch.setenv("LOG_WORKER_INDEX", "3")
+    assert Logger.buildLogFileName(str(tmp_path)) == "app-3.log"
+    monkeypatch.setenv("LOG_FILE_NAME", "single.log")
+    handler = Logger.buildFileHandler(str(tmp_path))
+    try:
+        assert handler.baseFilename == str(tmp_path / "single.log")
+    finally:
+        handler.close()
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import uuid
 
 import pytest
@@ -8,6 +7,7 @@ from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from lib.Database import incSqlCount
+from lib.Logger import STRUCTURED_LOG_ATTR
 from lib import Middleware as middleware
 
 
@@ -47,8 +47,8 @@ def testAccessLogWaitsForStreamingBodyAndBackgroundWork(monkeypatch):
     app.add_middleware(middleware.RequestLogMiddleware)
     events = []
 
-    def captureInfo(message):
-        payload = json.loads(message)
+    def captureInfo(message, extra=None):
+        payload = extra[STRUCTURED_LOG_ATTR]
         if payload.get("msg") == "access":
             events.append(("access", payload))
 
@@ -88,8 +88,8 @@ def testAccessLogTaskCapFailureAndDrain(monkeypatch):
 
         monkeypatch.setenv("ACCESS_LOG_PENDING_TASK_CAP", "1")
         monkeypatch.setattr(middleware, "writeUserAccessLogSafely", blockedWriter)
-        monkeypatch.setattr(middleware.logger, "error", lambda message: errors.append(json.loads(message)))
-        monkeypatch.setattr(middleware.logger, "warning", lambda message: warnings.append(json.loads(message)))
+        monkeypatch.setattr(middleware.logger, "error", lambda message, extra=None: errors.append(extra[STRUCTURED_LOG_ATTR]))
+        monkeypatch.setattr(middleware.logger, "warning", lambda message, extra=None: warnings.append(extra[STRUCTURED_LOG_ATTR]))
 
         assert middleware.scheduleUserAccessLog(requestId="first") is True
         assert middleware.scheduleUserAccessLog(requestId="second") is False
@@ -83,3 +83,53 @@ def testErrorResponseRejectsNonStringCode(code):
 def testErrorResponseRejectsBlankCode(code):
     with pytest.raises(ValueError, match="code must not be blank"):
         errorResponse(code=code)
+
+
+def collectStreamBody(response) -> str:
+    import asyncio
+
+    async def collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect()).decode("utf-8")
+
+
+async def iterateBatches(batches):
+    for batch in batches:
+        yield batch
+
+
+def testStreamRowsResponseEmitsNdjsonLinePerRow():
+    from datetime import date
+
+    from lib.Response import streamRowsResponse
+
+    response = streamRowsResponse(
+        iterateBatches([[{"id": 1, "title": "가"}], [{"id": 2, "title": None, "regDt": date(2026, 10, 18)}]]),
+        filename="dashboard export.ndjson",
+    )
+
+    assert response.media_type == "application/x-ndjson"
+    assert response.headers["content-disposition"] == "attachment; filename*=UTF-8''dashboard%20export.ndjson"
+    assert collectStreamBody(response).splitlines() == [
+        '{"id": 1, "title": "가"}',
+        '{"id": 2, "title": null, "regDt": "2026-10-18"}',
+    ]
+
+
+def testStreamRowsResponseEmitsCsvWithHeaderAndNeutralizedFormulas():
+    from lib.Response import streamRowsResponse
+
+    response = streamRowsResponse(
+        iterateBatches([[], [{"id": 1, "title": "=HYPERLINK(1)", "amt": -5}], [{"id": 2, "title": "a,b", "amt": None}]]),
+        format="csv",
+    )
+
+    assert response.media_type == "text/csv; charset=utf-8"
+    assert collectStreamBody(response).splitlines() == [
+        "\ufeffid,title,amt",
+        "1,'=HYPERLINK(1),-5",
+        '2,"a,b",',
+    ]
+    with pytest.raises(ValueError):
+        streamRowsResponse(iterateBatches([]), format="xml")
@@ -15,6 +15,94 @@ from service.SampleService import (
 )
 
 
+def testBootstrapRunsOncePerManagerUntilSchemaMissingErrorIsSeen(monkeypatch):
+    bootstrapCallList = []
+    managerList = [object()]
+
+    async def fakeBootstrapStorage():
+        bootstrapCallList.append(managerList[0])
+
+    monkeypatch.setattr(SampleService, "ensureBootstrapStorage", fakeBootstrapStorage)
+    monkeypatch.setattr(SampleService.DB, "getManager", lambda: managerList[0])
+    monkeypatch.setattr(SampleService, "sampleBootstrapManager", None)
+
+    async def scenario():
+        await asyncio.gather(*(SampleService.ensureBootstrap() for _ in range(5)))
+        await SampleService.ensureBootstrap()
+        assert len(bootstrapCallList) == 1
+
+        assert SampleService.noteSampleStorageError(ValueError("invalid input")) is False
+        await SampleService.ensureBootstrap()
+        assert len(bootstrapCallList) == 1
+
+        missingError = RuntimeError("query failed")
+        missingError.__cause__ = Exception('relation "t_sample_task" does not exist')
+        assert SampleService.noteSampleStorageError(missingError) is True
+        await SampleService.ensureBootstrap()
+        assert len(bootstrapCallList) == 2
+
+        managerList[0] = object()
+        await SampleService.ensureBootstrap()
+        await SampleService.ensureBootstrap(force=True)
+        assert len(bootstrapCallList) == 4
+
+    asyncio.run(scenario())
+    assert SampleService.isSampleSchemaMissingError(Exception("no such table: T_SAMPLE_CONFIG"))
+    assert SampleService.isSampleSchemaMissingError(Exception(1146, "Table 'app.T_SAMPLE_TASK' doesn't exist"))
+
+
+def testSampleOverviewCacheSharesLoadsInvalidatesOnWriteAndServesNotModified(monkeypatch):
+    from starlette.requests import Request
+
+    from router import SampleRouter
+
+    overviewQueryCountList = [0]
+
+    class FakeDb:
+        async def fetchOneQuery(self, queryName, values=None):
+            if queryName == "sample.overview":
+                overviewQueryCountList[0] += 1
+                await asyncio.sleep(0)
+                return {"taskCount": overviewQueryCountList[0], "adminUserCount": 1, "formSubmissionCount": 0}
+            assert queryName == "sample.taskDetail"
+            return {"taskNo": 1, "dataNm": "업무", "statCd": "ready"}
+
+        async def executeQuery(self, queryName, values=None):
+            assert queryName == "sample.taskDelete"
+
+    async def skipBootstrap():
+        return None
+
+    monkeypatch.setattr(SampleService, "ensureBootstrap", skipBootstrap)
+    monkeypatch.setattr(SampleService, "ensureDbManager", lambda: FakeDb())
+    monkeypatch.setattr(SampleService, "sampleReadCache", SampleService.SingleFlightResultCache(60_000))
+
+    def buildRequest(ifNoneMatch=None):
+        headers = [(b"if-none-match", ifNoneMatch.encode())] if ifNoneMatch else []
+        return Request({"type": "http", "method": "GET", "path": "/api/v1/sample/overview", "headers": headers})
+
+    async def scenario():
+        resultList = await asyncio.gather(*(SampleService.getSampleOverview() for _ in range(5)))
+        assert overviewQueryCountList[0] == 1
+        assert all(result["taskCount"] == 1 for result in resultList)
+
+        firstResponse = await SampleRouter.getSampleOverview(buildRequest())
+        assert firstResponse.status_code == 200
+        assert firstResponse.headers["cache-control"] == "no-cache"
+        etag = firstResponse.headers["etag"]
+        notModifiedResponse = await SampleRouter.getSampleOverview(buildRequest(f"W/{etag}"))
+        assert notModifiedResponse.status_code == 304
+        assert overviewQueryCountList[0] == 1
+
+        await SampleService.deleteSampleTask(1)
+        changedResponse = await SampleRouter.getSampleOverview(buildRequest(etag))
+        assert changedResponse.status_code == 200
+        assert changedResponse.headers["etag"] != etag
+        assert overviewQueryCountList[0] == 2
+
+    asyncio.run(scenario())
+
+
 def testLegacyTaskRowsUseCustomerFacingCopyWithoutDatabaseMutation():
     expectedTitleSet = {
         "신규 상담 요청 검토",
@@ -110,6 +198,8 @@ def testRecentTaskDateCompatibilityPreservesNonLegacyRows():
 
 
 def testSampleDashboardAppliesDateCompatibilityToRecentRows(monkeypatch):
+    monkeypatch.setattr(SampleService, "sampleReadCache", SampleService.SingleFlightResultCache(0))
+
     class FixedDate(date):
         @classmethod
         def today(cls):
@@ -29,6 +29,11 @@ def testSampleOverviewAndDashboardArePublic():
 
         dashboardResponse = client.get("/api/v1/sample/dashboard")
         assert dashboardResponse.status_code == 200
+        assert dashboardResponse.headers["cache-control"] == "no-cache"
+        dashboardEtag = dashboardResponse.headers["etag"]
+        notModifiedResponse = client.get("/api/v1/sample/dashboard", headers={"If-None-Match": dashboardEtag})
+        assert notModifiedResponse.status_code == 304
+        assert notModifiedResponse.headers["etag"] == dashboardEtag
         dashboardResult = dashboardResponse.json()["result"]
         assert isinstance(dashboardResult["statusSummaryList"], list)
         assert isinstance(dashboardResult["recentList"], list)
@@ -272,6 +277,7 @@ def testSampleListRoutersPassRawPaginationToService(monkeypatch):
         "toDate": None,
         "page": 0,
         "size": 999,
+        "cursor": None,
     }
     assert captured["users"] == {
         "page": -5,
@@ -478,7 +484,12 @@ def testSampleOpenApiPathsUseSchemaRefsAndCodeSamples():
         assert responseSchema["$ref"] == schemaRef
         cacheControlHeader = response["headers"]["Cache-Control"]
         assert cacheControlHeader["schema"]["type"] == "string"
-        assert cacheControlHeader["schema"]["example"] == "no-store"
+        if path in ("/api/v1/sample/overview", "/api/v1/sample/dashboard"):
+            assert cacheControlHeader["schema"]["example"] == "no-cache"
+            assert "ETag" in response["headers"]
+            assert "304" in operation["responses"]
+        else:
+            assert cacheControlHeader["schema"]["example"] == "no-store"
 
     requestBodyExpectations = {
         ("/api/v1/sample/tasks", "post"): "#/components/schemas/SampleTaskWriteRequest",
@@ -65,6 +65,49 @@ SELECT 2;
         assert raised, "duplicate keys should fail-fast"
 
 
+def testSqlLoaderExpandsSlotTemplates():
+    from lib.SqlLoader import buildQueryVariantName, loadSqlQueries
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        tmpPath = Path(tempDir)
+        writeSql(
+            tmpPath / "item.sql",
+            """-- name: item.list.{status}.{sort}
+-- slot: status any =
+-- slot: status eq = AND STAT_CD = :status
+-- slot: sort new = REG_DT DESC
+-- slot: sort old = REG_DT ASC
+SELECT * FROM item WHERE USER_ID = :userId {{status}} ORDER BY {{sort}};
+
+-- name: item.plain
+SELECT 1;
+""",
+        )
+
+        queries = loadSqlQueries(str(tmpPath))
+        assert sorted(queries) == [
+            "item.list.any.new",
+            "item.list.any.old",
+            "item.list.eq.new",
+            "item.list.eq.old",
+            "item.plain",
+        ]
+        eqQuery = queries[buildQueryVariantName("item.list.{status}.{sort}", status="eq", sort="old")]
+        assert "AND STAT_CD = :status ORDER BY REG_DT ASC" in eqQuery
+        assert ":status" not in queries["item.list.any.new"]
+        assert "-- slot:" not in eqQuery
+
+        writeSql(
+            tmpPath / "item.sql",
+            """-- name: item.list.{status}
+-- slot: status any =
+SELECT * FROM item WHERE USER_ID = :userId {{sort}};
+""",
+        )
+        with pytest.raises(ValueError):
+            loadSqlQueries(str(tmpPath))
+
+
 def testBindParameterEnforcement():
     from lib.Database import DatabaseManager
 
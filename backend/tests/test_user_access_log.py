@@ -5,6 +5,7 @@ import json
 import pytest
 
 from lib import UserAccessLog as userAccessLog
+from lib.AccessLogSpool import AccessLogSpool
 
 
 def buildConfig(**sections):
@@ -74,7 +75,7 @@ def testFailedIpGeoLogDoesNotExposeRawIp(monkeypatch):
             raise RuntimeError(f"provider failure for {rawIp}")
 
     monkeypatch.setattr(userAccessLog.httpx, "AsyncClient", FailingClient)
-    monkeypatch.setattr(userAccessLog.logger, "warning", warnings.append)
+    monkeypatch.setattr(userAccessLog.logger, "warning", lambda message, **_kwargs: warnings.append(str(message)))
 
     with pytest.raises(RuntimeError):
         asyncio.run(userAccessLog.getIpGeoFromRemote(rawIp, requestId="request-1"))
@@ -101,7 +102,7 @@ def testUserAccessLogPersistsBaseRowBeforeLocationEnrichment(monkeypatch):
 
     monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: FakeDb())
     monkeypatch.setattr(userAccessLog, "resolveIpLocation", fakeResolve)
-    monkeypatch.setattr(userAccessLog.logger, "warning", lambda message: None)
+    monkeypatch.setattr(userAccessLog.logger, "warning", lambda message, **_kwargs: None)
 
     asyncio.run(
         userAccessLog.writeUserAccessLog(
@@ -147,7 +148,7 @@ def testBaseInsertFailureStopsLocationLookup(monkeypatch):
 
     monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: FailingDb())
     monkeypatch.setattr(userAccessLog, "resolveIpLocation", fakeResolve)
-    monkeypatch.setattr(userAccessLog.logger, "warning", lambda message: None)
+    monkeypatch.setattr(userAccessLog.logger, "warning", lambda message, **_kwargs: None)
 
     asyncio.run(
         userAccessLog.writeUserAccessLog(
@@ -287,3 +288,327 @@ def testCacheMaxEntriesConfigUsesPositiveBound(monkeypatch):
     assert userAccessLog.getIpGeoCacheMaxEntries() == 3
     config["OBSERVABILITY"]["ip_geo_cache_max_entries"] = "0"
     assert userAccessLog.getIpGeoCacheMaxEntries() == userAccessLog.IP_GEO_DEFAULT_CACHE_MAX_ENTRIES
+
+
+def buildAccessLogKwargs(index, clientIp="8.8.8.8"):
+    return {
+        "username": "person@example.com",
+        "requestId": f"request-{index}",
+        "method": "GET",
+        "path": "/api/example",
+        "statusCode": 200,
+        "latencyMs": 5,
+        "sqlCount": 1,
+        "clientIp": clientIp,
+    }
+
+
+def testBatchWriterFlushesMultiRowInsertWithResolvedLocations(monkeypatch):
+    executed = []
+    resolvedIps = []
+
+    class FakeDb:
+        async def execute(self, query, values, queryName=None):
+            executed.append((query, dict(values), queryName))
+
+        async def executeQuery(self, queryName, values):
+            raise AssertionError("batch writer must not run per-row queries")
+
+    async def fakeResolve(clientIp, requestId=None):
+        resolvedIps.append(clientIp)
+        return ("US", "IP_GEO_REMOTE") if clientIp == "8.8.8.8" else ("PRIVATE_NET", "IP_LOCAL")
+
+    monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: FakeDb())
+    monkeypatch.setattr(userAccessLog, "resolveIpLocation", fakeResolve)
+    monkeypatch.setattr(
+        userAccessLog,
+        "userAccessLogWriterConfig",
+        userAccessLog.UserAccessLogWriterConfig(batchSize=3, flushIntervalMs=60_000, bufferLimit=10),
+    )
+
+    async def exercise():
+        assert userAccessLog.startUserAccessLogWriter() is True
+        try:
+            assert userAccessLog.enqueueUserAccessLog(**buildAccessLogKwargs(1)) is True
+            assert userAccessLog.enqueueUserAccessLog(**buildAccessLogKwargs(2, "10.0.0.1")) is True
+            assert userAccessLog.enqueueUserAccessLog(**buildAccessLogKwargs(3)) is True
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert len(executed) == 1
+            assert userAccessLog.enqueueUserAccessLog(**buildAccessLogKwargs(4)) is True
+        finally:
+            await userAccessLog.stopUserAccessLogWriter()
+
+    asyncio.run(exercise())
+
+    assert len(executed) == 2
+    query, values, queryName = executed[0]
+    assert queryName == userAccessLog.USER_ACCESS_LOG_BATCH_QUERY_NAME
+    assert query == userAccessLog.buildUserAccessLogBatchInsert(3)
+    assert query.count("(:logId_") == 3
+    assert [values[f"reqId_{index}"] for index in range(3)] == ["request-1", "request-2", "request-3"]
+    assert [values[f"ipLocTxt_{index}"] for index in range(3)] == ["US", "PRIVATE_NET", "US"]
+    assert sorted(resolvedIps[:2]) == ["10.0.0.1", "8.8.8.8"]
+    assert executed[1][1]["reqId_0"] == "request-4"
+    assert not userAccessLog.isUserAccessLogWriterRunning()
+
+
+def testBatchWriterLoopSurvivesCycleFailure(monkeypatch):
+    written = []
+
+    class FakeDb:
+        async def execute(self, query, values, queryName=None):
+            written.append(values["reqId_0"])
+
+    async def fakeResolve(clientIp, requestId=None):
+        return (None, None)
+
+    monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: FakeDb())
+    monkeypatch.setattr(userAccessLog, "resolveIpLocation", fakeResolve)
+    config = userAccessLog.UserAccessLogWriterConfig(batchSize=1, flushIntervalMs=60_000, bufferLimit=10)
+
+    async def exercise():
+        writer = userAccessLog.UserAccessLogBatchWriter(config)
+        failures = {"left": 1}
+        originalReplay = writer.replaySpool
+
+        async def flakyReplay():
+            if failures["left"]:
+                failures["left"] -= 1
+                raise RuntimeError("replay failed")
+            return await originalReplay()
+
+        writer.replaySpool = flakyReplay
+        writer.task = asyncio.create_task(writer.run())
+        try:
+            for index in range(2):
+                writer.enqueue(userAccessLog.buildUserAccessLogRow(**buildAccessLogKwargs(index)))
+                for _ in range(10):
+                    await asyncio.sleep(0)
+            assert not writer.task.done()
+        finally:
+            await writer.stop()
+
+    asyncio.run(exercise())
+
+    assert written == ["request-0", "request-1"]
+
+def testScheduleUsesBatchBufferAndCountsOverflowDrops(monkeypatch):
+    from lib import Metrics
+    from lib import Middleware as middleware
+
+    warnings = []
+    monkeypatch.setattr(Metrics, "metricsRegistry", Metrics.MetricsRegistry())
+    monkeypatch.setattr(Metrics, "metricsConfig", Metrics.MetricsConfig(enabled=True))
+    monkeypatch.setattr(middleware, "logStructured", lambda level, payload: warnings.append(payload))
+    monkeypatch.setattr(
+        userAccessLog,
+        "userAccessLogWriterConfig",
+        userAccessLog.UserAccessLogWriterConfig(batchSize=5, flushIntervalMs=60_000, bufferLimit=2),
+    )
+    monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: None)
+
+    async def exercise():
+        userAccessLog.startUserAccessLogWriter()
+        try:
+            results = [middleware.scheduleUserAccessLog(**buildAccessLogKwargs(index)) for index in range(3)]
+            assert results == [True, True, False]
+            assert not middleware._pendingAccessLogTasks
+            assert userAccessLog.getUserAccessLogBufferedCount() == 2
+        finally:
+            await userAccessLog.stopUserAccessLogWriter()
+
+    asyncio.run(exercise())
+
+    assert warnings[-1]["msg"] == "user_access_log_buffer_full"
+    assert Metrics.metricsRegistry.counters[("access_log_tasks_dropped_total", ())] == 1
+
+
+def testBatchWriterSpillsFailedBatchesAndReplaysAfterRecovery(monkeypatch, tmp_path):
+    executed = []
+    failedAttempts = []
+    databaseUp = {"value": False}
+
+    class FakeDb:
+        databaseUrl = "postgresql://example"
+
+        async def execute(self, query, values, queryName=None):
+            if not databaseUp["value"]:
+                failedAttempts.append(query)
+                raise ConnectionError("database down")
+            executed.append((query, dict(values)))
+
+    async def fakeResolve(clientIp, requestId=None):
+        return ("US", "IP_GEO_REMOTE")
+
+    monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: FakeDb())
+    monkeypatch.setattr(userAccessLog, "resolveIpLocation", fakeResolve)
+    monkeypatch.setattr(userAccessLog, "logStructured", lambda level, payload: None)
+    config = userAccessLog.UserAccessLogWriterConfig(
+        batchSize=2,
+        flushIntervalMs=60_000,
+        bufferLimit=2,
+        spoolDir=str(tmp_path),
+        spoolMaxBytes=1024 * 1024,
+        replayRowsPerSec=1000,
+    )
+
+    async def exercise():
+        writer = userAccessLog.UserAccessLogBatchWriter(config, AccessLogSpool(str(tmp_path), 1024 * 1024, 1024))
+        for index in range(3):
+            assert writer.enqueue(userAccessLog.buildUserAccessLogRow(**buildAccessLogKwargs(index))) is True
+        await writer.flush()
+        assert writer.spilled == 3 and writer.dropped == 0
+        failedAttempts.clear()
+        assert await writer.replaySpool() == 0
+        # DB 장애는 행 단위 재시도 없이 바로 backoff
+        assert len(failedAttempts) == 1
+        assert writer.replayNotBefore > 0
+        writer.replayNotBefore = 0.0
+        databaseUp["value"] = True
+        assert await writer.replaySpool() == 3
+        await writer.stop()
+        return writer
+
+    writer = asyncio.run(exercise())
+
+    assert writer.replayed == 3
+    replayedIds = [value for _, values in executed for key, value in values.items() if key.startswith("reqId_")]
+    assert sorted(replayedIds) == ["request-0", "request-1", "request-2"]
+    assert all("ON CONFLICT (LOG_ID) DO NOTHING" in query for query, _ in executed)
+    assert not list(tmp_path.glob("*/spool-*"))
+
+
+def testBatchWriterReplayDiscardsOnlyRowsRejectedByIntegrityErrors(monkeypatch, tmp_path):
+    executed = []
+
+    class IntegrityError(Exception):
+        pass
+
+    class FakeDb:
+        databaseUrl = "postgresql://example"
+
+        async def execute(self, query, values, queryName=None):
+            if "request-1" in values.values():
+                raise IntegrityError("value too long")
+            executed.append(sorted(value for key, value in values.items() if key.startswith("reqId_")))
+
+    async def fakeResolve(clientIp, requestId=None):
+        return ("US", "IP_GEO_REMOTE")
+
+    monkeypatch.setattr(userAccessLog.DB, "getManager", lambda dbName: FakeDb())
+    monkeypatch.setattr(userAccessLog, "resolveIpLocation", fakeResolve)
+    monkeypatch.setattr(userAccessLog, "logStructured", lambda level, payload: None)
+    config = userAccessLog.UserAccessLogWriterConfig(
+        batchSize=3,
+        flushIntervalMs=60_000,
+        bufferLimit=3,
+        spoolDir=str(tmp_path),
+        spoolMaxBytes=1024 * 1024,
+        replayRowsPerSec=1000,
+    )
+
+    async def exercise():
+        writer = userAccessLog.UserAccessLogBatchWriter(config, AccessLogSpool(str(tmp_path), 1024 * 1024, 1024 * 1024))
+        assert await writer.spill([userAccessLog.buildUserAccessLogRow(**buildAccessLogKwargs(index)) for index in range(3)])
+        replayed = await writer.replaySpool()
+        await writer.stop()
+        return writer, replayed
+
+    writer, replayed = asyncio.run(exercise())
+
+    assert replayed == 3
+    assert writer.discarded == 1 and writer.replayFailures == 0
+    assert executed == [["request-0"], ["request-2"]]
+    assert userAccessLog.isRowLevelInsertError(IntegrityError()) is True
+    assert userAccessLog.isRowLevelInsertError(ConnectionError()) is False
+
+
+def testAccessLogSpoolEnforcesDiskCapAndResumesFromOffset(tmp_path):
+    row = userAccessLog.buildUserAccessLogRow(**buildAccessLogKwargs(1))
+    rowBytes = len(json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode("utf-8")) + 1
+    spool = AccessLogSpool(str(tmp_path), rowBytes * 3, rowBytes * 2)
+
+    assert spool.append([row, row]) is True
+    assert spool.append([row]) is True
+    assert spool.append([row]) is False
+    assert len(list(tmp_path.glob("*/spool-*.jsonl"))) == 2
+
+    rows, cursor = spool.readBatch(1)
+    assert len(rows) == 1
+    spool.commit(cursor)
+    spool.close()
+
+    reopened = AccessLogSpool(str(tmp_path), rowBytes * 3, rowBytes * 2)
+    assert reopened.totalBytes == rowBytes * 2
+    rows, cursor = reopened.readBatch(10)
+    assert len(rows) == 1
+    reopened.commit(cursor)
+    assert len(list(tmp_path.glob("*/spool-*.jsonl"))) == 1
+    rows, cursor = reopened.readBatch(10)
+    reopened.commit(cursor)
+    assert reopened.totalBytes == 0
+    assert not list(tmp_path.glob("*/spool-*"))
+
+
+def appendSpoolRowsInChildProcess(rootDirectory, workerIndex, rowCount, readyQueue, releaseEvent):
+    spool = AccessLogSpool(rootDirectory, 1024 * 1024, 512)
+    for index in range(rowCount):
+        row = userAccessLog.buildUserAccessLogRow(**buildAccessLogKwargs(index))
+        row["reqId"] = f"worker-{workerIndex}-{index}"
+        assert spool.append([row]) is True
+    # 다른 worker가 살아 있는 동안 자기 디렉터리를 인수하지 않는지 확인하도록 종료 전 대기
+    readyQueue.put((workerIndex, spool.directory))
+    releaseEvent.wait(10)
+    spool.close()
+
+
+def testAccessLogSpoolSeparatesWorkersAndAdoptsOrphanedDirectories(tmp_path):
+    multiprocessing = pytest.importorskip("multiprocessing")
+    context = multiprocessing.get_context("fork")
+    readyQueue = context.Queue()
+    releaseEvent = context.Event()
+    rowCount = 40
+    workers = [
+        context.Process(
+            target=appendSpoolRowsInChildProcess,
+            args=(str(tmp_path), workerIndex, rowCount, readyQueue, releaseEvent),
+        )
+        for workerIndex in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        reports = [readyQueue.get(timeout=10) for _ in workers]
+        # 각 worker는 자기 디렉터리만 읽음(살아 있는 다른 worker 보관분은 인수 불가)
+        assert len({directory for _, directory in reports}) == 2
+        for workerIndex, directory in reports:
+            lines = [
+                json.loads(line)
+                for segmentPath in sorted(tmp_path.joinpath(directory).glob("spool-*.jsonl"))
+                for line in segmentPath.read_text(encoding="utf-8").splitlines()
+            ]
+            assert [line["reqId"] for line in lines] == [f"worker-{workerIndex}-{index}" for index in range(rowCount)]
+        liveSpool = AccessLogSpool(str(tmp_path), 1024 * 1024, 512)
+        assert liveSpool.readBatch(10) == ([], None)
+        liveSpool.close()
+    finally:
+        releaseEvent.set()
+        for worker in workers:
+            worker.join(10)
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    survivor = AccessLogSpool(str(tmp_path), 1024 * 1024, 512)
+    replayedIds = []
+    while True:
+        rows, cursor = survivor.readBatch(7)
+        if cursor is None:
+            break
+        replayedIds.extend(row["reqId"] for row in rows)
+        survivor.commit(cursor)
+    survivor.close()
+
+    expectedIds = [f"worker-{workerIndex}-{index}" for workerIndex in range(2) for index in range(rowCount)]
+    assert sorted(replayedIds) == sorted(expectedIds)
+    assert survivor.corruptLines == 0
+    assert not list(tmp_path.glob("*/spool-*"))